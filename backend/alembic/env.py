@@ -27,14 +27,12 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 
 # -------- 実装出来次第、下記にモデルをインポートしていく。-----------
-# from app.infrastructure.database import Base
-
+from app.infrastructure.db.models import Base  # noqa: E402
 
 # ------------------------------------------------------------
 
 
-# target_metadata = Base.metadata # 後でコメントアウトを外す
-target_metadata = None
+target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -0,0 +1,64 @@
+"""create users
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-03-01 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'users',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column('email', sa.String(length=255), nullable=False),
+        sa.Column('password_hash', sa.String(length=255), nullable=False),
+        sa.Column('username', sa.String(length=100), nullable=True),
+        sa.Column('avatar_url', sa.Text(), nullable=True),
+        sa.Column('discord_id', sa.String(length=255), nullable=True),
+        sa.Column(
+            'is_active', sa.Boolean(), server_default=sa.text('true'), nullable=False
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('email'),
+        sa.UniqueConstraint('discord_id'),
+    )
+    # 一覧のキーセットページネーション（created_at 降順, id 降順）用
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_created_at_id', table_name='users')
+    op.drop_table('users')
@@ -0,0 +1,219 @@
+"""create user profile tables
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-03-15 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: str | None = '0001'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _id_column() -> sa.Column:
+    return sa.Column(
+        'id',
+        postgresql.UUID(as_uuid=True),
+        server_default=sa.text('gen_random_uuid()'),
+        nullable=False,
+    )
+
+
+def _user_id_column() -> sa.Column:
+    return sa.Column(
+        'user_id',
+        postgresql.UUID(as_uuid=True),
+        sa.ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False,
+    )
+
+
+def _timestamp_columns() -> list[sa.Column]:
+    return [
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # display_name / tagline の部分一致検索（ILIKE）をインデックスで処理するため
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.create_table(
+        'user_metadata',
+        _id_column(),
+        _user_id_column(),
+        sa.Column('display_name', sa.String(length=100), nullable=True),
+        sa.Column('tagline', sa.String(length=150), nullable=True),
+        sa.Column('bio', sa.Text(), nullable=True),
+        sa.Column(
+            'skills',
+            postgresql.ARRAY(sa.Text()),
+            server_default=sa.text("'{}'"),
+            nullable=False,
+        ),
+        sa.Column(
+            'interests',
+            postgresql.ARRAY(sa.Text()),
+            server_default=sa.text("'{}'"),
+            nullable=False,
+        ),
+        *_timestamp_columns(),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id'),
+    )
+    op.create_index(
+        'ix_user_metadata_skills', 'user_metadata', ['skills'], postgresql_using='gin'
+    )
+    op.create_index(
+        'ix_user_metadata_interests',
+        'user_metadata',
+        ['interests'],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_user_metadata_display_name_trgm',
+        'user_metadata',
+        ['display_name'],
+        postgresql_using='gin',
+        postgresql_ops={'display_name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_user_metadata_tagline_trgm',
+        'user_metadata',
+        ['tagline'],
+        postgresql_using='gin',
+        postgresql_ops={'tagline': 'gin_trgm_ops'},
+    )
+
+    op.create_table(
+        'user_visions',
+        _id_column(),
+        _user_id_column(),
+        sa.Column('vision', sa.Text(), nullable=True),
+        sa.Column(
+            'is_public', sa.Boolean(), server_default=sa.text('false'), nullable=False
+        ),
+        *_timestamp_columns(),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id'),
+    )
+
+    op.create_table(
+        'user_social_links',
+        _id_column(),
+        _user_id_column(),
+        sa.Column('platform', sa.String(length=50), nullable=False),
+        sa.Column('url', sa.Text(), nullable=False),
+        sa.Column('title', sa.String(length=100), nullable=True),
+        sa.Column(
+            'is_public', sa.Boolean(), server_default=sa.text('true'), nullable=False
+        ),
+        *_timestamp_columns(),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_user_social_links_user_id_public',
+        'user_social_links',
+        ['user_id'],
+        postgresql_where=sa.text('is_public'),
+    )
+
+    op.create_table(
+        'title_achievements',
+        _id_column(),
+        _user_id_column(),
+        sa.Column('title_level', sa.Integer(), nullable=False),
+        sa.Column(
+            'achieved_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'is_current', sa.Boolean(), server_default=sa.text('false'), nullable=False
+        ),
+        *_timestamp_columns(),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'user_id', 'title_level', name='uq_title_achievements_user_level'
+        ),
+        sa.CheckConstraint(
+            'title_level BETWEEN 1 AND 8', name='ck_title_achievements_level'
+        ),
+    )
+    op.create_index(
+        'uq_title_achievements_user_current',
+        'title_achievements',
+        ['user_id'],
+        unique=True,
+        postgresql_where=sa.text('is_current'),
+    )
+
+    op.create_table(
+        'attendance_statistics',
+        _id_column(),
+        _user_id_column(),
+        sa.Column(
+            'total_attendance_days',
+            sa.Integer(),
+            server_default=sa.text('0'),
+            nullable=False,
+        ),
+        sa.Column(
+            'current_streak_days',
+            sa.Integer(),
+            server_default=sa.text('0'),
+            nullable=False,
+        ),
+        sa.Column(
+            'max_streak_days', sa.Integer(), server_default=sa.text('0'), nullable=False
+        ),
+        sa.Column('last_attendance_date', sa.Date(), nullable=True),
+        sa.Column('first_attendance_date', sa.Date(), nullable=True),
+        sa.Column(
+            'total_duration_minutes',
+            sa.Integer(),
+            server_default=sa.text('0'),
+            nullable=False,
+        ),
+        *_timestamp_columns(),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('attendance_statistics')
+    op.drop_index('uq_title_achievements_user_current', table_name='title_achievements')
+    op.drop_table('title_achievements')
+    op.drop_index('ix_user_social_links_user_id_public', table_name='user_social_links')
+    op.drop_table('user_social_links')
+    op.drop_table('user_visions')
+    op.drop_index('ix_user_metadata_tagline_trgm', table_name='user_metadata')
+    op.drop_index('ix_user_metadata_display_name_trgm', table_name='user_metadata')
+    op.drop_index('ix_user_metadata_interests', table_name='user_metadata')
+    op.drop_index('ix_user_metadata_skills', table_name='user_metadata')
+    op.drop_table('user_metadata')
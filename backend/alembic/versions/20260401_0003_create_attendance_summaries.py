@@ -0,0 +1,76 @@
+"""create attendance summaries
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-04-01 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: str | None = '0002'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'attendance_summaries',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'user_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column(
+            'total_duration_minutes',
+            sa.Integer(),
+            server_default=sa.text('0'),
+            nullable=False,
+        ),
+        sa.Column(
+            'session_count', sa.Integer(), server_default=sa.text('0'), nullable=False
+        ),
+        sa.Column('first_join_time', sa.Time(), nullable=True),
+        sa.Column('last_leave_time', sa.Time(), nullable=True),
+        sa.Column(
+            'is_morning_active',
+            sa.Boolean(),
+            server_default=sa.text('false'),
+            nullable=False,
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'date', name='uq_attendance_summaries_user_date'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('attendance_summaries')
@@ -0,0 +1,84 @@
+"""create attendance logs
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-04-15 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: str | None = '0003'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'attendance_logs',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'user_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column('event_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('discord_channel_id', sa.String(length=255), nullable=False),
+        sa.Column('joined_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('left_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('duration_minutes', sa.Integer(), nullable=True),
+        sa.Column(
+            'is_valid', sa.Boolean(), server_default=sa.text('true'), nullable=False
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'user_id',
+            'discord_channel_id',
+            'joined_at',
+            name='uq_attendance_logs_user_channel_joined',
+        ),
+    )
+    op.create_index(
+        'ix_attendance_logs_user_id_joined_at',
+        'attendance_logs',
+        ['user_id', 'joined_at'],
+    )
+    op.create_index(
+        'ix_attendance_logs_user_id_open',
+        'attendance_logs',
+        ['user_id'],
+        postgresql_where=sa.text('left_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_attendance_logs_user_id_open', table_name='attendance_logs')
+    op.drop_index('ix_attendance_logs_user_id_joined_at', table_name='attendance_logs')
+    op.drop_table('attendance_logs')
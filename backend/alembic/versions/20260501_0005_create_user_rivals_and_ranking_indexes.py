@@ -0,0 +1,77 @@
+"""create user rivals and ranking indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-05-01 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: str | None = '0004'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'user_rivals',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'user_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column(
+            'rival_user_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'rival_user_id', name='uq_user_rivals_user_rival'),
+        sa.CheckConstraint('user_id <> rival_user_id', name='ck_user_rivals_not_self'),
+    )
+
+    # ランキングの差分更新（前回以降に更新された行の取得）用
+    op.create_index(
+        'ix_attendance_statistics_updated_at', 'attendance_statistics', ['updated_at']
+    )
+    op.create_index(
+        'ix_attendance_summaries_updated_at', 'attendance_summaries', ['updated_at']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_attendance_summaries_updated_at', table_name='attendance_summaries')
+    op.drop_index(
+        'ix_attendance_statistics_updated_at', table_name='attendance_statistics'
+    )
+    op.drop_table('user_rivals')
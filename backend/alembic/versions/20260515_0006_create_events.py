@@ -0,0 +1,151 @@
+"""create events and event participants
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-05-15 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: str | None = '0005'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'events',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'creator_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.id', ondelete='SET NULL'),
+            nullable=True,
+        ),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column(
+            'event_type',
+            sa.String(length=50),
+            server_default='general',
+            nullable=False,
+        ),
+        sa.Column('scheduled_date', sa.Date(), nullable=False),
+        sa.Column('start_time', sa.Time(), nullable=False),
+        sa.Column('end_time', sa.Time(), nullable=False),
+        sa.Column('max_participants', sa.Integer(), nullable=True),
+        sa.Column(
+            'participant_count', sa.Integer(), server_default=sa.text('0'), nullable=False
+        ),
+        sa.Column(
+            'is_recurring', sa.Boolean(), server_default=sa.text('false'), nullable=False
+        ),
+        sa.Column('recurrence_pattern', sa.String(length=50), nullable=True),
+        sa.Column('discord_channel_id', sa.String(length=255), nullable=True),
+        sa.Column(
+            'is_active', sa.Boolean(), server_default=sa.text('true'), nullable=False
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.CheckConstraint(
+            'max_participants IS NULL OR max_participants > 0',
+            name='ck_events_max_participants_positive',
+        ),
+        sa.CheckConstraint(
+            'participant_count >= 0', name='ck_events_participant_count_non_negative'
+        ),
+    )
+
+    op.create_table(
+        'event_participants',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'event_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('events.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column(
+            'user_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column(
+            'status',
+            sa.String(length=20),
+            server_default='registered',
+            nullable=False,
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'event_id', 'user_id', name='uq_event_participants_event_user'
+        ),
+        sa.CheckConstraint(
+            "status IN ('registered', 'cancelled')",
+            name='ck_event_participants_status',
+        ),
+    )
+    op.create_index('ix_event_participants_user_id', 'event_participants', ['user_id'])
+
+    # attendance_logs 作成時に保留していた外部キー
+    op.create_foreign_key(
+        'attendance_logs_event_id_fkey',
+        'attendance_logs',
+        'events',
+        ['event_id'],
+        ['id'],
+        ondelete='SET NULL',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        'attendance_logs_event_id_fkey', 'attendance_logs', type_='foreignkey'
+    )
+    op.drop_index('ix_event_participants_user_id', table_name='event_participants')
+    op.drop_table('event_participants')
+    op.drop_table('events')
@@ -0,0 +1,43 @@
+"""add event schedule indexes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-06-01 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: str | None = '0006'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GET /events: 単発イベントを (開催日, 開始時刻, ID) の順に流し読みする
+    op.create_index(
+        'ix_events_one_off_schedule',
+        'events',
+        ['scheduled_date', 'start_time', 'id'],
+        postgresql_where=sa.text('is_active AND NOT is_recurring'),
+    )
+    # GET /events: 期間内に開催回がありうる定期開催イベント（行を展開せずに取得する）
+    op.create_index(
+        'ix_events_recurring',
+        'events',
+        ['scheduled_date'],
+        postgresql_where=sa.text('is_active AND is_recurring'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_recurring', table_name='events')
+    op.drop_index('ix_events_one_off_schedule', table_name='events')
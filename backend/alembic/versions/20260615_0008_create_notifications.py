@@ -0,0 +1,172 @@
+"""create notifications and notification settings
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-06-15 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: str | None = '0007'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'notifications',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'user_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column('type', sa.String(length=50), nullable=False),
+        sa.Column(
+            'audience', sa.String(length=20), server_default='user', nullable=False
+        ),
+        sa.Column(
+            'source_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('notifications.id', ondelete='CASCADE'),
+            nullable=True,
+        ),
+        sa.Column('title', sa.String(length=100), nullable=False),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('data', postgresql.JSONB(), nullable=True),
+        sa.Column(
+            'is_read', sa.Boolean(), server_default=sa.text('false'), nullable=False
+        ),
+        sa.Column('scheduled_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.CheckConstraint(
+            "type IN ('achievement', 'reminder', 'rival_update', 'event')",
+            name='ck_notifications_type',
+        ),
+        sa.CheckConstraint(
+            "audience IN ('user', 'rival_followers')", name='ck_notifications_audience'
+        ),
+    )
+    op.create_index(
+        'ix_notifications_user_id_created_at', 'notifications', ['user_id', 'created_at']
+    )
+    # 配信ワーカーが未送信の通知を FOR UPDATE SKIP LOCKED で確保する
+    op.create_index(
+        'ix_notifications_pending',
+        'notifications',
+        ['scheduled_at'],
+        postgresql_where=sa.text('sent_at IS NULL'),
+    )
+    op.create_index(
+        'uq_notifications_source_user',
+        'notifications',
+        ['source_id', 'user_id'],
+        unique=True,
+        postgresql_where=sa.text('source_id IS NOT NULL'),
+    )
+    op.create_index(
+        'uq_notifications_reminder',
+        'notifications',
+        ['user_id', 'scheduled_at'],
+        unique=True,
+        postgresql_where=sa.text("type = 'reminder'"),
+    )
+
+    op.create_table(
+        'notification_settings',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'user_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column(
+            'achievement_enabled',
+            sa.Boolean(),
+            server_default=sa.text('true'),
+            nullable=False,
+        ),
+        sa.Column(
+            'reminder_enabled',
+            sa.Boolean(),
+            server_default=sa.text('true'),
+            nullable=False,
+        ),
+        sa.Column(
+            'rival_update_enabled',
+            sa.Boolean(),
+            server_default=sa.text('true'),
+            nullable=False,
+        ),
+        sa.Column(
+            'event_reminder_enabled',
+            sa.Boolean(),
+            server_default=sa.text('true'),
+            nullable=False,
+        ),
+        sa.Column(
+            'reminder_time', sa.Time(), server_default=sa.text("'21:00'"), nullable=False
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id'),
+    )
+
+    # ライバル更新・称号獲得の通知を、ライバルに設定している側へ届ける
+    op.create_index('ix_user_rivals_rival_user_id', 'user_rivals', ['rival_user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_rivals_rival_user_id', table_name='user_rivals')
+    op.drop_table('notification_settings')
+    op.drop_index('uq_notifications_reminder', table_name='notifications')
+    op.drop_index('uq_notifications_source_user', table_name='notifications')
+    op.drop_index('ix_notifications_pending', table_name='notifications')
+    op.drop_index('ix_notifications_user_id_created_at', table_name='notifications')
+    op.drop_table('notifications')
@@ -0,0 +1,67 @@
+"""add notification unread counters
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-07-01 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: str | None = '0008'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 未読の通知一覧（read=false）と未読数の数え直し
+    op.create_index(
+        'ix_notifications_unread',
+        'notifications',
+        ['user_id', 'created_at'],
+        postgresql_where=sa.text('is_read = false'),
+    )
+
+    op.create_table(
+        'notification_counters',
+        sa.Column(
+            'user_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column(
+            'unread_count', sa.Integer(), server_default=sa.text('0'), nullable=False
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('user_id'),
+        sa.CheckConstraint(
+            'unread_count >= 0', name='ck_notification_counters_unread_count'
+        ),
+    )
+    # 既存の通知から未読数を作る（本人宛てで送信済みの未読の通知）
+    op.execute(
+        'INSERT INTO notification_counters (user_id, unread_count) '
+        'SELECT user_id, count(*) FROM notifications '
+        "WHERE is_read = false AND audience = 'user' AND sent_at IS NOT NULL "
+        'GROUP BY user_id'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('notification_counters')
+    op.drop_index('ix_notifications_unread', table_name='notifications')
@@ -0,0 +1,46 @@
+import datetime as dt
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from app.domain.entities.ranking import RankingType
+from app.domain.services.leaderboard import LeaderboardEntry
+
+
+@dataclass(frozen=True, slots=True)
+class RankingSnapshot:
+    """ランキングの1ページと、指定ユーザーの順位（同じ時点の値）"""
+
+    entries: list[LeaderboardEntry]
+    total: int
+    ranks: dict[UUID, LeaderboardEntry | None] = field(default_factory=dict)
+
+
+class ILeaderboardProvider(ABC):
+    """事前に並べておいたランキングを返すインターフェース"""
+
+    @abstractmethod
+    def get_ranking(
+        self,
+        ranking_type: RankingType,
+        offset: int,
+        limit: int,
+        user_ids: Sequence[UUID] = (),
+        month: dt.date | None = None,
+    ) -> RankingSnapshot:
+        """
+        ランキングの1ページと指定ユーザーの順位を取得
+
+        Args:
+            ranking_type: ランキングの種類
+            offset: オフセット
+            limit: 取得件数
+            user_ids: 順位も取得するユーザー（本人・ライバル）
+            month: 月間ランキングの対象月（1日の日付。None なら当月）
+
+        Returns:
+            RankingSnapshot: ランキングの1ページと指定ユーザーの順位
+                （ランキング外のユーザーは None）
+        """
+        pass
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import Enum
+
+
+class CacheNamespace(str, Enum):
+    """
+    レスポンスキャッシュの無効化の単位
+
+    書き込みを行うユースケースは、影響するネームスペースをコミット後に無効化する。
+    """
+
+    USERS = 'users'  # メンバー一覧・ユーザー詳細（参加日数・称号を含む）
+    RANKING = 'ranking'
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """キャッシュしたレスポンス本文と、その強いETag"""
+
+    body: bytes
+    etag: str
+
+
+class IResponseCache(ABC):
+    """
+    読み取りの多いエンドポイントのレスポンスキャッシュのインターフェース
+
+    ネームスペースごとに世代番号を持ち、キーに世代番号を含める。
+    無効化は世代番号を進めるだけで、古い世代のエントリは TTL・LRU で消える。
+    """
+
+    @abstractmethod
+    def generations(self, namespaces: Sequence[CacheNamespace]) -> tuple[int, ...] | None:
+        """ネームスペースごとの現在の世代番号（キャッシュが使えない場合はNone）"""
+        pass
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """キャッシュ済みのレスポンス（ない・期限切れの場合はNone）"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None:
+        """レスポンスを ttl 秒キャッシュ"""
+        pass
+
+    @abstractmethod
+    def invalidate(self, *namespaces: CacheNamespace) -> None:
+        """ネームスペースのキャッシュを無効化（世代番号を進める）"""
+        pass
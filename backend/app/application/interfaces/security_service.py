@@ -35,6 +35,35 @@ class ISecurityService(ABC):
         """
         pass
 
+    @abstractmethod
+    def verify_and_update_password(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        パスワードを検証し、ハッシュのコストが設定より低ければ再ハッシュする
+
+        Args:
+            plain_password: 平文パスワード
+            hashed_password: ハッシュ化されたパスワード
+
+        Returns:
+            tuple[bool, str | None]: (一致したか, 新しいハッシュ。再ハッシュ不要なら None)
+        """
+        pass
+
+    @abstractmethod
+    def dummy_password_hash(self) -> str:
+        """
+        ユーザーが存在しない場合の検証に使うハッシュ
+
+        存在するユーザーと同じコストで検証させ、応答時間からメールアドレスの
+        登録有無を推測されないようにする。
+
+        Returns:
+            str: 設定どおりのコストの、誰のパスワードとも一致しないハッシュ
+        """
+        pass
+
     @abstractmethod
     def hash_password(self, plain_password: str) -> str:
         """
@@ -47,3 +76,32 @@ class ISecurityService(ABC):
             str: ハッシュ化されたパスワード
         """
         pass
+
+    @abstractmethod
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """
+        パスワードを検証（async def のエンドポイント用、イベントループをブロックしない）
+
+        Args:
+            plain_password: 平文パスワード
+            hashed_password: ハッシュ化されたパスワード
+
+        Returns:
+            bool: パスワードが一致するかどうか
+        """
+        pass
+
+    @abstractmethod
+    async def hash_password_async(self, plain_password: str) -> str:
+        """
+        パスワードをハッシュ化（async def のエンドポイント用、イベントループをブロックしない）
+
+        Args:
+            plain_password: 平文パスワード
+
+        Returns:
+            str: ハッシュ化されたパスワード
+        """
+        pass
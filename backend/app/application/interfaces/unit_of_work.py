@@ -1,8 +1,18 @@
 from abc import ABC, abstractmethod
-from contextlib import AbstractContextManager
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import TypeVar
 
+T = TypeVar('T')
 
-class IUnitOfWork(ABC, AbstractContextManager):
+
+class TransactionConflictError(Exception):
+    """デッドロック・ロック競合が解消せず、トランザクションを完了できなかった"""
+
+    pass
+
+
+class IUnitOfWork(AbstractContextManager, ABC):
     """
     トランザクション管理のインターフェース
 
@@ -10,6 +20,10 @@ class IUnitOfWork(ABC, AbstractContextManager):
         with uow:
             user = user_repository.create(new_user)
             uow.commit()
+
+    デッドロック時に自動リトライさせたい場合は run() を使う:
+        with uow:
+            user = uow.run(lambda: user_repository.create(new_user))
     """
 
     @abstractmethod
@@ -19,6 +33,25 @@ class IUnitOfWork(ABC, AbstractContextManager):
         """
         pass
 
+    @abstractmethod
+    def run(self, work: Callable[[], T]) -> T:
+        """
+        work を実行してコミットする
+
+        デッドロック・ロック競合が発生した場合はロールバックし、
+        work をはじめからやり直す。
+
+        Args:
+            work: トランザクション内で実行する処理
+
+        Returns:
+            T: work の戻り値
+
+        Raises:
+            TransactionConflictError: リトライ回数・期限を超えた場合
+        """
+        pass
+
     @abstractmethod
     def rollback(self) -> None:
         """トランザクションをロールバックする"""
@@ -43,3 +76,69 @@ class IUnitOfWork(ABC, AbstractContextManager):
         例外が発生した場合は自動的にロールバックする
         """
         pass
+
+
+class IAsyncUnitOfWork(AbstractAsyncContextManager, ABC):
+    """
+    非同期トランザクション管理のインターフェース
+
+    使用例:
+        async with uow:
+            user = await user_repository.create(new_user)
+            await uow.commit()
+
+    デッドロック時に自動リトライさせたい場合は run() を使う:
+        async with uow:
+            user = await uow.run(lambda: user_repository.create(new_user))
+    """
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """
+        トランザクションをコミットする
+        """
+        pass
+
+    @abstractmethod
+    async def run(self, work: Callable[[], Awaitable[T]]) -> T:
+        """
+        work を実行してコミットする
+
+        デッドロック・ロック競合が発生した場合はロールバックし、
+        work をはじめからやり直す（待機中もイベントループは止めない）。
+
+        Args:
+            work: トランザクション内で実行する処理（コルーチン関数）
+
+        Returns:
+            T: work の戻り値
+
+        Raises:
+            TransactionConflictError: リトライ回数・期限を超えた場合
+        """
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """トランザクションをロールバックする"""
+        pass
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """
+        変更をデータベースに送信するがコミットはしない
+        """
+        pass
+
+    @abstractmethod
+    async def __aenter__(self):
+        """非同期コンテキストマネージャー開始"""
+        pass
+
+    @abstractmethod
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        非同期コンテキストマネージャー終了
+        例外が発生した場合は自動的にロールバックする
+        """
+        pass
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.domain.entities.attendance import AttendanceEventType
+
+
+class AttendanceEventInputDTO(BaseModel):
+    """Discord の入退室イベント（Discord User ID のまま受け取る）"""
+
+    discord_user_id: str = Field(..., description='Discord User ID')
+    discord_channel_id: str = Field(..., description='DiscordチャンネルID')
+    type: AttendanceEventType = Field(..., description='入室 / 退室')
+    occurred_at: datetime = Field(..., description='発生日時（タイムゾーン付き）')
+
+
+class AttendanceIngestInputDTO(BaseModel):
+    """入退室イベント取り込みの入力DTO"""
+
+    events: list[AttendanceEventInputDTO] = Field(
+        default_factory=list, description='入退室イベント'
+    )
+
+
+class AttendanceIngestOutputDTO(BaseModel):
+    """入退室イベント取り込みの出力DTO"""
+
+    received: int = Field(..., description='受け取ったイベント数')
+    unknown_users: int = Field(0, description='未連携のDiscordユーザーのイベント数')
+    logs_written: int = Field(0, description='作成・更新した参加ログ数')
+    summaries_written: int = Field(0, description='作成・更新した日次サマリー数')
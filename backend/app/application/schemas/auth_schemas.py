@@ -1,32 +1,39 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
+# 認証ユースケースの入出力はプレゼンテーション層で検証済みの値だけを受け渡すため、
+# 検証のない frozen な dataclass にしている
 
-class LoginInputDTO(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class LoginInputDTO:
     """ログイン入力DTO"""
 
-    email: str = Field(..., description='メールアドレス')
-    password: str = Field(..., description='パスワード')
+    email: str  # メールアドレス
+    password: str  # パスワード
 
 
-class LoginOutputDTO(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LoginOutputDTO:
     """ログイン出力DTO"""
 
-    access_token: str = Field(..., description='アクセストークン')
-    user_id: str = Field(..., description='ユーザーID (UUID)')
+    access_token: str  # アクセストークン
+    user_id: str  # ユーザーID (UUID)
 
 
-class LogoutOutputDTO(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LogoutOutputDTO:
     """ログアウト出力DTO"""
 
-    message: str = Field(..., description='メッセージ')
+    message: str  # メッセージ
 
 
-class MeOutputDTO(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MeOutputDTO:
     """現在のユーザー情報出力DTO"""
 
-    id: str = Field(..., description='ユーザーID (UUID)')
-    email: str = Field(..., description='メールアドレス')
-    username: str | None = Field(None, description='ユーザー名')
-    avatar_url: str | None = Field(None, description='アバター画像URL')
-    discord_id: str | None = Field(None, description='Discord User ID')
-    is_active: bool = Field(..., description='アカウント有効状態')
+    id: str  # ユーザーID (UUID)
+    email: str  # メールアドレス
+    is_active: bool  # アカウント有効状態
+    username: str | None = None  # ユーザー名
+    avatar_url: str | None = None  # アバター画像URL
+    discord_id: str | None = None  # Discord User ID
@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.entities.event import (
+    EventOccurrence,
+    EventParticipantStatus,
+    EventStatus,
+    ParticipationOutcome,
+)
+
+# イベントの入出力はプレゼンテーション層で検証済みの値・DBの値だけを受け渡すため、
+# 検証のない frozen な dataclass にしている
+
+
+@dataclass(frozen=True, slots=True)
+class EventParticipationInputDTO:
+    """参加登録・参加ステータス更新の入力DTO"""
+
+    event_id: UUID  # イベントID
+    user_id: UUID  # 参加者のユーザーID
+    status: EventParticipantStatus = EventParticipantStatus.REGISTERED  # 更新後の状態
+
+
+@dataclass(frozen=True, slots=True)
+class EventParticipationOutputDTO:
+    """参加登録・参加ステータス更新の出力DTO"""
+
+    event_id: UUID  # イベントID
+    user_id: UUID  # 参加者のユーザーID
+    outcome: ParticipationOutcome  # 結果
+    status: EventParticipantStatus | None  # 処理後の参加状態（不成立なら None）
+    participant_count: int  # 処理後の参加者数
+    max_participants: int | None  # 最大参加者数（None は無制限）
+
+
+@dataclass(frozen=True, slots=True)
+class EventListInputDTO:
+    """イベント一覧取得の入力DTO"""
+
+    status: EventStatus | None = None  # 開催回の状態（None は絞り込まない）
+    creator_id: UUID | None = None  # 作成者のユーザーID
+    date_from: datetime | None = None  # 期間の開始（含む。None は既定の期間）
+    date_to: datetime | None = None  # 期間の終了（含まない。None は既定の期間）
+    limit: int = 20  # 取得件数
+    offset: int = 0  # オフセット
+
+
+@dataclass(frozen=True, slots=True)
+class EventListOutputDTO:
+    """イベント一覧取得の出力DTO"""
+
+    occurrences: list[EventOccurrence]  # 開始日時順の開催回
+    date_from: datetime  # 適用した期間の開始
+    date_to: datetime  # 適用した期間の終了
+    total: int  # 期間内の開催回の総数
+    limit: int  # 取得件数制限
+    offset: int  # オフセット
+    has_more: bool  # 次のページがあるか
@@ -0,0 +1,82 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from app.domain.entities.notification import Notification, NotificationType
+
+# 通知の入出力はプレゼンテーション層で検証済みの値・DBの値だけを受け渡し、配信・修復の
+# 結果はワーカーの内部だけで受け渡すため、検証のない dataclass にしている
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationListInputDTO:
+    """通知一覧取得の入力DTO"""
+
+    user_id: UUID  # ユーザーID
+    type: NotificationType | None = None  # 通知タイプ（None は絞り込まない）
+    is_read: bool | None = None  # 既読状態（None は絞り込まない）
+    limit: int = 20  # 取得件数
+    offset: int = 0  # オフセット
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationListOutputDTO:
+    """通知一覧取得の出力DTO"""
+
+    notifications: list[Notification]  # 新しい順の通知
+    unread_count: int  # 未読数
+    total: int  # 条件に合う通知の総数
+    limit: int  # 取得件数制限
+    offset: int  # オフセット
+    has_more: bool  # 次のページがあるか
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationReadInputDTO:
+    """既読ステータス更新の入力DTO"""
+
+    notification_id: UUID  # 通知ID
+    user_id: UUID  # 通知対象のユーザーID（本人）
+    is_read: bool  # 更新後の既読状態
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationReadOutputDTO:
+    """既読ステータス更新の出力DTO"""
+
+    notification: Notification  # 更新後の通知
+    unread_count: int  # 更新後の未読数
+
+
+@dataclass(slots=True)
+class NotificationDispatchOutputDTO:
+    """通知の配信結果（複数バッチの合計）"""
+
+    claimed_ids: list[UUID] = field(default_factory=list)  # 確保した通知のID
+    delivered: int = 0  # 本人に届けた通知の数
+    suppressed: int = 0  # 通知設定で無効のため削除した通知の数
+    fanout_sources: int = 0  # 複製して届けた元の通知の数
+    fanout_deliveries: int = 0  # 複製して登録した通知の数
+    batches: int = 0  # 通知を確保できたトランザクションの数
+
+    @property
+    def claimed(self) -> int:
+        """確保した通知の数"""
+        return len(self.claimed_ids)
+
+    def add(self, other: 'NotificationDispatchOutputDTO') -> None:
+        """other の結果を合計に加える"""
+        self.claimed_ids.extend(other.claimed_ids)
+        self.delivered += other.delivered
+        self.suppressed += other.suppressed
+        self.fanout_sources += other.fanout_sources
+        self.fanout_deliveries += other.fanout_deliveries
+        self.batches += other.batches
+
+
+@dataclass(slots=True)
+class NotificationCounterRepairOutputDTO:
+    """未読数の修復結果（全バッチの合計）"""
+
+    checked: int = 0  # 確認したユーザー数
+    corrected: int = 0  # 未読数がずれていたため直したユーザー数
+    batches: int = 0  # バッチ（トランザクション）の数
@@ -0,0 +1,46 @@
+import datetime as dt
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from app.domain.entities.ranking import RankingType
+
+# ランキングの入出力はプレゼンテーション層で検証済みの値・DBの値だけを受け渡すため、
+# 検証のない frozen な dataclass にしている
+
+
+@dataclass(frozen=True, slots=True)
+class RankingInputDTO:
+    """ランキング取得の入力DTO"""
+
+    ranking_type: RankingType  # ランキングの種類
+    user_id: UUID  # リクエストしたユーザーのID
+    month: dt.date | None = None  # 月間ランキングの対象月（1日）
+    limit: int = 50  # 取得件数
+    offset: int = 0  # オフセット
+
+
+@dataclass(frozen=True, slots=True)
+class RankingItemDTO:
+    """ランキングの1行"""
+
+    rank: int  # 順位（同点は同順位）
+    user_id: UUID  # ユーザーID
+    score: int  # 参加日数 / 連続参加日数
+    username: str = ''  # ユーザー名
+    avatar_url: str | None = None  # アバター画像URL
+
+
+@dataclass(frozen=True, slots=True)
+class RankingOutputDTO:
+    """ランキング取得の出力DTO"""
+
+    ranking_type: RankingType  # ランキングの種類
+    total: int  # ランキング対象の人数
+    limit: int  # 取得件数制限
+    offset: int  # オフセット
+    has_more: bool  # 次のページがあるか
+    month: dt.date | None = None  # 月間ランキングの対象月
+    rankings: list[RankingItemDTO] = field(default_factory=list)  # ランキング
+    me: RankingItemDTO | None = None  # 自分の順位（ランキング外はNone）
+    # ライバルの順位（ランキング外は含まない）
+    rivals: list[RankingItemDTO] = field(default_factory=list)
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+
+from app.domain.entities.user_profile import UserProfile
+
+# メンバー一覧の入出力はプレゼンテーション層で検証済みの値と、リポジトリが DB の値から
+# 作ったエンティティだけを受け渡すため、検証のない frozen な dataclass にしている
+
+
+@dataclass(frozen=True, slots=True)
+class UserListInputDTO:
+    """メンバー一覧取得の入力DTO"""
+
+    search: str | None = None  # キーワード（表示名・一言プロフィール）
+    skills: list[str] = field(default_factory=list)  # スキル（OR検索）
+    interests: list[str] = field(default_factory=list)  # 興味・関心（OR検索）
+    title_levels: list[int] = field(default_factory=list)  # 称号レベル（OR検索）
+    limit: int = 20  # 取得件数
+    cursor: str | None = None  # 前ページの next_cursor
+    include_total: bool = False  # 総件数を数えるか
+
+
+@dataclass(frozen=True, slots=True)
+class UserListOutputDTO:
+    """メンバー一覧取得の出力DTO"""
+
+    limit: int  # 取得件数制限
+    has_more: bool  # 次のページがあるか
+    users: list[UserProfile] = field(default_factory=list)  # ユーザー一覧
+    next_cursor: str | None = None  # 次ページのカーソル
+    total: int | None = None  # 総件数（include_total のときのみ）
+    total_capped: bool = False  # 総件数が上限で打ち切られたか
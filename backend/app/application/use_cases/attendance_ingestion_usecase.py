@@ -0,0 +1,193 @@
+import datetime as dt
+import logging
+from collections import defaultdict
+from uuid import UUID
+
+from app.application.interfaces.response_cache import CacheNamespace, IResponseCache
+from app.application.interfaces.unit_of_work import IUnitOfWork
+from app.application.schemas.attendance_schemas import (
+    AttendanceIngestInputDTO,
+    AttendanceIngestOutputDTO,
+)
+from app.domain.entities.attendance import (
+    AttendanceEvent,
+    AttendanceLog,
+    AttendanceSummary,
+)
+from app.domain.repositories.attendance_log_repository import IAttendanceLogRepository
+from app.domain.repositories.attendance_repository import IAttendanceRepository
+from app.domain.repositories.user_repository import IUserRepository
+from app.domain.services.attendance_session_service import (
+    AttendancePolicy,
+    build_logs,
+    summarize_day,
+)
+from app.domain.services.attendance_statistics_service import (
+    AttendanceStatisticsService,
+)
+from app.domain.services.title_service import TitleAwardService
+
+logger = logging.getLogger(__name__)
+
+
+class AttendanceIngestionUsecase:
+    """
+    Discord の入退室イベントの取り込みユースケース
+
+    1バッチを1トランザクションで処理し、書き込みはテーブルごとに複数行の
+    INSERT ... ON CONFLICT を1文ずつ発行する（イベント数に比例した往復をしない）。
+    """
+
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        attendance_log_repository: IAttendanceLogRepository,
+        attendance_repository: IAttendanceRepository,
+        unit_of_work: IUnitOfWork,
+        policy: AttendancePolicy | None = None,
+        statistics_service: AttendanceStatisticsService | None = None,
+        title_award_service: TitleAwardService | None = None,
+        response_cache: IResponseCache | None = None,
+    ):
+        self.user_repository = user_repository
+        self.attendance_log_repository = attendance_log_repository
+        self.attendance_repository = attendance_repository
+        self.unit_of_work = unit_of_work
+        self.policy = policy or AttendancePolicy()
+        self.statistics_service = statistics_service or AttendanceStatisticsService()
+        self.title_award_service = title_award_service
+        self.response_cache = response_cache
+
+    def ingest(self, input_dto: AttendanceIngestInputDTO) -> AttendanceIngestOutputDTO:
+        """
+        入退室イベントのバッチを参加ログ・日次サマリー・参加統計に反映
+
+        1. Discord User ID をユーザーIDに変換（未連携のユーザーのイベントは無視）
+        2. 対象ユーザーの参加統計をロック（同じユーザーのバッチを直列化する）
+        3. 参加中のログと合わせて入退室を参加ログにまとめ、UPSERT
+        4. 退出済みのログがある日の日次サマリーを計算し直し、変化したものだけ UPSERT
+        5. 変化した日を参加統計に差分で反映し、新しく到達した称号を付与
+        """
+
+        def work() -> AttendanceIngestOutputDTO:
+            return self._ingest(input_dto)
+
+        output_dto = self.unit_of_work.run(work)
+        # コミット後に無効化する（コミット前の値を新しい世代でキャッシュさせない）
+        if self.response_cache is not None and output_dto.summaries_written:
+            self.response_cache.invalidate(CacheNamespace.USERS, CacheNamespace.RANKING)
+        logger.info(
+            '参加ログを取り込みました: events=%d unknown=%d logs=%d summaries=%d',
+            output_dto.received,
+            output_dto.unknown_users,
+            output_dto.logs_written,
+            output_dto.summaries_written,
+        )
+        return output_dto
+
+    def _ingest(self, input_dto: AttendanceIngestInputDTO) -> AttendanceIngestOutputDTO:
+        user_ids = self.user_repository.get_ids_by_discord_ids(
+            list({event.discord_user_id for event in input_dto.events})
+        )
+        events = [
+            AttendanceEvent(
+                user_id=user_ids[event.discord_user_id],
+                discord_channel_id=event.discord_channel_id,
+                type=event.type,
+                occurred_at=event.occurred_at,
+            )
+            for event in input_dto.events
+            if event.discord_user_id in user_ids
+        ]
+        output_dto = AttendanceIngestOutputDTO(
+            received=len(input_dto.events),
+            unknown_users=len(input_dto.events) - len(events),
+        )
+        if not events:
+            return output_dto
+
+        statistics = self.attendance_repository.get_statistics_for_update_many(
+            {event.user_id for event in events}
+        )
+
+        logs = self._dedupe(
+            build_logs(
+                events,
+                self.attendance_log_repository.get_open_logs(statistics.keys()),
+                self.policy,
+            )
+        )
+        self.attendance_log_repository.upsert_logs(logs)
+        output_dto.logs_written = len(logs)
+
+        days = {
+            (log.user_id, self.policy.local_date(log.joined_at))
+            for log in logs
+            if log.left_at is not None
+        }
+        if not days:
+            return output_dto
+
+        previous = self.attendance_repository.get_summaries(days)
+        changed = [
+            summary
+            for summary in self._summarize(days)
+            if previous.get((summary.user_id, summary.date)) != summary
+        ]
+        self.attendance_repository.upsert_summaries(changed)
+        output_dto.summaries_written = len(changed)
+
+        changes_by_user: dict[
+            UUID, list[tuple[AttendanceSummary | None, AttendanceSummary]]
+        ] = defaultdict(list)
+        for summary in changed:
+            changes_by_user[summary.user_id].append(
+                (previous.get((summary.user_id, summary.date)), summary)
+            )
+        updated = [
+            self.statistics_service.apply_many(
+                statistics[user_id], changes, self._attended_dates_loader(user_id)
+            )
+            for user_id, changes in changes_by_user.items()
+        ]
+        self.attendance_repository.save_statistics_many(updated)
+        if self.title_award_service is not None:
+            self.title_award_service.award(updated)
+        return output_dto
+
+    def _summarize(self, days: set[tuple[UUID, dt.date]]) -> list[AttendanceSummary]:
+        """対象日の参加ログを1回で読み、(ユーザー, 日付) ごとにサマリーを計算"""
+        dates = [day for _, day in days]
+        start, _ = self.policy.day_range(min(dates))
+        _, end = self.policy.day_range(max(dates))
+        logs_by_day: dict[tuple[UUID, dt.date], list[AttendanceLog]] = defaultdict(list)
+        for log in self.attendance_log_repository.list_logs(
+            {user_id for user_id, _ in days}, start, end
+        ):
+            key = (log.user_id, self.policy.local_date(log.joined_at))
+            if key in days:
+                logs_by_day[key].append(log)
+
+        return [
+            summarize_day(user_id, day, logs_by_day[(user_id, day)], self.policy)
+            for user_id, day in sorted(days)
+        ]
+
+    def _attended_dates_loader(self, user_id: UUID):
+        def load(start: dt.date, end: dt.date) -> set[dt.date]:
+            return self.attendance_repository.get_attended_dates(user_id, start, end)
+
+        return load
+
+    @staticmethod
+    def _dedupe(logs: list[AttendanceLog]) -> list[AttendanceLog]:
+        """
+        競合キーの重複を除き、キー順に並べる
+
+        1文の UPSERT で同じ行を2回更新できないため重複を除く。
+        キー順に書き込むことで、同時に実行されるバッチ間の行ロックの順序を揃える。
+        """
+        unique = {
+            (log.user_id, log.discord_channel_id, log.joined_at): log for log in logs
+        }
+        return [unique[key] for key in sorted(unique)]
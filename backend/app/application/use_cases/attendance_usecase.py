@@ -0,0 +1,85 @@
+import logging
+from uuid import UUID
+
+from app.application.interfaces.response_cache import CacheNamespace, IResponseCache
+from app.application.interfaces.unit_of_work import IUnitOfWork
+from app.domain.entities.attendance import AttendanceStatistics, AttendanceSummary
+from app.domain.repositories.attendance_repository import IAttendanceRepository
+from app.domain.services.attendance_statistics_service import (
+    AttendanceStatisticsService,
+    recompute_statistics,
+)
+from app.domain.services.title_service import TitleAwardService
+
+logger = logging.getLogger(__name__)
+
+
+class AttendanceUsecase:
+    """参加記録ユースケース"""
+
+    def __init__(
+        self,
+        attendance_repository: IAttendanceRepository,
+        unit_of_work: IUnitOfWork,
+        statistics_service: AttendanceStatisticsService | None = None,
+        title_award_service: TitleAwardService | None = None,
+        response_cache: IResponseCache | None = None,
+    ):
+        self.attendance_repository = attendance_repository
+        self.unit_of_work = unit_of_work
+        self.statistics_service = statistics_service or AttendanceStatisticsService()
+        self.title_award_service = title_award_service
+        self.response_cache = response_cache
+
+    def record_daily_summary(self, summary: AttendanceSummary) -> AttendanceStatistics:
+        """
+        1日分の参加サマリーを保存し、参加統計へ差分で反映（新しく到達した称号も付与）
+
+        参加統計の行ロックを先に取るため、同じユーザーの記録は直列に処理される。
+        """
+        repository = self.attendance_repository
+
+        def work() -> AttendanceStatistics:
+            statistics = repository.get_statistics_for_update(summary.user_id)
+            previous = repository.get_summary(summary.user_id, summary.date)
+            repository.upsert_summary(summary)
+            updated = self.statistics_service.apply(
+                statistics,
+                previous,
+                summary,
+                lambda start, end: repository.get_attended_dates(
+                    summary.user_id, start, end
+                ),
+            )
+            repository.save_statistics(updated)
+            self._award_titles(updated)
+            return updated
+
+        statistics = self.unit_of_work.run(work)
+        self._invalidate_cache()
+        return statistics
+
+    def rebuild_statistics(self, user_id: UUID) -> AttendanceStatistics:
+        """参加サマリー全件から参加統計を作り直す（データ修復用）"""
+        repository = self.attendance_repository
+
+        def work() -> AttendanceStatistics:
+            repository.get_statistics_for_update(user_id)
+            statistics = recompute_statistics(user_id, repository.list_summaries(user_id))
+            repository.save_statistics(statistics)
+            self._award_titles(statistics)
+            return statistics
+
+        statistics = self.unit_of_work.run(work)
+        self._invalidate_cache()
+        logger.info('参加統計を再計算しました: user_id=%s', user_id)
+        return statistics
+
+    def _award_titles(self, statistics: AttendanceStatistics) -> None:
+        if self.title_award_service is not None:
+            self.title_award_service.award([statistics])
+
+    def _invalidate_cache(self) -> None:
+        """参加日数・ランキングを含むレスポンスのキャッシュを無効化（コミット後に呼ぶ）"""
+        if self.response_cache is not None:
+            self.response_cache.invalidate(CacheNamespace.USERS, CacheNamespace.RANKING)
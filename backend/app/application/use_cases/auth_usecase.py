@@ -1,24 +1,22 @@
 import logging
-import uuid
+from dataclasses import replace
+from uuid import UUID
 
-# from app.domain.repositories.user_repository import IUserRepository
 from fastapi import HTTPException, status
 
 from app.application.interfaces.security_service import ISecurityService
+from app.application.interfaces.unit_of_work import IUnitOfWork
 from app.application.schemas.auth_schemas import (
     LoginInputDTO,
     LoginOutputDTO,
     LogoutOutputDTO,
     MeOutputDTO,
 )
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import IUserRepository
 
 logger = logging.getLogger(__name__)
 
-# 暫定的なテストユーザー（DB実装後に削除）
-TEST_USER_ID = '550e8400-e29b-41d4-a716-446655440000'
-TEST_USER_EMAIL = 'admin@example.com'
-TEST_USER_PASSWORD = 'password'
-
 
 class AuthUsecase:
     """認証ユースケース"""
@@ -26,53 +24,57 @@ class AuthUsecase:
     def __init__(
         self,
         security_service: ISecurityService,
-        # user_repository: IUserRepository  # 将来のDB認証用
+        user_repository: IUserRepository,
+        unit_of_work: IUnitOfWork | None = None,
     ):
         self.security_service = security_service
-        # self.user_repository = user_repository
+        self.user_repository = user_repository
+        self.unit_of_work = unit_of_work
 
     def login(self, input_dto: LoginInputDTO) -> LoginOutputDTO:
-        # ============================================================
-        # 【暫定実装】ハードコーディングでの認証
-        # ============================================================
-        if input_dto.email == TEST_USER_EMAIL and input_dto.password == TEST_USER_PASSWORD:
-            user_id = TEST_USER_ID
-            access_token = self.security_service.create_access_token(user_id=user_id)
-            logger.info('ログイン成功: %s', input_dto.email)
-
-            return LoginOutputDTO(access_token=access_token, user_id=user_id)
-        else:
-            # 認証失敗
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail='メールアドレスまたはパスワードが正しくありません',
+        """DBのユーザー情報で認証"""
+        authentication_error = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail='メールアドレスまたはパスワードが正しくありません',
+        )
+
+        user = self.user_repository.get_by_login_id(input_dto.email)
+        if user is None or not user.is_active:
+            # 存在するユーザーと同じコストの検証を行い、応答時間から
+            # メールアドレスの登録有無を推測されないようにする
+            self.security_service.verify_and_update_password(
+                input_dto.password, self.security_service.dummy_password_hash()
             )
+            raise authentication_error
+
+        is_authenticated, new_hash = self.security_service.verify_and_update_password(
+            input_dto.password, user.password_hash
+        )
+        if not is_authenticated:
+            raise authentication_error
+
+        # コスト設定が上がっていれば、平文パスワードがあるこのタイミングで再ハッシュする
+        if new_hash is not None:
+            self._rehash_password(replace(user, password_hash=new_hash))
 
-        # ============================================================
-        # 【将来実装】DBを使用した認証（参考実装）
-        # ============================================================
-        # user_data = self.user_repository.get_by_email(input_dto.email)
-        #
-        # if user_data is None:
-        #     raise HTTPException(
-        #         status_code=status.HTTP_401_UNAUTHORIZED,
-        #         detail="メールアドレスもしくはパスワードが違います。"
-        #     )
-        #
-        # is_authenticated = self.security_service.verify_password(
-        #     input_dto.password, user_data.password_hash
-        # )
-        # if not is_authenticated:
-        #     raise HTTPException(
-        #         status_code=status.HTTP_401_UNAUTHORIZED,
-        #         detail="メールアドレスもしくはパスワードが違います。"
-        #     )
-        #
-        # access_token = self.security_service.create_access_token(user_id=str(user_data.id))
-        # return LoginOutputDTO(
-        #     access_token=access_token,
-        #     user_id=str(user_data.id)
-        # )
+        user_id = str(user.id)
+        access_token = self.security_service.create_access_token(user_id=user_id)
+        logger.info('ログイン成功: %s', input_dto.email)
+        return LoginOutputDTO(access_token=access_token, user_id=user_id)
+
+    def _rehash_password(self, user: User) -> None:
+        """
+        再ハッシュしたパスワードを保存
+
+        失敗してもログイン自体は成功させる（次回ログイン時に再試行される）
+        """
+        if self.unit_of_work is None:
+            return
+        try:
+            self.unit_of_work.run(lambda: self.user_repository.update(user))
+            logger.info('パスワードハッシュを更新しました: %s', user.id)
+        except Exception:
+            logger.exception('パスワードハッシュの更新に失敗しました: %s', user.id)
 
     def logout(self) -> LogoutOutputDTO:
         """ログアウト処理（Cookieはエンドポイント側で削除）"""
@@ -81,32 +83,22 @@ class AuthUsecase:
 
     def get_me(self, user_id: str) -> MeOutputDTO:
         """現在のユーザー情報を取得"""
-        # ============================================================
-        # 【暫定実装】ハードコーディングでのユーザー情報
-        # ============================================================
-        return MeOutputDTO(
-            id=user_id,
-            email=TEST_USER_EMAIL,
-            username='Admin User',
-            avatar_url=None,
-            discord_id=None,
-            is_active=True,
+        not_found_error = HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='ユーザーが見つかりません',
         )
+        try:
+            user = self.user_repository.get_by_id(UUID(user_id))
+        except ValueError as e:
+            raise not_found_error from e
+        if user is None:
+            raise not_found_error
 
-        # ============================================================
-        # 【将来実装】DBからユーザー情報を取得
-        # ============================================================
-        # user_data = self.user_repository.get_by_id(uuid.UUID(user_id))
-        # if user_data is None:
-        #     raise HTTPException(
-        #         status_code=status.HTTP_404_NOT_FOUND,
-        #         detail="ユーザーが見つかりません"
-        #     )
-        # return MeOutputDTO(
-        #     id=str(user_data.id),
-        #     email=user_data.email,
-        #     username=user_data.username,
-        #     avatar_url=user_data.avatar_url,
-        #     discord_id=user_data.discord_id,
-        #     is_active=user_data.is_active,
-        # )
+        return MeOutputDTO(
+            id=str(user.id),
+            email=user.email,
+            username=user.username,
+            avatar_url=user.avatar_url,
+            discord_id=user.discord_id,
+            is_active=user.is_active,
+        )
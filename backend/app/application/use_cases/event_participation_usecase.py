@@ -0,0 +1,65 @@
+import logging
+
+from app.application.interfaces.unit_of_work import IUnitOfWork
+from app.application.schemas.event_schemas import (
+    EventParticipationInputDTO,
+    EventParticipationOutputDTO,
+)
+from app.domain.entities.event import EventParticipantStatus, ParticipationResult
+from app.domain.repositories.event_participant_repository import (
+    IEventParticipantRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class EventParticipationUsecase:
+    """
+    イベントへの参加登録・キャンセルのユースケース
+
+    定員の判定はリポジトリの条件付き UPDATE 1文で行うため、参加者を数えてから登録する
+    読み取りはしない（同時の申し込みでも定員を超えず、ロック待ちの順序も揃う）。
+    """
+
+    def __init__(
+        self,
+        event_participant_repository: IEventParticipantRepository,
+        unit_of_work: IUnitOfWork,
+    ):
+        self.event_participant_repository = event_participant_repository
+        self.unit_of_work = unit_of_work
+
+    def update_status(
+        self, input_dto: EventParticipationInputDTO
+    ) -> EventParticipationOutputDTO:
+        """
+        参加ステータスを更新（registered なら参加登録、cancelled ならキャンセル）
+
+        定員超過・登録済みなどで成立しなかった場合も例外にせず、結果を outcome で返す。
+        """
+
+        def work() -> ParticipationResult:
+            if input_dto.status == EventParticipantStatus.REGISTERED:
+                return self.event_participant_repository.register(
+                    input_dto.event_id, input_dto.user_id
+                )
+            return self.event_participant_repository.cancel(
+                input_dto.event_id, input_dto.user_id
+            )
+
+        result = self.unit_of_work.run(work)
+        logger.info(
+            'イベント参加ステータスを更新しました: event=%s user=%s outcome=%s count=%d',
+            result.event_id,
+            result.user_id,
+            result.outcome.value,
+            result.participant_count,
+        )
+        return EventParticipationOutputDTO(
+            event_id=result.event_id,
+            user_id=result.user_id,
+            outcome=result.outcome,
+            status=result.status,
+            participant_count=result.participant_count,
+            max_participants=result.max_participants,
+        )
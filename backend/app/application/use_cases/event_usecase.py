@@ -0,0 +1,71 @@
+import datetime as dt
+from itertools import islice
+
+from app.application.schemas.event_schemas import EventListInputDTO, EventListOutputDTO
+from app.domain.repositories.event_repository import IEventRepository
+from app.domain.services.event_schedule_service import (
+    EventSchedulePolicy,
+    count_occurrences,
+    expand,
+    merge_occurrences,
+)
+
+
+class EventUsecase:
+    """
+    イベント一覧のユースケース
+
+    定期開催のイベントは開催回の行を持たず、一覧の取得時に期間内の開催回だけを
+    生成器で展開する。単発イベントは開催日時順に流し読みし、heapq.merge で
+    開催回と1本に並べてからページを切り出すため、期間が何年でもメモリに載るのは
+    ページの分と各定期開催イベントの次の1回分だけになる。
+    """
+
+    def __init__(
+        self,
+        event_repository: IEventRepository,
+        policy: EventSchedulePolicy | None = None,
+    ):
+        self.event_repository = event_repository
+        self.policy = policy or EventSchedulePolicy()
+
+    def list_events(self, input_dto: EventListInputDTO) -> EventListOutputDTO:
+        """期間内の開催回を開始日時順に取得"""
+        zone = self.policy.zone
+        window = self.policy.window(
+            now=dt.datetime.now(dt.UTC),
+            status=input_dto.status,
+            date_from=input_dto.date_from,
+            date_to=input_dto.date_to,
+        )
+        first, last = window.dates(zone)
+        recurring = self.event_repository.list_recurring(last, input_dto.creator_id)
+
+        merged = merge_occurrences(
+            self.event_repository.iter_one_off(first, last, input_dto.creator_id),
+            recurring,
+            window,
+            zone,
+        )
+        start = input_dto.offset
+        occurrences = list(islice(merged, start, start + input_dto.limit))
+        merged.close()
+
+        # 総数は定期開催の開催回を計算で数え、単発イベントだけを流し読みして数える
+        total = sum(count_occurrences(event, window, zone) for event in recurring)
+        total += sum(
+            1
+            for event in self.event_repository.iter_one_off(
+                first, last, input_dto.creator_id
+            )
+            for _ in expand(event, window, zone)
+        )
+        return EventListOutputDTO(
+            occurrences=occurrences,
+            date_from=window.start,
+            date_to=window.end,
+            total=total,
+            limit=input_dto.limit,
+            offset=input_dto.offset,
+            has_more=input_dto.offset + len(occurrences) < total,
+        )
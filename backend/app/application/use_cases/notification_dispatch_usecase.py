@@ -0,0 +1,160 @@
+import datetime as dt
+import logging
+
+from app.application.interfaces.unit_of_work import IUnitOfWork
+from app.application.schemas.notification_schemas import NotificationDispatchOutputDTO
+from app.domain.entities.notification import NotificationAudience
+from app.domain.repositories.notification_repository import INotificationRepository
+from app.domain.repositories.notification_settings_repository import (
+    INotificationSettingsRepository,
+)
+from app.domain.repositories.user_rival_repository import IUserRivalRepository
+from app.domain.services.notification_dispatch_service import plan_dispatch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+REMINDER_TITLE = '朝活リマインダー'
+REMINDER_MESSAGE = '明日の朝活の準備をしましょう'
+
+
+class NotificationDispatchUsecase:
+    """
+    送信予定時刻を過ぎた通知を配信するユースケース（配信ワーカーから呼ぶ）
+
+    1トランザクションで batch_size 件の通知を FOR UPDATE SKIP LOCKED で確保し、
+    通知設定の確認・ライバルへの複製・送信済みへの更新までを行ってコミットする。
+    確保した行はコミットまでほかのワーカーから見えないため、ワーカーを複数同時に
+    動かしても二重に配信しない。通知設定はバッチ内のユーザーをまとめて1回で読む
+    （キャッシュ付きのリポジトリを渡せば、キャッシュにないユーザーだけを読む）。
+    """
+
+    def __init__(
+        self,
+        notification_repository: INotificationRepository,
+        notification_settings_repository: INotificationSettingsRepository,
+        user_rival_repository: IUserRivalRepository,
+        unit_of_work: IUnitOfWork,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.notification_repository = notification_repository
+        self.notification_settings_repository = notification_settings_repository
+        self.user_rival_repository = user_rival_repository
+        self.unit_of_work = unit_of_work
+        self.batch_size = batch_size
+
+    def dispatch_batch(
+        self, now: dt.datetime | None = None
+    ) -> NotificationDispatchOutputDTO:
+        """
+        通知を1バッチ分確保して配信
+
+        Args:
+            now: 基準日時（省略時は現在日時。送信予定時刻がこれ以前の通知を配信する）
+
+        Returns:
+            NotificationDispatchOutputDTO: 配信結果（確保できなければ0件）
+        """
+        now = now or dt.datetime.now(dt.UTC)
+
+        def work() -> NotificationDispatchOutputDTO:
+            claimed = self.notification_repository.claim_due(now, self.batch_size)
+            if not claimed:
+                return NotificationDispatchOutputDTO()
+
+            subjects = {
+                notification.user_id
+                for notification in claimed
+                if notification.audience == NotificationAudience.RIVAL_FOLLOWERS
+            }
+            followers = self.user_rival_repository.get_follower_ids(subjects)
+            recipients = {
+                notification.user_id
+                for notification in claimed
+                if notification.audience == NotificationAudience.USER
+            }
+            recipients.update(
+                user_id for user_ids in followers.values() for user_id in user_ids
+            )
+            plan = plan_dispatch(
+                claimed,
+                self.notification_settings_repository.get_many(recipients),
+                followers,
+            )
+
+            fanout_deliveries = sum(
+                self.notification_repository.insert_fanout(source, user_ids, now)
+                for source, user_ids in plan.fanouts
+                if user_ids
+            )
+            self.notification_repository.delete(plan.suppressed_ids)
+            self.notification_repository.mark_sent(
+                [*plan.delivered_ids, *(source.id for source, _ in plan.fanouts)], now
+            )
+            return NotificationDispatchOutputDTO(
+                claimed_ids=[notification.id for notification in claimed],
+                delivered=len(plan.delivered_ids),
+                suppressed=len(plan.suppressed_ids),
+                fanout_sources=len(plan.fanouts),
+                fanout_deliveries=fanout_deliveries,
+                batches=1,
+            )
+
+        return self.unit_of_work.run(work)
+
+    def dispatch_due(
+        self, now: dt.datetime | None = None, max_batches: int | None = None
+    ) -> NotificationDispatchOutputDTO:
+        """
+        確保できる通知がなくなるまでバッチを繰り返して配信
+
+        ほかのワーカーが確保中の通知は飛ばすため、複数のワーカーで同時に呼んでよい。
+
+        Args:
+            now: 基準日時（省略時はバッチごとの現在日時）
+            max_batches: 最大バッチ数（None は無制限）
+
+        Returns:
+            NotificationDispatchOutputDTO: 全バッチの配信結果の合計
+        """
+        total = NotificationDispatchOutputDTO()
+        while max_batches is None or total.batches < max_batches:
+            report = self.dispatch_batch(now)
+            if not report.claimed:
+                break
+            total.add(report)
+
+        if total.claimed:
+            logger.info(
+                '通知を配信しました: claimed=%d delivered=%d suppressed=%d '
+                'fanout=%d/%d batches=%d',
+                total.claimed,
+                total.delivered,
+                total.suppressed,
+                total.fanout_deliveries,
+                total.fanout_sources,
+                total.batches,
+            )
+        return total
+
+    def schedule_reminders(self, day: dt.date, timezone: str) -> int:
+        """
+        day のリマインダーを予約（各ユーザーのリマインダー送信時刻に配信される）
+
+        予約後にリマインダーを無効にしたユーザーの分は、配信時に通知設定で除く。
+        同じ日に再実行しても重複して予約しない。
+
+        Args:
+            day: リマインダーを送る日
+            timezone: リマインダー送信時刻を解釈するタイムゾーン
+
+        Returns:
+            int: 予約した件数
+        """
+        scheduled = self.unit_of_work.run(
+            lambda: self.notification_repository.schedule_reminders(
+                day, timezone, REMINDER_TITLE, REMINDER_MESSAGE
+            )
+        )
+        logger.info('リマインダーを予約しました: day=%s count=%d', day, scheduled)
+        return scheduled
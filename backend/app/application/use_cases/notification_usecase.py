@@ -0,0 +1,145 @@
+import logging
+from uuid import UUID
+
+from app.application.interfaces.unit_of_work import IUnitOfWork
+from app.application.schemas.notification_schemas import (
+    NotificationCounterRepairOutputDTO,
+    NotificationListInputDTO,
+    NotificationListOutputDTO,
+    NotificationReadInputDTO,
+    NotificationReadOutputDTO,
+)
+from app.domain.entities.notification import UnreadCountRepair
+from app.domain.repositories.notification_repository import INotificationRepository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPAIR_BATCH_SIZE = 1000
+
+
+class NotificationUsecase:
+    """
+    通知一覧・未読数・既読ステータス更新・削除のユースケース
+
+    未読数はリポジトリが通知の書き換えと同じトランザクションで増減する値を読むため、
+    一覧や未読バッジの表示のたびに通知を数えない。
+    """
+
+    def __init__(
+        self,
+        notification_repository: INotificationRepository,
+        unit_of_work: IUnitOfWork,
+    ):
+        self.notification_repository = notification_repository
+        self.unit_of_work = unit_of_work
+
+    def list_notifications(
+        self, input_dto: NotificationListInputDTO
+    ) -> NotificationListOutputDTO:
+        """
+        ユーザーの通知一覧を取得
+
+        未読のみ（タイプの絞り込みなし）の総数は未読数をそのまま使い、それ以外の条件の
+        場合だけユーザーの通知を数える。
+        """
+        repository = self.notification_repository
+        notifications = repository.list_for_user(
+            input_dto.user_id,
+            input_dto.type,
+            input_dto.is_read,
+            input_dto.limit,
+            input_dto.offset,
+        )
+        unread_count = repository.get_unread_count(input_dto.user_id)
+        if input_dto.is_read is False and input_dto.type is None:
+            total = unread_count
+        else:
+            total = repository.count_for_user(
+                input_dto.user_id, input_dto.type, input_dto.is_read
+            )
+        return NotificationListOutputDTO(
+            notifications=notifications,
+            unread_count=unread_count,
+            total=total,
+            limit=input_dto.limit,
+            offset=input_dto.offset,
+            has_more=input_dto.offset + len(notifications) < total,
+        )
+
+    def get_unread_count(self, user_id: UUID) -> int:
+        """ユーザーの未読数を取得"""
+        return self.notification_repository.get_unread_count(user_id)
+
+    def update_read(
+        self, input_dto: NotificationReadInputDTO
+    ) -> NotificationReadOutputDTO | None:
+        """
+        通知の既読ステータスを更新
+
+        Returns:
+            NotificationReadOutputDTO | None: 更新後の通知と未読数（見つからなければ None）
+        """
+
+        def work() -> NotificationReadOutputDTO | None:
+            notification = self.notification_repository.set_read(
+                input_dto.notification_id, input_dto.user_id, input_dto.is_read
+            )
+            if notification is None:
+                return None
+            return NotificationReadOutputDTO(
+                notification=notification,
+                unread_count=self.notification_repository.get_unread_count(
+                    input_dto.user_id
+                ),
+            )
+
+        return self.unit_of_work.run(work)
+
+    def delete_notification(self, notification_id: UUID, user_id: UUID) -> int | None:
+        """
+        通知を削除
+
+        Returns:
+            int | None: 削除後の未読数（見つからなければ None）
+        """
+
+        def work() -> int | None:
+            if not self.notification_repository.delete_for_user(notification_id, user_id):
+                return None
+            return self.notification_repository.get_unread_count(user_id)
+
+        return self.unit_of_work.run(work)
+
+    def repair_unread_counts(
+        self, batch_size: int = DEFAULT_REPAIR_BATCH_SIZE
+    ) -> NotificationCounterRepairOutputDTO:
+        """
+        全ユーザーの未読数を batch_size 人ずつ数え直し、ずれていれば直す
+
+        バッチごとにコミットするため、未読数の行をロックするのは1バッチ分の間だけになる。
+        """
+        total = NotificationCounterRepairOutputDTO()
+        after_user_id = None
+        while True:
+
+            def work(after_user_id=after_user_id) -> UnreadCountRepair:
+                return self.notification_repository.reconcile_unread_counts(
+                    after_user_id, batch_size
+                )
+
+            repair = self.unit_of_work.run(work)
+            if repair.last_user_id is None:
+                break
+            total.checked += repair.checked
+            total.corrected += repair.corrected
+            total.batches += 1
+            after_user_id = repair.last_user_id
+
+        log = logger.warning if total.corrected else logger.info
+        log(
+            '未読数を修復しました: checked=%d corrected=%d batches=%d',
+            total.checked,
+            total.corrected,
+            total.batches,
+        )
+        return total
@@ -0,0 +1,86 @@
+import logging
+
+from app.application.interfaces.leaderboard_provider import ILeaderboardProvider
+from app.application.schemas.ranking_schemas import (
+    RankingInputDTO,
+    RankingItemDTO,
+    RankingOutputDTO,
+)
+from app.domain.entities.ranking import RankingType
+from app.domain.repositories.user_repository import IUserRepository
+from app.domain.repositories.user_rival_repository import IUserRivalRepository
+from app.domain.services.leaderboard import LeaderboardEntry
+
+logger = logging.getLogger(__name__)
+
+
+class RankingUsecase:
+    """ランキングユースケース"""
+
+    def __init__(
+        self,
+        leaderboard_provider: ILeaderboardProvider,
+        user_repository: IUserRepository,
+        user_rival_repository: IUserRivalRepository,
+    ):
+        self.leaderboard_provider = leaderboard_provider
+        self.user_repository = user_repository
+        self.user_rival_repository = user_rival_repository
+
+    def get_ranking(self, input_dto: RankingInputDTO) -> RankingOutputDTO:
+        """
+        ランキングの1ページと、自分・ライバルの順位を取得
+
+        順位は事前に並べたランキングから引き、ユーザー情報はページ内・本人・ライバルの
+        分をまとめて1回で取得する。
+        """
+        rival_ids = self.user_rival_repository.get_rival_ids(input_dto.user_id)
+        month = input_dto.month if input_dto.ranking_type is RankingType.MONTHLY else None
+        snapshot = self.leaderboard_provider.get_ranking(
+            input_dto.ranking_type,
+            offset=input_dto.offset,
+            limit=input_dto.limit,
+            user_ids=[input_dto.user_id, *rival_ids],
+            month=month,
+        )
+
+        me = snapshot.ranks.get(input_dto.user_id)
+        rivals = [
+            entry
+            for rival_id in rival_ids
+            if (entry := snapshot.ranks.get(rival_id)) is not None
+        ]
+        users = {
+            user.id: user
+            for user in self.user_repository.get_many_by_ids(
+                list(
+                    {
+                        entry.user_id
+                        for entry in [*snapshot.entries, *rivals, me]
+                        if entry is not None
+                    }
+                )
+            )
+        }
+
+        def to_dto(entry: LeaderboardEntry) -> RankingItemDTO:
+            user = users.get(entry.user_id)
+            return RankingItemDTO(
+                rank=entry.rank,
+                user_id=entry.user_id,
+                username=(user.username or '') if user else '',
+                avatar_url=user.avatar_url if user else None,
+                score=entry.score,
+            )
+
+        return RankingOutputDTO(
+            ranking_type=input_dto.ranking_type,
+            month=month,
+            rankings=[to_dto(entry) for entry in snapshot.entries],
+            me=to_dto(me) if me else None,
+            rivals=[to_dto(entry) for entry in rivals],
+            total=snapshot.total,
+            limit=input_dto.limit,
+            offset=input_dto.offset,
+            has_more=input_dto.offset + len(snapshot.entries) < snapshot.total,
+        )
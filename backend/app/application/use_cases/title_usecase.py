@@ -0,0 +1,61 @@
+import logging
+
+from app.application.interfaces.response_cache import CacheNamespace, IResponseCache
+from app.application.interfaces.unit_of_work import IUnitOfWork
+from app.domain.repositories.attendance_repository import IAttendanceRepository
+from app.domain.services.title_service import TitleAwardService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class TitleUsecase:
+    """称号ユースケース"""
+
+    def __init__(
+        self,
+        attendance_repository: IAttendanceRepository,
+        title_award_service: TitleAwardService,
+        unit_of_work: IUnitOfWork,
+        response_cache: IResponseCache | None = None,
+    ):
+        self.attendance_repository = attendance_repository
+        self.title_award_service = title_award_service
+        self.unit_of_work = unit_of_work
+        self.response_cache = response_cache
+
+    def award_all(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        全ユーザーの称号を評価し直して付与（夜間バッチ）
+
+        参加統計をユーザーID順に chunk_size 件ずつ読み、チャンクごとに1トランザクションで
+        付与する。メモリとロックを持つ時間はチャンクの大きさまでに収まる。
+        参加記録の処理中でロックされているユーザーは飛ばす（その処理の中で付与される）。
+
+        Returns:
+            int: 称号を付与したユーザー数
+        """
+        repository = self.attendance_repository
+        after_user_id = None
+        awarded_users = 0
+        while True:
+
+            def work(after_user_id=after_user_id):
+                statistics = repository.list_statistics_for_update(
+                    after_user_id, chunk_size
+                )
+                awards = self.title_award_service.award(statistics)
+                last_user_id = statistics[-1].user_id if statistics else None
+                return last_user_id, len(statistics), len(awards)
+
+            after_user_id, read, awarded = self.unit_of_work.run(work)
+            awarded_users += awarded
+            if awarded and self.response_cache is not None:
+                # 現在の称号はメンバー一覧に含まれる
+                self.response_cache.invalidate(CacheNamespace.USERS)
+            if read < chunk_size:
+                break
+
+        logger.info('称号を評価しました: awarded_users=%d', awarded_users)
+        return awarded_users
@@ -0,0 +1,60 @@
+import logging
+
+from app.application.schemas.user_schemas import UserListInputDTO, UserListOutputDTO
+from app.domain.repositories.user_profile_repository import (
+    IUserProfileRepository,
+    UserProfileFilter,
+)
+
+logger = logging.getLogger(__name__)
+
+# 総件数を数える上限（これより多く一致する場合は上限で打ち切る）
+MAX_TOTAL_COUNT = 10000
+
+
+class UserUsecase:
+    """ユーザー（メンバー）ユースケース"""
+
+    def __init__(self, user_profile_repository: IUserProfileRepository):
+        self.user_profile_repository = user_profile_repository
+
+    def list_users(self, input_dto: UserListInputDTO) -> UserListOutputDTO:
+        """
+        メンバー一覧を取得
+
+        総件数は include_total のときだけ MAX_TOTAL_COUNT 件まで数える。
+        最初のページで全件が収まった場合は数えずにページの件数を使う。
+
+        Raises:
+            ValueError: カーソルが不正な場合
+        """
+        filter = UserProfileFilter(
+            search=input_dto.search,
+            skills=input_dto.skills,
+            interests=input_dto.interests,
+            title_levels=input_dto.title_levels,
+        )
+        page = self.user_profile_repository.search_profiles(
+            filter, limit=input_dto.limit, after_cursor=input_dto.cursor
+        )
+
+        total = None
+        total_capped = False
+        if input_dto.include_total:
+            if input_dto.cursor is None and page.next_cursor is None:
+                total = len(page.profiles)
+            else:
+                counted = self.user_profile_repository.count_profiles(
+                    filter, max_count=MAX_TOTAL_COUNT + 1
+                )
+                total_capped = counted > MAX_TOTAL_COUNT
+                total = min(counted, MAX_TOTAL_COUNT)
+
+        return UserListOutputDTO(
+            users=page.profiles,
+            limit=input_dto.limit,
+            next_cursor=page.next_cursor,
+            has_more=page.next_cursor is not None,
+            total=total,
+            total_capped=total_capped,
+        )
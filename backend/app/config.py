@@ -19,12 +19,99 @@ class Settings(BaseSettings):
     postgres_port: int = 5432
     stage: str = 'development'  # デフォルトは開発環境
     database_url: str = ''
+    # 非同期エンジン（asyncpg）用。空なら DATABASE_URL から導出する
+    async_database_url: str = ''
+    # 読み取り専用レプリカ（空ならプライマリで読み取る）
+    database_replica_url: str = ''
+    db_replica_sticky_seconds: float = 5.0  # 書き込み後にプライマリで読む時間（秒）
+    db_replica_sticky_secret: str = ''  # 上記の期限の Cookie の署名鍵（レプリカ時は必須）
+
+    # DB connection pool settings（uvicorn のワーカーごとに作成される）
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0  # 接続取得の待ち時間上限（秒）
+    db_pool_recycle: int = 1800  # 接続を作り直すまでの秒数
+    db_pool_pre_ping: bool = True  # チェックアウト時に接続の生存確認を行う
+    db_statement_timeout_ms: int = 30000  # 0 で無制限
+    db_lock_timeout_ms: int = 5000  # 0 で無制限
+
+    # DB transaction retry settings（デッドロック時）
+    db_retry_max_attempts: int = 3  # 最大試行回数（初回を含む）
+    db_retry_base_delay: float = 0.05  # バックオフの基準待機時間（秒）
+    db_retry_max_delay: float = 1.0  # 1回あたりの最大待機時間（秒）
+    db_retry_deadline: float = 2.0  # 1回のUnit of Workで使える合計時間（秒）
+
+    # Logging settings
+    log_mode: str = 'development'  # development: 同期出力 / production: 非同期JSON出力
+    log_level: str = 'DEBUG'
+    log_levels: str = (
+        ''  # モジュール別レベル 例: 'sqlalchemy.engine=WARNING,uvicorn=INFO'
+    )
+    log_capture_callsite: bool | None = None  # 呼び出し元の出力（未指定時は開発環境のみ）
+    log_dir: str = ''  # 未指定時は app/logs
+    log_file_max_bytes: int = 10 * 1024 * 1024  # ローテーションするファイルサイズ
+    log_file_backup_count: int = 5
+    log_queue_size: int = 10000  # production モードのキュー上限（溢れた分は破棄）
+
+    # Monitoring settings（/metrics, /diagnostics/* は Authorization: Bearer で保護する）
+    monitoring_token: str = ''  # 空なら監視用エンドポイントは常に 401
 
     # JWT settings
     jwt_expiration_hours: str = '24'
     jwt_algorithm: str = 'RS256'  # RS256 for RSA, HS256 for HMAC (deprecated)
     jwt_private_key: str = ''  # RSA private key for signing (RS256)
     jwt_public_key: str = ''  # RSA public key for verification (RS256)
+    jwt_token_cache_size: int = 1024  # 検証済みトークンキャッシュの最大件数（0で無効）
+
+    # Password hashing settings（bcrypt をワーカープロセスで計算する）
+    # コスト。上げると既存ユーザーは次回ログイン時に再ハッシュされる
+    # （目安は scripts/calibrate_bcrypt_rounds.py で計測）
+    password_bcrypt_rounds: int = 12
+    password_hash_workers: int = 2  # 0 でプールを使わずリクエストスレッドで計算
+    password_hash_max_pending: int = 32  # 実行中 + 待機中の上限（超えたら 503）
+    password_hash_retry_after_seconds: int = 1  # 503 時の Retry-After
+
+    # Attendance settings（Discord Bot からの参加ログ取り込み）
+    discord_bot_token: str = (
+        ''  # Bot が Authorization: Bearer で送るトークン（空なら無効）
+    )
+    attendance_timezone: str = 'Asia/Tokyo'  # 日付・朝活時間帯の判定に使う
+    attendance_min_valid_minutes: int = 5  # これ未満の参加は無効
+    attendance_morning_start: str = '06:00'  # 朝活時間帯（HH:MM）
+    attendance_morning_end: str = '07:00'
+    attendance_ingest_max_events: int = 5000  # 1リクエストで受け付けるイベント数の上限
+
+    # Ranking settings（ランキングはワーカープロセス内に保持し、差分で更新する）
+    ranking_refresh_seconds: float = 5.0  # DBの更新分を読みに行く間隔
+    ranking_refresh_overlap_seconds: float = (
+        60.0  # 差分取得でさかのぼる時間（長いトランザクション対策）
+    )
+    ranking_rebuild_seconds: float = 3600.0  # 全件から作り直す間隔
+
+    # Event settings（定期開催のイベントは一覧の取得時に期間内の開催回だけ展開する）
+    event_timezone: str = 'Asia/Tokyo'  # 開催日・開始時刻を解釈するタイムゾーン
+    event_default_window_days: int = 90  # 期間の指定がない場合に一覧に含める日数
+
+    # Notification settings（配信ワーカー scripts/notification_worker.py）
+    notification_timezone: str = (
+        'Asia/Tokyo'  # リマインダー送信時刻を解釈するタイムゾーン
+    )
+    notification_dispatch_batch_size: int = 500  # 1トランザクションで確保する通知の数
+    notification_poll_seconds: float = 5.0  # 送信予定の通知がない場合に待つ間隔
+    notification_settings_cache_size: int = 100_000  # 通知設定キャッシュの最大件数
+    notification_settings_cache_ttl_seconds: float = (
+        60.0  # 設定の変更が反映されるまでの上限
+    )
+    # 未読数の修復（scripts/repair_notification_counters.py）で1トランザクションに数え直す人数
+    notification_counter_repair_batch_size: int = 1000
+
+    # Response cache settings（読み取りの多いエンドポイントのレスポンスキャッシュ）
+    response_cache_backend: str = 'memory'  # memory: ワーカー内 / redis: 全ワーカーで共有
+    response_cache_redis_url: str = ''  # 例: redis://redis:6379/0（redis の場合のみ）
+    response_cache_size: int = 1024  # memory の最大件数（0で無効）
+    response_cache_ttl_seconds: float = 30.0  # 無効化が届かない場合に古い値を返す上限
+    # 一覧系のレスポンスをモデルを作らずに orjson でシリアライズする（False で従来の経路）
+    fast_json_responses: bool = True
 
     # 一旦これだけ書いてる
     class Config:
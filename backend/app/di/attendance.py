@@ -0,0 +1,50 @@
+from datetime import time
+
+from fastapi import Depends
+
+from app.application.use_cases.attendance_ingestion_usecase import (
+    AttendanceIngestionUsecase,
+)
+from app.config import get_settings
+from app.di.unit_of_work import get_unit_of_work
+from app.domain.services.attendance_session_service import AttendancePolicy
+from app.domain.services.title_service import TitleAwardService
+from app.infrastructure.cache.response_cache import get_response_cache
+from app.infrastructure.db.repositories.attendance_log_repository_impl import (
+    AttendanceLogRepositoryImpl,
+)
+from app.infrastructure.db.repositories.attendance_repository_impl import (
+    AttendanceRepositoryImpl,
+)
+from app.infrastructure.db.repositories.title_achievement_repository_impl import (
+    TitleAchievementRepositoryImpl,
+)
+from app.infrastructure.db.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+def get_attendance_policy() -> AttendancePolicy:
+    """設定値から参加ログの集計ルールを作る"""
+    settings = get_settings()
+    return AttendancePolicy(
+        timezone=settings.attendance_timezone,
+        min_valid_minutes=settings.attendance_min_valid_minutes,
+        morning_start=time.fromisoformat(settings.attendance_morning_start),
+        morning_end=time.fromisoformat(settings.attendance_morning_end),
+    )
+
+
+def get_attendance_ingestion_usecase(
+    uow: SQLAlchemyUnitOfWork = Depends(get_unit_of_work),
+) -> AttendanceIngestionUsecase:
+    return AttendanceIngestionUsecase(
+        user_repository=UserRepositoryImpl(uow.session),
+        attendance_log_repository=AttendanceLogRepositoryImpl(uow.session),
+        attendance_repository=AttendanceRepositoryImpl(uow.session),
+        unit_of_work=uow,
+        policy=get_attendance_policy(),
+        title_award_service=TitleAwardService(
+            TitleAchievementRepositoryImpl(uow.session)
+        ),
+        response_cache=get_response_cache(),
+    )
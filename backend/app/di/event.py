@@ -0,0 +1,42 @@
+from fastapi import Depends
+
+from app.application.use_cases.event_participation_usecase import (
+    EventParticipationUsecase,
+)
+from app.application.use_cases.event_usecase import EventUsecase
+from app.config import get_settings
+from app.di.unit_of_work import get_readonly_unit_of_work, get_unit_of_work
+from app.domain.services.event_schedule_service import EventSchedulePolicy
+from app.infrastructure.db.repositories.event_participant_repository_impl import (
+    EventParticipantRepositoryImpl,
+)
+from app.infrastructure.db.repositories.event_repository_impl import EventRepositoryImpl
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+def get_event_participation_usecase(
+    uow: SQLAlchemyUnitOfWork = Depends(get_unit_of_work),
+) -> EventParticipationUsecase:
+    return EventParticipationUsecase(
+        event_participant_repository=EventParticipantRepositoryImpl(uow.session),
+        unit_of_work=uow,
+    )
+
+
+def get_event_schedule_policy() -> EventSchedulePolicy:
+    """設定値からイベント一覧の開催回の展開ルールを作る"""
+    settings = get_settings()
+    return EventSchedulePolicy(
+        timezone=settings.event_timezone,
+        default_window_days=settings.event_default_window_days,
+    )
+
+
+def get_event_usecase(
+    uow: SQLAlchemyUnitOfWork = Depends(get_readonly_unit_of_work),
+) -> EventUsecase:
+    """一覧取得は読み取りのみのため、レプリカ向けのUnit of Workを使う"""
+    return EventUsecase(
+        event_repository=EventRepositoryImpl(uow.session),
+        policy=get_event_schedule_policy(),
+    )
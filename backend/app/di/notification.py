@@ -0,0 +1,18 @@
+from fastapi import Depends
+
+from app.application.use_cases.notification_usecase import NotificationUsecase
+from app.di.unit_of_work import get_unit_of_work
+from app.infrastructure.db.repositories.notification_repository_impl import (
+    NotificationRepositoryImpl,
+)
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+def get_notification_usecase(
+    uow: SQLAlchemyUnitOfWork = Depends(get_unit_of_work),
+) -> NotificationUsecase:
+    """既読にした直後の未読数を返すため、一覧もプライマリから読む"""
+    return NotificationUsecase(
+        notification_repository=NotificationRepositoryImpl(uow.session),
+        unit_of_work=uow,
+    )
@@ -0,0 +1,21 @@
+from fastapi import Depends
+
+from app.application.use_cases.ranking_usecase import RankingUsecase
+from app.di.unit_of_work import get_readonly_unit_of_work
+from app.infrastructure.db.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.db.repositories.user_rival_repository_impl import (
+    UserRivalRepositoryImpl,
+)
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+from app.infrastructure.ranking.leaderboard_cache import get_leaderboard_cache
+
+
+def get_ranking_usecase(
+    uow: SQLAlchemyUnitOfWork = Depends(get_readonly_unit_of_work),
+) -> RankingUsecase:
+    """ランキングは読み取りのみのため、レプリカ向けのUnit of Workを使う"""
+    return RankingUsecase(
+        leaderboard_provider=get_leaderboard_cache(),
+        user_repository=UserRepositoryImpl(uow.session),
+        user_rival_repository=UserRivalRepositoryImpl(uow.session),
+    )
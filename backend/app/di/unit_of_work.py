@@ -0,0 +1,46 @@
+from collections.abc import AsyncIterator, Iterator
+
+from fastapi import Request, Response
+
+from app.infrastructure.db.async_unit_of_work import AsyncSQLAlchemyUnitOfWork
+from app.infrastructure.db.replica_routing import mark_write, prefers_primary
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+def get_unit_of_work(response: Response) -> Iterator[SQLAlchemyUnitOfWork]:
+    """
+    同期Unit of Workを注入（def のエンドポイント用）
+
+    リクエスト終了時にセッションを閉じる。コミットはユースケース側で明示的に行う。
+    コミットしたクライアントには、しばらく読み取りもプライマリに向ける Cookie を返す。
+    """
+    with SQLAlchemyUnitOfWork(on_commit=lambda: mark_write(response)) as uow:
+        yield uow
+
+
+def get_readonly_unit_of_work(request: Request) -> Iterator[SQLAlchemyUnitOfWork]:
+    """
+    読み取り専用Unit of Workを注入（一覧・ランキングなど読み取りのみのエンドポイント用）
+
+    レプリカが設定されていればレプリカから読む。
+    直前に書き込んだクライアント（Cookie の期限内）はプライマリから読む。
+    """
+    with SQLAlchemyUnitOfWork(
+        readonly=True, prefer_primary=prefers_primary(request)
+    ) as uow:
+        yield uow
+
+
+async def get_async_unit_of_work() -> AsyncIterator[AsyncSQLAlchemyUnitOfWork]:
+    """
+    非同期Unit of Workを注入（async def のエンドポイント用）
+
+    リクエスト終了時にセッションを閉じる。コミットはユースケース側で明示的に行う。
+
+    使用例:
+        @router.get('/users')
+        async def get_users(uow: AsyncSQLAlchemyUnitOfWork = Depends(get_async_unit_of_work)):
+            ...
+    """
+    async with AsyncSQLAlchemyUnitOfWork() as uow:
+        yield uow
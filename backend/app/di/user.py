@@ -0,0 +1,15 @@
+from fastapi import Depends
+
+from app.application.use_cases.user_usecase import UserUsecase
+from app.di.unit_of_work import get_readonly_unit_of_work
+from app.infrastructure.db.repositories.user_profile_repository_impl import (
+    UserProfileRepositoryImpl,
+)
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+def get_user_usecase(
+    uow: SQLAlchemyUnitOfWork = Depends(get_readonly_unit_of_work),
+) -> UserUsecase:
+    """一覧取得は読み取りのみのため、レプリカ向けのUnit of Workを使う"""
+    return UserUsecase(user_profile_repository=UserProfileRepositoryImpl(uow.session))
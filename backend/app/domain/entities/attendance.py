@@ -0,0 +1,65 @@
+import datetime as dt
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class AttendanceSummary(BaseModel):
+    """1ユーザー・1日分の参加サマリー"""
+
+    user_id: UUID = Field(..., description='ユーザーID')
+    date: dt.date = Field(..., description='参加日')
+    total_duration_minutes: int = Field(default=0, description='1日の総参加時間(分)')
+    session_count: int = Field(default=0, description='有効な参加セッション数')
+    first_join_time: dt.time | None = Field(None, description='最初の参加時刻')
+    last_leave_time: dt.time | None = Field(None, description='最後の退出時刻')
+    is_morning_active: bool = Field(
+        default=False, description='朝活時間帯(6-7時)の参加有無'
+    )
+
+    @property
+    def is_attended(self) -> bool:
+        """参加日として数えるか（有効なセッションが1つ以上ある日）"""
+        return self.session_count > 0
+
+
+class AttendanceStatistics(BaseModel):
+    """ユーザーの参加統計（attendance_summaries から導出される値）"""
+
+    user_id: UUID = Field(..., description='ユーザーID')
+    total_attendance_days: int = Field(default=0, description='総参加日数')
+    current_streak_days: int = Field(
+        default=0, description='最後の参加日で終わる連続参加日数'
+    )
+    max_streak_days: int = Field(default=0, description='最大連続参加日数')
+    last_attendance_date: dt.date | None = Field(None, description='最後の参加日')
+    first_attendance_date: dt.date | None = Field(None, description='初回参加日')
+    total_duration_minutes: int = Field(default=0, description='総参加時間(分)')
+
+
+class AttendanceEventType(str, Enum):
+    """Discord ボイスチャンネルの入退室イベント種別"""
+
+    JOIN = 'join'
+    LEAVE = 'leave'
+
+
+class AttendanceEvent(BaseModel):
+    """Discord ボイスチャンネルの入退室イベント（1件）"""
+
+    user_id: UUID = Field(..., description='ユーザーID')
+    discord_channel_id: str = Field(..., description='DiscordチャンネルID')
+    type: AttendanceEventType = Field(..., description='入室 / 退室')
+    occurred_at: dt.datetime = Field(..., description='発生日時（タイムゾーン付き）')
+
+
+class AttendanceLog(BaseModel):
+    """1チャンネルへの1回の参加（入室から退室まで）"""
+
+    user_id: UUID = Field(..., description='ユーザーID')
+    discord_channel_id: str = Field(..., description='DiscordチャンネルID')
+    joined_at: dt.datetime = Field(..., description='入室日時')
+    left_at: dt.datetime | None = Field(None, description='退出日時（参加中はNone）')
+    duration_minutes: int | None = Field(None, description='参加時間(分)')
+    is_valid: bool = Field(default=False, description='有効な参加か（最低時間以上）')
@@ -0,0 +1,142 @@
+import datetime as dt
+from dataclasses import dataclass
+from enum import Enum
+from uuid import UUID
+
+
+class EventParticipantStatus(str, Enum):
+    """イベントへの参加状態"""
+
+    REGISTERED = 'registered'  # 参加登録済み（定員に数える）
+    CANCELLED = 'cancelled'  # キャンセル済み（再登録できる）
+
+
+class ParticipationOutcome(str, Enum):
+    """参加登録・キャンセルの結果"""
+
+    JOINED = 'joined'  # 参加登録した（キャンセル済みからの再登録を含む）
+    CANCELLED = 'cancelled'  # キャンセルした
+    ALREADY_REGISTERED = 'already_registered'  # すでに参加登録済み
+    ALREADY_CANCELLED = 'already_cancelled'  # すでにキャンセル済み
+    NOT_REGISTERED = 'not_registered'  # 参加登録したことがない
+    FULL = 'full'  # 定員に達している
+    EVENT_NOT_FOUND = 'event_not_found'  # イベントが存在しない・無効
+
+
+@dataclass(frozen=True, slots=True)
+class ParticipationResult:
+    """
+    参加登録・キャンセルの結果
+
+    Attributes:
+        event_id: イベントID
+        user_id: ユーザーID
+        outcome: 結果
+        participant_count: 処理後の参加者数（イベントが存在しない場合は0）
+        max_participants: 最大参加者数（None は無制限）
+    """
+
+    event_id: UUID
+    user_id: UUID
+    outcome: ParticipationOutcome
+    participant_count: int = 0
+    max_participants: int | None = None
+
+    @property
+    def status(self) -> EventParticipantStatus | None:
+        """処理後の参加状態（登録・キャンセルが成立しなかった場合は None）"""
+        if self.outcome in (
+            ParticipationOutcome.JOINED,
+            ParticipationOutcome.ALREADY_REGISTERED,
+        ):
+            return EventParticipantStatus.REGISTERED
+        if self.outcome in (
+            ParticipationOutcome.CANCELLED,
+            ParticipationOutcome.ALREADY_CANCELLED,
+        ):
+            return EventParticipantStatus.CANCELLED
+        return None
+
+
+class RecurrencePattern(str, Enum):
+    """定期開催イベントの繰り返しパターン（events.recurrence_pattern）"""
+
+    DAILY = 'daily'  # 毎日
+    WEEKDAYS = 'weekdays'  # 平日（月〜金）
+    WEEKLY = 'weekly'  # 毎週（開催日と同じ曜日）
+    BIWEEKLY = 'biweekly'  # 隔週（開催日と同じ曜日）
+    MONTHLY = 'monthly'  # 毎月（開催日と同じ日。その日がない月は開催しない）
+
+
+class EventStatus(str, Enum):
+    """開催回の状態（一覧の絞り込み条件）"""
+
+    UPCOMING = 'upcoming'  # 開始前
+    ONGOING = 'ongoing'  # 開催中（開始済みで終了前）
+    PAST = 'past'  # 終了済み
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """
+    朝活イベント
+
+    定期開催のイベントは1行で表し、開催回は一覧の取得時に必要な期間だけ展開する
+    （開催回ごとの行は持たない）。フィールドの順序は EventRepositoryImpl の取得カラムの
+    順序と一致させている。
+
+    Attributes:
+        id: イベントID
+        creator_id: 作成者のユーザーID
+        title: イベント名
+        description: イベント詳細
+        event_type: イベントタイプ (study, exercise, meditation, etc.)
+        scheduled_date: 開催日（定期開催の場合は初回の開催日）
+        start_time: 開始時刻（イベントのタイムゾーンの時刻）
+        end_time: 終了時刻（開始時刻以前なら翌日の時刻）
+        max_participants: 最大参加者数（None は無制限）
+        participant_count: 参加者数
+        is_recurring: 定期開催かどうか
+        recurrence_pattern: 繰り返しパターン（daily, weekly, etc.）
+        discord_channel_id: 対応するDiscordチャンネルID
+    """
+
+    id: UUID
+    creator_id: UUID | None
+    title: str
+    description: str | None
+    event_type: str
+    scheduled_date: dt.date
+    start_time: dt.time
+    end_time: dt.time
+    max_participants: int | None = None
+    participant_count: int = 0
+    is_recurring: bool = False
+    recurrence_pattern: str | None = None
+    discord_channel_id: str | None = None
+
+    @property
+    def recurrence(self) -> RecurrencePattern | None:
+        """繰り返しパターン（単発、または未知のパターンなら None）"""
+        if not self.is_recurring or self.recurrence_pattern is None:
+            return None
+        try:
+            return RecurrencePattern(self.recurrence_pattern)
+        except ValueError:
+            return None
+
+
+@dataclass(frozen=True, slots=True)
+class EventOccurrence:
+    """
+    イベントの1回の開催
+
+    Attributes:
+        event: イベント
+        starts_at: 開始日時（タイムゾーン付き）
+        ends_at: 終了日時（タイムゾーン付き）
+    """
+
+    event: Event
+    starts_at: dt.datetime
+    ends_at: dt.datetime
@@ -0,0 +1,140 @@
+import datetime as dt
+from dataclasses import dataclass, field
+from enum import Enum
+from uuid import UUID
+
+DEFAULT_REMINDER_TIME = dt.time(21, 0)  # notification_settings.reminder_time の既定値
+
+
+class NotificationType(str, Enum):
+    """通知タイプ"""
+
+    ACHIEVEMENT = 'achievement'  # 称号獲得
+    REMINDER = 'reminder'  # 朝活リマインダー
+    RIVAL_UPDATE = 'rival_update'  # ライバルの進捗更新
+    EVENT = 'event'  # イベント関連
+
+
+class NotificationAudience(str, Enum):
+    """通知の届け先"""
+
+    USER = 'user'  # user_id 本人に届ける
+    # user_id をライバルに設定しているユーザーに1件ずつ複製して届ける
+    # （元の行は配信の記録として残し、本人の通知一覧には出さない）
+    RIVAL_FOLLOWERS = 'rival_followers'
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationSettings:
+    """
+    ユーザーの通知設定（notification_settings の行がないユーザーは既定値）
+
+    Attributes:
+        user_id: ユーザーID
+        achievement_enabled: 称号獲得通知の有効/無効
+        reminder_enabled: リマインダー通知の有効/無効
+        rival_update_enabled: ライバル更新通知の有効/無効
+        event_reminder_enabled: イベントリマインダーの有効/無効
+        reminder_time: リマインダー送信時刻
+    """
+
+    user_id: UUID
+    achievement_enabled: bool = True
+    reminder_enabled: bool = True
+    rival_update_enabled: bool = True
+    event_reminder_enabled: bool = True
+    reminder_time: dt.time = DEFAULT_REMINDER_TIME
+
+    def allows(self, notification_type: NotificationType) -> bool:
+        """通知タイプを受け取る設定か"""
+        if notification_type == NotificationType.ACHIEVEMENT:
+            return self.achievement_enabled
+        if notification_type == NotificationType.REMINDER:
+            return self.reminder_enabled
+        if notification_type == NotificationType.RIVAL_UPDATE:
+            return self.rival_update_enabled
+        return self.event_reminder_enabled
+
+
+@dataclass(frozen=True, slots=True)
+class DueNotification:
+    """
+    配信のために確保した送信予定時刻を過ぎた未送信の通知
+
+    Attributes:
+        id: 通知ID
+        user_id: 通知対象のユーザーID（RIVAL_FOLLOWERS はライバルとして設定されている側）
+        type: 通知タイプ
+        audience: 届け先
+        title: 通知タイトル
+        message: 通知メッセージ
+        data: 関連データ
+    """
+
+    id: UUID
+    user_id: UUID
+    type: NotificationType
+    audience: NotificationAudience
+    title: str
+    message: str
+    data: dict | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class DispatchPlan:
+    """
+    確保した通知の配信内容
+
+    Attributes:
+        delivered_ids: 本人に届ける（送信済みにする）通知のID
+        suppressed_ids: 通知設定で無効のため削除する通知のID
+        fanouts: 複製して届ける通知と、届け先のユーザーID
+    """
+
+    delivered_ids: list[UUID] = field(default_factory=list)
+    suppressed_ids: list[UUID] = field(default_factory=list)
+    fanouts: list[tuple[DueNotification, list[UUID]]] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class Notification:
+    """
+    ユーザーの通知一覧に出す通知（本人宛てで送信済みのもの）
+
+    Attributes:
+        id: 通知ID
+        user_id: 通知対象のユーザーID
+        type: 通知タイプ
+        title: 通知タイトル
+        message: 通知メッセージ
+        data: 関連データ
+        is_read: 既読状態
+        sent_at: 送信日時
+        created_at: 作成日時
+    """
+
+    id: UUID
+    user_id: UUID
+    type: NotificationType
+    title: str
+    message: str
+    data: dict | None
+    is_read: bool
+    sent_at: dt.datetime
+    created_at: dt.datetime
+
+
+@dataclass(frozen=True, slots=True)
+class UnreadCountRepair:
+    """
+    未読数の修復（1バッチ分）の結果
+
+    Attributes:
+        last_user_id: バッチの最後のユーザーID（次のバッチの開始位置。対象がなければ None）
+        checked: 確認したユーザー数
+        corrected: 未読数がずれていたため直したユーザー数
+    """
+
+    last_user_id: UUID | None
+    checked: int
+    corrected: int
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class RankingType(str, Enum):
+    """ランキングの種類"""
+
+    MONTHLY = 'monthly'  # 月間の参加日数
+    TOTAL = 'total'  # 総参加日数
+    STREAK = 'streak'  # 現在の連続参加日数
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class TitleAward:
+    """1ユーザーに新しく付与する称号"""
+
+    user_id: UUID  # ユーザーID
+    levels: list[int]  # 新しく獲得した称号レベル（昇順）
+
+    @property
+    def current_level(self) -> int:
+        """現在の称号にするレベル（獲得した中で最も高いもの）"""
+        return self.levels[-1]
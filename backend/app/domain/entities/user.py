@@ -1,23 +1,35 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
 
+@dataclass(frozen=True, slots=True)
+class User:
+    """
+    ユーザーエンティティ (Ghoona Camp)
 
-class User(BaseModel):
-    """ユーザーエンティティ (Ghoona Camp)"""
+    リポジトリが DB の値から作るだけで外部の入力を直接受け取らないため、
+    検証のない frozen な dataclass にしている（変更は dataclasses.replace で行う）。
+    フィールドの順序は UserRepositoryImpl の取得カラムの順序と一致させている。
 
-    id: UUID = Field(..., description='ユーザーID (UUID)')
-    email: str = Field(..., description='メールアドレス')
-    password_hash: str = Field(..., description='ハッシュ化されたパスワード (bcrypt)')
-    username: str | None = Field(None, description='ユーザー名')
-    avatar_url: str | None = Field(None, description='アバター画像URL')
-    discord_id: str | None = Field(None, description='Discord User ID')
-    is_active: bool = Field(default=True, description='アカウント有効状態')
-    created_at: datetime = Field(default_factory=datetime.now, description='作成日時')
-    updated_at: datetime = Field(default_factory=datetime.now, description='更新日時')
+    Attributes:
+        id: ユーザーID (UUID)
+        email: メールアドレス
+        password_hash: ハッシュ化されたパスワード (bcrypt)
+        username: ユーザー名
+        avatar_url: アバター画像URL
+        discord_id: Discord User ID
+        is_active: アカウント有効状態
+        created_at: 作成日時
+        updated_at: 更新日時
+    """
 
-    class Config:
-        """Pydantic設定"""
-
-        from_attributes = True  # SQLAlchemyモデルから変換可能にする
+    id: UUID
+    email: str
+    password_hash: str
+    username: str | None = None
+    avatar_url: str | None = None
+    discord_id: str | None = None
+    is_active: bool = True
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
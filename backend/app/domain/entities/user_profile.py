@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class SocialLink:
+    """
+    外部リンク（公開設定のもののみ）
+
+    フィールドの順序は UserProfileRepositoryImpl が集約する配列の順序と一致させている。
+    """
+
+    id: UUID  # リンクID
+    platform: str  # プラットフォーム種別
+    url: str  # リンクURL
+    title: str | None = None  # リンクのタイトル
+
+
+@dataclass(frozen=True, slots=True)
+class UserProfile:
+    """
+    メンバー一覧に表示するユーザープロフィール（複数テーブルの集約）
+
+    リポジトリが DB の値から作るだけのため、User と同じく検証のない frozen な
+    dataclass にしている。フィールドの順序は build_user_profile_query の取得カラムの
+    順序と一致させている（外部リンクは最後に集約して渡す）。
+    """
+
+    id: UUID  # ユーザーID
+    username: str  # ユーザー名
+    display_name: str  # 表示名
+    joined_at: datetime  # 登録日時
+    avatar_url: str | None = None  # アバター画像URL
+    tagline: str | None = None  # 一言プロフィール
+    bio: str | None = None  # 自己紹介文
+    skills: list[str] = field(default_factory=list)  # スキル一覧
+    interests: list[str] = field(default_factory=list)  # 興味・関心一覧
+    vision: str | None = None  # ビジョン（非公開の場合はNone）
+    is_vision_public: bool = False  # ビジョンの公開設定
+    total_attendance_days: int = 0  # 総参加日数
+    current_streak_days: int = 0  # 現在の連続参加日数
+    max_streak_days: int = 0  # 最大連続参加日数
+    current_title_level: int = 1  # 現在の称号レベル（1-8）
+    social_links: list[SocialLink] = field(default_factory=list)  # 公開中の外部リンク
@@ -0,0 +1,50 @@
+import datetime as dt
+from abc import ABC, abstractmethod
+from collections.abc import Collection, Sequence
+from uuid import UUID
+
+from app.domain.entities.attendance import AttendanceLog
+
+
+class IAttendanceLogRepository(ABC):
+    """Discord 参加ログリポジトリのインターフェース"""
+
+    @abstractmethod
+    def get_open_logs(self, user_ids: Collection[UUID]) -> list[AttendanceLog]:
+        """
+        退出していない参加ログをまとめて取得（1回のクエリで取得する）
+
+        Args:
+            user_ids: ユーザーIDのリスト
+
+        Returns:
+            list[AttendanceLog]: 参加中のログ
+        """
+        pass
+
+    @abstractmethod
+    def upsert_logs(self, logs: Sequence[AttendanceLog]) -> None:
+        """
+        参加ログをまとめて作成または更新（ユーザー・チャンネル・入室日時で一意）
+
+        Args:
+            logs: 参加ログ
+        """
+        pass
+
+    @abstractmethod
+    def list_logs(
+        self, user_ids: Collection[UUID], start: dt.datetime, end: dt.datetime
+    ) -> list[AttendanceLog]:
+        """
+        入室日時が [start, end) の参加ログをまとめて取得
+
+        Args:
+            user_ids: ユーザーIDのリスト
+            start: 開始日時（この日時を含む）
+            end: 終了日時（この日時を含まない）
+
+        Returns:
+            list[AttendanceLog]: 参加ログ
+        """
+        pass
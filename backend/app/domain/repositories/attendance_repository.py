@@ -0,0 +1,159 @@
+import datetime as dt
+from abc import ABC, abstractmethod
+from collections.abc import Collection, Sequence
+from uuid import UUID
+
+from app.domain.entities.attendance import AttendanceStatistics, AttendanceSummary
+
+
+class IAttendanceRepository(ABC):
+    """参加サマリー・参加統計リポジトリのインターフェース"""
+
+    @abstractmethod
+    def get_summary(self, user_id: UUID, date: dt.date) -> AttendanceSummary | None:
+        """
+        1日分の参加サマリーを取得
+
+        Args:
+            user_id: ユーザーID
+            date: 対象日
+
+        Returns:
+            Optional[AttendanceSummary]: 参加サマリー（存在しない場合はNone）
+        """
+        pass
+
+    @abstractmethod
+    def get_summaries(
+        self, keys: Collection[tuple[UUID, dt.date]]
+    ) -> dict[tuple[UUID, dt.date], AttendanceSummary]:
+        """
+        複数の (ユーザーID, 日付) の参加サマリーをまとめて取得
+
+        Args:
+            keys: (ユーザーID, 日付) のリスト
+
+        Returns:
+            dict: (ユーザーID, 日付) -> 参加サマリー（存在しないものは含まない）
+        """
+        pass
+
+    @abstractmethod
+    def list_summaries(self, user_id: UUID) -> list[AttendanceSummary]:
+        """
+        ユーザーの全参加サマリーを日付順に取得
+
+        Args:
+            user_id: ユーザーID
+
+        Returns:
+            list[AttendanceSummary]: 参加サマリー
+        """
+        pass
+
+    @abstractmethod
+    def upsert_summary(self, summary: AttendanceSummary) -> None:
+        """
+        参加サマリーを作成または更新（ユーザー・日付で一意）
+
+        Args:
+            summary: 参加サマリー
+        """
+        pass
+
+    @abstractmethod
+    def upsert_summaries(self, summaries: Sequence[AttendanceSummary]) -> None:
+        """
+        参加サマリーをまとめて作成または更新（1文の複数行 UPSERT）
+
+        Args:
+            summaries: 参加サマリー（ユーザー・日付の重複なし）
+        """
+        pass
+
+    @abstractmethod
+    def get_attended_dates(
+        self, user_id: UUID, start: dt.date, end: dt.date
+    ) -> set[dt.date]:
+        """
+        期間 [start, end] の参加日を取得
+
+        Args:
+            user_id: ユーザーID
+            start: 開始日（この日を含む）
+            end: 終了日（この日を含む）
+
+        Returns:
+            set[date]: 有効なセッションが1つ以上ある日
+        """
+        pass
+
+    @abstractmethod
+    def get_statistics_for_update(self, user_id: UUID) -> AttendanceStatistics:
+        """
+        参加統計を行ロック付きで取得（存在しない場合は空の統計を作成）
+
+        同じユーザーの参加統計の更新はこのロックで直列化する。
+
+        Args:
+            user_id: ユーザーID
+
+        Returns:
+            AttendanceStatistics: 参加統計
+        """
+        pass
+
+    @abstractmethod
+    def get_statistics_for_update_many(
+        self, user_ids: Collection[UUID]
+    ) -> dict[UUID, AttendanceStatistics]:
+        """
+        複数ユーザーの参加統計を行ロック付きでまとめて取得（存在しない場合は作成）
+
+        デッドロックを避けるため、ロックはユーザーID順に取る。
+
+        Args:
+            user_ids: ユーザーIDのリスト
+
+        Returns:
+            dict: ユーザーID -> 参加統計
+        """
+        pass
+
+    @abstractmethod
+    def list_statistics_for_update(
+        self, after_user_id: UUID | None, limit: int
+    ) -> list[AttendanceStatistics]:
+        """
+        参加統計をユーザーID順に行ロック付きで1チャンクずつ取得（夜間バッチ用）
+
+        他のトランザクションがロックしている行（参加記録の処理中のユーザー）は飛ばす。
+
+        Args:
+            after_user_id: 前のチャンクの最後のユーザーID（最初のチャンクはNone）
+            limit: 取得件数
+
+        Returns:
+            list[AttendanceStatistics]: 参加統計（ユーザーID順）
+        """
+        pass
+
+    @abstractmethod
+    def save_statistics(self, statistics: AttendanceStatistics) -> None:
+        """
+        参加統計を保存
+
+        Args:
+            statistics: 参加統計
+        """
+        pass
+
+    @abstractmethod
+    def save_statistics_many(self, statistics: Sequence[AttendanceStatistics]) -> None:
+        """
+        複数ユーザーの参加統計をまとめて保存
+
+        Args:
+            statistics: 参加統計
+        """
+        pass
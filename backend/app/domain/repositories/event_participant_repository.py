@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from app.domain.entities.event import ParticipationResult
+
+
+class IEventParticipantRepository(ABC):
+    """イベント参加者リポジトリのインターフェース"""
+
+    @abstractmethod
+    def register(self, event_id: UUID, user_id: UUID) -> ParticipationResult:
+        """
+        イベントに参加登録（定員に空きがある場合のみ）
+
+        定員の確認と参加者数の加算は1文で不可分に行い、同時に申し込まれても
+        定員を超えて登録しない。キャンセル済みの参加者は再登録する。
+
+        Args:
+            event_id: イベントID
+            user_id: ユーザーID
+
+        Returns:
+            ParticipationResult: JOINED / ALREADY_REGISTERED / FULL / EVENT_NOT_FOUND
+        """
+        pass
+
+    @abstractmethod
+    def cancel(self, event_id: UUID, user_id: UUID) -> ParticipationResult:
+        """
+        イベントの参加登録をキャンセル（参加者数を1つ戻す）
+
+        Args:
+            event_id: イベントID
+            user_id: ユーザーID
+
+        Returns:
+            ParticipationResult: CANCELLED / ALREADY_CANCELLED / NOT_REGISTERED /
+                EVENT_NOT_FOUND
+        """
+        pass
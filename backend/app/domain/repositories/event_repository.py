@@ -0,0 +1,47 @@
+import datetime as dt
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from uuid import UUID
+
+from app.domain.entities.event import Event
+
+
+class IEventRepository(ABC):
+    """イベントリポジトリのインターフェース"""
+
+    @abstractmethod
+    def list_recurring(
+        self, until: dt.date, creator_id: UUID | None = None
+    ) -> list[Event]:
+        """
+        初回の開催日が until 以前の有効な定期開催イベントを取得
+
+        開催回ごとの行はないため、イベント1件につき1行だけ返す（開催回はドメインで展開する）。
+
+        Args:
+            until: 期間の最終日
+            creator_id: 作成者で絞り込む場合のユーザーID
+
+        Returns:
+            list[Event]: 定期開催イベント
+        """
+        pass
+
+    @abstractmethod
+    def iter_one_off(
+        self, first: dt.date, last: dt.date, creator_id: UUID | None = None
+    ) -> Iterator[Event]:
+        """
+        開催日が first〜last（両端を含む）の有効な単発イベントを順に取得
+
+        結果は全件をメモリに載せず、少しずつ読み出す。
+
+        Args:
+            first: 期間の初日
+            last: 期間の最終日
+            creator_id: 作成者で絞り込む場合のユーザーID
+
+        Returns:
+            Iterator[Event]: (開催日, 開始時刻, ID) の昇順の単発イベント
+        """
+        pass
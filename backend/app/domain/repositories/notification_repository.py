@@ -0,0 +1,209 @@
+import datetime as dt
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from uuid import UUID
+
+from app.domain.entities.notification import (
+    DueNotification,
+    Notification,
+    NotificationType,
+    UnreadCountRepair,
+)
+
+
+class INotificationRepository(ABC):
+    """
+    通知リポジトリのインターフェース
+
+    ユーザーごとの未読数（本人宛てで送信済みの未読の通知の数）は、通知を登録・送信済み・
+    既読/未読・削除にする各メソッドが同じトランザクションで増減する。
+    """
+
+    @abstractmethod
+    def claim_due(self, now: dt.datetime, limit: int) -> list[DueNotification]:
+        """
+        送信予定時刻を過ぎた未送信の通知を確保
+
+        確保した行はトランザクションの終了までロックし、ほかのワーカーがロック中の行は
+        待たずに飛ばす（複数のワーカーが同時に実行しても同じ通知を確保しない）。
+
+        Args:
+            now: 基準日時（送信予定時刻がこれ以前、または未指定の通知を対象にする）
+            limit: 確保する最大件数
+
+        Returns:
+            list[DueNotification]: 確保した通知（送信予定時刻の早い順）
+        """
+        pass
+
+    @abstractmethod
+    def mark_sent(self, notification_ids: Sequence[UUID], sent_at: dt.datetime) -> None:
+        """
+        通知を送信済みにする（本人宛ての未読の通知は未読数に加える）
+
+        Args:
+            notification_ids: 通知ID
+            sent_at: 送信日時
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, notification_ids: Sequence[UUID]) -> None:
+        """
+        通知を削除（通知設定で無効にしているユーザー宛ての未送信の通知）
+
+        送信済みの未読の通知を含む場合は未読数から除く。
+
+        Args:
+            notification_ids: 通知ID
+        """
+        pass
+
+    @abstractmethod
+    def insert_fanout(
+        self,
+        source: DueNotification,
+        user_ids: Sequence[UUID],
+        sent_at: dt.datetime,
+    ) -> int:
+        """
+        通知を各ユーザー宛てに複製して送信済みで登録（複数行の INSERT）
+
+        同じ元の通知・ユーザーの組は1件だけ登録する。登録した分を届け先の未読数に加える。
+
+        Args:
+            source: 元の通知
+            user_ids: 届け先のユーザーID
+            sent_at: 送信日時
+
+        Returns:
+            int: 登録した件数
+        """
+        pass
+
+    @abstractmethod
+    def schedule_reminders(
+        self, day: dt.date, timezone: str, title: str, message: str
+    ) -> int:
+        """
+        リマインダーを有効にしている有効なユーザーに、day のリマインダー送信時刻の通知を予約
+
+        同じユーザー・送信予定時刻のリマインダーは1件だけ登録する（再実行しても重複しない）。
+
+        Args:
+            day: リマインダーを送る日
+            timezone: リマインダー送信時刻を解釈するタイムゾーン
+            title: 通知タイトル
+            message: 通知メッセージ
+
+        Returns:
+            int: 予約した件数
+        """
+        pass
+
+    @abstractmethod
+    def list_for_user(
+        self,
+        user_id: UUID,
+        notification_type: NotificationType | None,
+        is_read: bool | None,
+        limit: int,
+        offset: int,
+    ) -> list[Notification]:
+        """
+        ユーザーの通知一覧を取得（本人宛てで送信済みの通知）
+
+        Args:
+            user_id: ユーザーID
+            notification_type: 通知タイプ（None は絞り込まない）
+            is_read: 既読状態（None は絞り込まない）
+            limit: 取得件数
+            offset: オフセット
+
+        Returns:
+            list[Notification]: 新しい順の通知
+        """
+        pass
+
+    @abstractmethod
+    def count_for_user(
+        self,
+        user_id: UUID,
+        notification_type: NotificationType | None,
+        is_read: bool | None,
+    ) -> int:
+        """
+        ユーザーの通知の件数を数える（未読数は get_unread_count を使う）
+
+        Args:
+            user_id: ユーザーID
+            notification_type: 通知タイプ（None は絞り込まない）
+            is_read: 既読状態（None は絞り込まない）
+
+        Returns:
+            int: 件数
+        """
+        pass
+
+    @abstractmethod
+    def get_unread_count(self, user_id: UUID) -> int:
+        """
+        ユーザーの未読数を取得（通知を数えず、保持している未読数を返す）
+
+        Args:
+            user_id: ユーザーID
+
+        Returns:
+            int: 未読数
+        """
+        pass
+
+    @abstractmethod
+    def set_read(
+        self, notification_id: UUID, user_id: UUID, is_read: bool
+    ) -> Notification | None:
+        """
+        ユーザーの通知を既読/未読にする（変わった場合は未読数を増減する）
+
+        Args:
+            notification_id: 通知ID
+            user_id: ユーザーID（ほかのユーザーの通知は見つからない扱い）
+            is_read: 既読状態
+
+        Returns:
+            Notification | None: 更新後の通知（見つからなければ None）
+        """
+        pass
+
+    @abstractmethod
+    def delete_for_user(self, notification_id: UUID, user_id: UUID) -> bool:
+        """
+        ユーザーの通知を削除（未読なら未読数から除く）
+
+        Args:
+            notification_id: 通知ID
+            user_id: ユーザーID（ほかのユーザーの通知は見つからない扱い）
+
+        Returns:
+            bool: 削除したか（見つからなければ False）
+        """
+        pass
+
+    @abstractmethod
+    def reconcile_unread_counts(
+        self, after_user_id: UUID | None, limit: int
+    ) -> UnreadCountRepair:
+        """
+        ユーザーID順に limit 人分の未読数を数え直し、ずれていれば直す
+
+        数え直す間は対象ユーザーの未読数の行をロックするため、同時に通知の登録・既読に
+        していても未読数はずれない。
+
+        Args:
+            after_user_id: このユーザーIDより後のユーザーを対象にする（None は先頭から）
+            limit: 1回で確認するユーザー数
+
+        Returns:
+            UnreadCountRepair: 確認・修正した結果と次の開始位置
+        """
+        pass
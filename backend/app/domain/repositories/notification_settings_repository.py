@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from collections.abc import Collection
+from uuid import UUID
+
+from app.domain.entities.notification import NotificationSettings
+
+
+class INotificationSettingsRepository(ABC):
+    """通知設定リポジトリのインターフェース"""
+
+    @abstractmethod
+    def get_many(self, user_ids: Collection[UUID]) -> dict[UUID, NotificationSettings]:
+        """
+        複数ユーザーの通知設定をまとめて取得
+
+        Args:
+            user_ids: ユーザーID
+
+        Returns:
+            dict[UUID, NotificationSettings]: ユーザーID -> 通知設定
+                （notification_settings の行がないユーザーは含めない）
+        """
+        pass
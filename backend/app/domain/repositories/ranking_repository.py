@@ -0,0 +1,69 @@
+import datetime as dt
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class IRankingRepository(ABC):
+    """
+    ランキング用のスコア取得のインターフェース
+
+    いずれのメソッドも since を指定すると、since 以降に更新されたユーザーの分だけ返す
+    （ランキングの差分更新用）。無効なユーザーのスコアは0として返す。
+    """
+
+    @abstractmethod
+    def current_time(self) -> dt.datetime:
+        """
+        DBの現在時刻（差分更新の基準時刻。updated_at と同じ時計を使う）
+
+        Returns:
+            datetime: 現在時刻
+        """
+        pass
+
+    @abstractmethod
+    def list_total_scores(
+        self, since: dt.datetime | None = None
+    ) -> list[tuple[UUID, int]]:
+        """
+        総参加日数を取得
+
+        Args:
+            since: この日時以降に更新されたユーザーだけを返す（None なら全員）
+
+        Returns:
+            list[tuple[UUID, int]]: (ユーザーID, 総参加日数)
+        """
+        pass
+
+    @abstractmethod
+    def list_streak_scores(
+        self, today: dt.date, since: dt.datetime | None = None
+    ) -> list[tuple[UUID, int]]:
+        """
+        現在の連続参加日数を取得（最後の参加が昨日より前なら途切れているので0）
+
+        Args:
+            today: 今日の日付
+            since: この日時以降に更新されたユーザーだけを返す（None なら全員）
+
+        Returns:
+            list[tuple[UUID, int]]: (ユーザーID, 連続参加日数)
+        """
+        pass
+
+    @abstractmethod
+    def list_monthly_scores(
+        self, month: dt.date, since: dt.datetime | None = None
+    ) -> list[tuple[UUID, int]]:
+        """
+        月間の参加日数を取得
+
+        Args:
+            month: 対象月（1日の日付）
+            since: この日時以降にその月のサマリーが更新されたユーザーだけを返す
+
+        Returns:
+            list[tuple[UUID, int]]: (ユーザーID, 月間参加日数)
+        """
+        pass
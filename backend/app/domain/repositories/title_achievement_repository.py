@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from collections.abc import Collection, Sequence
+from uuid import UUID
+
+from app.domain.entities.title import TitleAward
+
+
+class ITitleAchievementRepository(ABC):
+    """称号実績リポジトリのインターフェース"""
+
+    @abstractmethod
+    def get_highest_levels(self, user_ids: Collection[UUID]) -> dict[UUID, int]:
+        """
+        獲得済みの最高の称号レベルをまとめて取得
+
+        Args:
+            user_ids: ユーザーIDのリスト
+
+        Returns:
+            dict: ユーザーID -> 最高レベル（称号を獲得していないユーザーは含まない）
+        """
+        pass
+
+    @abstractmethod
+    def award(self, awards: Sequence[TitleAward]) -> None:
+        """
+        称号をまとめて付与し、現在の称号を付与した最高レベルに切り替える
+
+        同じトランザクション内で、現在の称号の解除・称号の一括 INSERT・
+        現在の称号の設定を行う（途中の状態は他のトランザクションから見えない）。
+
+        Args:
+            awards: 付与する称号
+        """
+        pass
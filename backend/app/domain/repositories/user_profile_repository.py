@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+from app.domain.entities.user_profile import UserProfile
+
+
+@dataclass(frozen=True, slots=True)
+class UserProfileFilter:
+    """メンバー一覧の絞り込み条件"""
+
+    # 表示名・一言プロフィールの部分一致（大文字小文字を区別しない）
+    search: str | None = None
+    skills: list[str] = field(default_factory=list)  # いずれかを持つ（OR）
+    interests: list[str] = field(default_factory=list)  # いずれかを持つ（OR）
+    title_levels: list[int] = field(default_factory=list)  # 現在の称号レベル（OR）
+
+
+@dataclass(frozen=True, slots=True)
+class UserProfilePage:
+    """メンバー一覧の1ページ分"""
+
+    profiles: list[UserProfile] = field(default_factory=list)  # プロフィール
+    next_cursor: str | None = None  # 次ページのカーソル（最終ページの場合はNone）
+
+
+class IUserProfileRepository(ABC):
+    """ユーザープロフィール（メンバー一覧）取得のインターフェース"""
+
+    @abstractmethod
+    def search_profiles(
+        self, filter: UserProfileFilter, limit: int, after_cursor: str | None = None
+    ) -> UserProfilePage:
+        """
+        条件に一致するプロフィールを登録日時の新しい順に取得（キーセットページネーション）
+
+        Args:
+            filter: 絞り込み条件
+            limit: 取得件数
+            after_cursor: 前ページの next_cursor（最初のページは None）
+
+        Returns:
+            UserProfilePage: プロフィール一覧と次ページのカーソル
+
+        Raises:
+            ValueError: カーソルが不正な場合
+        """
+        pass
+
+    @abstractmethod
+    def count_profiles(self, filter: UserProfileFilter, max_count: int) -> int:
+        """
+        条件に一致するプロフィールを max_count 件まで数える
+
+        Args:
+            filter: 絞り込み条件
+            max_count: 数える件数の上限（一致する件数が多くてもこれ以上は数えない）
+
+        Returns:
+            int: 一致する件数（max_count 以下）
+        """
+        pass
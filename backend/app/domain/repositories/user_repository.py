@@ -1,8 +1,27 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from uuid import UUID
 
 from app.domain.entities.user import User
 
 
+@dataclass(frozen=True, slots=True)
+class UserListFilter:
+    """ユーザー一覧の絞り込み条件"""
+
+    search: str | None = None  # ユーザー名の部分一致（大文字小文字を区別しない）
+    is_active: bool | None = True  # 有効状態（None の場合は絞り込まない）
+
+
+@dataclass(frozen=True, slots=True)
+class UserPage:
+    """キーセットページネーションの1ページ分"""
+
+    users: list[User] = field(default_factory=list)  # ユーザー一覧
+    next_cursor: str | None = None  # 次ページのカーソル（最終ページの場合はNone）
+
+
 class IUserRepository(ABC):
     """ユーザーリポジトリのインターフェース"""
 
@@ -20,7 +39,7 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    def get_by_id(self, user_id: int) -> User | None:
+    def get_by_id(self, user_id: UUID) -> User | None:
         """
         IDでユーザーを取得
 
@@ -32,6 +51,57 @@ class IUserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many_by_ids(self, user_ids: Sequence[UUID]) -> list[User]:
+        """
+        複数のIDでユーザーをまとめて取得（1回のクエリで取得する）
+
+        Args:
+            user_ids: ユーザーIDのリスト
+
+        Returns:
+            list[User]: user_ids の順に並べたユーザー（存在しないIDは含まない）
+        """
+        pass
+
+    @abstractmethod
+    def get_ids_by_discord_ids(self, discord_ids: Sequence[str]) -> dict[str, UUID]:
+        """
+        Discord User ID からユーザーIDをまとめて引く（1回のクエリで取得する）
+
+        Args:
+            discord_ids: Discord User ID のリスト
+
+        Returns:
+            dict[str, UUID]: Discord User ID -> ユーザーID（未連携のIDは含まない）
+        """
+        pass
+
+    @abstractmethod
+    def list_users(
+        self,
+        filter: UserListFilter | None = None,
+        after_cursor: str | None = None,
+        limit: int = 20,
+    ) -> UserPage:
+        """
+        ユーザー一覧を登録日時の新しい順に取得（キーセットページネーション）
+
+        OFFSET を使わないため、後ろのページでも取得コストが変わらない。
+
+        Args:
+            filter: 絞り込み条件
+            after_cursor: 前ページの next_cursor（最初のページは None）
+            limit: 取得件数
+
+        Returns:
+            UserPage: ユーザー一覧と次ページのカーソル
+
+        Raises:
+            ValueError: カーソルが不正な場合
+        """
+        pass
+
     @abstractmethod
     def create(self, user: User) -> User:
         """
@@ -59,7 +129,7 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    def delete(self, user_id: int) -> bool:
+    def delete(self, user_id: UUID) -> bool:
         """
         ユーザーを削除
 
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from collections.abc import Collection
+from uuid import UUID
+
+
+class IUserRivalRepository(ABC):
+    """ライバル関係リポジトリのインターフェース"""
+
+    @abstractmethod
+    def get_rival_ids(self, user_id: UUID) -> list[UUID]:
+        """
+        ユーザーが設定したライバルのIDを取得
+
+        Args:
+            user_id: ユーザーID
+
+        Returns:
+            list[UUID]: ライバルのユーザーID（設定日時の古い順）
+        """
+        pass
+
+    @abstractmethod
+    def get_follower_ids(self, user_ids: Collection[UUID]) -> dict[UUID, list[UUID]]:
+        """
+        複数ユーザーについて、そのユーザーをライバルに設定しているユーザーのIDを取得
+
+        Args:
+            user_ids: ユーザーID
+
+        Returns:
+            dict[UUID, list[UUID]]: ユーザーID -> ライバルに設定しているユーザーのID
+                （いないユーザーは含めない）
+        """
+        pass
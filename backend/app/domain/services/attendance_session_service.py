@@ -0,0 +1,166 @@
+import datetime as dt
+from collections import defaultdict
+from collections.abc import Iterable
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from pydantic import BaseModel, Field
+
+from app.domain.entities.attendance import (
+    AttendanceEvent,
+    AttendanceEventType,
+    AttendanceLog,
+    AttendanceSummary,
+)
+
+# 同時刻の入退室は退室を先に処理する（チャンネルの再接続を2回の参加として扱う）
+EVENT_ORDER = {AttendanceEventType.LEAVE: 0, AttendanceEventType.JOIN: 1}
+
+
+class AttendancePolicy(BaseModel):
+    """参加ログの集計ルール"""
+
+    timezone: str = Field('Asia/Tokyo', description='日付・朝活時間帯の判定に使う')
+    min_valid_minutes: int = Field(5, description='有効な参加とみなす最低時間(分)')
+    morning_start: dt.time = Field(dt.time(6, 0), description='朝活時間帯の開始')
+    morning_end: dt.time = Field(dt.time(7, 0), description='朝活時間帯の終了')
+
+    @property
+    def zone(self) -> ZoneInfo:
+        return ZoneInfo(self.timezone)
+
+    def local_date(self, moment: dt.datetime) -> dt.date:
+        """日時が属する日付（policy のタイムゾーン）"""
+        return moment.astimezone(self.zone).date()
+
+    def day_range(self, day: dt.date) -> tuple[dt.datetime, dt.datetime]:
+        """日付の開始・終了日時 [start, end)"""
+        start = dt.datetime.combine(day, dt.time(0), tzinfo=self.zone)
+        end = dt.datetime.combine(
+            day + dt.timedelta(days=1), dt.time(0), tzinfo=self.zone
+        )
+        return start, end
+
+
+def close_log(
+    log: AttendanceLog, left_at: dt.datetime, policy: AttendancePolicy
+) -> AttendanceLog:
+    """退出日時を記録し、参加時間と有効・無効を計算"""
+    duration = int((left_at - log.joined_at).total_seconds() // 60)
+    return log.model_copy(
+        update={
+            'left_at': left_at,
+            'duration_minutes': duration,
+            'is_valid': duration >= policy.min_valid_minutes,
+        }
+    )
+
+
+def build_logs(
+    events: Iterable[AttendanceEvent],
+    open_logs: Iterable[AttendanceLog],
+    policy: AttendancePolicy,
+) -> list[AttendanceLog]:
+    """
+    入退室イベントを (ユーザー, チャンネル) ごとに時刻順に並べ、参加ログにまとめる
+
+    - 参加中のログと同時刻の入室（同じイベントの重複配信）は無視する
+    - 参加中のログより後の入室は退室の取りこぼしとみなし、前のログを参加時間0の
+      無効なログとして閉じてから新しいログを始める（取りこぼした間を参加に数えない）
+    - 参加していないときの退室と、参加中のログより前のイベント（再送）は無視する
+    - 前回までに入室したまま閉じていないログ（open_logs）は、このバッチの退室で閉じる
+    - 退室のない入室は参加中（left_at=None）のログとして返す
+
+    Returns:
+        list[AttendanceLog]: 作成・更新された参加ログ（変化のない open_logs は含まない）
+    """
+    events_by_key: dict[tuple[UUID, str], list[AttendanceEvent]] = defaultdict(list)
+    for event in events:
+        events_by_key[(event.user_id, event.discord_channel_id)].append(event)
+    open_by_key = {(log.user_id, log.discord_channel_id): log for log in open_logs}
+
+    logs: list[AttendanceLog] = []
+    for key, channel_events in events_by_key.items():
+        channel_events.sort(key=lambda e: (e.occurred_at, EVENT_ORDER[e.type]))
+        current = open_by_key.get(key)
+        changed = False
+        for event in channel_events:
+            if current is not None and event.occurred_at <= current.joined_at:
+                continue
+            if event.type is AttendanceEventType.JOIN:
+                if current is not None:
+                    logs.append(close_log(current, current.joined_at, policy))
+                current = AttendanceLog(
+                    user_id=event.user_id,
+                    discord_channel_id=event.discord_channel_id,
+                    joined_at=event.occurred_at,
+                )
+                changed = True
+            elif current is not None:
+                logs.append(close_log(current, event.occurred_at, policy))
+                current = None
+                changed = False
+        if current is not None and changed:
+            logs.append(current)
+    return logs
+
+
+def merge_intervals(
+    intervals: Iterable[tuple[dt.datetime, dt.datetime]],
+) -> list[tuple[dt.datetime, dt.datetime]]:
+    """重なる・接する区間をまとめる"""
+    merged: list[tuple[dt.datetime, dt.datetime]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def summarize_day(
+    user_id: UUID,
+    day: dt.date,
+    logs: Iterable[AttendanceLog],
+    policy: AttendancePolicy,
+) -> AttendanceSummary:
+    """
+    1ユーザー・1日分の参加ログから参加サマリーを計算
+
+    チャンネル移動や複数チャンネルへの同時接続で重なった参加は1回にまとめ、
+    まとめた後の参加が最低時間以上のものを有効なセッションとして数える
+    （短いログの連続でも、まとめて最低時間を超えれば参加とみなす）。
+
+    Args:
+        user_id: ユーザーID
+        day: 対象日
+        logs: 入室日時が day に属する参加ログ（参加中のログは無視する）
+        policy: 集計ルール
+    """
+    sessions = [
+        (start, end)
+        for start, end in merge_intervals(
+            (log.joined_at, log.left_at) for log in logs if log.left_at is not None
+        )
+        if (end - start).total_seconds() // 60 >= policy.min_valid_minutes
+    ]
+    if not sessions:
+        return AttendanceSummary(user_id=user_id, date=day)
+
+    zone = policy.zone
+    morning_start = dt.datetime.combine(day, policy.morning_start, tzinfo=zone)
+    morning_end = dt.datetime.combine(day, policy.morning_end, tzinfo=zone)
+    return AttendanceSummary(
+        user_id=user_id,
+        date=day,
+        session_count=len(sessions),
+        total_duration_minutes=sum(
+            int((end - start).total_seconds() // 60) for start, end in sessions
+        ),
+        first_join_time=sessions[0][0].astimezone(zone).time(),
+        last_leave_time=sessions[-1][1].astimezone(zone).time(),
+        is_morning_active=any(
+            start < morning_end and end > morning_start for start, end in sessions
+        ),
+    )
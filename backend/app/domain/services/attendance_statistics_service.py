@@ -0,0 +1,284 @@
+import datetime as dt
+from collections.abc import Callable, Iterable
+from uuid import UUID
+
+from app.domain.entities.attendance import AttendanceStatistics, AttendanceSummary
+
+ONE_DAY = dt.timedelta(days=1)
+
+# 指定期間 [start, end] の参加日を返す関数
+AttendedDatesLoader = Callable[[dt.date, dt.date], set[dt.date]]
+
+
+def recompute_statistics(
+    user_id: UUID, summaries: Iterable[AttendanceSummary]
+) -> AttendanceStatistics:
+    """
+    全サマリーから参加統計を計算し直す（参加履歴の長さに比例する）
+
+    差分更新の検証用の基準実装であり、差分更新で扱えないケースの最終手段でもある。
+    """
+    summaries = list(summaries)
+    attended = sorted(summary.date for summary in summaries if summary.is_attended)
+    statistics = AttendanceStatistics(
+        user_id=user_id,
+        total_attendance_days=len(attended),
+        total_duration_minutes=sum(s.total_duration_minutes for s in summaries),
+    )
+    if not attended:
+        return statistics
+
+    run = 0
+    previous = None
+    for day in attended:
+        run = run + 1 if previous is not None and day - previous == ONE_DAY else 1
+        statistics.max_streak_days = max(statistics.max_streak_days, run)
+        previous = day
+
+    statistics.current_streak_days = run
+    statistics.first_attendance_date = attended[0]
+    statistics.last_attendance_date = attended[-1]
+    return statistics
+
+
+class AttendanceStatisticsService:
+    """
+    日次サマリーの更新を参加統計へ差分で反映するドメインサービス
+
+    - 最後の参加日以降の日（通常の「今日の参加」）の追加: O(1)
+    - 過去日の追加（バックフィル）: 追加した日の前後の連続参加だけを読む
+      （読み込む日数は連続参加日数に比例し、履歴全体の長さには依存しない）
+    - 参加日の取り消し: 取り消した日の前後の連続参加だけを読む。取り消した日を含む
+      連続参加が最長だった場合だけ、最大連続参加日数を求めるため参加期間全体を読む
+
+    Args:
+        chunk_days: バックフィル時に前後の参加日を一度に読む日数
+    """
+
+    def __init__(self, chunk_days: int = 31):
+        self.chunk_days = chunk_days
+
+    def apply(
+        self,
+        statistics: AttendanceStatistics,
+        previous: AttendanceSummary | None,
+        summary: AttendanceSummary,
+        load_attended_dates: AttendedDatesLoader,
+    ) -> AttendanceStatistics:
+        """
+        1日分のサマリーの追加・更新を参加統計へ反映
+
+        Args:
+            statistics: 更新前の参加統計
+            previous: 同じ日の更新前のサマリー（新規の場合はNone）
+            summary: 更新後のサマリー
+            load_attended_dates: 参加日を期間指定で取得する関数。
+                summary.date 以外の日については更新前後で同じ結果を返すこと
+
+        Returns:
+            AttendanceStatistics: 更新後の参加統計
+        """
+        updated = statistics.model_copy()
+        updated.total_duration_minutes += summary.total_duration_minutes - (
+            previous.total_duration_minutes if previous else 0
+        )
+
+        was_attended = previous is not None and previous.is_attended
+        if was_attended == summary.is_attended:
+            return updated
+
+        if not summary.is_attended:
+            return self._remove_day(updated, summary.date, load_attended_dates)
+        return self._add_day(updated, summary.date, load_attended_dates)
+
+    def apply_many(
+        self,
+        statistics: AttendanceStatistics,
+        changes: Iterable[tuple[AttendanceSummary | None, AttendanceSummary]],
+        load_attended_dates: AttendedDatesLoader,
+    ) -> AttendanceStatistics:
+        """
+        同じユーザーの複数日分のサマリーの更新を日付順に反映
+
+        Args:
+            statistics: 更新前の参加統計
+            changes: (更新前のサマリー, 更新後のサマリー) のリスト（日付の重複なし）
+            load_attended_dates: 参加日を期間指定で取得する関数。
+                changes の全ての更新を保存した後の状態を返すこと
+                （まだ反映していない日は、ここで更新前の状態に戻して apply に渡す）
+
+        Returns:
+            AttendanceStatistics: 更新後の参加統計
+        """
+        ordered = sorted(changes, key=lambda change: change[1].date)
+        pending = {
+            summary.date: previous is not None and previous.is_attended
+            for previous, summary in ordered
+        }
+
+        def load_before_pending(start: dt.date, end: dt.date) -> set[dt.date]:
+            attended = set(load_attended_dates(start, end))
+            for day, was_attended in pending.items():
+                if start <= day <= end:
+                    if was_attended:
+                        attended.add(day)
+                    else:
+                        attended.discard(day)
+            return attended
+
+        for previous, summary in ordered:
+            del pending[summary.date]
+            statistics = self.apply(statistics, previous, summary, load_before_pending)
+        return statistics
+
+    def _add_day(
+        self,
+        statistics: AttendanceStatistics,
+        day: dt.date,
+        load_attended_dates: AttendedDatesLoader,
+    ) -> AttendanceStatistics:
+        statistics.total_attendance_days += 1
+        last = statistics.last_attendance_date
+
+        # 初回の参加
+        if last is None:
+            statistics.first_attendance_date = day
+            statistics.last_attendance_date = day
+            statistics.current_streak_days = 1
+            statistics.max_streak_days = max(statistics.max_streak_days, 1)
+            return statistics
+
+        # 最後の参加日より後の日（通常のケース）
+        if day > last:
+            if day - last == ONE_DAY:
+                statistics.current_streak_days += 1
+            else:
+                statistics.current_streak_days = 1
+            statistics.last_attendance_date = day
+            statistics.max_streak_days = max(
+                statistics.max_streak_days, statistics.current_streak_days
+            )
+            return statistics
+
+        # 過去日の追加: 前後の連続参加とつながる
+        if (
+            statistics.first_attendance_date is None
+            or day < statistics.first_attendance_date
+        ):
+            statistics.first_attendance_date = day
+        before = self._run_length(day, -1, load_attended_dates)
+        after = self._run_length(day, 1, load_attended_dates)
+        merged = before + 1 + after
+        if day + after * ONE_DAY == last:
+            statistics.current_streak_days = merged
+        statistics.max_streak_days = max(statistics.max_streak_days, merged)
+        return statistics
+
+    def _remove_day(
+        self,
+        statistics: AttendanceStatistics,
+        day: dt.date,
+        load_attended_dates: AttendedDatesLoader,
+    ) -> AttendanceStatistics:
+        first = statistics.first_attendance_date
+        last = statistics.last_attendance_date
+        statistics.total_attendance_days -= 1
+        if first is None or last is None or first == last:
+            return self._clear_attendance(statistics)
+
+        # 取り消した日を含む連続参加は before 日と after 日の2つに分かれる
+        before = self._run_length(day, -1, load_attended_dates)
+        after = self._run_length(day, 1, load_attended_dates)
+
+        if day == first:
+            statistics.first_attendance_date = (
+                day + ONE_DAY
+                if after
+                else self._nearest_attended(day, 1, last, load_attended_dates)
+            )
+        if day == last:
+            new_last = (
+                day - ONE_DAY
+                if before
+                else self._nearest_attended(day, -1, first, load_attended_dates)
+            )
+            statistics.last_attendance_date = new_last
+            statistics.current_streak_days = before or (
+                1 + self._run_length(new_last, -1, load_attended_dates)
+            )
+        elif day + after * ONE_DAY == last:
+            statistics.current_streak_days = after
+
+        # 最長の連続参加を分割した場合だけ、他の連続参加と比べ直す
+        if before + 1 + after >= statistics.max_streak_days:
+            statistics.max_streak_days = self._longest_run(
+                statistics.first_attendance_date,
+                statistics.last_attendance_date,
+                day,
+                load_attended_dates,
+            )
+        return statistics
+
+    def _clear_attendance(self, statistics: AttendanceStatistics) -> AttendanceStatistics:
+        """唯一の参加日を取り消した（参加日がなくなった）"""
+        statistics.total_attendance_days = 0
+        statistics.current_streak_days = 0
+        statistics.max_streak_days = 0
+        statistics.first_attendance_date = None
+        statistics.last_attendance_date = None
+        return statistics
+
+    def _nearest_attended(
+        self,
+        day: dt.date,
+        direction: int,
+        bound: dt.date,
+        load_attended_dates: AttendedDatesLoader,
+    ) -> dt.date:
+        """day の隣（direction 方向）から bound までで最も近い参加日"""
+        cursor = day + direction * ONE_DAY
+        while (bound - cursor).days * direction >= 0:
+            chunk_end = cursor + direction * (self.chunk_days - 1) * ONE_DAY
+            if (chunk_end - bound).days * direction > 0:
+                chunk_end = bound
+            start, end = sorted((cursor, chunk_end))
+            attended = load_attended_dates(start, end)
+            if attended:
+                return min(attended) if direction > 0 else max(attended)
+            cursor = chunk_end + direction * ONE_DAY
+        return bound
+
+    def _longest_run(
+        self,
+        first: dt.date,
+        last: dt.date,
+        removed: dt.date,
+        load_attended_dates: AttendedDatesLoader,
+    ) -> int:
+        """[first, last] の参加日（removed を除く）の最大連続参加日数"""
+        attended = set(load_attended_dates(first, last))
+        attended.discard(removed)
+        longest = 0
+        run = 0
+        previous = None
+        for current in sorted(attended):
+            run = run + 1 if previous is not None and current - previous == ONE_DAY else 1
+            longest = max(longest, run)
+            previous = current
+        return longest
+
+    def _run_length(
+        self, day: dt.date, direction: int, load_attended_dates: AttendedDatesLoader
+    ) -> int:
+        """day の隣（direction 方向）から途切れるまでの連続参加日数"""
+        length = 0
+        cursor = day + direction * ONE_DAY
+        while True:
+            chunk_end = cursor + direction * (self.chunk_days - 1) * ONE_DAY
+            start, end = sorted((cursor, chunk_end))
+            attended = load_attended_dates(start, end)
+            for _ in range(self.chunk_days):
+                if cursor not in attended:
+                    return length
+                length += 1
+                cursor += direction * ONE_DAY
@@ -0,0 +1,272 @@
+import calendar
+import datetime as dt
+import heapq
+from collections.abc import Generator, Iterable, Iterator
+from dataclasses import dataclass
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from pydantic import BaseModel, Field
+
+from app.domain.entities.event import (
+    Event,
+    EventOccurrence,
+    EventStatus,
+    RecurrencePattern,
+)
+
+ONE_DAY = dt.timedelta(days=1)
+# 「now より後」を半開区間 [lo, hi) で表すための最小の刻み
+RESOLUTION = dt.timedelta(microseconds=1)
+# 一定間隔で繰り返すパターンの間隔（日数）
+PERIOD_DAYS = {
+    RecurrencePattern.DAILY: 1,
+    RecurrencePattern.WEEKLY: 7,
+    RecurrencePattern.BIWEEKLY: 14,
+}
+WEEKDAY_COUNT = 5  # 月〜金（date.weekday() が 5 未満）
+
+
+class EventSchedulePolicy(BaseModel):
+    """イベント一覧の開催回の展開ルール"""
+
+    timezone: str = Field('Asia/Tokyo', description='開催日・開始時刻を解釈する')
+    default_window_days: int = Field(90, description='期間の指定がない場合の日数')
+
+    @property
+    def zone(self) -> ZoneInfo:
+        return ZoneInfo(self.timezone)
+
+    def window(
+        self,
+        now: dt.datetime,
+        status: EventStatus | None = None,
+        date_from: dt.datetime | None = None,
+        date_to: dt.datetime | None = None,
+    ) -> 'OccurrenceWindow':
+        """
+        一覧の対象期間を決める
+
+        date_from の既定は今日の0時（ongoing は日をまたぐ開催を含めるため now の1日前、
+        past は date_to の default_window_days 日前）、date_to の既定は date_from の
+        default_window_days 日後（past は now）。タイムゾーンのない日時は policy の
+        タイムゾーンの時刻とみなす。
+        """
+        span = dt.timedelta(days=self.default_window_days)
+        now = now.astimezone(self.zone)
+        date_from = self._localize(date_from)
+        date_to = self._localize(date_to)
+        if status == EventStatus.PAST:
+            date_to = date_to or now
+            date_from = date_from or date_to - span
+        if date_from is None:
+            if status == EventStatus.ONGOING:
+                date_from = now - ONE_DAY
+            else:
+                today = now.date()
+                date_from = dt.datetime.combine(today, dt.time(0), tzinfo=self.zone)
+        if date_to is None:
+            date_to = date_from + span
+        return OccurrenceWindow(start=date_from, end=date_to, status=status, now=now)
+
+    def _localize(self, moment: dt.datetime | None) -> dt.datetime | None:
+        if moment is None or moment.tzinfo is not None:
+            return moment
+        return moment.replace(tzinfo=self.zone)
+
+
+@dataclass(frozen=True, slots=True)
+class OccurrenceWindow:
+    """
+    一覧に含める開催回の条件
+
+    開始日時が [start, end) に入り、status を指定した場合は now 時点でその状態の開催回。
+
+    Attributes:
+        start: 期間の開始（タイムゾーン付き、含む）
+        end: 期間の終了（タイムゾーン付き、含まない）
+        status: 開催回の状態（None は絞り込まない）
+        now: 状態を判定する日時
+    """
+
+    start: dt.datetime
+    end: dt.datetime
+    status: EventStatus | None = None
+    now: dt.datetime | None = None
+
+    def start_range(self, duration: dt.timedelta) -> tuple[dt.datetime, dt.datetime]:
+        """
+        開催時間が duration のイベントについて、条件を満たす開始日時の範囲 [lo, hi)
+
+        upcoming は now < 開始、ongoing は 開始 <= now < 終了、past は 終了 <= now。
+        """
+        lo, hi = self.start, self.end
+        if self.status is None or self.now is None:
+            return lo, hi
+        if self.status == EventStatus.UPCOMING:
+            lo = max(lo, self.now + RESOLUTION)
+        elif self.status == EventStatus.ONGOING:
+            lo = max(lo, self.now - duration + RESOLUTION)
+            hi = min(hi, self.now + RESOLUTION)
+        else:
+            hi = min(hi, self.now - duration + RESOLUTION)
+        return lo, hi
+
+    def dates(self, zone: ZoneInfo) -> tuple[dt.date, dt.date]:
+        """開始日時が期間に入りうる開催日の範囲（両端を含む。status の絞り込み前）"""
+        return self.start.astimezone(zone).date(), self.end.astimezone(zone).date()
+
+
+def event_duration(event: Event) -> dt.timedelta:
+    """開催時間（終了時刻が開始時刻以前なら翌日に終わる）"""
+    base = dt.date(2000, 1, 1)
+    duration = dt.datetime.combine(base, event.end_time) - dt.datetime.combine(
+        base, event.start_time
+    )
+    if duration <= dt.timedelta(0):
+        duration += ONE_DAY
+    return duration
+
+
+def occurrence_dates(event: Event, first: dt.date, last: dt.date) -> Iterator[dt.date]:
+    """
+    first〜last（両端を含む）の開催日を昇順に1日ずつ生成する
+
+    繰り返しの途中から始める場合も初回の開催日から数え直さず、最初の開催日を
+    計算で求める（期間の長さに関係なく、保持するのは現在の日付だけ）。
+    """
+    pattern = event.recurrence
+    if pattern is None:
+        if first <= event.scheduled_date <= last:
+            yield event.scheduled_date
+        return
+
+    first = max(first, event.scheduled_date)
+    if pattern == RecurrencePattern.MONTHLY:
+        yield from _monthly_dates(event.scheduled_date.day, first, last)
+        return
+    if pattern == RecurrencePattern.WEEKDAYS:
+        day = first
+        while day <= last:
+            if day.weekday() < WEEKDAY_COUNT:
+                yield day
+            day += ONE_DAY
+        return
+
+    period = PERIOD_DAYS[pattern]
+    day = first + dt.timedelta(days=-(first - event.scheduled_date).days % period)
+    step = dt.timedelta(days=period)
+    while day <= last:
+        yield day
+        day += step
+
+
+def count_occurrence_dates(event: Event, first: dt.date, last: dt.date) -> int:
+    """first〜last（両端を含む）の開催日の数（月単位以外は生成せずに計算する）"""
+    pattern = event.recurrence
+    if pattern is None:
+        return 1 if first <= event.scheduled_date <= last else 0
+
+    first = max(first, event.scheduled_date)
+    if first > last:
+        return 0
+    if pattern == RecurrencePattern.MONTHLY:
+        return sum(1 for _ in _monthly_dates(event.scheduled_date.day, first, last))
+
+    days = (last - first).days + 1
+    if pattern == RecurrencePattern.WEEKDAYS:
+        weeks, rest = divmod(days, 7)
+        start = first.weekday()
+        return weeks * WEEKDAY_COUNT + sum(
+            1 for offset in range(rest) if (start + offset) % 7 < WEEKDAY_COUNT
+        )
+
+    period = PERIOD_DAYS[pattern]
+    skip = -(first - event.scheduled_date).days % period
+    if skip >= days:
+        return 0
+    return (days - 1 - skip) // period + 1
+
+
+def expand(
+    event: Event, window: OccurrenceWindow, zone: ZoneInfo
+) -> Iterator[EventOccurrence]:
+    """
+    イベントの開催回のうち window の条件を満たすものを開始日時の昇順に生成する
+
+    開催時間は壁時計の時刻で数える（夏時間の切り替えをまたぐ開催回は、
+    状態の判定が切り替えの幅だけずれうる）。
+    """
+    duration = event_duration(event)
+    bounds = _date_bounds(event, window, duration, zone)
+    if bounds is None:
+        return
+    for day in occurrence_dates(event, *bounds):
+        starts_at = dt.datetime.combine(day, event.start_time, tzinfo=zone)
+        yield EventOccurrence(
+            event=event, starts_at=starts_at, ends_at=starts_at + duration
+        )
+
+
+def count_occurrences(event: Event, window: OccurrenceWindow, zone: ZoneInfo) -> int:
+    """expand が生成する開催回の数"""
+    bounds = _date_bounds(event, window, event_duration(event), zone)
+    if bounds is None:
+        return 0
+    return count_occurrence_dates(event, *bounds)
+
+
+def occurrence_sort_key(occurrence: EventOccurrence) -> tuple[dt.datetime, UUID]:
+    """一覧の並び順（開始日時、同時刻はイベントID順）"""
+    return occurrence.starts_at, occurrence.event.id
+
+
+def merge_occurrences(
+    one_off_events: Iterable[Event],
+    recurring_events: Iterable[Event],
+    window: OccurrenceWindow,
+    zone: ZoneInfo,
+) -> Generator[EventOccurrence, None, None]:
+    """
+    単発イベントと定期開催の開催回を開始日時順に1本にまとめる
+
+    one_off_events は (開催日, 開始時刻, ID) の昇順で渡す。定期開催はイベントごとに
+    expand した生成器を heapq.merge で k-way マージするため、メモリに載るのは
+    各イベントの次の1回分だけで、期間の長さには比例しない。
+    """
+    one_off = (
+        occurrence
+        for event in one_off_events
+        for occurrence in expand(event, window, zone)
+    )
+    recurring = [expand(event, window, zone) for event in recurring_events]
+    return heapq.merge(one_off, *recurring, key=occurrence_sort_key)
+
+
+def _date_bounds(
+    event: Event, window: OccurrenceWindow, duration: dt.timedelta, zone: ZoneInfo
+) -> tuple[dt.date, dt.date] | None:
+    """開始日時が window の範囲に入る開催日の範囲（両端を含む。空なら None）"""
+    lo, hi = window.start_range(duration)
+    if lo >= hi:
+        return None
+    first = lo.astimezone(zone).date()
+    if dt.datetime.combine(first, event.start_time, tzinfo=zone) < lo:
+        first += ONE_DAY
+    last = hi.astimezone(zone).date()
+    if dt.datetime.combine(last, event.start_time, tzinfo=zone) >= hi:
+        last -= ONE_DAY
+    if first > last:
+        return None
+    return first, last
+
+
+def _monthly_dates(day_of_month: int, first: dt.date, last: dt.date) -> Iterator[dt.date]:
+    """first〜last の各月の day_of_month 日（その日がない月は飛ばす）"""
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        if day_of_month <= calendar.monthrange(year, month)[1]:
+            day = dt.date(year, month, day_of_month)
+            if first <= day <= last:
+                yield day
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
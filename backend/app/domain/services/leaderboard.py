@@ -0,0 +1,140 @@
+import bisect
+from collections.abc import Iterable
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class LeaderboardEntry:
+    """ランキングの1行"""
+
+    rank: int
+    user_id: UUID
+    score: int
+
+
+class Leaderboard:
+    """
+    スコア（参加日数など）の降順に並んだランキング
+
+    スコアごとの人数を Fenwick 木（Binary Indexed Tree）で持ち、
+    同じスコアのユーザーはユーザーID順のリストで持つ。
+
+    - update: O(log S + 同スコアの人数)（S はスコアの上限。超えたら倍に広げる）
+    - rank_of: O(log S)。順位は「自分より高いスコアの人数 + 1」（同点は同順位）
+    - page: O(limit + ページ内のスコアの種類数 × log S)
+
+    スコアが0以下のユーザーはランキングに含めない。
+    スレッドセーフではない（呼び出し側でロックする）。
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._capacity = max(capacity, 1)
+        # 木のインデックス i はスコア (capacity - i + 1) に対応する（上位から数えるため反転）
+        self._tree = [0] * (self._capacity + 1)
+        self._buckets: dict[int, list[UUID]] = {}
+        self._scores: dict[UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, user_id: UUID) -> bool:
+        return user_id in self._scores
+
+    def score_of(self, user_id: UUID) -> int | None:
+        return self._scores.get(user_id)
+
+    def update(self, user_id: UUID, score: int) -> None:
+        """ユーザーのスコアを設定（0以下ならランキングから外す）"""
+        previous = self._scores.get(user_id)
+        if previous == score or (previous is None and score <= 0):
+            return
+        if previous is not None:
+            self._remove(user_id, previous)
+        if score > 0:
+            self._insert(user_id, score)
+
+    def update_many(self, scores: Iterable[tuple[UUID, int]]) -> None:
+        for user_id, score in scores:
+            self.update(user_id, score)
+
+    def rank_of(self, user_id: UUID) -> int | None:
+        """順位（ランキング外なら None）"""
+        score = self._scores.get(user_id)
+        if score is None:
+            return None
+        return self._count_above(score) + 1
+
+    def page(self, offset: int, limit: int) -> list[LeaderboardEntry]:
+        """上位から offset 件目以降の limit 件"""
+        entries: list[LeaderboardEntry] = []
+        if offset < 0 or limit <= 0:
+            return entries
+
+        # 次に読む位置が属するスコアを木の上で二分探索し、スコアごとにまとめて読む
+        position = offset
+        while len(entries) < limit and position < len(self._scores):
+            score = self._capacity - self._find_index(position + 1) + 1
+            above = self._count_above(score)
+            bucket = self._buckets[score]
+            start = position - above
+            entries.extend(
+                LeaderboardEntry(rank=above + 1, user_id=user_id, score=score)
+                for user_id in bucket[start : start + limit - len(entries)]
+            )
+            position = above + len(bucket)
+        return entries
+
+    def _insert(self, user_id: UUID, score: int) -> None:
+        if score > self._capacity:
+            self._grow(score)
+        bucket = self._buckets.setdefault(score, [])
+        bisect.insort(bucket, user_id)
+        self._scores[user_id] = score
+        self._add(score, 1)
+
+    def _remove(self, user_id: UUID, score: int) -> None:
+        bucket = self._buckets[score]
+        del bucket[bisect.bisect_left(bucket, user_id)]
+        if not bucket:
+            del self._buckets[score]
+        del self._scores[user_id]
+        self._add(score, -1)
+
+    def _grow(self, score: int) -> None:
+        capacity = self._capacity
+        while capacity < score:
+            capacity *= 2
+        self._capacity = capacity
+        self._tree = [0] * (capacity + 1)
+        for bucket_score, bucket in self._buckets.items():
+            self._add(bucket_score, len(bucket))
+
+    def _add(self, score: int, delta: int) -> None:
+        index = self._capacity - score + 1
+        while index <= self._capacity:
+            self._tree[index] += delta
+            index += index & -index
+
+    def _prefix(self, index: int) -> int:
+        total = 0
+        while index > 0:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+    def _count_above(self, score: int) -> int:
+        """score より高いスコアの人数"""
+        return self._prefix(self._capacity - score)
+
+    def _find_index(self, k: int) -> int:
+        """上位から数えて k 人目（1始まり）が属する木のインデックス"""
+        index = 0
+        step = 1 << self._capacity.bit_length()
+        while step:
+            next_index = index + step
+            if next_index <= self._capacity and self._tree[next_index] < k:
+                index = next_index
+                k -= self._tree[next_index]
+            step >>= 1
+        return index + 1
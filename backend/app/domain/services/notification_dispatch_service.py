@@ -0,0 +1,53 @@
+from collections.abc import Iterable, Mapping, Sequence
+from uuid import UUID
+
+from app.domain.entities.notification import (
+    DispatchPlan,
+    DueNotification,
+    NotificationAudience,
+    NotificationSettings,
+)
+
+
+def settings_for(
+    settings: Mapping[UUID, NotificationSettings], user_id: UUID
+) -> NotificationSettings:
+    """ユーザーの通知設定（行がなければ既定値）"""
+    return settings.get(user_id) or NotificationSettings(user_id=user_id)
+
+
+def plan_dispatch(
+    notifications: Iterable[DueNotification],
+    settings: Mapping[UUID, NotificationSettings],
+    followers: Mapping[UUID, Sequence[UUID]],
+) -> DispatchPlan:
+    """
+    確保した通知の配信内容を決める
+
+    本人宛ての通知は、そのタイプを無効にしているユーザーの分を削除し、残りを送信済みにする。
+    ライバル宛ての通知は、user_id をライバルにしているユーザーのうち有効にしている人だけに
+    複製する（本人には複製しない）。
+
+    Args:
+        notifications: 確保した通知
+        settings: ユーザーID -> 通知設定（行のないユーザーは含めなくてよい）
+        followers: ユーザーID -> そのユーザーをライバルにしているユーザーのID
+
+    Returns:
+        DispatchPlan: 配信内容
+    """
+    plan = DispatchPlan()
+    for notification in notifications:
+        if notification.audience == NotificationAudience.RIVAL_FOLLOWERS:
+            recipients = [
+                user_id
+                for user_id in followers.get(notification.user_id, ())
+                if user_id != notification.user_id
+                and settings_for(settings, user_id).allows(notification.type)
+            ]
+            plan.fanouts.append((notification, recipients))
+        elif settings_for(settings, notification.user_id).allows(notification.type):
+            plan.delivered_ids.append(notification.id)
+        else:
+            plan.suppressed_ids.append(notification.id)
+    return plan
@@ -0,0 +1,83 @@
+import bisect
+from collections.abc import Iterable, Mapping
+from uuid import UUID
+
+from app.domain.entities.attendance import AttendanceStatistics
+from app.domain.entities.title import TitleAward
+from app.domain.repositories.title_achievement_repository import (
+    ITitleAchievementRepository,
+)
+
+# 称号レベル (1-8) ごとの必要な総参加日数（レベル順に昇順）
+TITLE_THRESHOLDS: tuple[int, ...] = (0, 7, 30, 60, 100, 150, 250, 365)
+
+
+def title_level_for(total_attendance_days: int) -> int:
+    """総参加日数で到達している称号レベル（1-8）"""
+    return max(bisect.bisect_right(TITLE_THRESHOLDS, total_attendance_days), 1)
+
+
+def evaluate_titles(
+    statistics: Iterable[AttendanceStatistics],
+    highest_levels: Mapping[UUID, int],
+) -> list[TitleAward]:
+    """
+    参加統計から新しく獲得した称号を求める
+
+    獲得済みの最高レベルより上で、総参加日数が到達している全てのレベルを付与する
+    （バックフィルで複数のレベルを一度に越えた場合も途中のレベルを飛ばさない）。
+    称号は取り消さないため、参加日数が減っても獲得済みの称号はそのまま。
+
+    Args:
+        statistics: 参加統計
+        highest_levels: ユーザーID -> 獲得済みの最高レベル（未獲得のユーザーは含めない）
+
+    Returns:
+        list[TitleAward]: 新しく獲得した称号（ユーザーID順）
+    """
+    awards = []
+    for item in sorted(statistics, key=lambda s: s.user_id):
+        reached = title_level_for(item.total_attendance_days)
+        highest = highest_levels.get(item.user_id, 0)
+        if reached > highest:
+            awards.append(
+                TitleAward(
+                    user_id=item.user_id, levels=list(range(highest + 1, reached + 1))
+                )
+            )
+    return awards
+
+
+class TitleAwardService:
+    """
+    参加統計の更新後に称号を付与するドメインサービス
+
+    参加統計を更新したトランザクションの中で呼ぶ。獲得済みの最高レベルの取得1回と、
+    付与（新しく獲得したユーザーがいる場合のみ）で済み、ユーザー数に比例した往復をしない。
+    """
+
+    def __init__(self, title_achievement_repository: ITitleAchievementRepository):
+        self.title_achievement_repository = title_achievement_repository
+
+    def award(self, statistics: Iterable[AttendanceStatistics]) -> list[TitleAward]:
+        """
+        参加統計から新しく獲得した称号を付与
+
+        Args:
+            statistics: 更新後の参加統計
+
+        Returns:
+            list[TitleAward]: 付与した称号
+        """
+        statistics = list(statistics)
+        if not statistics:
+            return []
+
+        awards = evaluate_titles(
+            statistics,
+            self.title_achievement_repository.get_highest_levels(
+                [item.user_id for item in statistics]
+            ),
+        )
+        self.title_achievement_repository.award(awards)
+        return awards
@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from functools import lru_cache
+from uuid import UUID
+
+from app.config import get_settings
+from app.domain.entities.notification import NotificationSettings
+from app.domain.repositories.notification_settings_repository import (
+    INotificationSettingsRepository,
+)
+
+
+@dataclass(frozen=True)
+class NotificationSettingsCacheStats:
+    """通知設定キャッシュの統計情報"""
+
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class NotificationSettingsCache:
+    """
+    ユーザーごとの通知設定を保持する TTL 付き LRU キャッシュ（ワーカープロセス内で共有）
+
+    notification_settings の行がないユーザーも None として保持し、既定値のユーザーを
+    毎回問い合わせないようにする。設定の変更は TTL が切れるまで反映されない。
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[UUID, tuple[NotificationSettings | None, float]] = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_many(
+        self, user_ids: Collection[UUID]
+    ) -> tuple[dict[UUID, NotificationSettings | None], list[UUID]]:
+        """
+        キャッシュ済みの通知設定を取得
+
+        Returns:
+            tuple: (ユーザーID -> 通知設定（行がなければ None）, キャッシュになかったユーザーID)
+        """
+        found: dict[UUID, NotificationSettings | None] = {}
+        missing: list[UUID] = []
+        now = self.clock()
+        with self._lock:
+            for user_id in user_ids:
+                entry = self._entries.get(user_id)
+                if entry is None or entry[1] <= now:
+                    missing.append(user_id)
+                    continue
+                self._entries.move_to_end(user_id)
+                found[user_id] = entry[0]
+            self._hits += len(found)
+            self._misses += len(missing)
+        return found, missing
+
+    def put_many(self, settings: dict[UUID, NotificationSettings | None]) -> None:
+        """通知設定を保存（行がないユーザーは None）"""
+        if self.maxsize <= 0:
+            return
+        expires_at = self.clock() + self.ttl_seconds
+        with self._lock:
+            for user_id, item in settings.items():
+                self._entries[user_id] = (item, expires_at)
+                self._entries.move_to_end(user_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """全エントリを削除"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> NotificationSettingsCacheStats:
+        """統計情報を取得"""
+        with self._lock:
+            return NotificationSettingsCacheStats(
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+
+class CachedNotificationSettingsRepository(INotificationSettingsRepository):
+    """
+    通知設定をキャッシュから返し、キャッシュにないユーザーだけをまとめて読むリポジトリ
+
+    配信ワーカーは同じユーザー（リマインダーの対象者、ライバルに設定している人）の設定を
+    バッチごとに繰り返し参照するため、ユーザーごとの問い合わせをキャッシュで省く。
+    """
+
+    def __init__(
+        self,
+        repository: INotificationSettingsRepository,
+        cache: NotificationSettingsCache,
+    ):
+        self.repository = repository
+        self.cache = cache
+
+    def get_many(self, user_ids: Collection[UUID]) -> dict[UUID, NotificationSettings]:
+        found, missing = self.cache.get_many(set(user_ids))
+        if missing:
+            loaded = self.repository.get_many(missing)
+            fetched = {user_id: loaded.get(user_id) for user_id in missing}
+            self.cache.put_many(fetched)
+            found.update(fetched)
+        return {user_id: item for user_id, item in found.items() if item is not None}
+
+
+@lru_cache
+def get_notification_settings_cache() -> NotificationSettingsCache:
+    """Settings のサイズ・TTL で通知設定キャッシュを生成（プロセス内で共有）"""
+    settings = get_settings()
+    return NotificationSettingsCache(
+        maxsize=settings.notification_settings_cache_size,
+        ttl_seconds=settings.notification_settings_cache_ttl_seconds,
+    )
@@ -0,0 +1,198 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Protocol
+
+from app.application.interfaces.response_cache import (
+    CachedResponse,
+    CacheNamespace,
+    IResponseCache,
+)
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """レスポンスキャッシュの統計情報"""
+
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class InMemoryResponseCache(IResponseCache):
+    """
+    ワーカープロセス内の TTL 付き LRU キャッシュ
+
+    無効化はこのプロセスの中にしか届かない。他のワーカーのエントリは TTL で切れるため、
+    複数ワーカーで即時に無効化したい場合は RedisResponseCache を使う。
+    """
+
+    def __init__(self, maxsize: int, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[CachedResponse, float]] = OrderedDict()
+        self._generations: dict[CacheNamespace, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def generations(self, namespaces: Sequence[CacheNamespace]) -> tuple[int, ...] | None:
+        with self._lock:
+            return tuple(self._generations.get(namespace, 0) for namespace in namespaces)
+
+    def get(self, key: str) -> CachedResponse | None:
+        if self.maxsize <= 0:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            response, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return response
+
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None:
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (response, self.clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, *namespaces: CacheNamespace) -> None:
+        with self._lock:
+            for namespace in namespaces:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def clear(self) -> None:
+        """全エントリを削除"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> ResponseCacheStats:
+        """統計情報を取得"""
+        with self._lock:
+            return ResponseCacheStats(
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+
+class RedisClient(Protocol):
+    """RedisResponseCache が使う Redis のコマンド（redis-py 互換のクライアント）"""
+
+    def get(self, name: str) -> bytes | None: ...
+
+    def mget(self, keys: Sequence[str]) -> list[bytes | None]: ...
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> object: ...
+
+    def incr(self, name: str) -> int: ...
+
+
+class RedisResponseCache(IResponseCache):
+    """
+    Redis（互換サーバー）に置くレスポンスキャッシュ
+
+    全ワーカーでエントリと世代番号を共有するため、無効化が即座に全ワーカーへ届く。
+    Redis に接続できない場合はキャッシュなしとして動く（リクエストは失敗させない）。
+    """
+
+    def __init__(self, client: RedisClient, prefix: str = 'response-cache'):
+        self.client = client
+        self.prefix = prefix
+
+    def generations(self, namespaces: Sequence[CacheNamespace]) -> tuple[int, ...] | None:
+        if not namespaces:
+            return ()
+        try:
+            values = self.client.mget(
+                [self._generation_key(namespace) for namespace in namespaces]
+            )
+        except Exception:
+            logger.warning(
+                'レスポンスキャッシュの世代番号を取得できません', exc_info=True
+            )
+            return None
+        return tuple(int(value) if value is not None else 0 for value in values)
+
+    def get(self, key: str) -> CachedResponse | None:
+        try:
+            value = self.client.get(self._entry_key(key))
+        except Exception:
+            logger.warning('レスポンスキャッシュを取得できません', exc_info=True)
+            return None
+        if value is None:
+            return None
+        etag, body = value.split(b'\n', 1)
+        return CachedResponse(body=body, etag=etag.decode('ascii'))
+
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        try:
+            self.client.set(
+                self._entry_key(key),
+                # 値は「ETag 改行 本文」（ETag は改行を含まない）
+                response.etag.encode('ascii') + b'\n' + response.body,
+                ex=max(int(ttl), 1),
+            )
+        except Exception:
+            logger.warning('レスポンスキャッシュを保存できません', exc_info=True)
+
+    def invalidate(self, *namespaces: CacheNamespace) -> None:
+        for namespace in namespaces:
+            try:
+                self.client.incr(self._generation_key(namespace))
+            except Exception:
+                logger.warning(
+                    'レスポンスキャッシュを無効化できません: %s',
+                    namespace.value,
+                    exc_info=True,
+                )
+
+    def _entry_key(self, key: str) -> str:
+        return f'{self.prefix}:entry:{key}'
+
+    def _generation_key(self, namespace: CacheNamespace) -> str:
+        return f'{self.prefix}:generation:{namespace.value}'
+
+
+@lru_cache
+def get_response_cache() -> IResponseCache:
+    """
+    Settings のバックエンドでレスポンスキャッシュを生成（プロセス内で共有）
+
+    response_cache_backend が redis の場合は redis パッケージが必要。
+    """
+    settings = get_settings()
+    if settings.response_cache_backend == 'redis':
+        import redis
+
+        return RedisResponseCache(redis.Redis.from_url(settings.response_cache_redis_url))
+    return InMemoryResponseCache(maxsize=settings.response_cache_size)
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.interfaces.unit_of_work import (
+    IAsyncUnitOfWork,
+    TransactionConflictError,
+)
+from app.infrastructure.db.retry_policy import RetryPolicy
+from app.infrastructure.db.session import get_async_session_factory
+from app.infrastructure.metrics.timing import timed
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class AsyncSQLAlchemyUnitOfWork(IAsyncUnitOfWork):
+    """
+    SQLAlchemy（asyncio）用のUnit of Work実装
+
+    使用例:
+        uow = AsyncSQLAlchemyUnitOfWork()
+        async with uow:
+            repository = UserRepository(uow.session)
+            user = await uow.run(lambda: repository.create(new_user))
+
+    Args:
+        retry_policy: デッドロック時のリトライ方針（省略時は設定値）
+        sleep: リトライまでの待機（テストで差し替える）
+    """
+
+    def __init__(
+        self,
+        retry_policy: RetryPolicy | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.session: AsyncSession = None
+        self.retry_policy = retry_policy or RetryPolicy.from_settings()
+        self.sleep = sleep
+
+    async def __aenter__(self):
+        """セッションを開始"""
+        self.session = get_async_session_factory()()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        セッションを終了
+        例外が発生していた場合は自動的にロールバック
+        """
+        if exc_type is not None:
+            await self.rollback()
+        await self.session.close()
+        return False  # 例外を再送出
+
+    async def commit(self):
+        """
+        トランザクションをコミット
+        デッドロック時はリトライせず TransactionConflictError を送出する（やり直しは run()）
+        """
+        try:
+            with timed('db_commit'):
+                await self.session.commit()
+            logger.debug('トランザクションをコミットしました')
+        except (OperationalError, IntegrityError) as e:
+            await self.session.rollback()
+            if self.retry_policy.is_retryable(e):
+                logger.warning(f'デッドロック検出: {e}')
+                raise TransactionConflictError(str(e)) from e
+            logger.error(f'トランザクションエラー: {e}')
+            raise
+
+    async def run(self, work: Callable[[], Awaitable[T]]) -> T:
+        """
+        work を実行してコミット
+        デッドロックが発生した場合はロールバックして work ごとやり直す
+        """
+        budget = self.retry_policy.start()
+        while True:
+            try:
+                result = await work()
+                with timed('db_commit'):
+                    await self.session.commit()
+                logger.debug('トランザクションをコミットしました')
+                return result
+            except (OperationalError, IntegrityError) as e:
+                await self.session.rollback()
+                if not self.retry_policy.is_retryable(e):
+                    logger.error(f'トランザクションエラー: {e}')
+                    raise
+
+                delay = budget.next_delay()
+                if delay is None:
+                    error_msg = f'リトライ上限に達しました（{budget.attempt}回試行）'
+                    logger.error(error_msg)
+                    raise TransactionConflictError(error_msg) from e
+
+                logger.warning(
+                    f'デッドロック検出。{delay:.3f}秒後にリトライ '
+                    f'{budget.attempt}/{self.retry_policy.max_attempts}: {e}'
+                )
+                await self.sleep(delay)
+
+    async def rollback(self):
+        """トランザクションをロールバック"""
+        await self.session.rollback()
+        logger.debug('トランザクションをロールバックしました')
+
+    async def flush(self):
+        """
+        変更をデータベースに送信するがコミットはしない
+        """
+        await self.session.flush()
+        logger.debug('変更をフラッシュしました')
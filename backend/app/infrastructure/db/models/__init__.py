@@ -0,0 +1,39 @@
+from app.infrastructure.db.models.attendance_log_model import AttendanceLogModel
+from app.infrastructure.db.models.attendance_statistics_model import (
+    AttendanceStatisticsModel,
+)
+from app.infrastructure.db.models.attendance_summary_model import AttendanceSummaryModel
+from app.infrastructure.db.models.base import Base
+from app.infrastructure.db.models.event_model import EventModel
+from app.infrastructure.db.models.event_participant_model import EventParticipantModel
+from app.infrastructure.db.models.notification_counter_model import (
+    NotificationCounterModel,
+)
+from app.infrastructure.db.models.notification_model import NotificationModel
+from app.infrastructure.db.models.notification_settings_model import (
+    NotificationSettingsModel,
+)
+from app.infrastructure.db.models.title_achievement_model import TitleAchievementModel
+from app.infrastructure.db.models.user_metadata_model import UserMetadataModel
+from app.infrastructure.db.models.user_model import UserModel
+from app.infrastructure.db.models.user_rival_model import UserRivalModel
+from app.infrastructure.db.models.user_social_link_model import UserSocialLinkModel
+from app.infrastructure.db.models.user_vision_model import UserVisionModel
+
+__all__ = [
+    'AttendanceLogModel',
+    'AttendanceStatisticsModel',
+    'AttendanceSummaryModel',
+    'Base',
+    'EventModel',
+    'EventParticipantModel',
+    'NotificationCounterModel',
+    'NotificationModel',
+    'NotificationSettingsModel',
+    'TitleAchievementModel',
+    'UserMetadataModel',
+    'UserModel',
+    'UserRivalModel',
+    'UserSocialLinkModel',
+    'UserVisionModel',
+]
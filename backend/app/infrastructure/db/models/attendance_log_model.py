@@ -0,0 +1,73 @@
+import datetime as dt
+import uuid
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.models.base import Base
+
+
+class AttendanceLogModel(Base):
+    """Discord の参加ログ（attendance_logs テーブル）"""
+
+    __tablename__ = 'attendance_logs'
+    __table_args__ = (
+        # 同じ入室を二重に記録しない（取り込みの UPSERT の競合キー）
+        UniqueConstraint(
+            'user_id',
+            'discord_channel_id',
+            'joined_at',
+            name='uq_attendance_logs_user_channel_joined',
+        ),
+        Index('ix_attendance_logs_user_id_joined_at', 'user_id', 'joined_at'),
+        # 参加中（未退出）のログの検索用
+        Index(
+            'ix_attendance_logs_user_id_open',
+            'user_id',
+            postgresql_where=text('left_at IS NULL'),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=text('gen_random_uuid()'),
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False,
+    )
+    event_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey('events.id', ondelete='SET NULL')
+    )
+    discord_channel_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    joined_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    left_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))
+    duration_minutes: Mapped[int | None] = mapped_column(Integer)
+    is_valid: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=True, server_default=text('true')
+    )
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -0,0 +1,54 @@
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, func, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.models.base import Base
+
+
+class AttendanceStatisticsModel(Base):
+    """参加統計（attendance_statistics テーブル）"""
+
+    __tablename__ = 'attendance_statistics'
+    __table_args__ = (
+        # ランキングの差分更新（前回以降に更新された行の取得）用
+        Index('ix_attendance_statistics_updated_at', 'updated_at'),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=text('gen_random_uuid()'),
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        unique=True,
+        nullable=False,
+    )
+    total_attendance_days: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text('0')
+    )
+    current_streak_days: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text('0')
+    )
+    max_streak_days: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text('0')
+    )
+    last_attendance_date: Mapped[date | None] = mapped_column(Date)
+    first_attendance_date: Mapped[date | None] = mapped_column(Date)
+    total_duration_minutes: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text('0')
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -0,0 +1,64 @@
+import datetime as dt
+import uuid
+
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Time,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.models.base import Base
+
+
+class AttendanceSummaryModel(Base):
+    """日単位の参加サマリー（attendance_summaries テーブル）"""
+
+    __tablename__ = 'attendance_summaries'
+    __table_args__ = (
+        # 1ユーザー1日1行（UPSERT の競合キー・期間指定の参加日取得にも使う）
+        UniqueConstraint('user_id', 'date', name='uq_attendance_summaries_user_date'),
+        # 月間ランキングの差分更新（前回以降に更新された行の取得）用
+        Index('ix_attendance_summaries_updated_at', 'updated_at'),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=text('gen_random_uuid()'),
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False,
+    )
+    date: Mapped[dt.date] = mapped_column(Date, nullable=False)
+    total_duration_minutes: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text('0')
+    )
+    session_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text('0')
+    )
+    first_join_time: Mapped[dt.time | None] = mapped_column(Time)
+    last_leave_time: Mapped[dt.time | None] = mapped_column(Time)
+    is_morning_active: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=text('false')
+    )
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
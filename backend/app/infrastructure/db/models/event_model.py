@@ -0,0 +1,92 @@
+import datetime as dt
+import uuid
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Time,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.models.base import Base
+
+
+class EventModel(Base):
+    """朝活イベント（events テーブル）"""
+
+    __tablename__ = 'events'
+    __table_args__ = (
+        CheckConstraint(
+            'max_participants IS NULL OR max_participants > 0',
+            name='ck_events_max_participants_positive',
+        ),
+        CheckConstraint(
+            'participant_count >= 0', name='ck_events_participant_count_non_negative'
+        ),
+        # 一覧で単発イベントを開催日時順に流し読みする用
+        Index(
+            'ix_events_one_off_schedule',
+            'scheduled_date',
+            'start_time',
+            'id',
+            postgresql_where=text('is_active AND NOT is_recurring'),
+        ),
+        # 一覧で展開する定期開催イベントの検索用（初回の開催日が期間の終了以前）
+        Index(
+            'ix_events_recurring',
+            'scheduled_date',
+            postgresql_where=text('is_active AND is_recurring'),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=text('gen_random_uuid()'),
+    )
+    creator_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL')
+    )
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text)
+    event_type: Mapped[str] = mapped_column(
+        String(50), nullable=False, default='general', server_default='general'
+    )
+    scheduled_date: Mapped[dt.date] = mapped_column(Date, nullable=False)
+    start_time: Mapped[dt.time] = mapped_column(Time, nullable=False)
+    end_time: Mapped[dt.time] = mapped_column(Time, nullable=False)
+    # None は定員なし
+    max_participants: Mapped[int | None] = mapped_column(Integer)
+    # 参加登録済み（status = 'registered'）の参加者数。
+    # 参加登録・キャンセルの条件付き UPDATE だけが増減させる（定員の判定に使う）
+    participant_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text('0')
+    )
+    is_recurring: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=text('false')
+    )
+    recurrence_pattern: Mapped[str | None] = mapped_column(String(50))
+    discord_channel_id: Mapped[str | None] = mapped_column(String(255))
+    is_active: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=True, server_default=text('true')
+    )
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -0,0 +1,61 @@
+import datetime as dt
+import uuid
+
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.models.base import Base
+
+
+class EventParticipantModel(Base):
+    """イベント参加者（event_participants テーブル）"""
+
+    __tablename__ = 'event_participants'
+    __table_args__ = (
+        # 1ユーザー1行（キャンセル後の再登録は status を戻す。参加登録の UPSERT の競合キー）
+        UniqueConstraint('event_id', 'user_id', name='uq_event_participants_event_user'),
+        CheckConstraint(
+            "status IN ('registered', 'cancelled')",
+            name='ck_event_participants_status',
+        ),
+        Index('ix_event_participants_user_id', 'user_id'),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=text('gen_random_uuid()'),
+    )
+    event_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('events.id', ondelete='CASCADE'),
+        nullable=False,
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default='registered', server_default='registered'
+    )
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -0,0 +1,39 @@
+import datetime as dt
+import uuid
+
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Integer, func, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.models.base import Base
+
+
+class NotificationCounterModel(Base):
+    """
+    ユーザーごとの未読数（notification_counters テーブル。行がないユーザーは0件）
+
+    本人宛てで送信済みの未読の通知の数。notifications を書き換える文と同じ
+    トランザクションで増減し、ずれは scripts/repair_notification_counters.py で直す。
+    """
+
+    __tablename__ = 'notification_counters'
+    __table_args__ = (
+        CheckConstraint(
+            'unread_count >= 0', name='ck_notification_counters_unread_count'
+        ),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    unread_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text('0')
+    )
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -0,0 +1,104 @@
+import datetime as dt
+import uuid
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.models.base import Base
+
+
+class NotificationModel(Base):
+    """通知（notifications テーブル）"""
+
+    __tablename__ = 'notifications'
+    __table_args__ = (
+        CheckConstraint(
+            "type IN ('achievement', 'reminder', 'rival_update', 'event')",
+            name='ck_notifications_type',
+        ),
+        CheckConstraint(
+            "audience IN ('user', 'rival_followers')", name='ck_notifications_audience'
+        ),
+        # 通知一覧（本人宛て・新しい順）とユーザー削除時のカスケード用
+        Index('ix_notifications_user_id_created_at', 'user_id', 'created_at'),
+        # 未読の通知一覧（read=false）と未読数の数え直し用
+        Index(
+            'ix_notifications_unread',
+            'user_id',
+            'created_at',
+            postgresql_where=text('is_read = false'),
+        ),
+        # 配信ワーカーが未送信の通知を送信予定時刻順に確保する用
+        Index(
+            'ix_notifications_pending',
+            'scheduled_at',
+            postgresql_where=text('sent_at IS NULL'),
+        ),
+        # 複製は元の通知・ユーザーごとに1件（複製の INSERT の競合キー）
+        Index(
+            'uq_notifications_source_user',
+            'source_id',
+            'user_id',
+            unique=True,
+            postgresql_where=text('source_id IS NOT NULL'),
+        ),
+        # リマインダーはユーザー・送信予定時刻ごとに1件（予約の INSERT の競合キー）
+        Index(
+            'uq_notifications_reminder',
+            'user_id',
+            'scheduled_at',
+            unique=True,
+            postgresql_where=text("type = 'reminder'"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=text('gen_random_uuid()'),
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False,
+    )
+    type: Mapped[str] = mapped_column(String(50), nullable=False)
+    # user: user_id 本人宛て / rival_followers: user_id をライバルにしているユーザーへ複製する
+    audience: Mapped[str] = mapped_column(
+        String(20), nullable=False, default='user', server_default='user'
+    )
+    # 複製元の通知（rival_followers の通知を複製した行のみ）
+    source_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey('notifications.id', ondelete='CASCADE')
+    )
+    title: Mapped[str] = mapped_column(String(100), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    data: Mapped[dict | None] = mapped_column(JSONB)
+    is_read: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=text('false')
+    )
+    # NULL は即時送信
+    scheduled_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))
+    # 配信ワーカーが配信した日時（NULL は未送信）
+    sent_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
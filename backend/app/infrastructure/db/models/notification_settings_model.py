@@ -0,0 +1,51 @@
+import datetime as dt
+import uuid
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Time, func, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.models.base import Base
+
+
+class NotificationSettingsModel(Base):
+    """通知設定（notification_settings テーブル。行がないユーザーは既定値）"""
+
+    __tablename__ = 'notification_settings'
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=text('gen_random_uuid()'),
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        unique=True,
+        nullable=False,
+    )
+    achievement_enabled: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=True, server_default=text('true')
+    )
+    reminder_enabled: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=True, server_default=text('true')
+    )
+    rival_update_enabled: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=True, server_default=text('true')
+    )
+    event_reminder_enabled: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=True, server_default=text('true')
+    )
+    reminder_time: Mapped[dt.time] = mapped_column(
+        Time, nullable=False, default=dt.time(21, 0), server_default=text("'21:00'")
+    )
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -0,0 +1,67 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.models.base import Base
+
+
+class TitleAchievementModel(Base):
+    """称号実績（title_achievements テーブル）"""
+
+    __tablename__ = 'title_achievements'
+    __table_args__ = (
+        UniqueConstraint(
+            'user_id', 'title_level', name='uq_title_achievements_user_level'
+        ),
+        CheckConstraint(
+            'title_level BETWEEN 1 AND 8', name='ck_title_achievements_level'
+        ),
+        # 各ユーザーにつき is_current=true は1レコードのみ（現在の称号の結合にも使う）
+        Index(
+            'uq_title_achievements_user_current',
+            'user_id',
+            unique=True,
+            postgresql_where=text('is_current'),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=text('gen_random_uuid()'),
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False,
+    )
+    title_level: Mapped[int] = mapped_column(Integer, nullable=False)
+    achieved_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    is_current: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=text('false')
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -0,0 +1,63 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.models.base import Base
+
+
+class UserMetadataModel(Base):
+    """ユーザー詳細情報（user_metadata テーブル）"""
+
+    __tablename__ = 'user_metadata'
+    __table_args__ = (
+        # skills / interests の OR 検索（&& 演算子）用
+        Index('ix_user_metadata_skills', 'skills', postgresql_using='gin'),
+        Index('ix_user_metadata_interests', 'interests', postgresql_using='gin'),
+        # display_name / tagline の部分一致検索（ILIKE）用（pg_trgm）
+        Index(
+            'ix_user_metadata_display_name_trgm',
+            'display_name',
+            postgresql_using='gin',
+            postgresql_ops={'display_name': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_user_metadata_tagline_trgm',
+            'tagline',
+            postgresql_using='gin',
+            postgresql_ops={'tagline': 'gin_trgm_ops'},
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=text('gen_random_uuid()'),
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        unique=True,
+        nullable=False,
+    )
+    display_name: Mapped[str | None] = mapped_column(String(100))
+    tagline: Mapped[str | None] = mapped_column(String(150))
+    bio: Mapped[str | None] = mapped_column(Text)
+    skills: Mapped[list[str]] = mapped_column(
+        ARRAY(Text), nullable=False, server_default=text("'{}'")
+    )
+    interests: Mapped[list[str]] = mapped_column(
+        ARRAY(Text), nullable=False, server_default=text("'{}'")
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -0,0 +1,119 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.infrastructure.metrics.registry import metrics_registry
+
+WAIT_METRIC = 'db_pool_checkout_wait_seconds'
+WAIT_HELP = 'Time spent waiting for a connection from the SQLAlchemy pool'
+
+# 計測対象のプール（名前 → プール）
+_pools: dict[str, QueuePool] = {}
+# プール名 → チェックアウトのタイムアウト回数
+_timeouts: dict[str, int] = {}
+_lock = threading.Lock()
+
+
+class _CheckoutTimingMixin:
+    """プールからの接続取得にかかった時間とタイムアウト回数を記録する"""
+
+    pool_name = 'primary'
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with _lock:
+                _timeouts[self.pool_name] = _timeouts.get(self.pool_name, 0) + 1
+            raise
+        finally:
+            metrics_registry.histogram(
+                WAIT_METRIC, WAIT_HELP, pool=self.pool_name
+            ).observe(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """同期エンジン用の計測付きプール"""
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """非同期エンジン用の計測付きプール"""
+
+
+def register_pool(name: str, pool: QueuePool) -> None:
+    """プールを計測対象として登録（メトリクス名のラベルに name を使う）"""
+    if isinstance(pool, _CheckoutTimingMixin):
+        pool.pool_name = name
+    with _lock:
+        _pools[name] = pool
+
+
+def pool_statistics() -> dict[str, dict]:
+    """
+    登録済みプールの使用状況を取得
+
+    Returns:
+        dict: プール名ごとの統計（サイズ・使用中の接続数・使用率・待ち時間など）
+    """
+    with _lock:
+        pools = dict(_pools)
+        timeouts = dict(_timeouts)
+
+    stats = {}
+    for name, pool in pools.items():
+        # max_overflow=-1 は上限なし。分母がないため使用率と最大接続数は None にする
+        unbounded = pool._max_overflow < 0
+        capacity = None if unbounded else pool.size() + pool._max_overflow
+        checked_out = pool.checkedout()
+        if capacity is None:
+            utilization = None
+        else:
+            utilization = round(checked_out / capacity, 4) if capacity else 0.0
+        _, wait_sum, wait_count = metrics_registry.histogram(
+            WAIT_METRIC, WAIT_HELP, pool=name
+        ).collect()
+        stats[name] = {
+            'pool_size': pool.size(),
+            'max_overflow': pool._max_overflow,
+            'checked_out': checked_out,
+            'checked_in': pool.checkedin(),
+            'overflow': pool.overflow(),
+            'utilization': utilization,
+            'checkout_count': wait_count,
+            'checkout_wait_avg_ms': (
+                round(wait_sum / wait_count * 1000, 3) if wait_count else 0.0
+            ),
+            'checkout_timeouts': timeouts.get(name, 0),
+            'max_connections': capacity,
+        }
+    return stats
+
+
+def _gauge(field: str):
+    def collect() -> dict[tuple[tuple[str, str], ...], float]:
+        # 値のない（上限なしのプールの使用率など）系列は出力しない
+        return {
+            (('pool', name),): values[field]
+            for name, values in pool_statistics().items()
+            if values[field] is not None
+        }
+
+    return collect
+
+
+metrics_registry.register_gauge(
+    'db_pool_checked_out', 'Connections currently checked out', _gauge('checked_out')
+)
+metrics_registry.register_gauge(
+    'db_pool_utilization',
+    'Checked out connections / (pool_size + max_overflow)',
+    _gauge('utilization'),
+)
+metrics_registry.register_gauge(
+    'db_pool_checkout_timeouts',
+    'Pool checkouts that failed with a timeout',
+    _gauge('checkout_timeouts'),
+)
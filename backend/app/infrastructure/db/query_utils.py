@@ -0,0 +1,36 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from uuid import UUID
+
+
+def escape_like(value: str) -> str:
+    """
+    LIKE / ILIKE のワイルドカード文字をエスケープ
+
+    使用例:
+        column.ilike(f'%{escape_like(keyword)}%', escape='\\\\')
+    """
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def encode_keyset_cursor(created_at: datetime, row_id: UUID) -> str:
+    """ページ最後の行の並び順キー (created_at, id) を不透明なカーソル文字列にする"""
+    payload = json.dumps([created_at.isoformat(), str(row_id)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    カーソル文字列を並び順キー (created_at, id) に戻す
+
+    Raises:
+        ValueError: カーソルが不正な場合
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError('不正なカーソルです') from e
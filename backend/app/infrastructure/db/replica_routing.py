@@ -0,0 +1,96 @@
+import hashlib
+import hmac
+import math
+import time
+from functools import lru_cache
+
+from fastapi import Request, Response
+
+from app.config import get_settings
+
+# 直前に書き込んだクライアントに渡す Cookie（値は「固定する期限.署名」）
+STICKY_COOKIE = 'db_primary_until'
+
+
+class PrimaryStickiness:
+    """
+    書き込み直後のクライアントを一定時間プライマリに固定する
+
+    レプリカは非同期レプリケーションのため、書き込み直後に読み取り専用UoWで
+    レプリカを読むと自分の書き込みが見えないことがある（read-your-writes 違反）。
+    書き込みをコミットしたクライアントには「window 秒後の時刻」を署名付きで渡し、
+    次のリクエストでその期限内なら読み取りもプライマリに向ける。
+    状態をクライアント側に持つため、ワーカーやホストが複数あっても同じ判定になる。
+    """
+
+    def __init__(self, window: float, secret: str):
+        self.window = window
+        self._secret = secret.encode('utf-8')
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0
+
+    def issue(self, now: float | None = None) -> str:
+        """今から window 秒間プライマリに固定するためのトークンを発行"""
+        until = f'{(time.time() if now is None else now) + self.window:.3f}'
+        return f'{until}.{self._sign(until)}'
+
+    def is_sticky(self, token: str | None, now: float | None = None) -> bool:
+        """トークンの署名が正しく、期限内ならプライマリに固定する"""
+        if not token or not self.enabled:
+            return False
+        until, _, signature = token.rpartition('.')
+        if not hmac.compare_digest(signature, self._sign(until)):
+            return False
+        try:
+            deadline = float(until)
+        except ValueError:
+            return False
+        current = time.time() if now is None else now
+        # 署名済みでも window を超える期限は受け付けない（設定を短くした場合）
+        return current < deadline <= current + self.window
+
+    def _sign(self, value: str) -> str:
+        return hmac.new(self._secret, value.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+@lru_cache
+def get_primary_stickiness() -> PrimaryStickiness:
+    """
+    プロセスで共有する PrimaryStickiness（設定は最初に使うときに読む）
+
+    レプリカが未設定なら読み取りは常にプライマリなので固定は不要（window=0）。
+    レプリカを使う場合は署名用の DB_REPLICA_STICKY_SECRET を必須にする。
+    """
+    settings = get_settings()
+    if not settings.database_replica_url:
+        return PrimaryStickiness(window=0, secret='')
+    if not settings.db_replica_sticky_secret:
+        raise RuntimeError(
+            'DATABASE_REPLICA_URL を使う場合は DB_REPLICA_STICKY_SECRET を設定してください'
+        )
+    return PrimaryStickiness(
+        window=settings.db_replica_sticky_seconds,
+        secret=settings.db_replica_sticky_secret,
+    )
+
+
+def prefers_primary(request: Request) -> bool:
+    """直前に書き込んだクライアントのリクエストか（プライマリから読むべきか）"""
+    return get_primary_stickiness().is_sticky(request.cookies.get(STICKY_COOKIE))
+
+
+def mark_write(response: Response) -> None:
+    """書き込みをコミットしたクライアントに、プライマリに固定する Cookie を渡す"""
+    stickiness = get_primary_stickiness()
+    if not stickiness.enabled:
+        return
+    response.set_cookie(
+        key=STICKY_COOKIE,
+        value=stickiness.issue(),
+        max_age=math.ceil(stickiness.window),
+        httponly=True,
+        secure=True,
+        samesite='lax',
+    )
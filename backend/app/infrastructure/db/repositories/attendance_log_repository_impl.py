@@ -0,0 +1,119 @@
+import datetime as dt
+from collections.abc import Collection, Sequence
+from uuid import UUID
+
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.domain.entities.attendance import AttendanceLog
+from app.domain.repositories.attendance_log_repository import IAttendanceLogRepository
+from app.infrastructure.db.models import AttendanceLogModel
+
+# 1文あたりの最大行数（バインドパラメータ数の上限 65535 を超えないように分割する）
+MAX_ROWS_PER_STATEMENT = 5000
+
+
+class AttendanceLogRepositoryImpl(IAttendanceLogRepository):
+    """Discord 参加ログリポジトリの実装"""
+
+    def __init__(self, session: Session):
+        """
+        コンストラクタ
+
+        Args:
+            session: SQLAlchemyのセッション
+        """
+        self.session = session
+
+    def get_open_logs(self, user_ids: Collection[UUID]) -> list[AttendanceLog]:
+        """
+        退出していない参加ログをまとめて取得（ix_attendance_logs_user_id_open を使う1クエリ）
+
+        Args:
+            user_ids: ユーザーIDのリスト
+
+        Returns:
+            list[AttendanceLog]: 参加中のログ
+        """
+        if not user_ids:
+            return []
+
+        log_models = self.session.scalars(
+            select(AttendanceLogModel).where(
+                AttendanceLogModel.user_id.in_(set(user_ids)),
+                AttendanceLogModel.left_at.is_(None),
+            )
+        )
+        return [self._to_entity(model) for model in log_models]
+
+    def upsert_logs(self, logs: Sequence[AttendanceLog]) -> None:
+        """
+        参加ログをまとめて作成または更新（複数行の INSERT ... ON CONFLICT DO UPDATE）
+
+        前回までに入室だけ記録したログは、同じ競合キーで退出日時・参加時間が更新される。
+        退出済みのログを参加中のログで上書きしない（同じバッチの再送で結果が変わらないように）。
+
+        Args:
+            logs: 参加ログ
+        """
+        for offset in range(0, len(logs), MAX_ROWS_PER_STATEMENT):
+            chunk = logs[offset : offset + MAX_ROWS_PER_STATEMENT]
+            statement = insert(AttendanceLogModel).values(
+                [log.model_dump() for log in chunk]
+            )
+            excluded = statement.excluded
+            table = AttendanceLogModel.__table__.c
+            statement = statement.on_conflict_do_update(
+                constraint='uq_attendance_logs_user_channel_joined',
+                set_={
+                    'left_at': func.coalesce(excluded.left_at, table.left_at),
+                    'duration_minutes': func.coalesce(
+                        excluded.duration_minutes, table.duration_minutes
+                    ),
+                    'is_valid': case(
+                        (excluded.left_at.is_(None), table.is_valid),
+                        else_=excluded.is_valid,
+                    ),
+                    'updated_at': func.now(),
+                },
+            )
+            self.session.execute(statement)
+
+    def list_logs(
+        self, user_ids: Collection[UUID], start: dt.datetime, end: dt.datetime
+    ) -> list[AttendanceLog]:
+        """
+        入室日時が [start, end) の参加ログをまとめて取得（1クエリ）
+
+        Args:
+            user_ids: ユーザーIDのリスト
+            start: 開始日時（この日時を含む）
+            end: 終了日時（この日時を含まない）
+
+        Returns:
+            list[AttendanceLog]: 参加ログ
+        """
+        if not user_ids:
+            return []
+
+        log_models = self.session.scalars(
+            select(AttendanceLogModel).where(
+                AttendanceLogModel.user_id.in_(set(user_ids)),
+                AttendanceLogModel.joined_at >= start,
+                AttendanceLogModel.joined_at < end,
+            )
+        )
+        return [self._to_entity(model) for model in log_models]
+
+    def _to_entity(self, log_model: AttendanceLogModel) -> AttendanceLog:
+        """
+        DBモデルをエンティティに変換
+
+        Args:
+            log_model: 参加ログDBモデル
+
+        Returns:
+            AttendanceLog: 参加ログ
+        """
+        return AttendanceLog.model_validate(log_model, from_attributes=True)
@@ -0,0 +1,286 @@
+import datetime as dt
+from collections.abc import Collection, Sequence
+from uuid import UUID
+
+from sqlalchemy import bindparam, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.domain.entities.attendance import AttendanceStatistics, AttendanceSummary
+from app.domain.repositories.attendance_repository import IAttendanceRepository
+from app.infrastructure.db.models import (
+    AttendanceStatisticsModel,
+    AttendanceSummaryModel,
+)
+
+SUMMARY_FIELDS = (
+    'total_duration_minutes',
+    'session_count',
+    'first_join_time',
+    'last_leave_time',
+    'is_morning_active',
+)
+STATISTICS_FIELDS = (
+    'total_attendance_days',
+    'current_streak_days',
+    'max_streak_days',
+    'last_attendance_date',
+    'first_attendance_date',
+    'total_duration_minutes',
+)
+
+
+class AttendanceRepositoryImpl(IAttendanceRepository):
+    """参加サマリー・参加統計リポジトリの実装"""
+
+    def __init__(self, session: Session):
+        """
+        コンストラクタ
+
+        Args:
+            session: SQLAlchemyのセッション
+        """
+        self.session = session
+
+    def get_summary(self, user_id: UUID, date: dt.date) -> AttendanceSummary | None:
+        """
+        1日分の参加サマリーを取得
+
+        Args:
+            user_id: ユーザーID
+            date: 対象日
+
+        Returns:
+            Optional[AttendanceSummary]: 参加サマリー（存在しない場合はNone）
+        """
+        summary_model = self.session.scalar(
+            select(AttendanceSummaryModel).where(
+                AttendanceSummaryModel.user_id == user_id,
+                AttendanceSummaryModel.date == date,
+            )
+        )
+        if summary_model is None:
+            return None
+        return AttendanceSummary.model_validate(summary_model, from_attributes=True)
+
+    def get_summaries(
+        self, keys: Collection[tuple[UUID, dt.date]]
+    ) -> dict[tuple[UUID, dt.date], AttendanceSummary]:
+        """
+        複数の (ユーザーID, 日付) の参加サマリーをまとめて取得（1クエリ）
+
+        Args:
+            keys: (ユーザーID, 日付) のリスト
+
+        Returns:
+            dict: (ユーザーID, 日付) -> 参加サマリー（存在しないものは含まない）
+        """
+        if not keys:
+            return {}
+
+        summary_models = self.session.scalars(
+            select(AttendanceSummaryModel).where(
+                tuple_(AttendanceSummaryModel.user_id, AttendanceSummaryModel.date).in_(
+                    list(keys)
+                )
+            )
+        )
+        return {
+            (model.user_id, model.date): AttendanceSummary.model_validate(
+                model, from_attributes=True
+            )
+            for model in summary_models
+        }
+
+    def list_summaries(self, user_id: UUID) -> list[AttendanceSummary]:
+        """
+        ユーザーの全参加サマリーを日付順に取得
+
+        Args:
+            user_id: ユーザーID
+
+        Returns:
+            list[AttendanceSummary]: 参加サマリー
+        """
+        summary_models = self.session.scalars(
+            select(AttendanceSummaryModel)
+            .where(AttendanceSummaryModel.user_id == user_id)
+            .order_by(AttendanceSummaryModel.date)
+        )
+        return [
+            AttendanceSummary.model_validate(model, from_attributes=True)
+            for model in summary_models
+        ]
+
+    def upsert_summary(self, summary: AttendanceSummary) -> None:
+        """
+        参加サマリーを作成または更新（INSERT ... ON CONFLICT DO UPDATE の1文）
+
+        Args:
+            summary: 参加サマリー
+        """
+        self.upsert_summaries([summary])
+
+    def upsert_summaries(self, summaries: Sequence[AttendanceSummary]) -> None:
+        """
+        参加サマリーをまとめて作成または更新（複数行の INSERT ... ON CONFLICT DO UPDATE 1文）
+
+        Args:
+            summaries: 参加サマリー（ユーザー・日付の重複なし）
+        """
+        if not summaries:
+            return
+
+        statement = insert(AttendanceSummaryModel).values(
+            [
+                summary.model_dump(include={'user_id', 'date', *SUMMARY_FIELDS})
+                for summary in summaries
+            ]
+        )
+        statement = statement.on_conflict_do_update(
+            constraint='uq_attendance_summaries_user_date',
+            set_={
+                **{field: statement.excluded[field] for field in SUMMARY_FIELDS},
+                'updated_at': func.now(),
+            },
+        )
+        self.session.execute(statement)
+
+    def get_attended_dates(
+        self, user_id: UUID, start: dt.date, end: dt.date
+    ) -> set[dt.date]:
+        """
+        期間 [start, end] の参加日を取得（uq_attendance_summaries_user_date の範囲スキャン）
+
+        Args:
+            user_id: ユーザーID
+            start: 開始日（この日を含む）
+            end: 終了日（この日を含む）
+
+        Returns:
+            set[date]: 有効なセッションが1つ以上ある日
+        """
+        dates = self.session.scalars(
+            select(AttendanceSummaryModel.date).where(
+                AttendanceSummaryModel.user_id == user_id,
+                AttendanceSummaryModel.date.between(start, end),
+                AttendanceSummaryModel.session_count > 0,
+            )
+        )
+        return set(dates)
+
+    def get_statistics_for_update(self, user_id: UUID) -> AttendanceStatistics:
+        """
+        参加統計を行ロック付きで取得（存在しない場合は空の統計を作成）
+
+        Args:
+            user_id: ユーザーID
+
+        Returns:
+            AttendanceStatistics: 参加統計
+        """
+        return self.get_statistics_for_update_many([user_id])[user_id]
+
+    def get_statistics_for_update_many(
+        self, user_ids: Collection[UUID]
+    ) -> dict[UUID, AttendanceStatistics]:
+        """
+        複数ユーザーの参加統計を行ロック付きでまとめて取得（存在しない場合は作成）
+
+        初回は INSERT ... ON CONFLICT DO NOTHING で行を作ってからロックするため、
+        同時に初回の参加が記録されても行は1つにまとまる。
+        ロックはユーザーID順に取り、同時に実行されるバッチ同士のデッドロックを避ける。
+
+        Args:
+            user_ids: ユーザーIDのリスト
+
+        Returns:
+            dict: ユーザーID -> 参加統計
+        """
+        if not user_ids:
+            return {}
+
+        ordered = sorted(set(user_ids))
+        self.session.execute(
+            insert(AttendanceStatisticsModel)
+            .values([{'user_id': user_id} for user_id in ordered])
+            .on_conflict_do_nothing(index_elements=['user_id'])
+        )
+        statistics_models = self.session.scalars(
+            select(AttendanceStatisticsModel)
+            .where(AttendanceStatisticsModel.user_id.in_(ordered))
+            .order_by(AttendanceStatisticsModel.user_id)
+            .with_for_update()
+        )
+        return {
+            model.user_id: AttendanceStatistics.model_validate(
+                model, from_attributes=True
+            )
+            for model in statistics_models
+        }
+
+    def list_statistics_for_update(
+        self, after_user_id: UUID | None, limit: int
+    ) -> list[AttendanceStatistics]:
+        """
+        参加統計をユーザーID順に行ロック付きで1チャンクずつ取得（FOR UPDATE SKIP LOCKED）
+
+        user_id の一意インデックスをキーセットで読むため、後ろのチャンクでも遅くならない。
+
+        Args:
+            after_user_id: 前のチャンクの最後のユーザーID（最初のチャンクはNone）
+            limit: 取得件数
+
+        Returns:
+            list[AttendanceStatistics]: 参加統計（ユーザーID順）
+        """
+        query = select(AttendanceStatisticsModel)
+        if after_user_id is not None:
+            query = query.where(AttendanceStatisticsModel.user_id > after_user_id)
+        statistics_models = self.session.scalars(
+            query.order_by(AttendanceStatisticsModel.user_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return [
+            AttendanceStatistics.model_validate(model, from_attributes=True)
+            for model in statistics_models
+        ]
+
+    def save_statistics(self, statistics: AttendanceStatistics) -> None:
+        """
+        参加統計を保存
+
+        Args:
+            statistics: 参加統計
+        """
+        self.save_statistics_many([statistics])
+
+    def save_statistics_many(self, statistics: Sequence[AttendanceStatistics]) -> None:
+        """
+        複数ユーザーの参加統計をまとめて保存（executemany の UPDATE 1回）
+
+        Args:
+            statistics: 参加統計
+        """
+        if not statistics:
+            return
+
+        table = AttendanceStatisticsModel.__table__
+        self.session.execute(
+            update(table)
+            .where(table.c.user_id == bindparam('target_user_id'))
+            .values(
+                {
+                    **{field: bindparam(field) for field in STATISTICS_FIELDS},
+                    'updated_at': func.now(),
+                }
+            ),
+            [
+                {
+                    'target_user_id': item.user_id,
+                    **item.model_dump(include=set(STATISTICS_FIELDS)),
+                }
+                for item in statistics
+            ],
+        )
@@ -0,0 +1,268 @@
+from uuid import UUID
+
+from sqlalchemy import Exists, and_, exists, func, literal, or_, select, true, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.domain.entities.event import (
+    EventParticipantStatus,
+    ParticipationOutcome,
+    ParticipationResult,
+)
+from app.domain.repositories.event_participant_repository import (
+    IEventParticipantRepository,
+)
+from app.infrastructure.db.models import EventModel, EventParticipantModel
+
+REGISTERED = EventParticipantStatus.REGISTERED.value
+CANCELLED = EventParticipantStatus.CANCELLED.value
+
+
+class EventParticipantRepositoryImpl(IEventParticipantRepository):
+    """
+    イベント参加者リポジトリの実装
+
+    参加者数は events.participant_count に持ち、定員の判定と加算を条件付きの
+    UPDATE 1文で行う（参加者を数えてから INSERT すると、同時の申し込みで定員を超える）。
+    参加登録・キャンセルのどちらも events の行を先にロックし、次に event_participants の
+    行を書くため、ロックの順序が揃いデッドロックしない。
+    同じイベントへの申し込みは events の行ロックで直列化されるが、ロックを持つのは
+    1文とコミットの間だけになる。
+    """
+
+    def __init__(self, session: Session):
+        """
+        コンストラクタ
+
+        Args:
+            session: SQLAlchemyのセッション
+        """
+        self.session = session
+
+    def register(self, event_id: UUID, user_id: UUID) -> ParticipationResult:
+        """
+        イベントに参加登録（WITH seat AS (UPDATE ...) INSERT ... ON CONFLICT の1文）
+
+        1. seat: 有効なイベントで、定員に空きがあり、未登録なら participant_count を加算
+        2. joined: 席を確保できた場合だけ参加者を INSERT（キャンセル済みなら registered に戻す）
+
+        同じユーザーが同時に申し込むと、どちらも未登録と判定して席を確保し、後の方の
+        INSERT は競合して何もしないことがある。その場合は確保した席を同じトランザクション内で
+        戻す（events の行ロックは保持したままなので、他の申し込みへの影響はない）。
+
+        Args:
+            event_id: イベントID
+            user_id: ユーザーID
+
+        Returns:
+            ParticipationResult: JOINED / ALREADY_REGISTERED / FULL / EVENT_NOT_FOUND
+        """
+        seat = (
+            update(EventModel)
+            .where(
+                EventModel.id == event_id,
+                EventModel.is_active.is_(True),
+                or_(
+                    EventModel.max_participants.is_(None),
+                    EventModel.participant_count < EventModel.max_participants,
+                ),
+                ~self._is_registered(event_id, user_id),
+            )
+            .values(
+                participant_count=EventModel.participant_count + 1,
+                updated_at=func.now(),
+            )
+            .returning(
+                EventModel.id,
+                EventModel.participant_count,
+                EventModel.max_participants,
+            )
+            .cte('seat')
+        )
+        statement = insert(EventParticipantModel).from_select(
+            ['event_id', 'user_id', 'status'],
+            select(
+                seat.c.id, literal(user_id, PG_UUID(as_uuid=True)), literal(REGISTERED)
+            ),
+            include_defaults=False,  # id・日時はサーバー側のデフォルトを使う
+        )
+        joined = (
+            statement.on_conflict_do_update(
+                constraint='uq_event_participants_event_user',
+                set_={'status': REGISTERED, 'updated_at': func.now()},
+                where=EventParticipantModel.status == CANCELLED,
+            )
+            .returning(EventParticipantModel.id)
+            .cte('joined')
+        )
+        row = self.session.execute(
+            select(
+                seat.c.participant_count, seat.c.max_participants, joined.c.id
+            ).select_from(seat.outerjoin(joined, true()))
+        ).one_or_none()
+
+        if row is None:
+            return self._rejected(event_id, user_id, registering=True)
+        participant_count, max_participants, participant_id = row
+        if participant_id is None:
+            self._adjust_count(event_id, -1)
+            return ParticipationResult(
+                event_id=event_id,
+                user_id=user_id,
+                outcome=ParticipationOutcome.ALREADY_REGISTERED,
+                participant_count=participant_count - 1,
+                max_participants=max_participants,
+            )
+        return ParticipationResult(
+            event_id=event_id,
+            user_id=user_id,
+            outcome=ParticipationOutcome.JOINED,
+            participant_count=participant_count,
+            max_participants=max_participants,
+        )
+
+    def cancel(self, event_id: UUID, user_id: UUID) -> ParticipationResult:
+        """
+        参加登録をキャンセル（WITH seat AS (UPDATE events ...) UPDATE event_participants の1文）
+
+        参加登録と同じく events の行を先にロックする。同じユーザーが同時にキャンセルし、
+        後の方が参加者を更新できなかった場合は、減らした参加者数を戻す
+        （先のキャンセルが確定しているので、後の方はキャンセル済みとして扱う）。
+
+        Args:
+            event_id: イベントID
+            user_id: ユーザーID
+
+        Returns:
+            ParticipationResult: CANCELLED / ALREADY_CANCELLED / NOT_REGISTERED /
+                EVENT_NOT_FOUND
+        """
+        seat = (
+            update(EventModel)
+            .where(
+                EventModel.id == event_id,
+                # 行ロックを待った後は events の行だけが再評価される（EXISTS は待つ前の
+                # スナップショットのまま）。最後の1人の同時キャンセルで負にならないようにする
+                EventModel.participant_count > 0,
+                self._is_registered(event_id, user_id),
+            )
+            .values(
+                participant_count=EventModel.participant_count - 1,
+                updated_at=func.now(),
+            )
+            .returning(
+                EventModel.id,
+                EventModel.participant_count,
+                EventModel.max_participants,
+            )
+            .cte('seat')
+        )
+        left = (
+            update(EventParticipantModel)
+            .where(
+                EventParticipantModel.event_id.in_(select(seat.c.id)),
+                EventParticipantModel.user_id == user_id,
+                EventParticipantModel.status == REGISTERED,
+            )
+            .values(status=CANCELLED, updated_at=func.now())
+            .returning(EventParticipantModel.id)
+            .cte('left_participant')
+        )
+        row = self.session.execute(
+            select(
+                seat.c.participant_count, seat.c.max_participants, left.c.id
+            ).select_from(seat.outerjoin(left, true()))
+        ).one_or_none()
+
+        if row is None:
+            return self._rejected(event_id, user_id, registering=False)
+        participant_count, max_participants, participant_id = row
+        if participant_id is None:
+            self._adjust_count(event_id, 1)
+            return ParticipationResult(
+                event_id=event_id,
+                user_id=user_id,
+                outcome=ParticipationOutcome.ALREADY_CANCELLED,
+                participant_count=participant_count + 1,
+                max_participants=max_participants,
+            )
+        return ParticipationResult(
+            event_id=event_id,
+            user_id=user_id,
+            outcome=ParticipationOutcome.CANCELLED,
+            participant_count=participant_count,
+            max_participants=max_participants,
+        )
+
+    @staticmethod
+    def _is_registered(event_id: UUID, user_id: UUID) -> Exists:
+        """参加登録済みか（uq_event_participants_event_user で引く）"""
+        return exists().where(
+            and_(
+                EventParticipantModel.event_id == event_id,
+                EventParticipantModel.user_id == user_id,
+                EventParticipantModel.status == REGISTERED,
+            )
+        )
+
+    def _adjust_count(self, event_id: UUID, delta: int) -> None:
+        """同じトランザクションで確保・解放した席を戻す"""
+        self.session.execute(
+            update(EventModel)
+            .where(EventModel.id == event_id)
+            .values(participant_count=EventModel.participant_count + delta)
+        )
+
+    def _rejected(
+        self, event_id: UUID, user_id: UUID, registering: bool
+    ) -> ParticipationResult:
+        """
+        席を確保・解放できなかった理由を調べる
+
+        判定はすでに条件付き UPDATE で済んでおり、ここでは結果の種類を決めるだけ
+        （読み取った値で定員を判定し直すことはしない）。
+        """
+        row = self.session.execute(
+            select(
+                EventModel.is_active,
+                EventModel.participant_count,
+                EventModel.max_participants,
+                EventParticipantModel.status,
+            )
+            .outerjoin(
+                EventParticipantModel,
+                and_(
+                    EventParticipantModel.event_id == EventModel.id,
+                    EventParticipantModel.user_id == user_id,
+                ),
+            )
+            .where(EventModel.id == event_id)
+        ).one_or_none()
+
+        if row is None or (registering and not row.is_active):
+            return ParticipationResult(
+                event_id=event_id,
+                user_id=user_id,
+                outcome=ParticipationOutcome.EVENT_NOT_FOUND,
+            )
+        is_registered = row.status == REGISTERED
+        if registering:
+            outcome = (
+                ParticipationOutcome.ALREADY_REGISTERED
+                if is_registered
+                else ParticipationOutcome.FULL
+            )
+        elif row.status == CANCELLED:
+            outcome = ParticipationOutcome.ALREADY_CANCELLED
+        else:
+            # 同時に別の申し込みが確定した直後など、読み取り時点で登録済みに見える場合も
+            # 更新できなかった以上は未登録として扱う
+            outcome = ParticipationOutcome.NOT_REGISTERED
+        return ParticipationResult(
+            event_id=event_id,
+            user_id=user_id,
+            outcome=outcome,
+            participant_count=row.participant_count,
+            max_participants=row.max_participants,
+        )
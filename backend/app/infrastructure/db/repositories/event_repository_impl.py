@@ -0,0 +1,70 @@
+import datetime as dt
+from collections.abc import Iterator
+from dataclasses import fields
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.event import Event
+from app.domain.repositories.event_repository import IEventRepository
+from app.infrastructure.db.models import EventModel
+
+# Event のフィールド順に取得し、ORM オブジェクトを作らずに Event(*row) で組み立てる
+EVENT_FIELDS = tuple(field.name for field in fields(Event))
+EVENT_COLUMNS = tuple(EventModel.__table__.c[name] for name in EVENT_FIELDS)
+# 単発イベントをサーバー側カーソルで読み出す件数
+ONE_OFF_BATCH_SIZE = 500
+
+
+class EventRepositoryImpl(IEventRepository):
+    """イベントリポジトリの実装"""
+
+    def __init__(self, session: Session):
+        """
+        コンストラクタ
+
+        Args:
+            session: SQLAlchemyのセッション
+        """
+        self.session = session
+
+    def list_recurring(
+        self, until: dt.date, creator_id: UUID | None = None
+    ) -> list[Event]:
+        """初回の開催日が until 以前の有効な定期開催イベントを取得（ix_events_recurring）"""
+        query = _active_events(creator_id).where(
+            EventModel.is_recurring, EventModel.scheduled_date <= until
+        )
+        rows = self.session.execute(query.order_by(EventModel.id))
+        return [Event(*row) for row in rows]
+
+    def iter_one_off(
+        self, first: dt.date, last: dt.date, creator_id: UUID | None = None
+    ) -> Iterator[Event]:
+        """
+        開催日が first〜last の有効な単発イベントを順に取得（ix_events_one_off_schedule）
+
+        yield_per でサーバー側カーソルから ONE_OFF_BATCH_SIZE 件ずつ読み出すため、
+        期間が長くても一度に保持するのは1バッチ分だけになる。
+        """
+        query = (
+            _active_events(creator_id)
+            .where(
+                ~EventModel.is_recurring,
+                EventModel.scheduled_date.between(first, last),
+            )
+            .order_by(EventModel.scheduled_date, EventModel.start_time, EventModel.id)
+            .execution_options(yield_per=ONE_OFF_BATCH_SIZE)
+        )
+        with self.session.execute(query) as result:
+            for row in result:
+                yield Event(*row)
+
+
+def _active_events(creator_id: UUID | None) -> Select:
+    # 部分インデックスの条件と同じ形（is_active / NOT is_recurring）で書く
+    query = select(*EVENT_COLUMNS).where(EventModel.is_active)
+    if creator_id is not None:
+        query = query.where(EventModel.creator_id == creator_id)
+    return query
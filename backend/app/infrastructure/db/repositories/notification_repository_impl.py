@@ -0,0 +1,502 @@
+import datetime as dt
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Integer,
+    Row,
+    Time,
+    Values,
+    column,
+    delete,
+    false,
+    func,
+    literal,
+    select,
+    text,
+    true,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.domain.entities.notification import (
+    DEFAULT_REMINDER_TIME,
+    DueNotification,
+    Notification,
+    NotificationAudience,
+    NotificationType,
+    UnreadCountRepair,
+)
+from app.domain.repositories.notification_repository import INotificationRepository
+from app.infrastructure.db.models import (
+    NotificationCounterModel,
+    NotificationModel,
+    NotificationSettingsModel,
+    UserModel,
+)
+
+DUE_COLUMNS = (
+    NotificationModel.id,
+    NotificationModel.user_id,
+    NotificationModel.type,
+    NotificationModel.audience,
+    NotificationModel.title,
+    NotificationModel.message,
+    NotificationModel.data,
+)
+NOTIFICATION_COLUMNS = (
+    NotificationModel.id,
+    NotificationModel.user_id,
+    NotificationModel.type,
+    NotificationModel.title,
+    NotificationModel.message,
+    NotificationModel.data,
+    NotificationModel.is_read,
+    NotificationModel.sent_at,
+    NotificationModel.created_at,
+)
+# 未読数の増減を判定するために RETURNING で受け取る列
+COUNTED_COLUMNS = (
+    NotificationModel.user_id,
+    NotificationModel.audience,
+    NotificationModel.sent_at,
+    NotificationModel.is_read,
+)
+# 複製の INSERT 1文あたりの行数（VALUES の行数。バインド変数の上限を超えない範囲）
+FANOUT_CHUNK_SIZE = 1000
+# 未読数の増減1文あたりのユーザー数
+COUNTER_CHUNK_SIZE = 1000
+
+USER_AUDIENCE = NotificationAudience.USER.value
+# 通知一覧に出す通知（本人宛てで送信済み）
+VISIBLE = (
+    NotificationModel.audience == USER_AUDIENCE,
+    NotificationModel.sent_at.is_not(None),
+)
+# 未読数に数える通知（ix_notifications_unread の条件 is_read = false を含める）
+UNREAD = (NotificationModel.is_read == false(), *VISIBLE)
+
+
+class NotificationRepositoryImpl(INotificationRepository):
+    """
+    通知リポジトリの実装
+
+    未送信の通知は FOR UPDATE SKIP LOCKED で確保する。ほかのワーカーがロック中の行は
+    待たずに飛ばすため、複数のワーカーが同時に確保しても同じ行を取らず、互いに待たない。
+    確保した行の送信済みへの更新は同じトランザクションで行うため、コミット前に
+    ワーカーが落ちた場合はロックが外れて別のワーカーが確保し直す。
+
+    未読数は notification_counters に持ち、通知を書き換える文の RETURNING で
+    数に入る行（本人宛て・送信済み・未読）の増減を受け取り、同じトランザクションで
+    加減する（一覧のたびに COUNT(*) しない）。通知の行を書いてから未読数の行を
+    ユーザーID順にロックするため、ロックの順序が揃う。
+    """
+
+    def __init__(self, session: Session):
+        """
+        コンストラクタ
+
+        Args:
+            session: SQLAlchemyのセッション
+        """
+        self.session = session
+
+    def claim_due(self, now: dt.datetime, limit: int) -> list[DueNotification]:
+        """
+        送信予定時刻を過ぎた未送信の通知を確保（ix_notifications_pending）
+
+        即時送信（scheduled_at が NULL）を先に確保し、残りの件数を送信予定時刻の
+        早い順に確保する（OR でまとめるとインデックスの範囲で絞り込めないため2文に分ける）。
+        """
+        claimed = self._claim(NotificationModel.scheduled_at.is_(None), limit)
+        if len(claimed) < limit:
+            claimed += self._claim(
+                NotificationModel.scheduled_at <= now, limit - len(claimed)
+            )
+        return claimed
+
+    def mark_sent(self, notification_ids: Sequence[UUID], sent_at: dt.datetime) -> None:
+        """通知を送信済みにする（未送信の行だけを更新し、未読数に加える）"""
+        if not notification_ids:
+            return
+        rows = self.session.execute(
+            update(NotificationModel)
+            .where(
+                NotificationModel.id.in_(notification_ids),
+                NotificationModel.sent_at.is_(None),
+            )
+            .values(sent_at=sent_at)
+            .returning(*COUNTED_COLUMNS)
+        )
+        self._add_unread(Counter(row.user_id for row in rows if _is_unread(row)))
+
+    def delete(self, notification_ids: Sequence[UUID]) -> None:
+        """通知を削除"""
+        if not notification_ids:
+            return
+        rows = self.session.execute(
+            delete(NotificationModel)
+            .where(NotificationModel.id.in_(notification_ids))
+            .returning(*COUNTED_COLUMNS)
+        )
+        self._subtract_unread(row.user_id for row in rows if _is_unread(row))
+
+    def insert_fanout(
+        self,
+        source: DueNotification,
+        user_ids: Sequence[UUID],
+        sent_at: dt.datetime,
+    ) -> int:
+        """
+        通知を各ユーザー宛てに複製して登録
+
+        FANOUT_CHUNK_SIZE 行ずつ複数行の INSERT 1文で登録する（1行ずつの往復をしない）。
+        元の通知・ユーザーの組が登録済みなら何もしない（uq_notifications_source_user）。
+        実際に登録した行（RETURNING）の分だけ未読数に加える。
+        """
+        inserted: Counter[UUID] = Counter()
+        for start in range(0, len(user_ids), FANOUT_CHUNK_SIZE):
+            rows = [
+                {
+                    'user_id': user_id,
+                    'type': source.type.value,
+                    'audience': NotificationAudience.USER.value,
+                    'source_id': source.id,
+                    'title': source.title,
+                    'message': source.message,
+                    'data': source.data,
+                    'sent_at': sent_at,
+                }
+                for user_id in user_ids[start : start + FANOUT_CHUNK_SIZE]
+            ]
+            inserted.update(
+                self.session.scalars(
+                    insert(NotificationModel)
+                    .values(rows)
+                    .on_conflict_do_nothing(
+                        index_elements=['source_id', 'user_id'],
+                        index_where=text('source_id IS NOT NULL'),
+                    )
+                    .returning(NotificationModel.user_id)
+                )
+            )
+        self._add_unread(inserted)
+        return inserted.total()
+
+    def schedule_reminders(
+        self, day: dt.date, timezone: str, title: str, message: str
+    ) -> int:
+        """
+        リマインダーを予約（INSERT ... SELECT の1文）
+
+        notification_settings の行がないユーザーは既定値（有効・21:00）で予約する。
+        送信予定時刻は day とリマインダー送信時刻を timezone の時刻として組み立てる。
+        """
+        settings = NotificationSettingsModel
+        reminder_time = func.coalesce(
+            settings.reminder_time, literal(DEFAULT_REMINDER_TIME, Time)
+        )
+        scheduled_at = func.timezone(timezone, literal(day, Date) + reminder_time)
+        users = (
+            select(
+                UserModel.id,
+                literal(NotificationType.REMINDER.value),
+                literal(NotificationAudience.USER.value),
+                literal(title),
+                literal(message),
+                scheduled_at,
+            )
+            .select_from(UserModel)
+            .outerjoin(settings, settings.user_id == UserModel.id)
+            .where(UserModel.is_active, func.coalesce(settings.reminder_enabled, true()))
+        )
+        result = self.session.execute(
+            insert(NotificationModel)
+            .from_select(
+                ['user_id', 'type', 'audience', 'title', 'message', 'scheduled_at'],
+                users,
+                # id は行ごとに gen_random_uuid() で採番する（Python 側の既定値は1つしか作られない）
+                include_defaults=False,
+            )
+            .on_conflict_do_nothing(
+                index_elements=['user_id', 'scheduled_at'],
+                index_where=text("type = 'reminder'"),
+            )
+        )
+        return result.rowcount
+
+    def list_for_user(
+        self,
+        user_id: UUID,
+        notification_type: NotificationType | None,
+        is_read: bool | None,
+        limit: int,
+        offset: int,
+    ) -> list[Notification]:
+        """ユーザーの通知一覧を新しい順に取得（未読のみなら ix_notifications_unread）"""
+        rows = self.session.execute(
+            select(*NOTIFICATION_COLUMNS)
+            .where(*self._user_filters(user_id, notification_type, is_read))
+            .order_by(NotificationModel.created_at.desc(), NotificationModel.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return [_to_notification(row) for row in rows]
+
+    def count_for_user(
+        self,
+        user_id: UUID,
+        notification_type: NotificationType | None,
+        is_read: bool | None,
+    ) -> int:
+        """ユーザーの通知の件数を数える"""
+        return self.session.scalar(
+            select(func.count())
+            .select_from(NotificationModel)
+            .where(*self._user_filters(user_id, notification_type, is_read))
+        )
+
+    def get_unread_count(self, user_id: UUID) -> int:
+        """ユーザーの未読数を取得（notification_counters の主キーで1行読む）"""
+        count = self.session.scalar(
+            select(NotificationCounterModel.unread_count).where(
+                NotificationCounterModel.user_id == user_id
+            )
+        )
+        return count or 0
+
+    def set_read(
+        self, notification_id: UUID, user_id: UUID, is_read: bool
+    ) -> Notification | None:
+        """
+        ユーザーの通知を既読/未読にする
+
+        既読状態が変わる場合だけ更新し（同じ状態の指定で未読数を二重に増減しない）、
+        更新した行があれば未読数を1つ増減する。
+        """
+        row = self.session.execute(
+            update(NotificationModel)
+            .where(
+                NotificationModel.id == notification_id,
+                NotificationModel.user_id == user_id,
+                NotificationModel.is_read != is_read,
+                *VISIBLE,
+            )
+            .values(is_read=is_read)
+            .returning(*NOTIFICATION_COLUMNS)
+        ).one_or_none()
+        if row is not None:
+            self._add_unread({user_id: -1 if is_read else 1})
+            return _to_notification(row)
+
+        # 見つからないか、すでに指定の状態
+        row = self.session.execute(
+            select(*NOTIFICATION_COLUMNS).where(
+                NotificationModel.id == notification_id,
+                NotificationModel.user_id == user_id,
+                *VISIBLE,
+            )
+        ).one_or_none()
+        return None if row is None else _to_notification(row)
+
+    def delete_for_user(self, notification_id: UUID, user_id: UUID) -> bool:
+        """ユーザーの通知を削除（未読なら未読数を1つ減らす）"""
+        is_read = self.session.scalar(
+            delete(NotificationModel)
+            .where(
+                NotificationModel.id == notification_id,
+                NotificationModel.user_id == user_id,
+                *VISIBLE,
+            )
+            .returning(NotificationModel.is_read)
+        )
+        if is_read is None:
+            return False
+        if not is_read:
+            self._subtract_unread([user_id])
+        return True
+
+    def reconcile_unread_counts(
+        self, after_user_id: UUID | None, limit: int
+    ) -> UnreadCountRepair:
+        """
+        ユーザーID順に limit 人分の未読数を数え直す
+
+        1. 対象ユーザーの未読数の行をユーザーID順に FOR UPDATE でロックする
+           （未読数を増減中のトランザクションのコミットを待つ）
+        2. 未読の通知を ix_notifications_unread でユーザーごとに数える
+        3. ずれていたユーザーだけ数え直した値にする
+
+        ロックの後に数えるため、ロック前にコミットされた増減は数に含まれ、ロック中に
+        通知を書き換えたトランザクションはこの修復のコミット後に未読数を加減する。
+        未読数の行がないユーザーは INSERT ... ON CONFLICT DO NOTHING で作る
+        （同時に別のトランザクションが作った場合はそちらの値を残し、次の修復で確認する）。
+        """
+        user_ids = list(
+            self.session.scalars(
+                select(UserModel.id)
+                .where(UserModel.id > after_user_id if after_user_id else true())
+                .order_by(UserModel.id)
+                .limit(limit)
+            )
+        )
+        if not user_ids:
+            return UnreadCountRepair(last_user_id=None, checked=0, corrected=0)
+
+        counter = NotificationCounterModel
+        stored = dict(
+            self.session.execute(
+                select(counter.user_id, counter.unread_count)
+                .where(counter.user_id.in_(user_ids))
+                .order_by(counter.user_id)
+                .with_for_update()
+            ).all()
+        )
+        actual = dict(
+            self.session.execute(
+                select(NotificationModel.user_id, func.count())
+                .where(NotificationModel.user_id.in_(user_ids), *UNREAD)
+                .group_by(NotificationModel.user_id)
+            ).all()
+        )
+
+        drifted = [
+            (user_id, actual.get(user_id, 0))
+            for user_id in user_ids
+            if actual.get(user_id, 0) != stored.get(user_id, 0)
+        ]
+        existing = [(user_id, count) for user_id, count in drifted if user_id in stored]
+        if existing:
+            counts = _user_counts(existing)
+            self.session.execute(
+                update(counter)
+                .where(counter.user_id == counts.c.user_id)
+                .values(unread_count=counts.c.unread_count, updated_at=func.now())
+            )
+        missing = [
+            {'user_id': user_id, 'unread_count': count}
+            for user_id, count in drifted
+            if user_id not in stored
+        ]
+        if missing:
+            self.session.execute(
+                insert(counter)
+                .values(missing)
+                .on_conflict_do_nothing(index_elements=['user_id'])
+            )
+        return UnreadCountRepair(
+            last_user_id=user_ids[-1], checked=len(user_ids), corrected=len(drifted)
+        )
+
+    def _user_filters(
+        self,
+        user_id: UUID,
+        notification_type: NotificationType | None,
+        is_read: bool | None,
+    ) -> list[ColumnElement[bool]]:
+        filters = [NotificationModel.user_id == user_id, *VISIBLE]
+        if notification_type is not None:
+            filters.append(NotificationModel.type == notification_type.value)
+        if is_read is not None:
+            filters.append(NotificationModel.is_read == (true() if is_read else false()))
+        return filters
+
+    def _add_unread(self, deltas: Mapping[UUID, int]) -> None:
+        """
+        ユーザーごとの未読数に deltas を加える
+
+        加算は INSERT ... ON CONFLICT DO UPDATE（行がなければ作る）、減算は
+        UPDATE ... FROM (VALUES ...) で行い、0未満にはしない。どちらもユーザーID順に
+        COUNTER_CHUNK_SIZE 人ずつ1文にまとめる。
+        """
+        increments = sorted((key, n) for key, n in deltas.items() if n > 0)
+        decrements = sorted((key, -n) for key, n in deltas.items() if n < 0)
+        counter = NotificationCounterModel
+        for start in range(0, len(increments), COUNTER_CHUNK_SIZE):
+            statement = insert(counter).values(
+                [
+                    {'user_id': user_id, 'unread_count': n}
+                    for user_id, n in increments[start : start + COUNTER_CHUNK_SIZE]
+                ]
+            )
+            self.session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=['user_id'],
+                    set_={
+                        'unread_count': counter.unread_count
+                        + statement.excluded.unread_count,
+                        'updated_at': func.now(),
+                    },
+                )
+            )
+        for start in range(0, len(decrements), COUNTER_CHUNK_SIZE):
+            counts = _user_counts(decrements[start : start + COUNTER_CHUNK_SIZE])
+            self.session.execute(
+                update(counter)
+                .where(counter.user_id == counts.c.user_id)
+                .values(
+                    unread_count=func.greatest(
+                        counter.unread_count - counts.c.unread_count, 0
+                    ),
+                    updated_at=func.now(),
+                )
+            )
+
+    def _subtract_unread(self, user_ids: Iterable[UUID]) -> None:
+        """user_ids に含まれる回数だけ、ユーザーごとの未読数を減らす"""
+        self._add_unread({user_id: -n for user_id, n in Counter(user_ids).items()})
+
+    def _claim(self, condition: ColumnElement[bool], limit: int) -> list[DueNotification]:
+        rows = self.session.execute(
+            select(*DUE_COLUMNS)
+            .where(NotificationModel.sent_at.is_(None), condition)
+            .order_by(NotificationModel.scheduled_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return [
+            DueNotification(
+                id=row.id,
+                user_id=row.user_id,
+                type=NotificationType(row.type),
+                audience=NotificationAudience(row.audience),
+                title=row.title,
+                message=row.message,
+                data=row.data,
+            )
+            for row in rows
+        ]
+
+
+def _is_unread(row: Row) -> bool:
+    """未読数に数える通知の行か（UNREAD と同じ条件）"""
+    return row.audience == USER_AUDIENCE and row.sent_at is not None and not row.is_read
+
+
+def _user_counts(rows: Sequence[tuple[UUID, int]]) -> Values:
+    """(ユーザーID, 件数) の VALUES（UPDATE ... FROM で使う）"""
+    return values(
+        column('user_id', PG_UUID(as_uuid=True)),
+        column('unread_count', Integer),
+        name='user_counts',
+    ).data(rows)
+
+
+def _to_notification(row: Row) -> Notification:
+    return Notification(
+        id=row.id,
+        user_id=row.user_id,
+        type=NotificationType(row.type),
+        title=row.title,
+        message=row.message,
+        data=row.data,
+        is_read=row.is_read,
+        sent_at=row.sent_at,
+        created_at=row.created_at,
+    )
@@ -0,0 +1,43 @@
+from collections.abc import Collection
+from dataclasses import fields
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.notification import NotificationSettings
+from app.domain.repositories.notification_settings_repository import (
+    INotificationSettingsRepository,
+)
+from app.infrastructure.db.models import NotificationSettingsModel
+
+# NotificationSettings のフィールド順に取得し、NotificationSettings(*row) で組み立てる
+SETTINGS_FIELDS = tuple(field.name for field in fields(NotificationSettings))
+SETTINGS_COLUMNS = tuple(
+    NotificationSettingsModel.__table__.c[name] for name in SETTINGS_FIELDS
+)
+
+
+class NotificationSettingsRepositoryImpl(INotificationSettingsRepository):
+    """通知設定リポジトリの実装"""
+
+    def __init__(self, session: Session):
+        """
+        コンストラクタ
+
+        Args:
+            session: SQLAlchemyのセッション
+        """
+        self.session = session
+
+    def get_many(self, user_ids: Collection[UUID]) -> dict[UUID, NotificationSettings]:
+        """複数ユーザーの通知設定をまとめて取得（WHERE user_id IN (...) の1クエリ）"""
+        if not user_ids:
+            return {}
+        rows = self.session.execute(
+            select(*SETTINGS_COLUMNS).where(
+                NotificationSettingsModel.user_id.in_(set(user_ids))
+            )
+        )
+        settings = (NotificationSettings(*row) for row in rows)
+        return {item.user_id: item for item in settings}
@@ -0,0 +1,102 @@
+import datetime as dt
+from uuid import UUID
+
+from sqlalchemy import Select, and_, case, func, select
+from sqlalchemy.orm import Session
+
+from app.domain.repositories.ranking_repository import IRankingRepository
+from app.infrastructure.db.models import (
+    AttendanceStatisticsModel,
+    AttendanceSummaryModel,
+    UserModel,
+)
+
+
+class RankingRepositoryImpl(IRankingRepository):
+    """ランキング用のスコア取得の実装"""
+
+    def __init__(self, session: Session):
+        """
+        コンストラクタ
+
+        Args:
+            session: SQLAlchemyのセッション
+        """
+        self.session = session
+
+    def current_time(self) -> dt.datetime:
+        """DBの現在時刻"""
+        return self.session.scalar(select(func.now()))
+
+    def list_total_scores(
+        self, since: dt.datetime | None = None
+    ) -> list[tuple[UUID, int]]:
+        """総参加日数を取得（since 指定時は ix_attendance_statistics_updated_at を使う）"""
+        statistics = AttendanceStatisticsModel
+        return self._scores(
+            self._statistics_query(statistics.total_attendance_days), since
+        )
+
+    def list_streak_scores(
+        self, today: dt.date, since: dt.datetime | None = None
+    ) -> list[tuple[UUID, int]]:
+        """現在の連続参加日数を取得（最後の参加が昨日より前なら0）"""
+        statistics = AttendanceStatisticsModel
+        streak = case(
+            (
+                statistics.last_attendance_date >= today - dt.timedelta(days=1),
+                statistics.current_streak_days,
+            ),
+            else_=0,
+        )
+        return self._scores(self._statistics_query(streak), since)
+
+    def list_monthly_scores(
+        self, month: dt.date, since: dt.datetime | None = None
+    ) -> list[tuple[UUID, int]]:
+        """
+        月間の参加日数を取得
+
+        since 指定時は、その月のサマリーが since 以降に更新されたユーザーに絞ってから
+        月内のサマリーを数える（uq_attendance_summaries_user_date の範囲スキャン）。
+        """
+        summary = AttendanceSummaryModel
+        start, end = _month_range(month)
+        in_month = and_(summary.date >= start, summary.date < end)
+        attended = func.count().filter(summary.session_count > 0)
+        query = (
+            select(
+                summary.user_id,
+                case((UserModel.is_active, attended), else_=0).label('score'),
+            )
+            .join(UserModel, UserModel.id == summary.user_id)
+            .where(in_month)
+            .group_by(summary.user_id, UserModel.is_active)
+        )
+        if since is not None:
+            changed = (
+                select(summary.user_id)
+                .where(in_month, summary.updated_at >= since)
+                .distinct()
+            )
+            query = query.where(summary.user_id.in_(changed))
+        return [(user_id, score) for user_id, score in self.session.execute(query)]
+
+    def _statistics_query(self, score) -> Select:
+        statistics = AttendanceStatisticsModel
+        return select(
+            statistics.user_id,
+            case((UserModel.is_active, score), else_=0).label('score'),
+        ).join(UserModel, UserModel.id == statistics.user_id)
+
+    def _scores(self, query: Select, since: dt.datetime | None) -> list[tuple[UUID, int]]:
+        if since is not None:
+            query = query.where(AttendanceStatisticsModel.updated_at >= since)
+        return [(user_id, score) for user_id, score in self.session.execute(query)]
+
+
+def _month_range(month: dt.date) -> tuple[dt.date, dt.date]:
+    """月の初日と翌月の初日"""
+    start = month.replace(day=1)
+    end = (start + dt.timedelta(days=32)).replace(day=1)
+    return start, end
@@ -0,0 +1,94 @@
+from collections.abc import Collection, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.domain.entities.title import TitleAward
+from app.domain.repositories.title_achievement_repository import (
+    ITitleAchievementRepository,
+)
+from app.infrastructure.db.models import TitleAchievementModel
+
+
+class TitleAchievementRepositoryImpl(ITitleAchievementRepository):
+    """称号実績リポジトリの実装"""
+
+    def __init__(self, session: Session):
+        """
+        コンストラクタ
+
+        Args:
+            session: SQLAlchemyのセッション
+        """
+        self.session = session
+
+    def get_highest_levels(self, user_ids: Collection[UUID]) -> dict[UUID, int]:
+        """
+        獲得済みの最高の称号レベルをまとめて取得（uq_title_achievements_user_level を使う1クエリ）
+
+        Args:
+            user_ids: ユーザーIDのリスト
+
+        Returns:
+            dict: ユーザーID -> 最高レベル（称号を獲得していないユーザーは含まない）
+        """
+        if not user_ids:
+            return {}
+
+        rows = self.session.execute(
+            select(
+                TitleAchievementModel.user_id,
+                func.max(TitleAchievementModel.title_level),
+            )
+            .where(TitleAchievementModel.user_id.in_(set(user_ids)))
+            .group_by(TitleAchievementModel.user_id)
+        )
+        return {user_id: level for user_id, level in rows}
+
+    def award(self, awards: Sequence[TitleAward]) -> None:
+        """
+        称号をまとめて付与し、現在の称号を付与した最高レベルに切り替える（3文）
+
+        uq_title_achievements_user_current（is_current の部分一意インデックス）は
+        行ごとに検査されるため、1文で付け替えると途中で重複になる。
+        先に現在の称号を外してから INSERT し、最後に付与した最高レベルを現在の称号にする。
+
+        Args:
+            awards: 付与する称号
+        """
+        if not awards:
+            return
+
+        user_ids = sorted({award.user_id for award in awards})
+        self.session.execute(
+            update(TitleAchievementModel)
+            .where(
+                TitleAchievementModel.user_id.in_(user_ids),
+                TitleAchievementModel.is_current,
+            )
+            .values(is_current=False, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        self.session.execute(
+            insert(TitleAchievementModel)
+            .values(
+                [
+                    {'user_id': award.user_id, 'title_level': level}
+                    for award in awards
+                    for level in award.levels
+                ]
+            )
+            .on_conflict_do_nothing(constraint='uq_title_achievements_user_level')
+        )
+        self.session.execute(
+            update(TitleAchievementModel)
+            .where(
+                tuple_(
+                    TitleAchievementModel.user_id, TitleAchievementModel.title_level
+                ).in_([(award.user_id, award.current_level) for award in awards])
+            )
+            .values(is_current=True, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
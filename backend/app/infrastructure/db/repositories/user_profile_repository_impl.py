@@ -0,0 +1,260 @@
+from uuid import UUID
+
+from sqlalchemy import (
+    Select,
+    and_,
+    case,
+    cast,
+    func,
+    literal_column,
+    or_,
+    select,
+    true,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.orm import Session
+from sqlalchemy.types import Text
+
+from app.domain.entities.user_profile import SocialLink, UserProfile
+from app.domain.repositories.user_profile_repository import (
+    IUserProfileRepository,
+    UserProfileFilter,
+    UserProfilePage,
+)
+from app.infrastructure.db.models import (
+    AttendanceStatisticsModel,
+    TitleAchievementModel,
+    UserMetadataModel,
+    UserModel,
+    UserSocialLinkModel,
+    UserVisionModel,
+)
+from app.infrastructure.db.query_utils import (
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+    escape_like,
+)
+
+# 称号未取得のユーザーの称号レベル
+DEFAULT_TITLE_LEVEL = 1
+
+_TITLE_LEVEL = func.coalesce(TitleAchievementModel.title_level, DEFAULT_TITLE_LEVEL)
+
+
+def build_user_profile_query(
+    filter: UserProfileFilter, limit: int, after_cursor: str | None = None
+) -> Select:
+    """
+    メンバー一覧の1ページ分を1回で取得するクエリを組み立てる
+
+    1. page CTE: users に 1:1 のテーブル（メタデータ・ビジョン・統計・現在の称号）を結合し、
+       絞り込みと (created_at, id) のキーセットページネーションを適用する。
+       次ページの有無を判定するため limit + 1 行取得する。
+    2. ページ内の行だけに LATERAL で公開中の外部リンクを json_agg で集約する。
+       （絞り込み後の全行ではなく、最大 limit + 1 行分だけ集約する）
+
+    総件数は数えない（必要な場合だけ build_user_profile_count_query で別途数える）。
+
+    インデックス:
+        - 並び順・カーソル: ix_users_created_at_id
+        - search: ix_user_metadata_{display_name,tagline}_trgm（pg_trgm）
+        - skills / interests: ix_user_metadata_{skills,interests}（GIN, && 演算子）
+        - 現在の称号: uq_title_achievements_user_current（部分インデックス）
+        - 外部リンク: ix_user_social_links_user_id_public（部分インデックス）
+
+    Raises:
+        ValueError: カーソルが不正な場合
+    """
+    metadata = UserMetadataModel
+    vision = UserVisionModel
+    statistics = AttendanceStatisticsModel
+
+    # UserProfile のフィールド順に並べる（外部リンクは最後に LATERAL で集約する）
+    page_query = _filtered_users(
+        filter,
+        UserModel.id,
+        func.coalesce(UserModel.username, '').label('username'),
+        func.coalesce(metadata.display_name, UserModel.username, '').label(
+            'display_name'
+        ),
+        UserModel.created_at.label('joined_at'),
+        UserModel.avatar_url,
+        metadata.tagline,
+        metadata.bio,
+        func.coalesce(metadata.skills, literal_column("'{}'::text[]")).label('skills'),
+        func.coalesce(metadata.interests, literal_column("'{}'::text[]")).label(
+            'interests'
+        ),
+        case((vision.is_public, vision.vision), else_=None).label('vision'),
+        func.coalesce(vision.is_public, False).label('is_vision_public'),
+        func.coalesce(statistics.total_attendance_days, 0).label('total_attendance_days'),
+        func.coalesce(statistics.current_streak_days, 0).label('current_streak_days'),
+        func.coalesce(statistics.max_streak_days, 0).label('max_streak_days'),
+        _TITLE_LEVEL.label('current_title_level'),
+    )
+    page_query = page_query.outerjoin(vision, vision.user_id == UserModel.id).outerjoin(
+        statistics, statistics.user_id == UserModel.id
+    )
+    if after_cursor is not None:
+        created_at, user_id = decode_keyset_cursor(after_cursor)
+        page_query = page_query.where(
+            tuple_(UserModel.created_at, UserModel.id) < (created_at, user_id)
+        )
+
+    page = (
+        page_query.order_by(UserModel.created_at.desc(), UserModel.id.desc())
+        .limit(limit + 1)
+        .cte('page')
+    )
+
+    link = UserSocialLinkModel
+    links = (
+        select(
+            func.json_agg(
+                aggregate_order_by(
+                    # SocialLink のフィールド順の配列
+                    func.json_build_array(link.id, link.platform, link.url, link.title),
+                    link.created_at,
+                )
+            ).label('social_links')
+        )
+        .where(link.user_id == page.c.id, link.is_public)
+        .lateral('links')
+    )
+
+    return (
+        select(
+            page,
+            func.coalesce(links.c.social_links, literal_column("'[]'::json")).label(
+                'social_links'
+            ),
+        )
+        .select_from(page.outerjoin(links, true()))
+        .order_by(page.c.joined_at.desc(), page.c.id.desc())
+    )
+
+
+def build_user_profile_count_query(filter: UserProfileFilter, max_count: int) -> Select:
+    """
+    条件に一致するユーザーを max_count 件まで数えるクエリ
+
+    一致する行を max_count 件読んだ時点で打ち切るため、条件が緩くユーザーが多くても
+    読む行数は max_count で頭打ちになる。
+    """
+    matched = _filtered_users(filter, UserModel.id).limit(max_count).subquery()
+    return select(func.count()).select_from(matched)
+
+
+def _filtered_users(filter: UserProfileFilter, *columns) -> Select:
+    """
+    絞り込みに使うテーブル（メタデータ・現在の称号）を結合し、条件を適用した SELECT
+
+    columns に指定したカラムを取得する。有効なユーザーのみが対象。
+    """
+    metadata = UserMetadataModel
+    title = TitleAchievementModel
+    query = (
+        select(*columns)
+        .select_from(UserModel)
+        .outerjoin(metadata, metadata.user_id == UserModel.id)
+        .outerjoin(title, and_(title.user_id == UserModel.id, title.is_current))
+        .where(UserModel.is_active)
+    )
+
+    if filter.search:
+        pattern = f'%{escape_like(filter.search)}%'
+        query = query.where(
+            or_(
+                metadata.display_name.ilike(pattern, escape='\\'),
+                metadata.tagline.ilike(pattern, escape='\\'),
+            )
+        )
+    if filter.skills:
+        query = query.where(metadata.skills.overlap(_text_array(filter.skills)))
+    if filter.interests:
+        query = query.where(metadata.interests.overlap(_text_array(filter.interests)))
+    if filter.title_levels:
+        query = query.where(_TITLE_LEVEL.in_(filter.title_levels))
+    return query
+
+
+class UserProfileRepositoryImpl(IUserProfileRepository):
+    """ユーザープロフィールリポジトリの実装"""
+
+    def __init__(self, session: Session):
+        """
+        コンストラクタ
+
+        Args:
+            session: SQLAlchemyのセッション
+        """
+        self.session = session
+
+    def search_profiles(
+        self, filter: UserProfileFilter, limit: int, after_cursor: str | None = None
+    ) -> UserProfilePage:
+        """
+        条件に一致するプロフィールを登録日時の新しい順に取得（1クエリ）
+
+        Args:
+            filter: 絞り込み条件
+            limit: 取得件数
+            after_cursor: 前ページの next_cursor（最初のページは None）
+
+        Returns:
+            UserProfilePage: プロフィール一覧と次ページのカーソル
+
+        Raises:
+            ValueError: カーソルが不正な場合
+        """
+        query = build_user_profile_query(filter, limit, after_cursor)
+        rows = self.session.execute(query).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_keyset_cursor(rows[-1].joined_at, rows[-1].id)
+
+        return UserProfilePage(
+            profiles=[self._to_entity(row) for row in rows], next_cursor=next_cursor
+        )
+
+    def count_profiles(self, filter: UserProfileFilter, max_count: int) -> int:
+        """
+        条件に一致するプロフィールを max_count 件まで数える
+
+        Args:
+            filter: 絞り込み条件
+            max_count: 数える件数の上限
+
+        Returns:
+            int: 一致する件数（max_count 以下）
+        """
+        query = build_user_profile_count_query(filter, max_count)
+        return self.session.execute(query).scalar_one()
+
+    def _to_entity(self, row) -> UserProfile:
+        """
+        クエリ結果の行をエンティティに変換
+
+        行は UserProfile のフィールド順に並んでいるため、検証せずに位置引数で渡す。
+
+        Args:
+            row: build_user_profile_query の結果行
+
+        Returns:
+            UserProfile: ユーザープロフィール
+        """
+        *columns, links = row
+        return UserProfile(
+            *columns,
+            social_links=[
+                SocialLink(UUID(link_id), *values) for link_id, *values in links
+            ],
+        )
+
+
+def _text_array(values: list[str]):
+    """text[] としてバインドする（&& の両辺の型を揃える）"""
+    return cast(values, ARRAY(Text))
@@ -1,130 +1,238 @@
-# from typing import Optional
-# from sqlalchemy.orm import Session
-# from app.domain.entities.user import User
-# from app.domain.repositories.user_repository import IUserRepository
-# from app.infrastructure.db.models.user_model import UserModel
-#
-#
-# class UserRepositoryImpl(IUserRepository):
-#     """ユーザーリポジトリの実装"""
-#
-#     def __init__(self, session: Session):
-#         """
-#         コンストラクタ
-#
-#         Args:
-#             session: SQLAlchemyのセッション
-#         """
-#         self.session = session
-#
-#     def get_by_login_id(self, login_id: str) -> Optional[User]:
-#         """
-#         ログインIDでユーザーを取得
-#
-#         Args:
-#             login_id: ログインID
-#
-#         Returns:
-#             Optional[User]: ユーザーエンティティ（存在しない場合はNone）
-#         """
-#         user_model = (
-#             self.session.query(UserModel)
-#             .filter(UserModel.login_id == login_id)
-#             .first()
-#         )
-#         if user_model is None:
-#             return None
-#         return self._to_entity(user_model)
-#
-#     def get_by_id(self, user_id: int) -> Optional[User]:
-#         """
-#         IDでユーザーを取得
-#
-#         Args:
-#             user_id: ユーザーID
-#
-#         Returns:
-#             Optional[User]: ユーザーエンティティ（存在しない場合はNone）
-#         """
-#         user_model = self.session.query(UserModel).filter(UserModel.id == user_id).first()
-#         if user_model is None:
-#             return None
-#         return self._to_entity(user_model)
-#
-#     def create(self, user: User) -> User:
-#         """
-#         ユーザーを作成
-#
-#         Args:
-#             user: ユーザーエンティティ
-#
-#         Returns:
-#             User: 作成されたユーザーエンティティ
-#         """
-#         user_model = UserModel(
-#             login_id=user.login_id,
-#             password=user.password,
-#             email=user.email,
-#             name=user.name
-#         )
-#         self.session.add(user_model)
-#         self.session.flush()  # IDを取得するためにflush
-#         return self._to_entity(user_model)
-#
-#     def update(self, user: User) -> User:
-#         """
-#         ユーザーを更新
-#
-#         Args:
-#             user: ユーザーエンティティ
-#
-#         Returns:
-#             User: 更新されたユーザーエンティティ
-#         """
-#         user_model = self.session.query(UserModel).filter(UserModel.id == user.id).first()
-#         if user_model is None:
-#             raise ValueError(f"User with id {user.id} not found")
-#
-#         user_model.login_id = user.login_id
-#         user_model.password = user.password
-#         user_model.email = user.email
-#         user_model.name = user.name
-#
-#         self.session.flush()
-#         return self._to_entity(user_model)
-#
-#     def delete(self, user_id: int) -> bool:
-#         """
-#         ユーザーを削除
-#
-#         Args:
-#             user_id: ユーザーID
-#
-#         Returns:
-#             bool: 削除成功の場合True
-#         """
-#         user_model = self.session.query(UserModel).filter(UserModel.id == user_id).first()
-#         if user_model is None:
-#             return False
-#
-#         self.session.delete(user_model)
-#         self.session.flush()
-#         return True
-#
-#     def _to_entity(self, user_model: UserModel) -> User:
-#         """
-#         DBモデルをエンティティに変換
-#
-#         Args:
-#             user_model: ユーザーDBモデル
-#
-#         Returns:
-#             User: ユーザーエンティティ
-#         """
-#         return User(
-#             id=user_model.id,
-#             login_id=user_model.login_id,
-#             password=user_model.password,
-#             email=user_model.email,
-#             name=user_model.name
-#         )
+from collections.abc import Sequence
+from dataclasses import fields
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import (
+    IUserRepository,
+    UserListFilter,
+    UserPage,
+)
+from app.infrastructure.db.models.user_model import UserModel
+from app.infrastructure.db.query_utils import (
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+    escape_like,
+)
+
+# User のフィールド順に並べた取得カラム。読み取りのみのクエリは ORM のオブジェクトを作らず、
+# 行をそのまま User(*row) にする（identity map への登録・属性の計装を省く）
+USER_FIELDS = tuple(field.name for field in fields(User))
+USER_COLUMNS = tuple(UserModel.__table__.c[name] for name in USER_FIELDS)
+
+
+class UserRepositoryImpl(IUserRepository):
+    """ユーザーリポジトリの実装"""
+
+    def __init__(self, session: Session):
+        """
+        コンストラクタ
+
+        Args:
+            session: SQLAlchemyのセッション
+        """
+        self.session = session
+
+    def get_by_login_id(self, login_id: str) -> User | None:
+        """
+        ログインID（メールアドレス）でユーザーを取得
+
+        Args:
+            login_id: ログインID
+
+        Returns:
+            Optional[User]: ユーザーエンティティ（存在しない場合はNone）
+        """
+        row = self.session.execute(
+            select(*USER_COLUMNS).where(UserModel.email == login_id)
+        ).first()
+        if row is None:
+            return None
+        return User(*row)
+
+    def get_by_id(self, user_id: UUID) -> User | None:
+        """
+        IDでユーザーを取得
+
+        Args:
+            user_id: ユーザーID
+
+        Returns:
+            Optional[User]: ユーザーエンティティ（存在しない場合はNone）
+        """
+        user_model = self.session.get(UserModel, user_id)
+        if user_model is None:
+            return None
+        return self._to_entity(user_model)
+
+    def get_many_by_ids(self, user_ids: Sequence[UUID]) -> list[User]:
+        """
+        複数のIDでユーザーをまとめて取得（WHERE id IN (...) の1クエリ）
+
+        Args:
+            user_ids: ユーザーIDのリスト
+
+        Returns:
+            list[User]: user_ids の順に並べたユーザー（存在しないIDは含まない）
+        """
+        if not user_ids:
+            return []
+
+        rows = self.session.execute(
+            select(*USER_COLUMNS).where(UserModel.id.in_(set(user_ids)))
+        )
+        users_by_id = {user.id: user for user in (User(*row) for row in rows)}
+        return [users_by_id[user_id] for user_id in user_ids if user_id in users_by_id]
+
+    def get_ids_by_discord_ids(self, discord_ids: Sequence[str]) -> dict[str, UUID]:
+        """
+        Discord User ID からユーザーIDをまとめて引く（WHERE discord_id IN (...) の1クエリ）
+
+        Args:
+            discord_ids: Discord User ID のリスト
+
+        Returns:
+            dict[str, UUID]: Discord User ID -> ユーザーID（未連携のIDは含まない）
+        """
+        if not discord_ids:
+            return {}
+
+        rows = self.session.execute(
+            select(UserModel.discord_id, UserModel.id).where(
+                UserModel.discord_id.in_(set(discord_ids))
+            )
+        )
+        return {discord_id: user_id for discord_id, user_id in rows}
+
+    def list_users(
+        self,
+        filter: UserListFilter | None = None,
+        after_cursor: str | None = None,
+        limit: int = 20,
+    ) -> UserPage:
+        """
+        ユーザー一覧を登録日時の新しい順に取得（キーセットページネーション）
+
+        (created_at, id) の組で並べ、前ページ最後の行より後ろを
+        ix_users_created_at_id から読むため、ページが深くなっても遅くならない。
+
+        Args:
+            filter: 絞り込み条件
+            after_cursor: 前ページの next_cursor（最初のページは None）
+            limit: 取得件数
+
+        Returns:
+            UserPage: ユーザー一覧と次ページのカーソル
+
+        Raises:
+            ValueError: カーソルが不正な場合
+        """
+        filter = filter or UserListFilter()
+        query = select(*USER_COLUMNS)
+
+        if filter.is_active is not None:
+            query = query.where(UserModel.is_active.is_(filter.is_active))
+        if filter.search:
+            query = query.where(
+                UserModel.username.ilike(f'%{escape_like(filter.search)}%', escape='\\')
+            )
+        if after_cursor is not None:
+            created_at, user_id = decode_keyset_cursor(after_cursor)
+            query = query.where(
+                tuple_(UserModel.created_at, UserModel.id) < (created_at, user_id)
+            )
+
+        # 1件多く取得して次ページの有無を判定する
+        query = query.order_by(UserModel.created_at.desc(), UserModel.id.desc())
+        users = [User(*row) for row in self.session.execute(query.limit(limit + 1))]
+
+        has_more = len(users) > limit
+        users = users[:limit]
+        next_cursor = None
+        if has_more and users:
+            last = users[-1]
+            next_cursor = encode_keyset_cursor(last.created_at, last.id)
+
+        return UserPage(users=users, next_cursor=next_cursor)
+
+    def create(self, user: User) -> User:
+        """
+        ユーザーを作成
+
+        Args:
+            user: ユーザーエンティティ
+
+        Returns:
+            User: 作成されたユーザーエンティティ
+        """
+        user_model = UserModel(
+            id=user.id,
+            email=user.email,
+            password_hash=user.password_hash,
+            username=user.username,
+            avatar_url=user.avatar_url,
+            discord_id=user.discord_id,
+            is_active=user.is_active,
+        )
+        self.session.add(user_model)
+        self.session.flush()  # サーバー側のデフォルト値（作成日時）を取得するためにflush
+        self.session.refresh(user_model)
+        return self._to_entity(user_model)
+
+    def update(self, user: User) -> User:
+        """
+        ユーザーを更新
+
+        Args:
+            user: ユーザーエンティティ
+
+        Returns:
+            User: 更新されたユーザーエンティティ
+        """
+        user_model = self.session.get(UserModel, user.id)
+        if user_model is None:
+            raise ValueError(f'User with id {user.id} not found')
+
+        user_model.email = user.email
+        user_model.password_hash = user.password_hash
+        user_model.username = user.username
+        user_model.avatar_url = user.avatar_url
+        user_model.discord_id = user.discord_id
+        user_model.is_active = user.is_active
+
+        self.session.flush()
+        self.session.refresh(user_model)
+        return self._to_entity(user_model)
+
+    def delete(self, user_id: UUID) -> bool:
+        """
+        ユーザーを削除
+
+        Args:
+            user_id: ユーザーID
+
+        Returns:
+            bool: 削除成功の場合True
+        """
+        user_model = self.session.get(UserModel, user_id)
+        if user_model is None:
+            return False
+
+        self.session.delete(user_model)
+        self.session.flush()
+        return True
+
+    def _to_entity(self, user_model: UserModel) -> User:
+        """
+        DBモデルをエンティティに変換
+
+        Args:
+            user_model: ユーザーDBモデル
+
+        Returns:
+            User: ユーザーエンティティ
+        """
+        return User(*(getattr(user_model, name) for name in USER_FIELDS))
@@ -0,0 +1,57 @@
+from collections import defaultdict
+from collections.abc import Collection
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.domain.repositories.user_rival_repository import IUserRivalRepository
+from app.infrastructure.db.models import UserRivalModel
+
+
+class UserRivalRepositoryImpl(IUserRivalRepository):
+    """ライバル関係リポジトリの実装"""
+
+    def __init__(self, session: Session):
+        """
+        コンストラクタ
+
+        Args:
+            session: SQLAlchemyのセッション
+        """
+        self.session = session
+
+    def get_rival_ids(self, user_id: UUID) -> list[UUID]:
+        """
+        ユーザーが設定したライバルのIDを取得
+
+        Args:
+            user_id: ユーザーID
+
+        Returns:
+            list[UUID]: ライバルのユーザーID（設定日時の古い順）
+        """
+        return list(
+            self.session.scalars(
+                select(UserRivalModel.rival_user_id)
+                .where(UserRivalModel.user_id == user_id)
+                .order_by(UserRivalModel.created_at)
+            )
+        )
+
+    def get_follower_ids(self, user_ids: Collection[UUID]) -> dict[UUID, list[UUID]]:
+        """
+        複数ユーザーについて、そのユーザーをライバルに設定しているユーザーのIDを取得
+        （WHERE rival_user_id IN (...) の1クエリ。ix_user_rivals_rival_user_id）
+        """
+        if not user_ids:
+            return {}
+        rows = self.session.execute(
+            select(UserRivalModel.rival_user_id, UserRivalModel.user_id).where(
+                UserRivalModel.rival_user_id.in_(set(user_ids))
+            )
+        )
+        followers: defaultdict[UUID, list[UUID]] = defaultdict(list)
+        for rival_user_id, user_id in rows:
+            followers[rival_user_id].append(user_id)
+        return dict(followers)
@@ -0,0 +1,94 @@
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from app.config import get_settings
+
+# デッドロック・ロック競合を示すエラーメッセージ
+RETRYABLE_ERROR_KEYWORDS = (
+    'deadlock',
+    'lock timeout',
+    'lock wait timeout',
+    'could not serialize access',
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    デッドロック時のリトライ方針
+
+    待機時間は指数バックオフ + フルジッター（0 〜 min(max_delay, base_delay * 2^n) の一様乱数）。
+    同時刻に競合したトランザクション同士が同じタイミングで再衝突しないようにする。
+    deadline は1回の Unit of Work に使える合計時間（秒）で、超える場合はリトライしない。
+    clock（経過時間の計測）と uniform（ジッターの乱数）はテストで差し替える。
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 1.0
+    deadline: float = 2.0
+    clock: Callable[[], float] = field(default=time.monotonic, compare=False, repr=False)
+    uniform: Callable[[float, float], float] = field(
+        default=random.uniform, compare=False, repr=False
+    )
+
+    @classmethod
+    def from_settings(cls) -> 'RetryPolicy':
+        """Settings からリトライ方針を生成"""
+        settings = get_settings()
+        return cls(
+            max_attempts=settings.db_retry_max_attempts,
+            base_delay=settings.db_retry_base_delay,
+            max_delay=settings.db_retry_max_delay,
+            deadline=settings.db_retry_deadline,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """attempt 回目の失敗後に待機する秒数"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return self.uniform(0, ceiling)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        例外がデッドロックまたはロックタイムアウトかを判定
+
+        対応するエラー:
+        - PostgreSQL: deadlock detected
+        - PostgreSQL: could not serialize access
+        - MySQL: Deadlock found
+        - MySQL: Lock wait timeout exceeded
+        """
+        error_msg = str(error).lower()
+        return any(keyword in error_msg for keyword in RETRYABLE_ERROR_KEYWORDS)
+
+    def start(self) -> 'RetryBudget':
+        """1回の Unit of Work 分のリトライ予算を開始"""
+        return RetryBudget(self, self.clock() + self.deadline)
+
+
+class RetryBudget:
+    """1回の Unit of Work で消費するリトライ回数・時間の残り"""
+
+    def __init__(self, policy: RetryPolicy, deadline_at: float):
+        self.policy = policy
+        self.deadline_at = deadline_at
+        self.attempt = 1
+
+    def next_delay(self) -> float | None:
+        """
+        次の試行までの待機秒数を返す
+
+        Returns:
+            float | None: 待機秒数（回数・期限を使い切った場合はNone）
+        """
+        if self.attempt >= self.policy.max_attempts:
+            return None
+
+        delay = self.policy.backoff(self.attempt)
+        if self.policy.clock() + delay >= self.deadline_at:
+            return None
+
+        self.attempt += 1
+        return delay
@@ -1,21 +1,251 @@
+import logging
+import shlex
+from functools import lru_cache
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import Settings, get_settings
+from app.infrastructure.db.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    register_pool,
+)
+
+logger = logging.getLogger(__name__)
+
+# libpq（psycopg2）の接続パラメータのうち、asyncpg では名前が違うだけのもの
+_LIBPQ_RENAMED_PARAMS = {'sslmode': 'ssl'}
+# asyncpg ダイアレクトがURLのクエリとしてそのまま受け付けるパラメータ
+_ASYNCPG_QUERY_PARAMS = frozenset(
+    {'host', 'port', 'ssl', 'target_session_attrs', 'prepared_statement_cache_size'}
+)
+# 接続引数（async_connect_args）に移すパラメータ
+_LIBPQ_CONNECT_ARG_PARAMS = frozenset({'options', 'application_name', 'connect_timeout'})
+
+# エンジン・セッションファクトリはインポート時ではなく最初に使うとき
+# （アプリでは lifespan の起動時）に作成する。
+# スクリプトや OpenAPI の出力のようにルーターを読み込むだけの処理では Settings の読み込みも
+# 接続プールの作成も行わない。
+
+
+def database_uri(settings: Settings) -> str:
+    """データベースのURL（DATABASE_URL が設定されていればそちらを優先）"""
+    return settings.database_url or (
+        f'postgresql+psycopg2://{settings.postgres_user}:{settings.postgres_password}'
+        f'@{settings.postgres_host}:{settings.postgres_port}/{settings.postgres_db}'
+    )
+
+
+def async_database_uri(settings: Settings) -> URL:
+    """
+    非同期ドライバ（asyncpg）用のデータベースのURL
+
+    ASYNC_DATABASE_URL が設定されていればそのまま使う。未設定なら同期用のURLのドライバを
+    asyncpg に置き換え、libpq 専用のクエリパラメータ（sslmode など）を asyncpg が
+    受け付ける形に読み替える。options などは async_connect_args で接続引数に移し、
+    どちらにも対応しないものは警告を出して取り除く（asyncpg は未知の引数で接続に失敗する）。
+    """
+    if settings.async_database_url:
+        return make_url(settings.async_database_url)
+    url = make_url(database_uri(settings))
+    query = {}
+    dropped = []
+    for key, value in url.query.items():
+        name = _LIBPQ_RENAMED_PARAMS.get(key, key)
+        if name in _ASYNCPG_QUERY_PARAMS:
+            query[name] = value
+        elif key not in _LIBPQ_CONNECT_ARG_PARAMS:
+            dropped.append(key)
+    if dropped:
+        logger.warning(
+            'asyncpg が対応していない接続パラメータを無視します: %s', ', '.join(dropped)
+        )
+    return url.set(drivername='postgresql+asyncpg', query=query)
+
+
+def async_connect_args(settings: Settings) -> dict:
+    """
+    asyncpg の接続引数
+
+    同期用のURLから導出する場合は libpq の options（-c key=value）と application_name を
+    server_settings に、connect_timeout を timeout に移す。
+    タイムアウト設定（session_timeouts）はURLの options より優先する。
+    """
+    connect_args = {}
+    server_settings = {}
+    if not settings.async_database_url:
+        query = make_url(database_uri(settings)).query
+        server_settings.update(_parse_libpq_options(str(query.get('options', ''))))
+        if 'application_name' in query:
+            server_settings['application_name'] = str(query['application_name'])
+        if 'connect_timeout' in query:
+            connect_args['timeout'] = float(query['connect_timeout'])
+    server_settings.update(session_timeouts(settings))
+    connect_args['server_settings'] = server_settings
+    return connect_args
+
+
+def _parse_libpq_options(options: str) -> dict[str, str]:
+    """libpq の options（'-c key=value', '-ckey=value', '--key=value'）を辞書にする"""
+    settings = {}
+    tokens = iter(shlex.split(options))
+    for token in tokens:
+        if token == '-c':
+            token = next(tokens, '')
+        elif token.startswith('-c'):
+            token = token[2:]
+        elif token.startswith('--'):
+            token = token[2:]
+        key, sep, value = token.partition('=')
+        if sep and key:
+            settings[key.replace('-', '_')] = value
+    return settings
+
+
+def session_timeouts(settings: Settings) -> dict[str, str]:
+    """接続時に適用するタイムアウト（ミリ秒, 0 は無制限）"""
+    return {
+        'statement_timeout': str(settings.db_statement_timeout_ms),
+        'lock_timeout': str(settings.db_lock_timeout_ms),
+    }
+
+
+def pool_options(settings: Settings) -> dict:
+    """
+    プール設定
+
+    pool_pre_ping: チェックアウト時に接続の生存確認をして、RDS側で切断された接続を使わない
+    pool_recycle: 一定時間使った接続を作り直す（RDS/NAT のアイドル切断対策）
+    """
+    return {
+        'pool_size': settings.db_pool_size,
+        'max_overflow': settings.db_max_overflow,
+        'pool_timeout': settings.db_pool_timeout,
+        'pool_recycle': settings.db_pool_recycle,
+        'pool_pre_ping': settings.db_pool_pre_ping,
+    }
+
+
+def _create_sync_engine(url: str, settings: Settings) -> Engine:
+    # psycopg2 の接続時オプションでタイムアウトを設定する
+    # （PostgreSQL 以外のURL（テストの SQLite など）には渡さない）
+    connect_args = {}
+    if make_url(url).get_backend_name() == 'postgresql':
+        connect_args['options'] = ' '.join(
+            f'-c {key}={value}' for key, value in session_timeouts(settings).items()
+        )
+    return create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        connect_args=connect_args,
+        echo=False,
+        **pool_options(settings),
+    )
+
+
+@lru_cache
+def get_engine() -> Engine:
+    """プライマリのエンジン"""
+    settings = get_settings()
+    engine = _create_sync_engine(database_uri(settings), settings)
+    register_pool('primary', engine.pool)
+    return engine
+
+
+@lru_cache
+def get_replica_engine() -> Engine:
+    """読み取り専用レプリカのエンジン（DATABASE_REPLICA_URL 未設定ならプライマリを使う）"""
+    settings = get_settings()
+    if not settings.database_replica_url:
+        return get_engine()
+    engine = _create_sync_engine(settings.database_replica_url, settings)
+    register_pool('replica', engine.pool)
+    return engine
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """
+    非同期エンジン（asyncpg）
+
+    イベントループ上で接続を待つため、スレッドプールのサイズに制限されない
+    """
+    settings = get_settings()
+    engine = create_async_engine(
+        async_database_uri(settings),
+        poolclass=InstrumentedAsyncQueuePool,
+        connect_args=async_connect_args(settings),
+        echo=False,
+        **pool_options(settings),
+    )
+    register_pool('primary_async', engine.pool)
+    return engine
+
+
+@lru_cache
+def get_session_factory() -> sessionmaker[Session]:
+    """プライマリの読み書きセッション"""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+@lru_cache
+def get_replica_session_factory() -> sessionmaker[Session]:
+    """
+    読み取り専用セッション
+
+    postgresql_readonly でトランザクションを READ ONLY にし、誤った書き込みをDB側で拒否する
+    （接続特性はプールへ返却時に元に戻るため、プライマリのプールを共有しても影響しない）
+    """
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=get_replica_engine().execution_options(postgresql_readonly=True),
+    )
+
+
+@lru_cache
+def get_readonly_primary_session_factory() -> sessionmaker[Session]:
+    """書き込み直後のクライアントが読み取りに使うセッション（プライマリ・読み取り専用）"""
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=get_engine().execution_options(postgresql_readonly=True),
+    )
+
 
-from app.config import get_settings
+@lru_cache
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    非同期セッション
 
-settings = get_settings()
+    コミット後に属性へアクセスしても暗黙のI/Oが発生しないよう expire_on_commit=False
+    """
+    return async_sessionmaker(
+        bind=get_async_engine(), autoflush=False, expire_on_commit=False
+    )
 
-user = settings.postgres_user
-password = settings.postgres_password
-host = settings.postgres_host
-port = settings.postgres_port
-db_name = settings.postgres_db
 
-# データベースのURLを設定
-DATABASE_URI = f'postgresql+psycopg2://{user}:{password}@{host}:{port}/{db_name}'
+def init_engines() -> None:
+    """エンジンとセッションファクトリを作成（接続はしない。lifespan の起動時に呼ぶ）"""
+    get_session_factory()
+    get_replica_session_factory()
+    get_readonly_primary_session_factory()
+    get_async_session_factory()
 
-# エンジンの作成
-engine = create_engine(DATABASE_URI, pool_size=10, max_overflow=20, echo=False)
 
-# セッションの作成
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async def dispose_engines() -> None:
+    """作成済みのエンジンの接続プールを閉じる（lifespan の終了時に呼ぶ）"""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_replica_engine.cache_info().currsize:
+        get_replica_engine().dispose()
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
@@ -1,17 +1,26 @@
 import logging
 import time
+from collections.abc import Callable
+from typing import TypeVar
 
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
-from app.application.interfaces.unit_of_work import IUnitOfWork
-from app.infrastructure.db.session import SessionLocal
+from app.application.interfaces.unit_of_work import (
+    IUnitOfWork,
+    TransactionConflictError,
+)
+from app.infrastructure.db.retry_policy import RetryPolicy
+from app.infrastructure.db.session import (
+    get_readonly_primary_session_factory,
+    get_replica_session_factory,
+    get_session_factory,
+)
+from app.infrastructure.metrics.timing import timed
 
 logger = logging.getLogger(__name__)
 
-# デッドロックリトライ設定
-MAX_RETRIES = 3  # 最大リトライ回数
-RETRY_DELAY = 0.5  # リトライ間の待機時間（秒）
+T = TypeVar('T')
 
 
 class SQLAlchemyUnitOfWork(IUnitOfWork):
@@ -22,16 +31,43 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
         uow = SQLAlchemyUnitOfWork()
         with uow:
             repository = UserRepository(uow.session)
-            user = repository.create(new_user)
-            uow.commit()
+            user = uow.run(lambda: repository.create(new_user))
+
+    読み取り専用（レプリカで読む）:
+        with SQLAlchemyUnitOfWork(readonly=True) as uow:
+            users = UserRepository(uow.session).list_users(...)
+
+    Args:
+        retry_policy: デッドロック時のリトライ方針（省略時は設定値）
+        readonly: True ならレプリカに READ ONLY トランザクションで接続する
+        prefer_primary: readonly でもプライマリから読む（直前に書き込んだクライアント用）
+        on_commit: 書き込みをコミットした後に呼ぶ処理（プライマリへの固定の記録など）
+        sleep: リトライまでの待機（テストで差し替える）
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        retry_policy: RetryPolicy | None = None,
+        readonly: bool = False,
+        prefer_primary: bool = False,
+        on_commit: Callable[[], None] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
         self.session: Session = None
+        self.retry_policy = retry_policy or RetryPolicy.from_settings()
+        self.readonly = readonly
+        self.prefer_primary = prefer_primary
+        self.on_commit = on_commit
+        self.sleep = sleep
 
     def __enter__(self):
         """セッションを開始"""
-        self.session = SessionLocal()
+        if not self.readonly:
+            self.session = get_session_factory()()
+        elif self.prefer_primary:
+            self.session = get_readonly_primary_session_factory()()
+        else:
+            self.session = get_replica_session_factory()()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -47,34 +83,60 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
     def commit(self):
         """
         トランザクションをコミット
-        デッドロックが発生した場合は自動的にリトライ
+
+        ロールバック後に commit し直しても空のトランザクションが確定するだけなので、
+        デッドロック時はリトライせず TransactionConflictError を送出する。
+        自動でやり直したい場合は run() を使う。
         """
-        retries = 0
-        while retries < MAX_RETRIES:
-            try:
+        try:
+            with timed('db_commit'):
                 self.session.commit()
+            self._mark_write()
+            logger.debug('トランザクションをコミットしました')
+        except (OperationalError, IntegrityError) as e:
+            self.session.rollback()
+            if self.retry_policy.is_retryable(e):
+                logger.warning(f'デッドロック検出: {e}')
+                raise TransactionConflictError(str(e)) from e
+            logger.error(f'トランザクションエラー: {e}')
+            raise
+
+    def run(self, work: Callable[[], T]) -> T:
+        """
+        work を実行してコミット
+        デッドロックが発生した場合はロールバックして work ごとやり直す
+        """
+        budget = self.retry_policy.start()
+        while True:
+            try:
+                result = work()
+                with timed('db_commit'):
+                    self.session.commit()
+                self._mark_write()
                 logger.debug('トランザクションをコミットしました')
-                return
+                return result
             except (OperationalError, IntegrityError) as e:
-                if self._is_deadlock_or_lock_timeout(e):
-                    retries += 1
-                    self.session.rollback()
-                    logger.warning(
-                        f'デッドロック検出。リトライ {retries}/{MAX_RETRIES}: {e}'
-                    )
-                    # 指数バックオフでリトライ
-                    time.sleep(RETRY_DELAY * retries)
-                    continue
-                else:
-                    # デッドロック以外のエラーは即座に例外を送出
-                    self.session.rollback()
+                self.session.rollback()
+                if not self.retry_policy.is_retryable(e):
                     logger.error(f'トランザクションエラー: {e}')
                     raise
 
-        # 最大リトライ回数を超えた場合
-        error_msg = f'最大リトライ回数({MAX_RETRIES})を超えました'
-        logger.error(error_msg)
-        raise Exception(error_msg)
+                delay = budget.next_delay()
+                if delay is None:
+                    error_msg = f'リトライ上限に達しました（{budget.attempt}回試行）'
+                    logger.error(error_msg)
+                    raise TransactionConflictError(error_msg) from e
+
+                logger.warning(
+                    f'デッドロック検出。{delay:.3f}秒後にリトライ '
+                    f'{budget.attempt}/{self.retry_policy.max_attempts}: {e}'
+                )
+                self.sleep(delay)
+
+    def _mark_write(self):
+        """書き込みの確定を on_commit に知らせる"""
+        if not self.readonly and self.on_commit is not None:
+            self.on_commit()
 
     def rollback(self):
         """トランザクションをロールバック"""
@@ -87,23 +149,3 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
         """
         self.session.flush()
         logger.debug('変更をフラッシュしました')
-
-    @staticmethod
-    def _is_deadlock_or_lock_timeout(e):
-        """
-        例外がデッドロックまたはロックタイムアウトかを判定
-
-        対応するエラー:
-        - PostgreSQL: deadlock detected
-        - PostgreSQL: could not serialize access
-        - MySQL: Deadlock found
-        - MySQL: Lock wait timeout exceeded
-        """
-        error_msg = str(e).lower()
-        deadlock_keywords = [
-            'deadlock',
-            'lock timeout',
-            'lock wait timeout',
-            'could not serialize access',
-        ]
-        return any(keyword in error_msg for keyword in deadlock_keywords)
@@ -1,19 +1,159 @@
+import atexit
+import copy
+import json
 import logging
+import queue
 import sys
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+from app.config import get_settings
+
+# ファイル名・行番号・関数名まで表示して原因追跡を容易にする（開発環境向け）
+CALLSITE_FORMAT = '%(asctime)s [%(levelname)s] %(name)s %(pathname)s:%(lineno)d %(funcName)s: %(message)s'
+PLAIN_FORMAT = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+
+_DEFAULT_SRCFILE = logging._srcfile  # type: ignore[attr-defined]
+_listener: QueueListener | None = None
+
+
+class JSONFormatter(logging.Formatter):
+    """1レコードを1行のJSONとして出力するフォーマッター"""
+
+    def __init__(self, include_callsite: bool = False):
+        super().__init__()
+        self.include_callsite = include_callsite
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, UTC).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        if self.include_callsite:
+            entry['pathname'] = record.pathname
+            entry['lineno'] = record.lineno
+            entry['func'] = record.funcName
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    キューが満杯でも呼び出し元をブロックしない QueueHandler
+
+    書き込みはバックグラウンドの QueueListener が行う。
+    キューが溢れた場合はレコードを破棄し、件数だけ数えておく。
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # メッセージの組み立てと例外の文字列化だけを行い、整形は書き込みスレッドに任せる
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
 
 def setup_logging():
-    log_dir = Path(__file__).resolve().parent.parent.parent / 'logs'
+    """
+    ロギングを初期化
+
+    LOG_MODE=development（デフォルト）:
+        標準出力とファイルに同期で書き込む。呼び出し元（ファイル・行番号・関数名）も出力する。
+    LOG_MODE=production:
+        QueueHandler でキューに積むだけにして、バックグラウンドスレッドが
+        標準出力とサイズローテーション付きファイルに JSON Lines で書き込む。
+    """
+    global _listener
+
+    settings = get_settings()
+    production = settings.log_mode == 'production'
+    capture_callsite = settings.log_capture_callsite
+    if capture_callsite is None:
+        capture_callsite = not production
+
+    # 呼び出し元を出力しない場合はフレームの走査自体を省略する
+    logging._srcfile = _DEFAULT_SRCFILE if capture_callsite else None  # type: ignore[attr-defined]
+    logging.logMultiprocessing = False
+
+    log_dir = (
+        Path(settings.log_dir)
+        if settings.log_dir
+        else Path(__file__).resolve().parent.parent.parent / 'logs'
+    )
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file_path = log_dir / 'app.log'
 
-    logging.basicConfig(
-        level=logging.DEBUG,
-        # ファイル名・行番号・関数名まで表示して原因追跡を容易にする
-        format='%(asctime)s [%(levelname)s] %(name)s %(pathname)s:%(lineno)d %(funcName)s: %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(log_file_path),
-        ],
+    _stop_listener()
+
+    if production:
+        formatter: logging.Formatter = JSONFormatter(include_callsite=capture_callsite)
+    else:
+        formatter = logging.Formatter(
+            CALLSITE_FORMAT if capture_callsite else PLAIN_FORMAT
+        )
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    file_handler = RotatingFileHandler(
+        log_file_path,
+        maxBytes=settings.log_file_max_bytes,
+        backupCount=settings.log_file_backup_count,
+        encoding='utf-8',
     )
+    for handler in (stream_handler, file_handler):
+        handler.setFormatter(formatter)
+
+    if production:
+        log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+        _listener = QueueListener(
+            log_queue, stream_handler, file_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.unregister(_stop_listener)
+        atexit.register(_stop_listener)
+        handlers: list[logging.Handler] = [NonBlockingQueueHandler(log_queue)]
+    else:
+        handlers = [stream_handler, file_handler]
+
+    logging.basicConfig(level=settings.log_level.upper(), handlers=handlers, force=True)
+
+    for name, level in _parse_module_levels(settings.log_levels).items():
+        logging.getLogger(name).setLevel(level)
+
+
+def _stop_listener() -> None:
+    """キューに残ったレコードを書き出してバックグラウンドスレッドを停止"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _parse_module_levels(value: str) -> dict[str, str]:
+    """'sqlalchemy.engine=WARNING,uvicorn.access=INFO' 形式をパース"""
+    levels: dict[str, str] = {}
+    for item in value.split(','):
+        if '=' not in item:
+            continue
+        name, level = item.split('=', 1)
+        if name.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
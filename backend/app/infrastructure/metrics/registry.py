@@ -0,0 +1,180 @@
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+
+# レイテンシ計測用のデフォルトバケット（秒）
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """
+    スレッドごとにシャードを持つヒストグラム
+
+    observe() は呼び出しスレッド専用のシャードに書き込むだけなので、ロックを取らない。
+    ロックはシャードの初回登録時と collect() 時のみ使用する。
+    終了したスレッドのシャードは collect() 時に集約済みの値へ畳み込む。
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards: list[tuple[threading.Thread, list[float]]] = []
+        self._retired = self._new_shard()
+
+    def _new_shard(self) -> list[float]:
+        # [bucket_0, ..., bucket_n, +Inf, sum]
+        return [0] * (len(self.buckets) + 1) + [0.0]
+
+    def _shard(self) -> list[float]:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._new_shard()
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+            self._local.shard = shard
+        return shard
+
+    def observe(self, value: float) -> None:
+        """値を1件記録"""
+        shard = self._shard()
+        shard[bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def collect(self) -> tuple[list[int], float, int]:
+        """
+        全シャードを集計
+
+        Returns:
+            tuple: (累積バケットカウント（+Inf を含む）, 合計値, 件数)
+        """
+        with self._lock:
+            alive = []
+            for thread, shard in self._shards:
+                if thread.is_alive():
+                    alive.append((thread, shard))
+                else:
+                    _merge_into(self._retired, shard)
+            self._shards = alive
+
+            totals = list(self._retired)
+            for _, shard in alive:
+                _merge_into(totals, shard)
+
+        cumulative = []
+        running = 0
+        for count in totals[:-1]:
+            running += int(count)
+            cumulative.append(running)
+        return cumulative, totals[-1], running
+
+
+def _merge_into(target: list[float], source: list[float]) -> None:
+    for i, value in enumerate(source):
+        target[i] += value
+
+
+class MetricsRegistry:
+    """ラベル付きヒストグラムとゲージを保持し、Prometheus のテキスト形式で出力する"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help: dict[str, str] = {}
+        self._histograms: dict[tuple[str, tuple[tuple[str, str], ...]], Histogram] = {}
+        self._gauges: dict[
+            str, Callable[[], dict[tuple[tuple[str, str], ...], float]]
+        ] = {}
+
+    def histogram(self, name: str, help_text: str, **labels: str) -> Histogram:
+        """ラベルに対応するヒストグラムを取得（なければ作成）"""
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = Histogram()
+                    self._histograms[key] = histogram
+                    self._help.setdefault(name, help_text)
+        return histogram
+
+    def register_gauge(
+        self,
+        name: str,
+        help_text: str,
+        collect: Callable[[], dict[tuple[tuple[str, str], ...], float]],
+    ) -> None:
+        """
+        スクレイプ時に値を計算するゲージを登録
+
+        Args:
+            name: メトリクス名
+            help_text: 説明
+            collect: {ラベルのタプル: 値} を返す関数
+        """
+        with self._lock:
+            self._gauges[name] = collect
+            self._help[name] = help_text
+
+    def render(self) -> str:
+        """Prometheus テキスト形式（version 0.0.4）で出力"""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            gauges = sorted(self._gauges.items())
+            help_texts = dict(self._help)
+
+        lines: list[str] = []
+        current_name = None
+        for (name, labels), histogram in histograms:
+            if name != current_name:
+                lines.append(f'# HELP {name} {help_texts[name]}')
+                lines.append(f'# TYPE {name} histogram')
+                current_name = name
+            cumulative, total, count = histogram.collect()
+            bounds = [*(_format_float(b) for b in histogram.buckets), '+Inf']
+            for bound, value in zip(bounds, cumulative, strict=True):
+                lines.append(
+                    f'{name}_bucket{_format_labels((*labels, ("le", bound)))} {value}'
+                )
+            lines.append(f'{name}_sum{_format_labels(labels)} {total}')
+            lines.append(f'{name}_count{_format_labels(labels)} {count}')
+
+        for name, collect in gauges:
+            lines.append(f'# HELP {name} {help_texts[name]}')
+            lines.append(f'# TYPE {name} gauge')
+            for labels, value in sorted(collect().items()):
+                lines.append(f'{name}{_format_labels(labels)} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    pairs = ','.join(f'{key}="{_escape(value)}"' for key, value in labels)
+    return '{' + pairs + '}'
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+metrics_registry = MetricsRegistry()
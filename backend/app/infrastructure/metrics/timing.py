@@ -0,0 +1,55 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from app.infrastructure.metrics.registry import metrics_registry
+
+PHASE_METRIC = 'app_phase_duration_seconds'
+PHASE_HELP = 'Time spent in each request phase (auth, usecase, db_commit)'
+
+
+class RequestTimings:
+    """1リクエスト内で計測したフェーズごとの所要時間（秒）"""
+
+    __slots__ = ('phases',)
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def server_timing(self, total: float) -> str:
+        """Server-Timing ヘッダーの値を生成（単位はミリ秒）"""
+        entries = [
+            f'{phase};dur={seconds * 1000:.2f}' for phase, seconds in self.phases.items()
+        ]
+        entries.append(f'app;dur={total * 1000:.2f}')
+        return ', '.join(entries)
+
+
+# リクエストごとの計測結果（スレッドプールで実行される依存関数にもコピーされる）
+request_timings: ContextVar[RequestTimings | None] = ContextVar(
+    'request_timings', default=None
+)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    ブロックの所要時間を計測し、フェーズ別ヒストグラムと Server-Timing に記録する
+
+    使用例:
+        with timed('usecase'):
+            output_dto = auth_usecase.get_me(user_id=current_user.id)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        metrics_registry.histogram(PHASE_METRIC, PHASE_HELP, phase=phase).observe(elapsed)
+        timings = request_timings.get()
+        if timings is not None:
+            timings.add(phase, elapsed)
@@ -0,0 +1,183 @@
+import datetime as dt
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.orm import Session
+
+from app.application.interfaces.leaderboard_provider import (
+    ILeaderboardProvider,
+    RankingSnapshot,
+)
+from app.config import get_settings
+from app.domain.entities.ranking import RankingType
+from app.domain.services.leaderboard import Leaderboard, LeaderboardEntry
+from app.infrastructure.db.repositories.ranking_repository_impl import (
+    RankingRepositoryImpl,
+)
+from app.infrastructure.db.session import get_replica_session_factory
+
+logger = logging.getLogger(__name__)
+
+# 保持する月間ランキングの数（古い月から捨てる）
+MAX_MONTHLY_BOARDS = 12
+
+BoardKey = tuple[RankingType, dt.date | None]
+
+
+@dataclass
+class _BoardState:
+    board: Leaderboard = field(default_factory=Leaderboard)
+    watermark: dt.datetime | None = None
+    built_at: float = 0.0
+    refreshed_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class LeaderboardCache(ILeaderboardProvider):
+    """
+    ランキングをワーカープロセス内に並べて保持し、DBの更新分だけ反映する
+
+    - 初回（と rebuild_interval ごと）に全ユーザーのスコアを読んで作り直す
+    - 以降は refresh_interval ごとに、前回以降に更新された行だけを読んで反映する
+      （updated_at は更新トランザクションの開始時刻のため、overlap 秒さかのぼって読む）
+    - 連続参加ランキングは日付が変わると途切れるユーザーが出るため、日ごとに作り直す
+
+    リクエストごとの全件ソートをなくし、ページ・順位の取得を O(log N) 程度にする。
+    ワーカープロセスごとに持つため、反映までに最大 refresh_interval 秒遅れる。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        timezone: str = 'Asia/Tokyo',
+        refresh_interval: float = 5.0,
+        overlap: float = 60.0,
+        rebuild_interval: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.session_factory = session_factory
+        self.zone = ZoneInfo(timezone)
+        self.refresh_interval = refresh_interval
+        self.overlap = dt.timedelta(seconds=overlap)
+        self.rebuild_interval = rebuild_interval
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._boards: OrderedDict[BoardKey, _BoardState] = OrderedDict()
+
+    def get_ranking(
+        self,
+        ranking_type: RankingType,
+        offset: int,
+        limit: int,
+        user_ids: Sequence[UUID] = (),
+        month: dt.date | None = None,
+    ) -> RankingSnapshot:
+        """ランキングの1ページと指定ユーザーの順位を取得"""
+        key = self._key(ranking_type, month)
+        state = self._state(key)
+        with state.lock:
+            self._refresh(key, state)
+            board = state.board
+            return RankingSnapshot(
+                entries=board.page(offset, limit),
+                total=len(board),
+                ranks={user_id: _entry(board, user_id) for user_id in user_ids},
+            )
+
+    def invalidate(self) -> None:
+        """保持しているランキングを捨てる（次回アクセス時に作り直す）"""
+        with self._lock:
+            self._boards.clear()
+
+    def _key(self, ranking_type: RankingType, month: dt.date | None) -> BoardKey:
+        today = dt.datetime.now(self.zone).date()
+        if ranking_type is RankingType.MONTHLY:
+            return ranking_type, (month or today).replace(day=1)
+        if ranking_type is RankingType.STREAK:
+            return ranking_type, today
+        return ranking_type, None
+
+    def _state(self, key: BoardKey) -> _BoardState:
+        with self._lock:
+            state = self._boards.get(key)
+            if state is None:
+                state = self._boards[key] = _BoardState()
+                self._evict(key)
+            self._boards.move_to_end(key)
+            return state
+
+    def _evict(self, added: BoardKey) -> None:
+        """前日までの連続参加ランキングと、古い月間ランキングを捨てる"""
+        ranking_type, _ = added
+        same_type = [key for key in self._boards if key[0] is ranking_type]
+        keep = MAX_MONTHLY_BOARDS if ranking_type is RankingType.MONTHLY else 1
+        for key in same_type[: max(len(same_type) - keep, 0)]:
+            del self._boards[key]
+
+    def _refresh(self, key: BoardKey, state: _BoardState) -> None:
+        now = self.clock()
+        if state.built_at and now - state.refreshed_at < self.refresh_interval:
+            return
+
+        rebuild = not state.built_at or now - state.built_at >= self.rebuild_interval
+        since = None if rebuild else state.watermark - self.overlap
+        started = time.perf_counter()
+        with self.session_factory() as session:
+            repository = RankingRepositoryImpl(session)
+            watermark = repository.current_time()
+            scores = self._load(repository, key, since)
+
+        if rebuild:
+            state.board = Leaderboard()
+            state.built_at = now
+        state.board.update_many(scores)
+        state.watermark = watermark
+        state.refreshed_at = now
+        logger.debug(
+            'ランキングを%sしました: %s %s rows=%d %.1fms',
+            '作成' if rebuild else '更新',
+            key[0].value,
+            key[1] or '',
+            len(scores),
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def _load(
+        self,
+        repository: RankingRepositoryImpl,
+        key: BoardKey,
+        since: dt.datetime | None,
+    ) -> list[tuple[UUID, int]]:
+        ranking_type, day = key
+        if ranking_type is RankingType.MONTHLY:
+            return repository.list_monthly_scores(day, since)
+        if ranking_type is RankingType.STREAK:
+            return repository.list_streak_scores(day, since)
+        return repository.list_total_scores(since)
+
+
+def _entry(board: Leaderboard, user_id: UUID) -> LeaderboardEntry | None:
+    rank = board.rank_of(user_id)
+    if rank is None:
+        return None
+    return LeaderboardEntry(rank=rank, user_id=user_id, score=board.score_of(user_id))
+
+
+@lru_cache
+def get_leaderboard_cache() -> LeaderboardCache:
+    """ワーカープロセスで共有するランキングキャッシュ（レプリカから読む）"""
+    settings = get_settings()
+    return LeaderboardCache(
+        session_factory=get_replica_session_factory(),
+        timezone=settings.attendance_timezone,
+        refresh_interval=settings.ranking_refresh_seconds,
+        overlap=settings.ranking_refresh_overlap_seconds,
+        rebuild_interval=settings.ranking_rebuild_seconds,
+    )
@@ -0,0 +1,17 @@
+import hmac
+
+from fastapi import Request
+
+
+def bearer_token_matches(request: Request, expected: str) -> bool:
+    """
+    Authorization: Bearer <token> が expected と一致するか（定数時間で比較）
+
+    expected が空の場合は常に一致しない（トークン未設定のエンドポイントは無効にする）。
+    """
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    return (
+        bool(expected)
+        and scheme.lower() == 'bearer'
+        and hmac.compare_digest(token.encode('utf-8'), expected.encode('utf-8'))
+    )
@@ -0,0 +1,19 @@
+from fastapi import HTTPException, Request, status
+
+from app.config import get_settings
+from app.infrastructure.security.bearer_auth import bearer_token_matches
+
+
+def verify_discord_bot(request: Request) -> None:
+    """
+    Discord Bot 専用エンドポイントの認証（🤖 Bot認証）
+
+    Authorization: Bearer <DISCORD_BOT_TOKEN> を定数時間で比較する。
+    DISCORD_BOT_TOKEN が未設定の場合は常に拒否する。
+    """
+    if not bearer_token_matches(request, get_settings().discord_bot_token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail='Bot認証に失敗しました',
+            headers={'WWW-Authenticate': 'Bearer'},
+        )
@@ -0,0 +1,90 @@
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from app.config import get_settings
+
+if TYPE_CHECKING:
+    from jose.backends.base import Key
+
+
+@dataclass(frozen=True)
+class JWTKeyPair:
+    """パース済みのJWT署名鍵・検証鍵"""
+
+    algorithm: str
+    signing_key: 'Key'
+    verifying_key: 'Key'
+
+
+class JWTKeyCache:
+    """
+    RSA鍵のパース結果をプロセス内で共有するキャッシュ
+
+    PEM文字列のパースはリクエストごとに行うと高コストなため、
+    一度だけ cryptography の鍵オブジェクトに変換して署名・検証の両方で使い回す。
+    Settings の鍵が入れ替わった場合は、次回の get() で自動的に再パースする。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._source: tuple[str, str, str] | None = None
+        self._keys: JWTKeyPair | None = None
+
+    def get(self) -> JWTKeyPair:
+        """現在の Settings に対応する鍵ペアを取得"""
+        settings = get_settings()
+        source = (
+            settings.jwt_algorithm,
+            settings.jwt_private_key,
+            settings.jwt_public_key,
+        )
+        keys = self._keys
+        if keys is not None and self._source == source:
+            return keys
+
+        with self._lock:
+            if self._keys is None or self._source != source:
+                self._keys = _parse_key_pair(*source)
+                self._source = source
+            return self._keys
+
+    def reload(self) -> JWTKeyPair:
+        """Settings を読み直して鍵を再パースする（鍵ローテーション用）"""
+        get_settings.cache_clear()
+        with self._lock:
+            self._keys = None
+            self._source = None
+        return self.get()
+
+
+def _parse_key_pair(algorithm: str, private_pem: str, public_pem: str) -> JWTKeyPair:
+    """環境変数のPEM文字列を鍵オブジェクトに変換"""
+    if algorithm != 'RS256':
+        raise ValueError(f'Unsupported JWT algorithm: {algorithm}')
+
+    if not private_pem:
+        raise ValueError('JWT_PRIVATE_KEY is required for RS256.')
+
+    if not public_pem:
+        raise ValueError('JWT_PUBLIC_KEY is required for RS256.')
+
+    # jose・cryptography は最初に鍵を使うときに読み込む（起動時間の短縮）
+    from jose import jwk
+
+    signing_key = jwk.construct(_normalize_pem(private_pem), algorithm)
+    verifying_key = jwk.construct(_normalize_pem(public_pem), algorithm)
+
+    return JWTKeyPair(
+        algorithm=algorithm,
+        signing_key=signing_key,
+        verifying_key=verifying_key,
+    )
+
+
+def _normalize_pem(pem: str) -> bytes:
+    """.env で \\n に変換された改行を元に戻す"""
+    return pem.replace('\\n', '\n').encode('utf-8')
+
+
+jwt_key_cache = JWTKeyCache()
@@ -0,0 +1,20 @@
+from fastapi import HTTPException, Request, status
+
+from app.config import get_settings
+from app.infrastructure.security.bearer_auth import bearer_token_matches
+
+
+def verify_monitoring_token(request: Request) -> None:
+    """
+    監視用エンドポイント（/metrics, /diagnostics/*）の認証
+
+    Authorization: Bearer <MONITORING_TOKEN> を定数時間で比較する
+    （Prometheus はスクレイプ設定の authorization で付けられる）。
+    MONITORING_TOKEN が未設定の場合は常に拒否する。
+    """
+    if not bearer_token_matches(request, get_settings().monitoring_token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail='監視用トークンの認証に失敗しました',
+            headers={'WWW-Authenticate': 'Bearer'},
+        )
@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import multiprocessing
+import secrets
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING
+
+from fastapi import HTTPException, status
+
+from app.config import get_settings
+from app.infrastructure.metrics.registry import metrics_registry
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache
+def get_crypt_context() -> 'CryptContext':
+    """
+    プロセス内で共有する CryptContext
+
+    passlib・bcrypt の読み込みはアプリの起動時間に占める割合が大きいため、
+    最初にパスワードを扱うときに読み込む（ワーカープロセスでも同じ）。
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=['bcrypt'], deprecated='auto')
+
+
+def configure_rounds(rounds: int) -> None:
+    """
+    bcrypt のコストを設定（ワーカープロセスの初期化でも呼ばれる）
+
+    min_rounds も同じ値にすることで、これより低いコストのハッシュは
+    verify_and_update で再ハッシュ対象になる。
+    """
+    get_crypt_context().update(bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    """ワーカープロセスで実行するパスワード検証"""
+    return get_crypt_context().verify(plain_password, hashed_password)
+
+
+def _hash(plain_password: str) -> str:
+    """ワーカープロセスで実行するパスワードハッシュ化"""
+    return get_crypt_context().hash(plain_password)
+
+
+def _verify_and_update(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """ワーカープロセスで実行する検証 + 必要に応じた再ハッシュ"""
+    return get_crypt_context().verify_and_update(plain_password, hashed_password)
+
+
+class PasswordHasher:
+    """
+    bcrypt の計算を専用のプロセスプールで実行する
+
+    bcrypt は1回あたり数十〜数百ミリ秒CPUを使うため、リクエストスレッドで直接実行すると
+    スレッドプールを占有し、他のリクエストの応答が遅れる。
+    プロセス数を固定し、処理待ちが max_pending を超えたら 503 で即座に断る（アドミッション制御）。
+
+    Args:
+        max_workers: ワーカープロセス数（0 の場合はプールを使わず呼び出し元で計算する）
+        max_pending: 実行中 + 待機中の上限
+        retry_after: 混雑時に返す Retry-After（秒）
+        rounds: bcrypt のコスト（省略時は passlib の既定値）
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        retry_after: int = 1,
+        rounds: int | None = None,
+    ):
+        if rounds is not None:
+            configure_rounds(rounds)
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.rejected = 0
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """パスワードを検証（結果が出るまで呼び出し元のスレッドを待たせる）"""
+        if not self.max_workers:
+            return _verify(plain_password, hashed_password)
+        return self._submit(_verify, plain_password, hashed_password).result()
+
+    def hash(self, plain_password: str) -> str:
+        """パスワードをハッシュ化（結果が出るまで呼び出し元のスレッドを待たせる）"""
+        if not self.max_workers:
+            return _hash(plain_password)
+        return self._submit(_hash, plain_password).result()
+
+    def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        パスワードを検証し、ハッシュのコストが設定より低ければ新しいハッシュも返す
+
+        Returns:
+            tuple[bool, str | None]: (一致したか, 再ハッシュ後の値。不要なら None)
+        """
+        if not self.max_workers:
+            return _verify_and_update(plain_password, hashed_password)
+        return self._submit(_verify_and_update, plain_password, hashed_password).result()
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """パスワードを検証（イベントループをブロックしない）"""
+        if not self.max_workers:
+            return await asyncio.to_thread(_verify, plain_password, hashed_password)
+        return await asyncio.wrap_future(
+            self._submit(_verify, plain_password, hashed_password)
+        )
+
+    async def hash_async(self, plain_password: str) -> str:
+        """パスワードをハッシュ化（イベントループをブロックしない）"""
+        if not self.max_workers:
+            return await asyncio.to_thread(_hash, plain_password)
+        return await asyncio.wrap_future(self._submit(_hash, plain_password))
+
+    @cached_property
+    def dummy_hash(self) -> str:
+        """
+        存在しないユーザーのログインで検証に使う、設定どおりのコストのハッシュ
+
+        最初に使うときに呼び出し元で1回だけ計算する（誰のパスワードとも一致しない）。
+        """
+        return _hash(secrets.token_urlsafe(32))
+
+    @property
+    def pending(self) -> int:
+        """実行中 + 待機中の件数"""
+        return self._pending
+
+    def shutdown(self) -> None:
+        """ワーカープロセスを停止"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                logger.debug(
+                    'パスワード処理が混雑しているため拒否しました（待機中: %d）',
+                    self._pending,
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail='混雑しています。しばらくしてから再度お試しください',
+                    headers={'Retry-After': str(self.retry_after)},
+                )
+            if self._executor is None:
+                # スレッドを持つプロセスから fork するとロックの状態が壊れるため spawn を使う
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=configure_rounds if self.rounds else None,
+                    initargs=(self.rounds,) if self.rounds else (),
+                )
+            executor = self._executor
+            self._pending += 1
+
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+    """設定値からプロセス内で共有する PasswordHasher を作成"""
+    settings = get_settings()
+    return PasswordHasher(
+        max_workers=settings.password_hash_workers,
+        max_pending=settings.password_hash_max_pending,
+        retry_after=settings.password_hash_retry_after_seconds,
+        rounds=settings.password_bcrypt_rounds,
+    )
+
+
+metrics_registry.register_gauge(
+    'password_hash_pending',
+    'Password hash/verify jobs running or queued in the worker pool',
+    lambda: {(): get_password_hasher().pending},
+)
+metrics_registry.register_gauge(
+    'password_hash_rejected',
+    'Password hash/verify jobs rejected because the worker pool was full',
+    lambda: {(): get_password_hasher().rejected},
+)
@@ -1,21 +1,20 @@
-from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 
 from fastapi import HTTPException, Request, status
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from pydantic import BaseModel, Field
 
 from app.application.interfaces.security_service import ISecurityService
-from app.config import get_settings
+from app.infrastructure.metrics.timing import timed
+from app.infrastructure.security.jwt_key_cache import jwt_key_cache
+from app.infrastructure.security.password_hasher import get_password_hasher
+from app.infrastructure.security.token_cache import get_verified_token_cache
 
 
-class User(BaseModel):
-    """ユーザースキーマ（認証用）"""
+@dataclass(frozen=True, slots=True)
+class User:
+    """ユーザースキーマ（認証用。検証済みトークンから作る）"""
 
-    id: str = Field(..., description='ユーザーID (UUID)')
-
-
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+    id: str  # ユーザーID (UUID)
 
 
 class SecurityServiceImpl(ISecurityService):
@@ -25,57 +24,57 @@ class SecurityServiceImpl(ISecurityService):
         self, user_id: str, expires_delta: timedelta | None = None
     ) -> str:
         """アクセストークンを生成"""
+        from jose import jwt  # 起動時間の短縮のため最初に使うときに読み込む
+
         if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
+            expire = datetime.now(UTC) + expires_delta
         else:
-            expire = datetime.now(timezone.utc) + timedelta(days=7)
+            expire = datetime.now(UTC) + timedelta(days=7)
 
         to_encode = {'user_id': user_id, 'exp': expire}
-        settings = get_settings()
-        algorithm = settings.jwt_algorithm
-
-        if algorithm == 'RS256':
-            private_key, _ = _load_rsa_keys()
-            encoded_jwt = jwt.encode(to_encode, private_key, algorithm=algorithm)
-        else:
-            raise ValueError(f'Unsupported JWT algorithm: {algorithm}')
+        keys = jwt_key_cache.get()
+        encoded_jwt = jwt.encode(to_encode, keys.signing_key, algorithm=keys.algorithm)
 
         if isinstance(encoded_jwt, bytes):
             return encoded_jwt.decode('utf-8')
         return encoded_jwt
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """パスワードを検証"""
-        return pwd_context.verify(plain_password, hashed_password)
-
-    def hash_password(self, plain_password: str) -> str:
-        """パスワードをハッシュ化"""
-        return pwd_context.hash(plain_password)
-
+        """パスワードを検証（bcrypt はワーカープロセスで計算する）"""
+        return get_password_hasher().verify(plain_password, hashed_password)
 
-def _load_rsa_keys() -> tuple:
-    """RSA鍵ペアを環境変数から読み込み"""
-    settings = get_settings()
+    def verify_and_update_password(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """パスワードを検証し、コストが古いハッシュは再ハッシュする"""
+        return get_password_hasher().verify_and_update(plain_password, hashed_password)
 
-    if settings.jwt_algorithm != 'RS256':
-        return None, None
+    def dummy_password_hash(self) -> str:
+        """ユーザーが存在しない場合の検証に使う、設定どおりのコストのハッシュ"""
+        return get_password_hasher().dummy_hash
 
-    jwt_private_key = settings.jwt_private_key
-    if not jwt_private_key:
-        raise ValueError('JWT_PRIVATE_KEY is required for RS256.')
-
-    jwt_public_key = settings.jwt_public_key
-    if not jwt_public_key:
-        raise ValueError('JWT_PUBLIC_KEY is required for RS256.')
+    def hash_password(self, plain_password: str) -> str:
+        """パスワードをハッシュ化（bcrypt はワーカープロセスで計算する）"""
+        return get_password_hasher().hash(plain_password)
 
-    private_key = jwt_private_key.replace('\\n', '\n').encode('utf-8')
-    public_key = jwt_public_key.replace('\\n', '\n').encode('utf-8')
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """パスワードを検証（イベントループをブロックしない）"""
+        return await get_password_hasher().verify_async(plain_password, hashed_password)
 
-    return private_key, public_key
+    async def hash_password_async(self, plain_password: str) -> str:
+        """パスワードをハッシュ化（イベントループをブロックしない）"""
+        return await get_password_hasher().hash_async(plain_password)
 
 
 def get_current_user_from_cookie(request: Request) -> User:
     """Cookieからアクセストークンを取得してユーザー情報をバリデーション"""
+    with timed('auth'):
+        return _authenticate(request)
+
+
+def _authenticate(request: Request) -> User:
     token = request.cookies.get('access_token')
     if not token:
         raise HTTPException(
@@ -90,15 +89,15 @@ def get_current_user_from_cookie(request: Request) -> User:
         headers={'WWW-Authenticate': 'Bearer'},
     )
 
-    try:
-        settings = get_settings()
-        algorithm = settings.jwt_algorithm
+    from jose import JWTError, jwt  # 起動時間の短縮のため最初に使うときに読み込む
 
-        if algorithm == 'RS256':
-            _, public_key = _load_rsa_keys()
-            payload = jwt.decode(token, public_key, algorithms=[algorithm])
-        else:
-            raise ValueError(f'Unsupported JWT algorithm: {algorithm}')
+    try:
+        keys = jwt_key_cache.get()
+        token_cache = get_verified_token_cache()
+        payload = token_cache.get(token, keys.verifying_key)
+        if payload is None:
+            payload = jwt.decode(token, keys.verifying_key, algorithms=[keys.algorithm])
+            token_cache.put(token, payload, keys.verifying_key)
 
         user_id: str = payload.get('user_id')
         if user_id is None:
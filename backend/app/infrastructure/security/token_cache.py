@@ -0,0 +1,114 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from app.config import get_settings
+
+
+@dataclass(frozen=True)
+class TokenCacheStats:
+    """検証済みトークンキャッシュの統計情報"""
+
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class VerifiedTokenCache:
+    """
+    署名検証済みJWTのペイロードを保持するLRUキャッシュ
+
+    キーはトークン文字列のSHA-256ハッシュで、トークン本体は保持しない。
+    エントリはトークンの exp まで有効で、検証に使った鍵が入れ替わった場合は無効になる。
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, tuple[dict, float, object]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, token: str, verifying_key: object) -> dict | None:
+        """
+        キャッシュ済みのペイロードを取得
+
+        Args:
+            token: アクセストークン
+            verifying_key: 現在の検証鍵（検証時と異なる場合はミス扱い）
+
+        Returns:
+            dict | None: ペイロード（キャッシュにない・期限切れの場合はNone）
+        """
+        if self.maxsize <= 0:
+            return None
+
+        key = _token_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            payload, expires_at, cached_key = entry
+            if expires_at <= time.time() or cached_key is not verifying_key:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return payload
+
+    def put(self, token: str, payload: dict, verifying_key: object) -> None:
+        """
+        検証済みのペイロードを保存
+
+        exp を持たないトークンは有効期限が判断できないためキャッシュしない。
+        """
+        if self.maxsize <= 0:
+            return
+
+        expires_at = payload.get('exp')
+        if not isinstance(expires_at, int | float):
+            return
+
+        key = _token_key(token)
+        with self._lock:
+            self._entries[key] = (payload, float(expires_at), verifying_key)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """全エントリを削除"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> TokenCacheStats:
+        """統計情報を取得"""
+        with self._lock:
+            return TokenCacheStats(
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+
+@lru_cache
+def get_verified_token_cache() -> VerifiedTokenCache:
+    """Settings のサイズで検証済みトークンキャッシュを生成（プロセス内で共有）"""
+    return VerifiedTokenCache(maxsize=get_settings().jwt_token_cache_size)
@@ -1,22 +1,46 @@
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from app.infrastructure.db.session import dispose_engines, init_engines
 from app.infrastructure.logging.logging import setup_logging
-from app.presentation.api.auth_api import router as auth_router
-
-# ロギングの設定を初期化
-setup_logging()
+from app.infrastructure.security.password_hasher import get_password_hasher
+from app.presentation.api.routers import API_TITLE, API_VERSION, load_routers
+from app.presentation.exception_handlers import register_exception_handlers
+from app.presentation.middleware.timing_middleware import TimingMiddleware
 
 # 環境変数から環境を取得（デフォルトはdevelopment）
 ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    ワーカーの起動・終了処理
+
+    ロギングの初期化と DB エンジンの作成はインポート時ではなくここで行う
+    （app.main をインポートするだけのスクリプトでは Settings の読み込みも接続プールの
+    作成もしない）。終了時はパスワードハッシュのワーカープロセスも止める
+    （ログインなどで作られていない場合は、停止のためだけに作らない）。
+    """
+    setup_logging()
+    init_engines()
+    yield
+    await dispose_engines()
+    if get_password_hasher.cache_info().currsize:
+        get_password_hasher().shutdown()
+
+
 # FastAPI アプリケーションのインスタンスを作成
 # 本番環境ではドキュメントを無効化しましょう
 app = FastAPI(
+    title=API_TITLE,
+    version=API_VERSION,
+    lifespan=lifespan,
     docs_url='/docs' if ENVIRONMENT != 'production' else None,
     redoc_url='/redoc' if ENVIRONMENT != 'production' else None,
     openapi_url='/openapi.json' if ENVIRONMENT != 'production' else None,
@@ -46,11 +70,19 @@ app.add_middleware(
     expose_headers=[
         'Content-Disposition',
         'X-Custom-Header',
+        'Server-Timing',
     ],  # 例: クライアントに公開したいヘッダー
 )
 
+# レイテンシ計測（CORSより外側に置き、全リクエストを計測する）
+app.add_middleware(TimingMiddleware)
+
 # API ルーターをアプリケーションに含める
-app.include_router(auth_router)
+for router in load_routers():
+    app.include_router(router)
+
+# トランザクションの競合（リトライ切れ）などを HTTP のエラーに変換する
+register_exception_handlers(app)
 
 # static ディレクトリが存在する場合のみマウント
 static_dir = 'app/static'
@@ -59,6 +91,8 @@ if os.path.exists(static_dir):
 
 # アプリケーションのエントリポイント
 if __name__ == '__main__':
+    import uvicorn
+
     # ファイルアップロード用のフォルダが存在しない場合は作成
     upload_folder = os.getenv('UPLOAD_FOLDER', 'uploads')
     if not os.path.exists(upload_folder):
@@ -0,0 +1,70 @@
+from datetime import UTC, datetime
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.application.schemas.attendance_schemas import (
+    AttendanceEventInputDTO,
+    AttendanceIngestInputDTO,
+)
+from app.application.use_cases.attendance_ingestion_usecase import (
+    AttendanceIngestionUsecase,
+)
+from app.config import get_settings
+from app.di.attendance import get_attendance_ingestion_usecase
+from app.infrastructure.metrics.timing import timed
+from app.infrastructure.security.bot_auth import verify_discord_bot
+from app.presentation.schemas.attendance_schemas import (
+    AttendanceEventBatchRequest,
+    AttendanceIngestData,
+    AttendanceIngestResponse,
+)
+
+router = APIRouter(prefix='/attendance', tags=['参加記録'])
+
+
+@router.post(
+    '/events',
+    response_model=AttendanceIngestResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(verify_discord_bot)],
+)
+def ingest_attendance_events(
+    request: AttendanceEventBatchRequest,
+    usecase: AttendanceIngestionUsecase = Depends(get_attendance_ingestion_usecase),
+) -> AttendanceIngestResponse:
+    """
+    Discord ボイスチャンネルの入退室イベント取り込みエンドポイント（Bot専用）
+
+    Bot はイベントを溜めてまとめて送る。同じバッチを再送しても結果は変わらない。
+    """
+    max_events = get_settings().attendance_ingest_max_events
+    if len(request.events) > max_events:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={'events': f'1回に送れるイベントは{max_events}件までです'},
+        )
+
+    input_dto = AttendanceIngestInputDTO(
+        events=[
+            AttendanceEventInputDTO(
+                discord_user_id=event.discord_user_id,
+                discord_channel_id=event.discord_channel_id,
+                type=event.type,
+                occurred_at=event.occurred_at,
+            )
+            for event in request.events
+        ]
+    )
+    with timed('usecase'):
+        output_dto = usecase.ingest(input_dto)
+
+    return AttendanceIngestResponse(
+        data=AttendanceIngestData(
+            received=output_dto.received,
+            unknown_users=output_dto.unknown_users,
+            logs_written=output_dto.logs_written,
+            summaries_written=output_dto.summaries_written,
+        ),
+        message='success',
+        timestamp=datetime.now(UTC),
+    )
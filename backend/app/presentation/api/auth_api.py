@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, Response, status
 from app.application.schemas.auth_schemas import LoginInputDTO
 from app.application.use_cases.auth_usecase import AuthUsecase
 from app.di.auth import get_auth_usecase
+from app.infrastructure.metrics.timing import timed
 from app.infrastructure.security.security_service_impl import (
     User,  # これは後からuser entityのものに変更する必要あり
     get_current_user_from_cookie,
@@ -25,7 +26,8 @@ def login(
 ) -> LoginResponse:
     input_dto = LoginInputDTO(email=request.email, password=request.password)
 
-    output_dto = auth_usecase.login(input_dto)
+    with timed('usecase'):
+        output_dto = auth_usecase.login(input_dto)
 
     # Cookieにアクセストークンを設定
     response.set_cookie(
@@ -51,7 +53,8 @@ def logout(
     auth_usecase: AuthUsecase = Depends(get_auth_usecase),
 ) -> LogoutResponse:
     """ログアウトエンドポイント"""
-    output_dto = auth_usecase.logout()
+    with timed('usecase'):
+        output_dto = auth_usecase.logout()
 
     # Cookieを削除
     response.delete_cookie(key='access_token')
@@ -65,7 +68,8 @@ def get_me(
     auth_usecase: AuthUsecase = Depends(get_auth_usecase),
 ) -> MeResponse:
     """現在のユーザー情報取得エンドポイント"""
-    output_dto = auth_usecase.get_me(user_id=current_user.id)
+    with timed('usecase'):
+        output_dto = auth_usecase.get_me(user_id=current_user.id)
 
     return MeResponse(
         id=output_dto.id,
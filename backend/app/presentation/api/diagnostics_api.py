@@ -0,0 +1,33 @@
+import os
+
+from fastapi import APIRouter, Depends
+
+from app.infrastructure.db.pool_metrics import pool_statistics
+from app.infrastructure.security.monitoring_auth import verify_monitoring_token
+
+router = APIRouter(
+    prefix='/diagnostics',
+    tags=['監視'],
+    dependencies=[Depends(verify_monitoring_token)],
+)
+
+
+@router.get('/db-pool', include_in_schema=False)
+def get_db_pool_diagnostics() -> dict:
+    """
+    DBコネクションプールの使用状況（MONITORING_TOKEN で保護）
+
+    プールはワーカープロセスごとに作られるため、全ワーカー合計の最大接続数も返す
+    （上限なし（max_overflow=-1）のプールがあれば None）。
+    """
+    workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+    pools = pool_statistics()
+    capacities = [pool['max_connections'] for pool in pools.values()]
+    return {
+        'pid': os.getpid(),
+        'workers': workers,
+        'pools': pools,
+        'max_connections_all_workers': (
+            None if None in capacities else workers * sum(capacities)
+        ),
+    }
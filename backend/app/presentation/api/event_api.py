@@ -0,0 +1,283 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.application.schemas.event_schemas import (
+    EventListInputDTO,
+    EventListOutputDTO,
+    EventParticipationInputDTO,
+    EventParticipationOutputDTO,
+)
+from app.application.use_cases.event_participation_usecase import (
+    EventParticipationUsecase,
+)
+from app.application.use_cases.event_usecase import EventUsecase
+from app.di.event import get_event_participation_usecase, get_event_usecase
+from app.domain.entities.event import (
+    EventParticipantStatus,
+    EventStatus,
+    ParticipationOutcome,
+)
+from app.infrastructure.metrics.timing import timed
+from app.infrastructure.security.security_service_impl import (
+    User,  # これは後からuser entityのものに変更する必要あり
+    get_current_user_from_cookie,
+)
+from app.presentation.schemas.event_schemas import (
+    EventListData,
+    EventListResponse,
+    EventOccurrenceResponse,
+    EventParticipantStatusRequest,
+    EventParticipationData,
+    EventParticipationResponse,
+)
+from app.presentation.schemas.user_schemas import PaginationResponse
+
+router = APIRouter(prefix='/events', tags=['イベント'])
+
+MAX_LIMIT = 100
+# 期間の日時として受け付ける年（既定の期間を足しても日付の範囲を超えないように）
+MIN_YEAR = 1900
+MAX_YEAR = 9000
+
+# 成立しなかった結果のエラー（PUT で現在と同じ状態を指定した場合は除く）
+OUTCOME_ERRORS = {
+    ParticipationOutcome.EVENT_NOT_FOUND: (
+        status.HTTP_404_NOT_FOUND,
+        'イベントが見つかりません',
+    ),
+    ParticipationOutcome.FULL: (status.HTTP_409_CONFLICT, '定員に達しています'),
+    ParticipationOutcome.ALREADY_REGISTERED: (
+        status.HTTP_409_CONFLICT,
+        'すでに参加登録済みです',
+    ),
+    ParticipationOutcome.ALREADY_CANCELLED: (
+        status.HTTP_409_CONFLICT,
+        'すでにキャンセル済みです',
+    ),
+    ParticipationOutcome.NOT_REGISTERED: (
+        status.HTTP_409_CONFLICT,
+        '参加登録されていません',
+    ),
+}
+
+# 参加ステータス更新（PUT）で、指定した状態にすでになっている結果（200 を返す）
+UNCHANGED_OUTCOMES = {
+    ParticipationOutcome.ALREADY_REGISTERED,
+    ParticipationOutcome.ALREADY_CANCELLED,
+}
+
+
+@router.get('', response_model=EventListResponse, status_code=status.HTTP_200_OK)
+def get_events(
+    status_: str | None = Query(
+        None, alias='status', description='開催回の状態 (upcoming, ongoing, past)'
+    ),
+    creator_id: str | None = Query(None, description='作成者のユーザーID (UUID)'),
+    date_from: str | None = Query(
+        None,
+        description='期間の開始（ISO 8601、含む。タイムゾーンなしはイベントの時刻）',
+    ),
+    date_to: str | None = Query(
+        None,
+        description='期間の終了（ISO 8601、含まない。タイムゾーンなしはイベントの時刻）',
+    ),
+    limit: int = Query(20, description=f'取得件数（最大: {MAX_LIMIT}）'),
+    offset: int = Query(0, description='オフセット'),
+    current_user: User = Depends(get_current_user_from_cookie),
+    usecase: EventUsecase = Depends(get_event_usecase),
+) -> EventListResponse:
+    """
+    イベント一覧取得エンドポイント
+
+    定期開催のイベントは期間内の開催回を1回ずつ返し、単発イベントと開始日時順に並べる。
+    期間の指定がない場合は今日から（past は今までの）一定日数分を返す。
+    """
+    errors = {}
+    input_dto = EventListInputDTO(
+        status=_parse_status(status_, errors),
+        creator_id=_parse_uuid(creator_id, 'creator_id', errors),
+        date_from=_parse_datetime(date_from, 'date_from', errors),
+        date_to=_parse_datetime(date_to, 'date_to', errors),
+        limit=limit,
+        offset=offset,
+    )
+    if not 1 <= limit <= MAX_LIMIT:
+        errors['limit'] = f'1から{MAX_LIMIT}の間で指定してください'
+    if offset < 0:
+        errors['offset'] = '0以上で指定してください'
+    if _is_empty_range(input_dto.date_from, input_dto.date_to):
+        errors['date_to'] = 'date_from より後の日時を指定してください'
+    if errors:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=errors)
+
+    with timed('usecase'):
+        output_dto = usecase.list_events(input_dto)
+    return _to_list_response(output_dto)
+
+
+@router.post(
+    '/{event_id}/participants',
+    response_model=EventParticipationResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def join_event(
+    event_id: UUID,
+    current_user: User = Depends(get_current_user_from_cookie),
+    usecase: EventParticipationUsecase = Depends(get_event_participation_usecase),
+) -> EventParticipationResponse:
+    """
+    イベント参加申込エンドポイント
+
+    定員に空きがある場合だけ参加登録する（キャンセル済みなら再登録）。
+    定員超過・登録済みは 409 を返す。
+    """
+    input_dto = EventParticipationInputDTO(
+        event_id=event_id, user_id=UUID(current_user.id)
+    )
+    with timed('usecase'):
+        output_dto = usecase.update_status(input_dto)
+    _raise_for_outcome(output_dto)
+    return _to_response(output_dto)
+
+
+@router.put(
+    '/{event_id}/participants/{user_id}',
+    response_model=EventParticipationResponse,
+    status_code=status.HTTP_200_OK,
+)
+def update_participant_status(
+    event_id: UUID,
+    user_id: UUID,
+    request: EventParticipantStatusRequest,
+    current_user: User = Depends(get_current_user_from_cookie),
+    usecase: EventParticipationUsecase = Depends(get_event_participation_usecase),
+) -> EventParticipationResponse:
+    """
+    参加ステータス更新エンドポイント（本人のみ）
+
+    registered は参加申込と同じく定員を確認する。登録済みのまま registered、
+    キャンセル済みのまま cancelled を指定した場合は変更なしで 200 を返す（冪等）。
+    """
+    if str(user_id) != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='本人の参加ステータスのみ更新できます',
+        )
+
+    input_dto = EventParticipationInputDTO(
+        event_id=event_id,
+        user_id=user_id,
+        status=EventParticipantStatus(request.status),
+    )
+    with timed('usecase'):
+        output_dto = usecase.update_status(input_dto)
+    if output_dto.outcome not in UNCHANGED_OUTCOMES:
+        _raise_for_outcome(output_dto)
+    return _to_response(output_dto)
+
+
+def _raise_for_outcome(output_dto: EventParticipationOutputDTO) -> None:
+    error = OUTCOME_ERRORS.get(output_dto.outcome)
+    if error is not None:
+        status_code, detail = error
+        raise HTTPException(status_code=status_code, detail=detail)
+
+
+def _to_response(output_dto: EventParticipationOutputDTO) -> EventParticipationResponse:
+    return EventParticipationResponse(
+        data=EventParticipationData(
+            event_id=str(output_dto.event_id),
+            user_id=str(output_dto.user_id),
+            status=output_dto.status.value,
+            participant_count=output_dto.participant_count,
+            max_participants=output_dto.max_participants,
+        ),
+        message='success',
+        timestamp=datetime.now(UTC),
+    )
+
+
+def _to_list_response(output_dto: EventListOutputDTO) -> EventListResponse:
+    return EventListResponse(
+        data=EventListData(
+            events=[
+                EventOccurrenceResponse(
+                    id=str(occurrence.event.id),
+                    title=occurrence.event.title,
+                    description=occurrence.event.description,
+                    event_type=occurrence.event.event_type,
+                    creator_id=(
+                        str(occurrence.event.creator_id)
+                        if occurrence.event.creator_id
+                        else None
+                    ),
+                    starts_at=occurrence.starts_at,
+                    ends_at=occurrence.ends_at,
+                    max_participants=occurrence.event.max_participants,
+                    participant_count=occurrence.event.participant_count,
+                    is_recurring=occurrence.event.is_recurring,
+                    recurrence_pattern=occurrence.event.recurrence_pattern,
+                    discord_channel_id=occurrence.event.discord_channel_id,
+                )
+                for occurrence in output_dto.occurrences
+            ],
+            date_from=output_dto.date_from,
+            date_to=output_dto.date_to,
+            pagination=PaginationResponse(
+                total=output_dto.total,
+                limit=output_dto.limit,
+                offset=output_dto.offset,
+                has_more=output_dto.has_more,
+            ),
+        ),
+        message='success',
+        timestamp=datetime.now(UTC),
+    )
+
+
+def _parse_status(value: str | None, errors: dict) -> EventStatus | None:
+    if value is None:
+        return None
+    try:
+        return EventStatus(value)
+    except ValueError:
+        choices = ', '.join(member.value for member in EventStatus)
+        errors['status'] = f'{choices} のいずれかを指定してください'
+        return None
+
+
+def _parse_uuid(value: str | None, field: str, errors: dict) -> UUID | None:
+    if value is None:
+        return None
+    try:
+        return UUID(value)
+    except ValueError:
+        errors[field] = 'UUIDを指定してください'
+        return None
+
+
+def _parse_datetime(value: str | None, field: str, errors: dict) -> datetime | None:
+    """ISO 8601 の日付・日時（日付だけなら0時）"""
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        parsed = None
+    if parsed is None or not MIN_YEAR <= parsed.year <= MAX_YEAR:
+        errors[field] = (
+            f'{MIN_YEAR}年から{MAX_YEAR}年の ISO 8601 の日時を指定してください'
+        )
+        return None
+    return parsed
+
+
+def _is_empty_range(date_from: datetime | None, date_to: datetime | None) -> bool:
+    """date_to が date_from 以前か（タイムゾーンの有無が異なる場合はユースケースに任せる）"""
+    if date_from is None or date_to is None:
+        return False
+    if (date_from.tzinfo is None) != (date_to.tzinfo is None):
+        return False
+    return date_from >= date_to
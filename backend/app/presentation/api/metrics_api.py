@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.infrastructure.metrics.registry import metrics_registry
+from app.infrastructure.security.monitoring_auth import verify_monitoring_token
+
+router = APIRouter(tags=['監視'], dependencies=[Depends(verify_monitoring_token)])
+
+
+@router.get('/metrics', response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics() -> PlainTextResponse:
+    """Prometheus形式のメトリクスエンドポイント（MONITORING_TOKEN で保護）"""
+    return PlainTextResponse(
+        metrics_registry.render(), media_type='text/plain; version=0.0.4'
+    )
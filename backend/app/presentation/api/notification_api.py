@@ -0,0 +1,215 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.application.schemas.notification_schemas import (
+    NotificationListInputDTO,
+    NotificationListOutputDTO,
+    NotificationReadInputDTO,
+)
+from app.application.use_cases.notification_usecase import NotificationUsecase
+from app.di.notification import get_notification_usecase
+from app.domain.entities.notification import Notification, NotificationType
+from app.infrastructure.metrics.timing import timed
+from app.infrastructure.security.security_service_impl import (
+    User,  # これは後からuser entityのものに変更する必要あり
+    get_current_user_from_cookie,
+)
+from app.presentation.schemas.notification_schemas import (
+    NotificationListData,
+    NotificationListResponse,
+    NotificationReadData,
+    NotificationReadRequest,
+    NotificationReadResponse,
+    NotificationResponse,
+    UnreadCountData,
+    UnreadCountResponse,
+)
+from app.presentation.schemas.user_schemas import PaginationResponse
+
+router = APIRouter(tags=['通知'])
+
+MAX_LIMIT = 100
+
+
+@router.get(
+    '/users/{user_id}/notifications',
+    response_model=NotificationListResponse,
+    status_code=status.HTTP_200_OK,
+)
+def get_notifications(
+    user_id: UUID,
+    type_: str | None = Query(
+        None,
+        alias='type',
+        description='通知タイプ (achievement, reminder, rival_update, event)',
+    ),
+    read: bool | None = Query(None, description='既読状態 (true, false)'),
+    limit: int = Query(20, description=f'取得件数（最大: {MAX_LIMIT}）'),
+    offset: int = Query(0, description='オフセット'),
+    current_user: User = Depends(get_current_user_from_cookie),
+    usecase: NotificationUsecase = Depends(get_notification_usecase),
+) -> NotificationListResponse:
+    """
+    通知一覧取得エンドポイント（本人のみ）
+
+    未読数は通知を数えずに保持している値を返す（read=false の総数も同じ値）。
+    """
+    _ensure_self(user_id, current_user)
+    errors = {}
+    notification_type = _parse_type(type_, errors)
+    if not 1 <= limit <= MAX_LIMIT:
+        errors['limit'] = f'1から{MAX_LIMIT}の間で指定してください'
+    if offset < 0:
+        errors['offset'] = '0以上で指定してください'
+    if errors:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=errors)
+
+    input_dto = NotificationListInputDTO(
+        user_id=user_id,
+        type=notification_type,
+        is_read=read,
+        limit=limit,
+        offset=offset,
+    )
+    with timed('usecase'):
+        output_dto = usecase.list_notifications(input_dto)
+    return _to_list_response(output_dto)
+
+
+@router.get(
+    '/users/{user_id}/notifications/unread-count',
+    response_model=UnreadCountResponse,
+    status_code=status.HTTP_200_OK,
+)
+def get_unread_count(
+    user_id: UUID,
+    current_user: User = Depends(get_current_user_from_cookie),
+    usecase: NotificationUsecase = Depends(get_notification_usecase),
+) -> UnreadCountResponse:
+    """未読数取得エンドポイント（本人のみ。ヘッダーの未読バッジ用）"""
+    _ensure_self(user_id, current_user)
+    with timed('usecase'):
+        unread_count = usecase.get_unread_count(user_id)
+    return _to_unread_count_response(unread_count)
+
+
+@router.put(
+    '/notifications/{notification_id}',
+    response_model=NotificationReadResponse,
+    status_code=status.HTTP_200_OK,
+)
+def update_notification(
+    notification_id: UUID,
+    request: NotificationReadRequest,
+    current_user: User = Depends(get_current_user_from_cookie),
+    usecase: NotificationUsecase = Depends(get_notification_usecase),
+) -> NotificationReadResponse:
+    """
+    既読ステータス更新エンドポイント（本人の通知のみ）
+
+    現在と同じ状態を指定した場合は変更なしで 200 を返す。
+    """
+    input_dto = NotificationReadInputDTO(
+        notification_id=notification_id,
+        user_id=UUID(current_user.id),
+        is_read=request.is_read,
+    )
+    with timed('usecase'):
+        output_dto = usecase.update_read(input_dto)
+    if output_dto is None:
+        _raise_not_found()
+    return NotificationReadResponse(
+        data=NotificationReadData(
+            notification=_to_notification_response(output_dto.notification),
+            unread_count=output_dto.unread_count,
+        ),
+        message='success',
+        timestamp=datetime.now(UTC),
+    )
+
+
+@router.delete(
+    '/notifications/{notification_id}',
+    response_model=UnreadCountResponse,
+    status_code=status.HTTP_200_OK,
+)
+def delete_notification(
+    notification_id: UUID,
+    current_user: User = Depends(get_current_user_from_cookie),
+    usecase: NotificationUsecase = Depends(get_notification_usecase),
+) -> UnreadCountResponse:
+    """通知削除エンドポイント（本人の通知のみ。削除後の未読数を返す）"""
+    with timed('usecase'):
+        unread_count = usecase.delete_notification(notification_id, UUID(current_user.id))
+    if unread_count is None:
+        _raise_not_found()
+    return _to_unread_count_response(unread_count)
+
+
+def _ensure_self(user_id: UUID, current_user: User) -> None:
+    if str(user_id) != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='本人の通知のみ取得できます',
+        )
+
+
+def _raise_not_found() -> None:
+    # ほかのユーザーの通知も、存在を知らせないよう見つからない扱いにする
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail='通知が見つかりません'
+    )
+
+
+def _parse_type(value: str | None, errors: dict) -> NotificationType | None:
+    if value is None:
+        return None
+    try:
+        return NotificationType(value)
+    except ValueError:
+        choices = ', '.join(member.value for member in NotificationType)
+        errors['type'] = f'{choices} のいずれかを指定してください'
+        return None
+
+
+def _to_notification_response(notification: Notification) -> NotificationResponse:
+    return NotificationResponse(
+        id=str(notification.id),
+        type=notification.type.value,
+        title=notification.title,
+        message=notification.message,
+        data=notification.data,
+        is_read=notification.is_read,
+        sent_at=notification.sent_at,
+        created_at=notification.created_at,
+    )
+
+
+def _to_list_response(output_dto: NotificationListOutputDTO) -> NotificationListResponse:
+    return NotificationListResponse(
+        data=NotificationListData(
+            notifications=[
+                _to_notification_response(notification)
+                for notification in output_dto.notifications
+            ],
+            unread_count=output_dto.unread_count,
+            pagination=PaginationResponse(
+                total=output_dto.total,
+                limit=output_dto.limit,
+                offset=output_dto.offset,
+                has_more=output_dto.has_more,
+            ),
+        ),
+        message='success',
+        timestamp=datetime.now(UTC),
+    )
+
+
+def _to_unread_count_response(unread_count: int) -> UnreadCountResponse:
+    return UnreadCountResponse(
+        data=UnreadCountData(unread_count=unread_count),
+        message='success',
+        timestamp=datetime.now(UTC),
+    )
@@ -0,0 +1,201 @@
+from datetime import UTC, date, datetime
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+
+from app.application.interfaces.response_cache import CacheNamespace, IResponseCache
+from app.application.schemas.ranking_schemas import (
+    RankingInputDTO,
+    RankingItemDTO,
+    RankingOutputDTO,
+)
+from app.application.use_cases.ranking_usecase import RankingUsecase
+from app.config import get_settings
+from app.di.ranking import get_ranking_usecase
+from app.domain.entities.ranking import RankingType
+from app.infrastructure.cache.response_cache import get_response_cache
+from app.infrastructure.metrics.timing import timed
+from app.infrastructure.security.security_service_impl import (
+    User,  # これは後からuser entityのものに変更する必要あり
+    get_current_user_from_cookie,
+)
+from app.presentation.http_cache import cached_json_response
+from app.presentation.schemas.ranking_schemas import (
+    RankingData,
+    RankingItemResponse,
+    RankingResponse,
+)
+from app.presentation.schemas.user_schemas import PaginationResponse
+from app.presentation.serializers.ranking_serializer import serialize_ranking
+
+router = APIRouter(prefix='/ranking', tags=['ランキング'])
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 100
+
+
+@router.get('/monthly', response_model=RankingResponse, status_code=status.HTTP_200_OK)
+def get_monthly_ranking(
+    request: Request,
+    month: int | None = Query(None, description='月（1-12, デフォルト: 現在月）'),
+    limit: int = Query(DEFAULT_LIMIT, description=f'取得件数（最大: {MAX_LIMIT}）'),
+    offset: int = Query(0, description='オフセット'),
+    current_user: User = Depends(get_current_user_from_cookie),
+    ranking_usecase: RankingUsecase = Depends(get_ranking_usecase),
+    response_cache: IResponseCache = Depends(get_response_cache),
+) -> Response:
+    """月間参加日数ランキング取得エンドポイント（ライバルの順位を含む）"""
+    if month is not None and not 1 <= month <= 12:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={'month': '1から12の整数で指定してください'},
+        )
+    return _get_ranking(
+        request,
+        RankingType.MONTHLY,
+        limit,
+        offset,
+        current_user,
+        ranking_usecase,
+        response_cache,
+        month=_resolve_month(month),
+    )
+
+
+@router.get('/total', response_model=RankingResponse, status_code=status.HTTP_200_OK)
+def get_total_ranking(
+    request: Request,
+    limit: int = Query(DEFAULT_LIMIT, description=f'取得件数（最大: {MAX_LIMIT}）'),
+    offset: int = Query(0, description='オフセット'),
+    current_user: User = Depends(get_current_user_from_cookie),
+    ranking_usecase: RankingUsecase = Depends(get_ranking_usecase),
+    response_cache: IResponseCache = Depends(get_response_cache),
+) -> Response:
+    """総合参加日数ランキング取得エンドポイント"""
+    return _get_ranking(
+        request,
+        RankingType.TOTAL,
+        limit,
+        offset,
+        current_user,
+        ranking_usecase,
+        response_cache,
+    )
+
+
+@router.get('/streak', response_model=RankingResponse, status_code=status.HTTP_200_OK)
+def get_streak_ranking(
+    request: Request,
+    limit: int = Query(DEFAULT_LIMIT, description=f'取得件数（最大: {MAX_LIMIT}）'),
+    offset: int = Query(0, description='オフセット'),
+    current_user: User = Depends(get_current_user_from_cookie),
+    ranking_usecase: RankingUsecase = Depends(get_ranking_usecase),
+    response_cache: IResponseCache = Depends(get_response_cache),
+) -> Response:
+    """連続参加日数ランキング取得エンドポイント（現在の連続記録で順位付け）"""
+    return _get_ranking(
+        request,
+        RankingType.STREAK,
+        limit,
+        offset,
+        current_user,
+        ranking_usecase,
+        response_cache,
+    )
+
+
+def _get_ranking(
+    request: Request,
+    ranking_type: RankingType,
+    limit: int,
+    offset: int,
+    current_user: User,
+    ranking_usecase: RankingUsecase,
+    response_cache: IResponseCache,
+    month: date | None = None,
+) -> Response:
+    """
+    ランキングを取得（本人・ライバルの順位を含むため、キャッシュはユーザーごと）
+
+    ランキング自体が ranking_refresh_seconds ごとの更新のため、それより長くはキャッシュしない。
+    月間ランキングは月の指定を解決した後の月をキーに含める（月が変わればキーも変わる）。
+    """
+    _validate_pagination(limit, offset)
+    input_dto = RankingInputDTO(
+        ranking_type=ranking_type,
+        user_id=UUID(current_user.id),
+        month=month,
+        limit=limit,
+        offset=offset,
+    )
+
+    settings = get_settings()
+
+    def build() -> RankingResponse | dict:
+        with timed('usecase'):
+            output_dto = ranking_usecase.get_ranking(input_dto)
+
+        timestamp = datetime.now(UTC)
+        if settings.fast_json_responses:
+            return serialize_ranking(output_dto, timestamp)
+        return RankingResponse(
+            data=_to_data(output_dto),
+            message='success',
+            timestamp=timestamp,
+        )
+
+    return cached_json_response(
+        request,
+        response_cache,
+        [CacheNamespace.RANKING],
+        build,
+        vary=f'{current_user.id}|{month or ""}',
+        ttl=min(settings.response_cache_ttl_seconds, settings.ranking_refresh_seconds),
+    )
+
+
+def _to_data(output_dto: RankingOutputDTO) -> RankingData:
+    return RankingData(
+        type=output_dto.ranking_type.value,
+        year=output_dto.month.year if output_dto.month else None,
+        month=output_dto.month.month if output_dto.month else None,
+        rankings=[_to_item(item) for item in output_dto.rankings],
+        me=_to_item(output_dto.me) if output_dto.me else None,
+        rivals=[_to_item(item) for item in output_dto.rivals],
+        pagination=PaginationResponse(
+            total=output_dto.total,
+            limit=output_dto.limit,
+            offset=output_dto.offset,
+            has_more=output_dto.has_more,
+        ),
+    )
+
+
+def _to_item(item: RankingItemDTO) -> RankingItemResponse:
+    return RankingItemResponse(
+        rank=item.rank,
+        user_id=str(item.user_id),
+        username=item.username,
+        avatar_url=item.avatar_url,
+        score=item.score,
+    )
+
+
+def _resolve_month(month: int | None) -> date:
+    """月（1-12）を直近のその月の1日にする（未来の月は前年とみなす）"""
+    today = datetime.now(ZoneInfo(get_settings().attendance_timezone)).date()
+    if month is None:
+        return today.replace(day=1)
+    year = today.year if month <= today.month else today.year - 1
+    return date(year, month, 1)
+
+
+def _validate_pagination(limit: int, offset: int) -> None:
+    errors = {}
+    if not 1 <= limit <= MAX_LIMIT:
+        errors['limit'] = f'1から{MAX_LIMIT}の間で指定してください'
+    if offset < 0:
+        errors['offset'] = '0以上で指定してください'
+    if errors:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=errors)
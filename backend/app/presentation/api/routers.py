@@ -0,0 +1,32 @@
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fastapi import APIRouter
+
+# OpenAPI の info（main.py の FastAPI と scripts/export_swagger.py で共有する）
+API_TITLE = 'FastAPI'
+API_VERSION = '0.1.0'
+
+# アプリに含める API ルーターのモジュール（include_router する順序）
+# main.py はすべてを読み込み、scripts/export_swagger.py は変更のあったものだけを読み込む
+ROUTER_MODULES = (
+    'app.presentation.api.auth_api',
+    'app.presentation.api.user_api',
+    'app.presentation.api.attendance_api',
+    'app.presentation.api.ranking_api',
+    'app.presentation.api.event_api',
+    'app.presentation.api.notification_api',
+    'app.presentation.api.metrics_api',
+    'app.presentation.api.diagnostics_api',
+)
+
+
+def load_router(module_name: str) -> 'APIRouter':
+    """モジュールを読み込み、モジュールの router を返す"""
+    return importlib.import_module(module_name).router
+
+
+def load_routers() -> list['APIRouter']:
+    """ROUTER_MODULES の順にすべてのルーターを読み込む"""
+    return [load_router(module_name) for module_name in ROUTER_MODULES]
@@ -0,0 +1,158 @@
+from datetime import UTC, datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+
+from app.application.interfaces.response_cache import CacheNamespace, IResponseCache
+from app.application.schemas.user_schemas import UserListInputDTO, UserListOutputDTO
+from app.application.use_cases.user_usecase import UserUsecase
+from app.config import get_settings
+from app.di.user import get_user_usecase
+from app.infrastructure.cache.response_cache import get_response_cache
+from app.infrastructure.metrics.timing import timed
+from app.infrastructure.security.security_service_impl import (
+    User,  # これは後からuser entityのものに変更する必要あり
+    get_current_user_from_cookie,
+)
+from app.presentation.http_cache import cached_json_response
+from app.presentation.schemas.user_schemas import (
+    CursorPaginationResponse,
+    SocialLinkResponse,
+    UserListData,
+    UserListItemResponse,
+    UserListResponse,
+)
+from app.presentation.serializers.user_serializer import serialize_user_list
+
+router = APIRouter(prefix='/users', tags=['ユーザー'])
+
+MAX_LIMIT = 100
+MIN_TITLE_LEVEL = 1
+MAX_TITLE_LEVEL = 8
+
+
+@router.get('', response_model=UserListResponse, status_code=status.HTTP_200_OK)
+def get_users(
+    request: Request,
+    search: str | None = Query(
+        None, description='キーワード検索（displayName, tagline）'
+    ),
+    skills: str | None = Query(None, description='スキル（カンマ区切り、OR検索）'),
+    interests: str | None = Query(None, description='興味・関心（カンマ区切り、OR検索）'),
+    title_levels: str | None = Query(None, description='称号レベル（カンマ区切り、1-8）'),
+    limit: int = Query(20, description=f'取得件数（最大: {MAX_LIMIT}）'),
+    cursor: str | None = Query(None, description='前ページの nextCursor'),
+    include_total: bool = Query(
+        False, description='総件数を返すか（最大 10000 件まで数える）'
+    ),
+    current_user: User = Depends(get_current_user_from_cookie),
+    user_usecase: UserUsecase = Depends(get_user_usecase),
+    response_cache: IResponseCache = Depends(get_response_cache),
+) -> Response:
+    """
+    メンバー一覧取得エンドポイント
+
+    登録日時の新しい順。次のページは pagination.nextCursor を cursor に指定して取得する。
+    閲覧者によらず同じ内容のため、全員で同じキャッシュを使う（ETag による 304 に対応）。
+    """
+    _validate_limit(limit)
+    input_dto = UserListInputDTO(
+        search=search.strip() if search and search.strip() else None,
+        skills=_split_csv(skills),
+        interests=_split_csv(interests),
+        title_levels=_parse_title_levels(title_levels),
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+    def build() -> UserListResponse | dict:
+        try:
+            with timed('usecase'):
+                output_dto = user_usecase.list_users(input_dto)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail={'cursor': str(e)}
+            ) from e
+
+        timestamp = datetime.now(UTC)
+        if get_settings().fast_json_responses:
+            return serialize_user_list(output_dto, timestamp)
+        return _to_response(output_dto, timestamp)
+
+    return cached_json_response(request, response_cache, [CacheNamespace.USERS], build)
+
+
+def _to_response(output_dto: UserListOutputDTO, timestamp: datetime) -> UserListResponse:
+    return UserListResponse(
+        data=UserListData(
+            users=[
+                UserListItemResponse(
+                    id=str(user.id),
+                    username=user.username,
+                    avatar_url=user.avatar_url,
+                    display_name=user.display_name,
+                    tagline=user.tagline,
+                    bio=user.bio,
+                    skills=user.skills,
+                    interests=user.interests,
+                    vision=user.vision,
+                    is_vision_public=user.is_vision_public,
+                    social_links=[
+                        SocialLinkResponse(
+                            id=str(link.id),
+                            platform=link.platform,
+                            url=link.url,
+                            title=link.title,
+                        )
+                        for link in user.social_links
+                    ],
+                    total_attendance_days=user.total_attendance_days,
+                    current_streak_days=user.current_streak_days,
+                    max_streak_days=user.max_streak_days,
+                    current_title_level=user.current_title_level,
+                    joined_at=user.joined_at,
+                )
+                for user in output_dto.users
+            ],
+            pagination=CursorPaginationResponse(
+                limit=output_dto.limit,
+                next_cursor=output_dto.next_cursor,
+                has_more=output_dto.has_more,
+                total=output_dto.total,
+                total_capped=output_dto.total_capped,
+            ),
+        ),
+        message='success',
+        timestamp=timestamp,
+    )
+
+
+def _split_csv(value: str | None) -> list[str]:
+    """カンマ区切りの文字列をリストに変換（空要素は除く）"""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def _parse_title_levels(value: str | None) -> list[int]:
+    levels = _split_csv(value)
+    try:
+        parsed = [int(level) for level in levels]
+    except ValueError:
+        parsed = None
+    if parsed is None or any(
+        not MIN_TITLE_LEVEL <= level <= MAX_TITLE_LEVEL for level in parsed
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={'title_levels': '1から8の整数で指定してください'},
+        )
+    return parsed
+
+
+def _validate_limit(limit: int) -> None:
+    if not 1 <= limit <= MAX_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={'limit': f'1から{MAX_LIMIT}の間で指定してください'},
+        )
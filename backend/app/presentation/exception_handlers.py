@@ -0,0 +1,27 @@
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from app.application.interfaces.unit_of_work import TransactionConflictError
+
+# 競合でトランザクションを完了できなかった場合に、再試行まで待ってほしい秒数
+TRANSACTION_CONFLICT_RETRY_AFTER = 1
+
+
+async def transaction_conflict_handler(
+    request: Request, exc: TransactionConflictError
+) -> JSONResponse:
+    """
+    デッドロック・ロック競合のリトライを使い切った場合は 503 を返す
+
+    リクエスト自体は正しく、時間をおけば成功しうるため Retry-After を付ける。
+    """
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={'detail': '混み合っているため処理できませんでした。再度お試しください'},
+        headers={'Retry-After': str(TRANSACTION_CONFLICT_RETRY_AFTER)},
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """アプリ全体の例外ハンドラーを登録する"""
+    app.add_exception_handler(TransactionConflictError, transaction_conflict_handler)
@@ -0,0 +1,113 @@
+import hashlib
+from collections.abc import Callable, Sequence
+from urllib.parse import urlencode
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from app.application.interfaces.response_cache import (
+    CachedResponse,
+    CacheNamespace,
+    IResponseCache,
+)
+from app.config import get_settings
+from app.infrastructure.metrics.timing import timed
+from app.presentation.serializers.json import dumps
+
+# 認証付きのレスポンスのため共有キャッシュには置かせず、毎回 ETag で再検証させる
+CACHE_CONTROL = 'private, no-cache'
+
+
+def cached_json_response(
+    request: Request,
+    response_cache: IResponseCache,
+    namespaces: Sequence[CacheNamespace],
+    build: Callable[[], BaseModel | dict],
+    vary: str = '',
+    ttl: float | None = None,
+) -> Response:
+    """
+    レスポンスをキャッシュから返す（なければ build() で作ってキャッシュする）
+
+    キーはパス・クエリ文字列（順序は問わない）・vary・ネームスペースの世代番号から作る。
+    If-None-Match が ETag と一致すれば本文なしの 304 を返す。キャッシュにあれば
+    ユースケースを呼ばないため、DB には接続しない。
+
+    Args:
+        request: リクエスト
+        response_cache: レスポンスキャッシュ
+        namespaces: レスポンスが依存するデータのネームスペース（無効化の単位）
+        build: レスポンスを作る関数（レスポンスモデル、もしくは serializers で作った辞書）
+        vary: 閲覧者によって内容が変わる場合の閲覧者の区別（本人の順位を含む場合の
+            ユーザーIDなど）。全員に同じ内容を返す場合は空文字
+        ttl: キャッシュする秒数（省略時は response_cache_ttl_seconds）
+    """
+    with timed('cache'):
+        generations = response_cache.generations(namespaces)
+        key = None
+        cached = None
+        if generations is not None:
+            key = _cache_key(request, namespaces, generations, vary)
+            cached = response_cache.get(key)
+
+    if cached is None:
+        cached = _render(build())
+        if key is not None:
+            response_cache.set(
+                key,
+                cached,
+                get_settings().response_cache_ttl_seconds if ttl is None else ttl,
+            )
+
+    headers = {'ETag': cached.etag, 'Cache-Control': CACHE_CONTROL, 'Vary': 'Cookie'}
+    if _etag_matches(request.headers.get('if-none-match'), cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type='application/json', headers=headers)
+
+
+def _cache_key(
+    request: Request,
+    namespaces: Sequence[CacheNamespace],
+    generations: tuple[int, ...],
+    vary: str,
+) -> str:
+    # デコード済みの値をエスケープし直して連結する（そのまま連結すると
+    # ?search=a%26skills%3Db と ?search=a&skills=b が同じキーになる）
+    query = urlencode(sorted(request.query_params.multi_items()))
+    digest = hashlib.sha256(f'{request.url.path}?{query}|{vary}'.encode()).hexdigest()
+    versions = ','.join(
+        f'{namespace.value}.{generation}'
+        for namespace, generation in zip(namespaces, generations, strict=True)
+    )
+    return f'{versions}:{digest}'
+
+
+def _render(content: BaseModel | dict) -> CachedResponse:
+    """
+    本文と、内容のハッシュから作る強いETag
+
+    ETag にはレスポンスの生成日時（timestamp）を含めない。無効化で作り直しても内容が
+    同じなら ETag は変わらず、クライアントは手元の本文をそのまま使える（304）。
+    """
+    if isinstance(content, BaseModel):
+        body = content.model_dump_json(by_alias=True).encode('utf-8')
+        versioned = content.model_dump_json(by_alias=True, exclude={'timestamp'})
+        versioned = versioned.encode('utf-8')
+    else:
+        body = dumps(content)
+        versioned = dumps({k: v for k, v in content.items() if k != 'timestamp'})
+    return CachedResponse(
+        body=body, etag=f'"{hashlib.sha256(versioned).hexdigest()[:32]}"'
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match の照合（RFC 9110 に従い弱い比較で行う）"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(
+        candidate.strip().removeprefix('W/') == etag
+        for candidate in if_none_match.split(',')
+    )
@@ -0,0 +1,56 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.metrics.registry import metrics_registry
+from app.infrastructure.metrics.timing import RequestTimings, request_timings
+
+REQUEST_METRIC = 'http_request_duration_seconds'
+REQUEST_HELP = 'HTTP request latency by method, route template and status code'
+
+
+class TimingMiddleware:
+    """
+    リクエストのレイテンシを計測するASGIミドルウェア
+
+    - ルートテンプレート（例: /users/{user_id}）・ステータスコード別のヒストグラムに記録
+    - timed() で計測したフェーズと合わせて Server-Timing ヘッダーを付与
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    'Server-Timing', timings.server_timing(time.perf_counter() - started)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            elapsed = time.perf_counter() - started
+            route = scope.get('route')
+            metrics_registry.histogram(
+                REQUEST_METRIC,
+                REQUEST_HELP,
+                method=scope['method'],
+                route=getattr(route, 'path', '<unmatched>'),
+                status=str(status_code),
+            ).observe(elapsed)
+            request_timings.reset(token)
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import AwareDatetime, Field
+
+from app.presentation.schemas.base import CamelModel
+
+
+class AttendanceEventRequest(CamelModel):
+    """Discord ボイスチャンネルの入退室イベント"""
+
+    discord_user_id: str = Field(..., min_length=1, description='Discord User ID')
+    discord_channel_id: str = Field(..., min_length=1, description='DiscordチャンネルID')
+    type: Literal['join', 'leave'] = Field(..., description='入室 / 退室')
+    occurred_at: AwareDatetime = Field(..., description='発生日時（タイムゾーン付き）')
+
+
+class AttendanceEventBatchRequest(CamelModel):
+    """入退室イベントのバッチ"""
+
+    events: list[AttendanceEventRequest] = Field(..., description='入退室イベント')
+
+
+class AttendanceIngestData(CamelModel):
+    """取り込み結果"""
+
+    received: int = Field(..., description='受け取ったイベント数')
+    unknown_users: int = Field(
+        ..., description='未連携のDiscordユーザーのため無視したイベント数'
+    )
+    logs_written: int = Field(..., description='作成・更新した参加ログ数')
+    summaries_written: int = Field(..., description='作成・更新した日次サマリー数')
+
+
+class AttendanceIngestResponse(CamelModel):
+    """入退室イベント取り込みレスポンス"""
+
+    data: AttendanceIngestData = Field(..., description='レスポンスデータ')
+    message: str = Field(..., description='メッセージ')
+    timestamp: datetime = Field(..., description='レスポンス生成日時')
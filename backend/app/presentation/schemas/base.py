@@ -0,0 +1,8 @@
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+
+class CamelModel(BaseModel):
+    """フィールド名を camelCase で入出力するスキーマの基底クラス"""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
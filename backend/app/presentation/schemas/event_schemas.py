@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from app.presentation.schemas.base import CamelModel
+from app.presentation.schemas.user_schemas import PaginationResponse
+
+
+class EventParticipantStatusRequest(CamelModel):
+    """参加ステータス更新リクエスト"""
+
+    status: Literal['registered', 'cancelled'] = Field(
+        ..., description='参加状態 (registered: 参加, cancelled: キャンセル)'
+    )
+
+
+class EventParticipationData(CamelModel):
+    """参加登録・参加ステータス更新の結果"""
+
+    event_id: str = Field(..., description='イベントID (UUID)')
+    user_id: str = Field(..., description='参加者のユーザーID (UUID)')
+    status: Literal['registered', 'cancelled'] = Field(..., description='参加状態')
+    participant_count: int = Field(..., description='参加者数')
+    max_participants: int | None = Field(None, description='最大参加者数（nullは無制限）')
+
+
+class EventParticipationResponse(CamelModel):
+    """参加登録・参加ステータス更新レスポンス"""
+
+    data: EventParticipationData = Field(..., description='レスポンスデータ')
+    message: str = Field(..., description='メッセージ')
+    timestamp: datetime = Field(..., description='レスポンス生成日時')
+
+
+class EventOccurrenceResponse(CamelModel):
+    """イベントの開催回（定期開催は1回ごと）"""
+
+    id: str = Field(..., description='イベントID (UUID)')
+    title: str = Field(..., description='イベント名')
+    description: str | None = Field(None, description='イベント詳細')
+    event_type: str = Field(..., description='イベントタイプ')
+    creator_id: str | None = Field(None, description='作成者のユーザーID (UUID)')
+    starts_at: datetime = Field(
+        ..., description='開始日時（イベントのタイムゾーンのオフセット付き）'
+    )
+    ends_at: datetime = Field(..., description='終了日時')
+    max_participants: int | None = Field(None, description='最大参加者数（nullは無制限）')
+    participant_count: int = Field(..., description='参加者数')
+    is_recurring: bool = Field(..., description='定期開催かどうか')
+    recurrence_pattern: str | None = Field(None, description='繰り返しパターン')
+    discord_channel_id: str | None = Field(None, description='DiscordチャンネルID')
+
+
+class EventListData(CamelModel):
+    """イベント一覧"""
+
+    events: list[EventOccurrenceResponse] = Field(..., description='開始日時順の開催回')
+    date_from: datetime = Field(..., description='対象期間の開始（含む）')
+    date_to: datetime = Field(..., description='対象期間の終了（含まない）')
+    pagination: PaginationResponse = Field(..., description='ページネーション情報')
+
+
+class EventListResponse(CamelModel):
+    """イベント一覧レスポンス"""
+
+    data: EventListData = Field(..., description='レスポンスデータ')
+    message: str = Field(..., description='メッセージ')
+    timestamp: datetime = Field(..., description='レスポンス生成日時')
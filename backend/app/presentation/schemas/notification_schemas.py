@@ -0,0 +1,72 @@
+from datetime import datetime
+
+from pydantic import Field
+
+from app.presentation.schemas.base import CamelModel
+from app.presentation.schemas.user_schemas import PaginationResponse
+
+
+class NotificationReadRequest(CamelModel):
+    """既読ステータス更新リクエスト"""
+
+    is_read: bool = Field(..., description='既読状態')
+
+
+class NotificationResponse(CamelModel):
+    """通知"""
+
+    id: str = Field(..., description='通知ID (UUID)')
+    type: str = Field(
+        ..., description='通知タイプ (achievement, reminder, rival_update, event)'
+    )
+    title: str = Field(..., description='通知タイトル')
+    message: str = Field(..., description='通知メッセージ')
+    data: dict | None = Field(None, description='関連データ')
+    is_read: bool = Field(..., description='既読状態')
+    sent_at: datetime = Field(..., description='送信日時')
+    created_at: datetime = Field(..., description='作成日時')
+
+
+class NotificationListData(CamelModel):
+    """通知一覧"""
+
+    notifications: list[NotificationResponse] = Field(..., description='新しい順の通知')
+    unread_count: int = Field(..., description='未読数')
+    pagination: PaginationResponse = Field(..., description='ページネーション情報')
+
+
+class NotificationListResponse(CamelModel):
+    """通知一覧取得レスポンス"""
+
+    data: NotificationListData = Field(..., description='レスポンスデータ')
+    message: str = Field(..., description='メッセージ')
+    timestamp: datetime = Field(..., description='レスポンス生成日時')
+
+
+class UnreadCountData(CamelModel):
+    """未読数"""
+
+    unread_count: int = Field(..., description='未読数')
+
+
+class UnreadCountResponse(CamelModel):
+    """未読数取得・通知削除レスポンス"""
+
+    data: UnreadCountData = Field(..., description='レスポンスデータ')
+    message: str = Field(..., description='メッセージ')
+    timestamp: datetime = Field(..., description='レスポンス生成日時')
+
+
+class NotificationReadData(CamelModel):
+    """既読ステータス更新の結果"""
+
+    notification: NotificationResponse = Field(..., description='更新後の通知')
+    unread_count: int = Field(..., description='更新後の未読数')
+
+
+class NotificationReadResponse(CamelModel):
+    """既読ステータス更新レスポンス"""
+
+    data: NotificationReadData = Field(..., description='レスポンスデータ')
+    message: str = Field(..., description='メッセージ')
+    timestamp: datetime = Field(..., description='レスポンス生成日時')
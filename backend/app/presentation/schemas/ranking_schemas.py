@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from pydantic import Field
+
+from app.presentation.schemas.base import CamelModel
+from app.presentation.schemas.user_schemas import PaginationResponse
+
+
+class RankingItemResponse(CamelModel):
+    """ランキングの1行"""
+
+    rank: int = Field(..., description='順位（同点は同順位）')
+    user_id: str = Field(..., description='ユーザーID (UUID)')
+    username: str = Field(..., description='ユーザー名')
+    avatar_url: str | None = Field(None, description='アバター画像URL')
+    score: int = Field(..., description='参加日数（streak は連続参加日数）')
+
+
+class RankingData(CamelModel):
+    """ランキング"""
+
+    type: str = Field(..., description='ランキングの種類 (monthly, total, streak)')
+    year: int | None = Field(None, description='月間ランキングの対象年')
+    month: int | None = Field(None, description='月間ランキングの対象月（1-12）')
+    rankings: list[RankingItemResponse] = Field(..., description='ランキング')
+    me: RankingItemResponse | None = Field(
+        None, description='自分の順位（ランキング外の場合はnull）'
+    )
+    rivals: list[RankingItemResponse] = Field(..., description='ライバルの順位')
+    pagination: PaginationResponse = Field(..., description='ページネーション情報')
+
+
+class RankingResponse(CamelModel):
+    """ランキングレスポンス"""
+
+    data: RankingData = Field(..., description='レスポンスデータ')
+    message: str = Field(..., description='メッセージ')
+    timestamp: datetime = Field(..., description='レスポンス生成日時')
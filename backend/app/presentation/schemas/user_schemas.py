@@ -0,0 +1,75 @@
+from datetime import datetime
+
+from pydantic import Field
+
+from app.presentation.schemas.base import CamelModel
+
+
+class SocialLinkResponse(CamelModel):
+    """外部リンク"""
+
+    id: str = Field(..., description='リンクID')
+    platform: str = Field(..., description='プラットフォーム種別')
+    url: str = Field(..., description='リンクURL')
+    title: str | None = Field(None, description='リンクのタイトル')
+
+
+class UserListItemResponse(CamelModel):
+    """メンバー一覧の1ユーザー"""
+
+    id: str = Field(..., description='ユーザーID (UUID)')
+    username: str = Field(..., description='ユーザー名')
+    avatar_url: str | None = Field(None, description='アバター画像URL')
+    display_name: str = Field(..., description='表示名')
+    tagline: str | None = Field(None, description='一言プロフィール')
+    bio: str | None = Field(None, description='自己紹介文')
+    skills: list[str] = Field(..., description='スキル一覧')
+    interests: list[str] = Field(..., description='興味・関心一覧')
+    vision: str | None = Field(None, description='ビジョン（非公開の場合はnull）')
+    is_vision_public: bool = Field(..., description='ビジョンの公開設定')
+    social_links: list[SocialLinkResponse] = Field(..., description='SNSリンク一覧')
+    total_attendance_days: int = Field(..., description='総参加日数')
+    current_streak_days: int = Field(..., description='現在の連続参加日数')
+    max_streak_days: int = Field(..., description='最大連続参加日数')
+    current_title_level: int = Field(..., description='現在の称号レベル（1-8）')
+    joined_at: datetime = Field(..., description='登録日時')
+
+
+class PaginationResponse(CamelModel):
+    """ページネーション情報"""
+
+    total: int = Field(..., description='総件数')
+    limit: int = Field(..., description='取得件数制限')
+    offset: int = Field(..., description='オフセット')
+    has_more: bool = Field(..., description='次のページがあるか')
+
+
+class CursorPaginationResponse(CamelModel):
+    """ページネーション情報（キーセットページネーション）"""
+
+    limit: int = Field(..., description='取得件数制限')
+    next_cursor: str | None = Field(
+        None, description='次ページのカーソル（最終ページの場合はnull）'
+    )
+    has_more: bool = Field(..., description='次のページがあるか')
+    total: int | None = Field(
+        None, description='総件数（include_total=true のときのみ。それ以外はnull）'
+    )
+    total_capped: bool = Field(
+        False, description='総件数が上限（10000件）で打ち切られたか'
+    )
+
+
+class UserListData(CamelModel):
+    """メンバー一覧"""
+
+    users: list[UserListItemResponse] = Field(..., description='ユーザー一覧')
+    pagination: CursorPaginationResponse = Field(..., description='ページネーション情報')
+
+
+class UserListResponse(CamelModel):
+    """メンバー一覧レスポンス"""
+
+    data: UserListData = Field(..., description='レスポンスデータ')
+    message: str = Field(..., description='メッセージ')
+    timestamp: datetime = Field(..., description='レスポンス生成日時')
@@ -0,0 +1,10 @@
+import orjson
+
+
+def dumps(content: object) -> bytes:
+    """
+    JSON にする（orjson）
+
+    datetime・UUID はそのまま渡せる。UTC の datetime は pydantic と同じく末尾を Z にする。
+    """
+    return orjson.dumps(content, option=orjson.OPT_UTC_Z)
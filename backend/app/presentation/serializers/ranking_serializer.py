@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from app.application.schemas.ranking_schemas import RankingItemDTO, RankingOutputDTO
+
+
+def serialize_ranking(output_dto: RankingOutputDTO, timestamp: datetime) -> dict:
+    """ランキングを RankingResponse と同じ形の辞書にする（user_serializer と同じ方針）"""
+    month = output_dto.month
+    return {
+        'data': {
+            'type': output_dto.ranking_type.value,
+            'year': month.year if month else None,
+            'month': month.month if month else None,
+            'rankings': [_serialize_item(item) for item in output_dto.rankings],
+            'me': _serialize_item(output_dto.me) if output_dto.me else None,
+            'rivals': [_serialize_item(item) for item in output_dto.rivals],
+            'pagination': {
+                'total': output_dto.total,
+                'limit': output_dto.limit,
+                'offset': output_dto.offset,
+                'hasMore': output_dto.has_more,
+            },
+        },
+        'message': 'success',
+        'timestamp': timestamp,
+    }
+
+
+def _serialize_item(item: RankingItemDTO) -> dict:
+    return {
+        'rank': item.rank,
+        'userId': item.user_id,
+        'username': item.username,
+        'avatarUrl': item.avatar_url,
+        'score': item.score,
+    }
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+from app.application.schemas.user_schemas import UserListOutputDTO
+from app.domain.entities.user_profile import UserProfile
+
+
+def serialize_user_list(output_dto: UserListOutputDTO, timestamp: datetime) -> dict:
+    """
+    メンバー一覧を UserListResponse と同じ形の辞書にする
+
+    ユースケースが返す DTO は検証済みのため、レスポンスモデルを作らずに辞書へ詰め替える
+    （モデルの検証とシリアライズの分だけ速い）。キーはレスポンスモデルの alias に合わせる。
+    """
+    return {
+        'data': {
+            'users': [_serialize_user(user) for user in output_dto.users],
+            'pagination': {
+                'limit': output_dto.limit,
+                'nextCursor': output_dto.next_cursor,
+                'hasMore': output_dto.has_more,
+                'total': output_dto.total,
+                'totalCapped': output_dto.total_capped,
+            },
+        },
+        'message': 'success',
+        'timestamp': timestamp,
+    }
+
+
+def _serialize_user(user: UserProfile) -> dict:
+    return {
+        'id': user.id,
+        'username': user.username,
+        'avatarUrl': user.avatar_url,
+        'displayName': user.display_name,
+        'tagline': user.tagline,
+        'bio': user.bio,
+        'skills': user.skills,
+        'interests': user.interests,
+        'vision': user.vision,
+        'isVisionPublic': user.is_vision_public,
+        'socialLinks': [
+            {
+                'id': link.id,
+                'platform': link.platform,
+                'url': link.url,
+                'title': link.title,
+            }
+            for link in user.social_links
+        ],
+        'totalAttendanceDays': user.total_attendance_days,
+        'currentStreakDays': user.current_streak_days,
+        'maxStreakDays': user.max_streak_days,
+        'currentTitleLevel': user.current_title_level,
+        'joinedAt': user.joined_at,
+    }
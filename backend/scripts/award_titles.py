@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+称号の夜間バッチ
+
+全ユーザーの参加統計をユーザーID順にチャンクで読み、到達している称号を付与します。
+通常は参加記録の処理の中で付与されるため、このバッチは参加統計の作り直し
+（rebuild_statistics）や称号の閾値変更の後の取りこぼしを拾うためのものです。
+
+使用方法:
+    python scripts/award_titles.py [--chunk-size 1000]
+    または
+    make award-titles
+
+cron などで1日1回、参加の少ない時間帯に実行してください。
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from app.application.use_cases.title_usecase import (  # noqa: E402
+    DEFAULT_CHUNK_SIZE,
+    TitleUsecase,
+)
+from app.domain.services.title_service import TitleAwardService  # noqa: E402
+from app.infrastructure.cache.response_cache import get_response_cache  # noqa: E402
+from app.infrastructure.db.repositories.attendance_repository_impl import (  # noqa: E402
+    AttendanceRepositoryImpl,
+)
+from app.infrastructure.db.repositories.title_achievement_repository_impl import (  # noqa: E402
+    TitleAchievementRepositoryImpl,
+)
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help='1トランザクションで評価するユーザー数',
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    started = time.perf_counter()
+    with SQLAlchemyUnitOfWork() as uow:
+        usecase = TitleUsecase(
+            attendance_repository=AttendanceRepositoryImpl(uow.session),
+            title_award_service=TitleAwardService(
+                TitleAchievementRepositoryImpl(uow.session)
+            ),
+            unit_of_work=uow,
+            response_cache=get_response_cache(),
+        )
+        awarded = usecase.award_all(chunk_size=args.chunk_size)
+
+    print(
+        f'称号を付与したユーザー: {awarded} 人 '
+        f'({time.perf_counter() - started:.1f}s, chunk_size={args.chunk_size})'
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
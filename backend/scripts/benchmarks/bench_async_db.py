@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+同期UoW（スレッドプール）と非同期UoW（asyncio）の負荷ベンチマーク
+
+FastAPI の def エンドポイントと同じく、同期UoWは AnyIO のスレッドプール
+（デフォルト40スレッド）経由で実行し、非同期UoWはイベントループ上で直接実行する。
+各リクエストは `SELECT pg_sleep(:latency)` でDBの待ち時間を模擬する。
+
+ローカルの PostgreSQL（docker compose の db サービスなど）を対象に実行する:
+    POSTGRES_HOST=localhost python scripts/benchmarks/bench_async_db.py \\
+        --requests 2000 --concurrency 500 --latency 0.01
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import (  # noqa: E402
+    percentile,
+    print_table,
+    setup_environment,
+)
+
+setup_environment(with_jwt_keys=False)
+
+from anyio import to_thread  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.infrastructure.db.async_unit_of_work import (  # noqa: E402
+    AsyncSQLAlchemyUnitOfWork,
+)
+from app.infrastructure.db.session import dispose_engines  # noqa: E402
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork  # noqa: E402
+
+QUERY = text('SELECT pg_sleep(:latency)')
+
+
+def sync_request(latency: float) -> None:
+    with SQLAlchemyUnitOfWork() as uow:
+        uow.session.execute(QUERY, {'latency': latency})
+        uow.commit()
+
+
+async def async_request(latency: float) -> None:
+    async with AsyncSQLAlchemyUnitOfWork() as uow:
+        await uow.session.execute(QUERY, {'latency': latency})
+        await uow.commit()
+
+
+async def run_load(
+    handler, total: int, concurrency: int, latency: float
+) -> tuple[float, list[float]]:
+    """concurrency 件を同時に投げ続け、スループットと各リクエストのレイテンシを返す"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await handler(latency)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    return total / elapsed, latencies
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    async def via_threadpool(latency: float) -> None:
+        await to_thread.run_sync(sync_request, latency)
+
+    rows = []
+    for name, handler in (
+        ('sync UoW (threadpool)', via_threadpool),
+        ('AsyncSQLAlchemyUnitOfWork', async_request),
+    ):
+        await run_load(handler, min(args.concurrency, 50), args.concurrency, 0)
+        throughput, latencies = await run_load(
+            handler, args.requests, args.concurrency, args.latency
+        )
+        rows.append(
+            (
+                name,
+                f'{throughput:,.0f}',
+                f'{percentile(latencies, 50) * 1000:.1f}',
+                f'{percentile(latencies, 95) * 1000:.1f}',
+            )
+        )
+
+    print_table(
+        f'{args.requests} requests, concurrency={args.concurrency}, '
+        f'db latency={args.latency * 1000:.0f}ms',
+        rows,
+        ('mode', 'req/s', 'p50 ms', 'p95 ms'),
+    )
+
+    await dispose_engines()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=500)
+    parser.add_argument(
+        '--latency', type=float, default=0.01, help='模擬DB待ち時間（秒）'
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
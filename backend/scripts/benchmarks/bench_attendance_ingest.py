@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Discord 入退室イベント取り込み（AttendanceIngestionUsecase）のリプレイベンチマーク
+
+朝活のピーク（5:30〜7:30）を模した入退室イベント（チャンネル移動・同じイベントの
+重複配信を含む）を JSONL ファイルに生成し、発生順に --batch-sizes 件ずつ区切って
+取り込む。バッチサイズごとに events/s とバッチあたりの p50 / p95 を表示する。
+バッチサイズ 1 はイベントごとにコミットする場合に相当する。
+
+取り込み後、参加統計が日次サマリーからの全件再計算と一致するかを確認し、
+食い違えば終了コード 1 を返す。
+
+PostgreSQL が必要（DATABASE_URL もしくは --database-url で接続先を指定）。
+--in-memory を付けるとDBを使わず、取り込み処理（セッションの組み立て・集計）だけを計測する。
+
+使用方法:
+    python scripts/benchmarks/bench_attendance_ingest.py --generate events.jsonl \\
+        [--users 500] [--days 30]
+    python scripts/benchmarks/bench_attendance_ingest.py --events events.jsonl \\
+        [--batch-sizes 1,100,1000] [--in-memory]
+"""
+
+import argparse
+import datetime as dt
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import (  # noqa: E402
+    create_tables,
+    percentile,
+    print_table,
+    setup_environment,
+)
+
+setup_environment(with_jwt_keys=False)
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.application.schemas.attendance_schemas import (  # noqa: E402
+    AttendanceEventInputDTO,
+    AttendanceIngestInputDTO,
+)
+from app.application.use_cases.attendance_ingestion_usecase import (  # noqa: E402
+    AttendanceIngestionUsecase,
+)
+from app.domain.entities.attendance import (  # noqa: E402
+    AttendanceLog,
+    AttendanceStatistics,
+    AttendanceSummary,
+)
+from app.domain.services.attendance_statistics_service import (  # noqa: E402
+    recompute_statistics,
+)
+from app.infrastructure.db.models import Base  # noqa: E402
+from app.infrastructure.db.repositories.attendance_log_repository_impl import (  # noqa: E402
+    AttendanceLogRepositoryImpl,
+)
+from app.infrastructure.db.repositories.attendance_repository_impl import (  # noqa: E402
+    AttendanceRepositoryImpl,
+)
+from app.infrastructure.db.repositories.user_repository_impl import (  # noqa: E402
+    UserRepositoryImpl,
+)
+
+SCHEMA = 'bench_attendance_ingest'
+TIMEZONE = ZoneInfo('Asia/Tokyo')
+START_DATE = dt.date(2026, 4, 1)
+CHANNELS = ['morning-1', 'morning-2', 'mokumoku']
+
+
+def generate_events(users: int, days: int, seed: int) -> list[dict]:
+    """朝活のピークを模した入退室イベントを生成（発生順）"""
+    rng = random.Random(seed)  # noqa: S311 (暗号用途ではない)
+    events: list[dict] = []
+
+    def add(discord_user_id: str, channel: str, type: str, at: dt.datetime) -> None:
+        event = {
+            'discordUserId': discord_user_id,
+            'discordChannelId': channel,
+            'type': type,
+            'occurredAt': at.isoformat(),
+        }
+        events.append(event)
+        if rng.random() < 0.03:
+            events.append(dict(event))  # 同じイベントの重複配信
+
+    for day in range(days):
+        base = dt.datetime.combine(
+            START_DATE + dt.timedelta(days=day), dt.time(5, 30), tzinfo=TIMEZONE
+        )
+        for user in range(users):
+            if rng.random() < 0.35:
+                continue
+            discord_user_id = str(10**17 + user)
+            at = base + dt.timedelta(seconds=rng.randint(0, 60 * 60))
+            for _ in range(rng.choice([1, 1, 1, 2, 3])):
+                channel = rng.choice(CHANNELS)
+                add(discord_user_id, channel, 'join', at)
+                at += dt.timedelta(seconds=rng.randint(60, 90 * 60))
+                add(discord_user_id, channel, 'leave', at)
+                at += dt.timedelta(seconds=rng.choice([0, 0, 30, 600]))
+
+    events.sort(key=lambda event: event['occurredAt'])
+    return events
+
+
+class InMemoryStore:
+    """--in-memory 用のリポジトリ（ユーザーごとの辞書で、DBの索引を引く程度のコストにする）"""
+
+    def __init__(self, discord_ids: dict[str, uuid.UUID]):
+        self.discord_ids = discord_ids
+        self.logs: dict[uuid.UUID, dict[tuple, AttendanceLog]] = defaultdict(dict)
+        self.summaries: dict[uuid.UUID, dict[dt.date, AttendanceSummary]] = defaultdict(
+            dict
+        )
+        self.statistics: dict[uuid.UUID, AttendanceStatistics] = {}
+
+    # IUserRepository
+    def get_ids_by_discord_ids(self, discord_ids):
+        return {i: self.discord_ids[i] for i in discord_ids if i in self.discord_ids}
+
+    # IAttendanceLogRepository
+    def get_open_logs(self, user_ids):
+        return [
+            log
+            for user_id in user_ids
+            for log in self.logs[user_id].values()
+            if log.left_at is None
+        ]
+
+    def upsert_logs(self, logs):
+        for log in logs:
+            user_logs = self.logs[log.user_id]
+            key = (log.discord_channel_id, log.joined_at)
+            existing = user_logs.get(key)
+            if existing is None or existing.left_at is None or log.left_at is not None:
+                user_logs[key] = log
+
+    def list_logs(self, user_ids, start, end):
+        return [
+            log
+            for user_id in user_ids
+            for log in self.logs[user_id].values()
+            if start <= log.joined_at < end
+        ]
+
+    # IAttendanceRepository
+    def get_summaries(self, keys):
+        return {
+            (user_id, day): self.summaries[user_id][day]
+            for user_id, day in keys
+            if day in self.summaries[user_id]
+        }
+
+    def upsert_summaries(self, summaries):
+        for summary in summaries:
+            self.summaries[summary.user_id][summary.date] = summary
+
+    def get_attended_dates(self, user_id, start, end):
+        return {
+            day
+            for day, summary in self.summaries[user_id].items()
+            if start <= day <= end and summary.is_attended
+        }
+
+    def get_statistics_for_update_many(self, user_ids):
+        return {
+            user_id: self.statistics.get(user_id, AttendanceStatistics(user_id=user_id))
+            for user_id in user_ids
+        }
+
+    def save_statistics_many(self, statistics):
+        for item in statistics:
+            self.statistics[item.user_id] = item
+
+    # IUnitOfWork
+    def run(self, work):
+        return work()
+
+    def mismatches(self) -> int:
+        return sum(
+            1
+            for user_id, statistics in self.statistics.items()
+            if statistics
+            != recompute_statistics(user_id, self.summaries[user_id].values())
+        )
+
+
+class SessionUnitOfWork:
+    """ベンチマーク用のスキーマに接続したセッションでコミットするだけのUoW"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def run(self, work):
+        result = work()
+        self.session.commit()
+        return result
+
+
+def replay(
+    usecase: AttendanceIngestionUsecase,
+    events: list[AttendanceEventInputDTO],
+    batch_size: int,
+) -> tuple[float, list[float]]:
+    latencies = []
+    started = time.perf_counter()
+    for offset in range(0, len(events), batch_size):
+        batch = AttendanceIngestInputDTO(events=events[offset : offset + batch_size])
+        batch_started = time.perf_counter()
+        usecase.ingest(batch)
+        latencies.append(time.perf_counter() - batch_started)
+    return time.perf_counter() - started, latencies
+
+
+def run_in_memory(
+    events: list[AttendanceEventInputDTO], discord_ids: list[str], batch_size: int
+) -> tuple[float, list[float], int]:
+    store = InMemoryStore({discord_id: uuid.uuid4() for discord_id in discord_ids})
+    usecase = AttendanceIngestionUsecase(store, store, store, store)
+    elapsed, latencies = replay(usecase, events, batch_size)
+    return elapsed, latencies, store.mismatches()
+
+
+def run_postgres(
+    database_url: str,
+    events: list[AttendanceEventInputDTO],
+    discord_ids: list[str],
+    batch_size: int,
+) -> tuple[float, list[float], int]:
+    engine = create_engine(database_url)
+    with engine.connect() as connection:
+        connection.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        connection.execute(text(f'CREATE SCHEMA {SCHEMA}'))
+        connection.execute(text(f'SET search_path TO {SCHEMA}, public'))
+        connection.commit()
+        create_tables(connection, Base.metadata)
+        connection.execute(
+            text(
+                'INSERT INTO users (email, password_hash, discord_id) '
+                "SELECT d || '@example.com', 'x', d FROM unnest(CAST(:ids AS text[])) AS d"
+            ),
+            {'ids': discord_ids},
+        )
+        connection.commit()
+
+        session = Session(bind=connection)
+        try:
+            attendance_repository = AttendanceRepositoryImpl(session)
+            usecase = AttendanceIngestionUsecase(
+                user_repository=UserRepositoryImpl(session),
+                attendance_log_repository=AttendanceLogRepositoryImpl(session),
+                attendance_repository=attendance_repository,
+                unit_of_work=SessionUnitOfWork(session),
+            )
+            elapsed, latencies = replay(usecase, events, batch_size)
+
+            user_ids = UserRepositoryImpl(session).get_ids_by_discord_ids(discord_ids)
+            statistics = attendance_repository.get_statistics_for_update_many(
+                user_ids.values()
+            )
+            mismatches = sum(
+                1
+                for user_id, item in statistics.items()
+                if item
+                != recompute_statistics(
+                    user_id, attendance_repository.list_summaries(user_id)
+                )
+            )
+            session.rollback()
+        finally:
+            session.close()
+            connection.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+            connection.commit()
+    return elapsed, latencies, mismatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--generate', type=Path, help='イベントを生成して書き出すファイル'
+    )
+    parser.add_argument('--events', type=Path, help='リプレイするイベントファイル')
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--batch-sizes', default='1,100,1000')
+    parser.add_argument('--in-memory', action='store_true', help='DBを使わない')
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'))
+    args = parser.parse_args()
+
+    if args.generate:
+        events = generate_events(args.users, args.days, args.seed)
+        with args.generate.open('w') as f:
+            f.writelines(json.dumps(event) + '\n' for event in events)
+        print(f'{len(events):,} events written to {args.generate}')
+        if not args.events:
+            return 0
+
+    path = args.events
+    if path is None:
+        path = Path(tempfile.mkstemp(suffix='.jsonl')[1])
+        with path.open('w') as f:
+            f.writelines(
+                json.dumps(event) + '\n'
+                for event in generate_events(args.users, args.days, args.seed)
+            )
+
+    with path.open() as f:
+        raw_events = [json.loads(line) for line in f if line.strip()]
+    events = [
+        AttendanceEventInputDTO(
+            discord_user_id=event['discordUserId'],
+            discord_channel_id=event['discordChannelId'],
+            type=event['type'],
+            occurred_at=event['occurredAt'],
+        )
+        for event in raw_events
+    ]
+    discord_ids = sorted({event.discord_user_id for event in events})
+
+    if not args.in_memory and not args.database_url:
+        print(
+            'DATABASE_URL もしくは --database-url を指定してください（--in-memory も可）'
+        )
+        return 1
+
+    runner: Callable[[int], tuple[float, list[float], int]]
+    if args.in_memory:
+        runner = lambda size: run_in_memory(events, discord_ids, size)  # noqa: E731
+    else:
+        runner = lambda size: run_postgres(  # noqa: E731
+            args.database_url, events, discord_ids, size
+        )
+
+    rows = []
+    failed = False
+    for batch_size in [int(size) for size in args.batch_sizes.split(',')]:
+        elapsed, latencies, mismatches = runner(batch_size)
+        failed |= mismatches > 0
+        rows.append(
+            (
+                str(batch_size),
+                f'{len(events) / elapsed:,.0f}',
+                f'{percentile(latencies, 50) * 1000:.2f}',
+                f'{percentile(latencies, 95) * 1000:.2f}',
+                str(mismatches),
+            )
+        )
+
+    backend = 'in-memory' if args.in_memory else 'PostgreSQL'
+    print_table(
+        f'replay {len(events):,} events, {len(discord_ids):,} users ({backend})',
+        rows,
+        ('batch', 'events/s', 'p50 ms', 'p95 ms', 'stat mismatches'),
+    )
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
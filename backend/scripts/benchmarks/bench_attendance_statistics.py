@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+参加統計の差分更新（AttendanceStatisticsService）のベンチマーク
+
+--days 日分の参加履歴があるユーザーについて、差分更新と全件再計算の時間と
+読み込んだ日数を比較する。
+1. 「今日の参加」を追加する
+2. 最近の参加日を1日取り消す（取り消した日を含む連続参加は最長ではない）
+
+DB は使わず、参加日の取得はメモリ上の辞書で代用する。
+差分更新の結果が全件再計算と一致することは
+tests/domain/services/test_attendance_statistics_service.py で検証する。
+
+使用方法:
+    python scripts/benchmarks/bench_attendance_statistics.py [--days 1095]
+"""
+
+import argparse
+import datetime as dt
+import sys
+import time
+import uuid
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from app.domain.entities.attendance import (  # noqa: E402
+    AttendanceStatistics,
+    AttendanceSummary,
+)
+from app.domain.services.attendance_statistics_service import (  # noqa: E402
+    AttendanceStatisticsService,
+    recompute_statistics,
+)
+from scripts.benchmarks.common import print_table  # noqa: E402
+
+START = dt.date(2025, 1, 1)
+
+
+class InMemorySummaries:
+    """attendance_summaries の代わりに使う日付 -> サマリーの辞書"""
+
+    def __init__(self, user_id: uuid.UUID):
+        self.user_id = user_id
+        self.by_date: dict[dt.date, AttendanceSummary] = {}
+        self.loaded_days = 0
+
+    def attended_dates(self, start: dt.date, end: dt.date) -> set[dt.date]:
+        self.loaded_days += (end - start).days + 1
+        return {
+            day
+            for day, summary in self.by_date.items()
+            if start <= day <= end and summary.is_attended
+        }
+
+
+def build_history(
+    days: int, skip_every: int
+) -> tuple[InMemorySummaries, AttendanceStatistics, AttendanceStatisticsService]:
+    """START から days 日分（skip_every 日ごとに休み）の参加履歴と参加統計"""
+    user_id = uuid.uuid4()
+    service = AttendanceStatisticsService()
+    store = InMemorySummaries(user_id)
+    statistics = AttendanceStatistics(user_id=user_id)
+    for offset in range(days):
+        if skip_every and offset % skip_every == skip_every - 1:
+            continue
+        day = START + dt.timedelta(days=offset)
+        summary = AttendanceSummary(
+            user_id=user_id, date=day, session_count=1, total_duration_minutes=30
+        )
+        store.by_date[day] = summary
+        statistics = service.apply(statistics, None, summary, store.attended_dates)
+    return store, statistics, service
+
+
+def compare(
+    iterations: int, incremental_op, recompute_op, store: InMemorySummaries
+) -> list[tuple[str, str, str, str]]:
+    """差分更新と全件再計算の1回あたりの時間と読み込んだ日数を比較"""
+    store.loaded_days = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        incremental_op()
+    incremental = (time.perf_counter() - started) / iterations
+    loaded_days = store.loaded_days // iterations
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        recompute_op()
+    recompute = (time.perf_counter() - started) / iterations
+
+    return [
+        ('incremental', f'{incremental * 1e6:.1f}', '1.0x', f'{loaded_days:,}'),
+        (
+            'full recompute',
+            f'{recompute * 1e6:.1f}',
+            f'{recompute / incremental:.0f}x',
+            f'{len(store.by_date):,}',
+        ),
+    ]
+
+
+def bench_append(days: int, iterations: int) -> list[tuple[str, str, str, str]]:
+    """長い履歴の末尾に1日追加するときの時間を比較"""
+    store, statistics, service = build_history(days, skip_every=0)
+    today = START + dt.timedelta(days=days)
+    summary = AttendanceSummary(
+        user_id=store.user_id, date=today, session_count=1, total_duration_minutes=30
+    )
+    history = list(store.by_date.values())
+
+    return compare(
+        iterations,
+        lambda: service.apply(statistics, None, summary, store.attended_dates),
+        lambda: recompute_statistics(store.user_id, [*history, summary]),
+        store,
+    )
+
+
+def bench_remove(days: int, iterations: int) -> list[tuple[str, str, str, str]]:
+    """長い履歴の最近の参加日を1日取り消すときの時間を比較"""
+    # 1年目は毎日参加（最長の連続参加）、以降は7日ごとに休む
+    store, statistics, service = build_history(days, skip_every=0)
+    for offset in range(365, days, 7):
+        del store.by_date[START + dt.timedelta(days=offset)]
+    statistics = recompute_statistics(store.user_id, store.by_date.values())
+
+    removed_day = max(store.by_date) - dt.timedelta(days=10)
+    previous = store.by_date[removed_day]
+    removed = AttendanceSummary(user_id=store.user_id, date=removed_day, session_count=0)
+    remaining = [s for day, s in store.by_date.items() if day != removed_day]
+
+    return compare(
+        iterations,
+        lambda: service.apply(
+            statistics.model_copy(), previous, removed, store.attended_dates
+        ),
+        lambda: recompute_statistics(store.user_id, remaining),
+        store,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--days', type=int, default=1095, help='履歴の日数')
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    columns = ('method', 'us/op', 'ratio', 'days read')
+    print_table(
+        f'append today to {args.days:,} days of history',
+        bench_append(args.days, args.iterations),
+        columns,
+    )
+    print_table(
+        f'remove a recent day from {args.days:,} days of history',
+        bench_remove(args.days, args.iterations),
+        columns,
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
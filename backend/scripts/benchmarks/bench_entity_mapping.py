@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+DB の行から User エンティティへの変換のスループットと割り当てメモリを比較するベンチマーク
+
+--rows 行（既定 10,000）の users の行を、次の経路でエンティティに変換する。
+
+- pydantic (from_attributes): 変更前の経路。ORM オブジェクトを Pydantic の User に
+  model_validate(from_attributes=True) で検証しながら変換する
+- dataclass (orm): ORM オブジェクトから slots の dataclass の User を作る
+  （UserRepositoryImpl._to_entity。書き込み後など ORM オブジェクトがある場合）
+- dataclass (row): 取得カラムの行から User(*row) を作る
+  （UserRepositoryImpl の読み取りクエリの経路。ORM オブジェクトを作らない）
+
+ORM オブジェクトの生成（identity map への登録など）の時間は含めず、変換だけを測る。
+DB には接続しない。dataclass の結果のフィールドが pydantic の結果と一致しなければ
+終了コード 1 を返す。
+
+使用方法:
+    python scripts/benchmarks/bench_entity_mapping.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import print_table, setup_environment  # noqa: E402
+
+setup_environment(with_jwt_keys=False)
+
+from pydantic import BaseModel, ConfigDict, Field  # noqa: E402
+
+from app.domain.entities.user import User  # noqa: E402
+from app.infrastructure.db.models.user_model import UserModel  # noqa: E402
+from app.infrastructure.db.repositories.user_repository_impl import (  # noqa: E402
+    USER_FIELDS,
+    UserRepositoryImpl,
+)
+
+
+class PydanticUser(BaseModel):
+    """変更前の User エンティティ（比較用）"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID = Field(..., description='ユーザーID (UUID)')
+    email: str = Field(..., description='メールアドレス')
+    password_hash: str = Field(..., description='ハッシュ化されたパスワード (bcrypt)')
+    username: str | None = Field(None, description='ユーザー名')
+    avatar_url: str | None = Field(None, description='アバター画像URL')
+    discord_id: str | None = Field(None, description='Discord User ID')
+    is_active: bool = Field(default=True, description='アカウント有効状態')
+    created_at: datetime = Field(default_factory=datetime.now, description='作成日時')
+    updated_at: datetime = Field(default_factory=datetime.now, description='更新日時')
+
+
+def make_rows(count: int) -> list[tuple]:
+    """USER_FIELDS の順に並べた users の行"""
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        (
+            uuid.uuid4(),
+            f'user{i}@example.com',
+            '$2b$12$' + 'x' * 53,
+            f'user{i}',
+            None if i % 3 else f'https://example.com/avatars/{i}.png',
+            str(10**17 + i) if i % 2 else None,
+            bool(i % 10),
+            base + timedelta(minutes=i),
+            base + timedelta(minutes=i, seconds=30),
+        )
+        for i in range(count)
+    ]
+
+
+def measure(convert: Callable[[], list], repeat: int) -> tuple[float, int]:
+    """(最良の実行時間[秒], 結果を保持したままの割り当てメモリ[バイト])"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        convert()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    result = convert()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, allocated
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    models = [UserModel(**dict(zip(USER_FIELDS, row, strict=True))) for row in rows]
+    to_entity = UserRepositoryImpl(session=None)._to_entity  # DB には接続しない
+
+    paths: dict[str, Callable[[], list]] = {
+        'pydantic (from_attributes)': lambda: [
+            PydanticUser.model_validate(model) for model in models
+        ],
+        'dataclass (orm)': lambda: [to_entity(model) for model in models],
+        'dataclass (row)': lambda: [User(*row) for row in rows],
+    }
+
+    expected = [tuple(user.model_dump().values()) for user in paths[next(iter(paths))]()]
+    mismatches = [
+        name
+        for name, convert in list(paths.items())[1:]
+        if [tuple(getattr(user, f) for f in USER_FIELDS) for user in convert()]
+        != expected
+    ]
+
+    results = []
+    baseline = None
+    for name, convert in paths.items():
+        seconds, allocated = measure(convert, args.repeat)
+        baseline = baseline or seconds
+        results.append(
+            (
+                name,
+                f'{seconds * 1e3:,.1f}',
+                f'{args.rows / seconds:,.0f}',
+                f'{allocated / 1024:,.0f}',
+                f'{allocated / args.rows:,.0f}',
+                f'{baseline / seconds:.1f}x',
+            )
+        )
+
+    print_table(
+        f'users row -> User entity ({args.rows:,} rows, best of {args.repeat})',
+        results,
+        ('path', 'ms', 'rows/s', 'KiB', 'B/row', 'speedup'),
+    )
+    if mismatches:
+        print('\nMISMATCH with pydantic: ' + ', '.join(mismatches))
+        return 1
+    print('\nall paths produce the same field values')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+イベント参加申込の同時実行ベンチマーク（定員の保証と throughput）
+
+定員 --seats（既定 50）のイベントに --users 人（既定 1,000）が同時に参加申込を行い、
+次の方式で結果を比較する。各方式とも --workers 本のスレッドがそれぞれ接続を持ち、
+Barrier で揃えてから一斉に申し込む。
+
+- guarded: EventParticipantRepositoryImpl.register（参加者数の条件付き UPDATE 1文）
+- naive: 登録済みの参加者を数えてから INSERT（READ COMMITTED。定員を超えうる）
+- naive-serializable: naive を SERIALIZABLE で実行し、直列化の失敗を
+  SQLAlchemyUnitOfWork.run のリトライ（待機してやり直す）で処理する
+
+guarded では続けて、登録済みの半数のキャンセルと未登録のユーザーの申込を同時に行い
+（--churn 件ずつ）、参加者数と登録済みの行数が一致し、定員を超えないことを確認する。
+guarded の結果が定員どおりでない場合は終了コード 1 を返す。
+
+PostgreSQL が必要（DATABASE_URL もしくは --database-url で接続先を指定）。
+max_connections が --workers より大きいこと。
+
+使用方法:
+    python scripts/benchmarks/bench_event_join.py [--users 1000] [--seats 50] \\
+        [--workers 64] [--modes guarded,naive,naive-serializable] [--churn 200]
+"""
+
+import argparse
+import datetime as dt
+import os
+import queue
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import (  # noqa: E402
+    create_tables,
+    percentile,
+    print_table,
+    setup_environment,
+)
+
+setup_environment(with_jwt_keys=False)
+
+from sqlalchemy import create_engine, func, select, text  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.application.interfaces.unit_of_work import (  # noqa: E402
+    TransactionConflictError,
+)
+from app.domain.entities.event import ParticipationOutcome  # noqa: E402
+from app.infrastructure.db.models import (  # noqa: E402
+    Base,
+    EventModel,
+    EventParticipantModel,
+)
+from app.infrastructure.db.repositories.event_participant_repository_impl import (  # noqa: E402
+    EventParticipantRepositoryImpl,
+)
+from app.infrastructure.db.retry_policy import RetryPolicy  # noqa: E402
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork  # noqa: E402
+
+SCHEMA = 'bench_event_join'
+REGISTERED = 'registered'
+
+
+@dataclass
+class RunResult:
+    """1回の同時実行の結果"""
+
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    outcomes: Counter = field(default_factory=Counter)
+    retries: int = 0
+    failed: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(self, latency: float, outcome: str, attempts: int) -> None:
+        with self.lock:
+            self.latencies.append(latency)
+            self.outcomes[outcome] += 1
+            self.retries += max(attempts - 1, 0)
+
+
+def guarded_register(
+    session: Session, event_id: uuid.UUID, user_id: uuid.UUID
+) -> ParticipationOutcome:
+    return EventParticipantRepositoryImpl(session).register(event_id, user_id).outcome
+
+
+def guarded_cancel(
+    session: Session, event_id: uuid.UUID, user_id: uuid.UUID
+) -> ParticipationOutcome:
+    return EventParticipantRepositoryImpl(session).cancel(event_id, user_id).outcome
+
+
+def naive_register(
+    session: Session, event_id: uuid.UUID, user_id: uuid.UUID
+) -> ParticipationOutcome:
+    """変更前に想定される実装: 登録済みの参加者を数えてから INSERT"""
+    max_participants = session.scalar(
+        select(EventModel.max_participants).where(EventModel.id == event_id)
+    )
+    registered = session.scalar(
+        select(func.count())
+        .select_from(EventParticipantModel)
+        .where(
+            EventParticipantModel.event_id == event_id,
+            EventParticipantModel.status == REGISTERED,
+        )
+    )
+    if max_participants is not None and registered >= max_participants:
+        return ParticipationOutcome.FULL
+    session.add(
+        EventParticipantModel(event_id=event_id, user_id=user_id, status=REGISTERED)
+    )
+    session.flush()
+    return ParticipationOutcome.JOINED
+
+
+def naive_serializable_register(
+    session: Session, event_id: uuid.UUID, user_id: uuid.UUID
+) -> ParticipationOutcome:
+    session.connection(execution_options={'isolation_level': 'SERIALIZABLE'})
+    return naive_register(session, event_id, user_id)
+
+
+MODES: dict[str, Callable[[Session, uuid.UUID, uuid.UUID], ParticipationOutcome]] = {
+    'guarded': guarded_register,
+    'naive': naive_register,
+    'naive-serializable': naive_serializable_register,
+}
+
+
+def run_concurrently(
+    session_factory: sessionmaker[Session],
+    tasks: list[tuple[Callable, uuid.UUID, uuid.UUID]],
+    workers: int,
+) -> RunResult:
+    """
+    tasks（処理, イベントID, ユーザーID）を workers 本のスレッドで一斉に実行
+
+    各処理は SQLAlchemyUnitOfWork.run で実行し、デッドロック・直列化の失敗は
+    アプリと同じ方針で待機してやり直す。
+    """
+    result = RunResult()
+    pending: queue.SimpleQueue = queue.SimpleQueue()
+    for task in tasks:
+        pending.put(task)
+    workers = min(workers, len(tasks))
+    barrier = threading.Barrier(workers + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        while True:
+            try:
+                operation, event_id, user_id = pending.get_nowait()
+            except queue.Empty:
+                return
+            started = time.perf_counter()
+            uow = SQLAlchemyUnitOfWork(retry_policy=RetryPolicy())
+            uow.session = session_factory()  # ベンチマーク用のスキーマに接続する
+            attempts = 0
+
+            def work(operation=operation, event_id=event_id, user_id=user_id, uow=uow):
+                nonlocal attempts
+                attempts += 1
+                return operation(uow.session, event_id, user_id)
+
+            try:
+                outcome = uow.run(work).value
+            except TransactionConflictError:
+                outcome = 'conflict'
+                with result.lock:
+                    result.failed += 1
+            finally:
+                uow.session.close()
+            result.record(time.perf_counter() - started, outcome, attempts)
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def setup_schema(engine: Engine, users: int, seats: int) -> tuple[uuid.UUID, list]:
+    with engine.connect() as connection:
+        connection.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        connection.execute(text(f'CREATE SCHEMA {SCHEMA}'))
+        connection.commit()
+        create_tables(connection, Base.metadata)
+        user_ids = list(
+            connection.execute(
+                text(
+                    'INSERT INTO users (email, password_hash) '
+                    "SELECT 'event' || i || '@example.com', 'x' "
+                    'FROM generate_series(1, :users) AS i RETURNING id'
+                ),
+                {'users': users},
+            ).scalars()
+        )
+        event_id = connection.execute(
+            text(
+                'INSERT INTO events (title, scheduled_date, start_time, end_time, '
+                'max_participants) VALUES '
+                "('朝活もくもく会', :day, '06:00', '07:00', :seats) RETURNING id"
+            ),
+            {'day': dt.date.today() + dt.timedelta(days=1), 'seats': seats},
+        ).scalar_one()
+        connection.commit()
+    return event_id, user_ids
+
+
+def reset_event(engine: Engine, event_id: uuid.UUID) -> None:
+    with engine.begin() as connection:
+        connection.execute(text('TRUNCATE event_participants'))
+        connection.execute(
+            text('UPDATE events SET participant_count = 0 WHERE id = :id'),
+            {'id': event_id},
+        )
+
+
+def event_state(engine: Engine, event_id: uuid.UUID) -> tuple[int, int]:
+    """(events.participant_count, 登録済みの行数)"""
+    with engine.connect() as connection:
+        counter = connection.execute(
+            text('SELECT participant_count FROM events WHERE id = :id'),
+            {'id': event_id},
+        ).scalar_one()
+        registered = connection.execute(
+            text(
+                'SELECT count(*) FROM event_participants '
+                "WHERE event_id = :id AND status = 'registered'"
+            ),
+            {'id': event_id},
+        ).scalar_one()
+    return counter, registered
+
+
+def registered_users(engine: Engine, event_id: uuid.UUID) -> set[uuid.UUID]:
+    with engine.connect() as connection:
+        return set(
+            connection.execute(
+                text(
+                    'SELECT user_id FROM event_participants '
+                    "WHERE event_id = :id AND status = 'registered'"
+                ),
+                {'id': event_id},
+            ).scalars()
+        )
+
+
+def result_row(
+    name: str, result: RunResult, counter: int | str, registered: int, seats: int
+) -> tuple[str, ...]:
+    attempts = sum(result.outcomes.values())
+    return (
+        name,
+        str(attempts),
+        str(result.outcomes[ParticipationOutcome.JOINED.value]),
+        str(registered),
+        str(counter),
+        str(max(registered - seats, 0)),
+        str(result.outcomes[ParticipationOutcome.FULL.value]),
+        str(result.retries),
+        str(result.failed),
+        f'{attempts / result.elapsed:,.0f}',
+        f'{percentile(result.latencies, 50) * 1000:.1f}',
+        f'{percentile(result.latencies, 95) * 1000:.1f}',
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'))
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--seats', type=int, default=50)
+    parser.add_argument('--workers', type=int, default=64)
+    parser.add_argument('--modes', default='guarded,naive,naive-serializable')
+    parser.add_argument('--churn', type=int, default=200)
+    args = parser.parse_args()
+
+    if not args.database_url:
+        print('DATABASE_URL もしくは --database-url を指定してください')
+        return 1
+
+    engine = create_engine(
+        args.database_url,
+        pool_size=args.workers,
+        max_overflow=0,
+        # public に同名のテーブルがあっても使わないよう、ベンチマーク用のスキーマだけを見る
+        connect_args={'options': f'-c search_path={SCHEMA}'},
+    )
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    event_id, user_ids = setup_schema(engine, args.users, args.seats)
+    expected = min(args.seats, args.users)
+
+    rows = []
+    failures = []
+    try:
+        for mode in args.modes.split(','):
+            reset_event(engine, event_id)
+            operation = MODES[mode]
+            result = run_concurrently(
+                session_factory,
+                [(operation, event_id, user_id) for user_id in user_ids],
+                args.workers,
+            )
+            counter, registered = event_state(engine, event_id)
+            rows.append(
+                result_row(
+                    mode,
+                    result,
+                    counter if mode == 'guarded' else '-',
+                    registered,
+                    args.seats,
+                )
+            )
+            if mode != 'guarded':
+                continue
+            if registered != expected or counter != registered:
+                failures.append(
+                    f'guarded: registered={registered} counter={counter} '
+                    f'(expected {expected})'
+                )
+
+            # 登録済みの半数のキャンセルと、未登録のユーザーの申込を同時に行う
+            admitted = registered_users(engine, event_id)
+            waiting = [user_id for user_id in user_ids if user_id not in admitted]
+            cancels = sorted(admitted)[: min(args.churn, len(admitted) // 2)]
+            joins = waiting[: args.churn]
+            tasks = [
+                task
+                for cancel, join in zip_longest(cancels, joins)
+                for task in (
+                    (guarded_cancel, event_id, cancel),
+                    (guarded_register, event_id, join),
+                )
+                if task[2] is not None
+            ]
+            result = run_concurrently(session_factory, tasks, args.workers)
+            counter, registered = event_state(engine, event_id)
+            rows.append(
+                result_row('guarded (churn)', result, counter, registered, args.seats)
+            )
+            if counter != registered or registered > args.seats:
+                failures.append(
+                    f'guarded churn: registered={registered} counter={counter} '
+                    f'(seats {args.seats})'
+                )
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        engine.dispose()
+
+    print_table(
+        f'{args.users:,} simultaneous joins, {args.seats} seats, '
+        f'{args.workers} connections (PostgreSQL)',
+        rows,
+        (
+            'mode',
+            'requests',
+            'joined',
+            'registered',
+            'counter',
+            'over seats',
+            'full',
+            'retries',
+            'conflicts',
+            'req/s',
+            'p50 ms',
+            'p95 ms',
+        ),
+    )
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f'NG: {failure}')
+        return 1
+    print(f'OK: guarded admitted exactly {expected} and the counter matches')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
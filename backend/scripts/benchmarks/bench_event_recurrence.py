@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+イベント一覧（GET /events）の開催回展開のベンチマーク
+
+DB を使わず、メモリ上のリポジトリで EventUsecase.list_events を実行する。
+定期開催イベント --series 件（daily / weekdays / weekly / biweekly / monthly）と、
+毎日 --one-off-per-day 件の単発イベント（リポジトリが開催日順に生成する）を、
+7日〜100年の期間で一覧にし、次を比較する。
+
+- lazy: EventUsecase（開催回を生成器で展開し heapq.merge でページを切り出す）
+- naive: 期間内の開催回をすべてリストにしてソートしてからページを切り出す
+  （--naive-max-days より長い期間は省略）
+
+メモリは tracemalloc のピーク（時間も tracemalloc を有効にした状態で測る）。
+lazy のメモリは期間の長さによらずほぼ一定になる。総数は単発イベントを流し読みして
+数えるため、時間は期間に比例する。
+先頭ページ・深いページ（--deep-offset）・総数が naive と一致しない場合、
+またはランダムな範囲で開催日の数（計算）と生成した開催日の数が一致しない場合は
+終了コード 1 を返す。
+
+使用方法:
+    python scripts/benchmarks/bench_event_recurrence.py [--series 200] [--limit 20]
+"""
+
+import argparse
+import datetime as dt
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import print_table, setup_environment  # noqa: E402
+
+setup_environment()
+
+from app.application.schemas.event_schemas import EventListInputDTO  # noqa: E402
+from app.application.use_cases.event_usecase import EventUsecase  # noqa: E402
+from app.domain.entities.event import (  # noqa: E402
+    Event,
+    EventStatus,
+    RecurrencePattern,
+)
+from app.domain.repositories.event_repository import IEventRepository  # noqa: E402
+from app.domain.services.event_schedule_service import (  # noqa: E402
+    EventSchedulePolicy,
+    count_occurrence_dates,
+    expand,
+    occurrence_dates,
+    occurrence_sort_key,
+)
+
+POLICY = EventSchedulePolicy(timezone='Asia/Tokyo', default_window_days=90)
+ORIGIN = dt.date(2026, 1, 1)
+WINDOWS = (
+    ('7 days', 7),
+    ('90 days', 90),
+    ('1 year', 365),
+    ('10 years', 3650),
+    ('100 years', 36500),
+)
+START_TIMES = (dt.time(5, 30), dt.time(6, 0), dt.time(6, 30), dt.time(23, 30))
+
+
+class InMemoryEventRepository(IEventRepository):
+    """定期開催はリストで持ち、単発イベントは開催日ごとにその場で生成するリポジトリ"""
+
+    def __init__(self, series: list[Event], one_off_per_day: int):
+        self.series = series
+        self.one_off_per_day = one_off_per_day
+
+    def list_recurring(
+        self, until: dt.date, creator_id: uuid.UUID | None = None
+    ) -> list[Event]:
+        return [event for event in self.series if event.scheduled_date <= until]
+
+    def iter_one_off(
+        self, first: dt.date, last: dt.date, creator_id: uuid.UUID | None = None
+    ) -> Iterator[Event]:
+        day = first
+        while day <= last:
+            events = [self._one_off(day, index) for index in range(self.one_off_per_day)]
+            events.sort(key=lambda event: (event.start_time, event.id))
+            yield from events
+            day += dt.timedelta(days=1)
+
+    @staticmethod
+    def _one_off(day: dt.date, index: int) -> Event:
+        return Event(
+            id=uuid.UUID(int=day.toordinal() * 1000 + index),
+            creator_id=None,
+            title='one-off',
+            description=None,
+            event_type='general',
+            scheduled_date=day,
+            start_time=START_TIMES[index % len(START_TIMES)],
+            end_time=dt.time(7, 0),
+        )
+
+
+def make_series(count: int, rng: random.Random) -> list[Event]:
+    patterns = list(RecurrencePattern)
+    return [
+        Event(
+            id=uuid.UUID(int=rng.getrandbits(128)),
+            creator_id=None,
+            title=f'series {index}',
+            description=None,
+            event_type='study',
+            scheduled_date=ORIGIN - dt.timedelta(days=rng.randrange(0, 400)),
+            start_time=rng.choice(START_TIMES),
+            end_time=dt.time(7, 0),
+            is_recurring=True,
+            recurrence_pattern=patterns[index % len(patterns)].value,
+        )
+        for index in range(count)
+    ]
+
+
+def naive_page(
+    repository: InMemoryEventRepository, input_dto: EventListInputDTO
+) -> tuple[list, int]:
+    """期間内の開催回をすべてリストにしてソートする（比較用）"""
+    zone = POLICY.zone
+    window = POLICY.window(
+        now=dt.datetime.now(dt.UTC),
+        status=input_dto.status,
+        date_from=input_dto.date_from,
+        date_to=input_dto.date_to,
+    )
+    first, last = window.dates(zone)
+    events = [*repository.list_recurring(last), *repository.iter_one_off(first, last)]
+    occurrences = [
+        occurrence for event in events for occurrence in expand(event, window, zone)
+    ]
+    occurrences.sort(key=occurrence_sort_key)
+    start = input_dto.offset
+    return occurrences[start : start + input_dto.limit], len(occurrences)
+
+
+def measure(func: Callable[[], object]) -> tuple[object, float, int]:
+    """1回実行し、結果・経過時間・tracemalloc のピークを返す"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def page_key(occurrences: list) -> list[tuple]:
+    return [(occurrence.event.id, occurrence.starts_at) for occurrence in occurrences]
+
+
+def check_counts(rng: random.Random, cases: int) -> str | None:
+    """計算した開催日の数と、生成した開催日の数が一致するか"""
+    for case in range(cases):
+        pattern = rng.choice([*RecurrencePattern, None])
+        event = Event(
+            id=uuid.uuid4(),
+            creator_id=None,
+            title='check',
+            description=None,
+            event_type='general',
+            scheduled_date=ORIGIN + dt.timedelta(days=rng.randrange(-800, 800)),
+            start_time=dt.time(6, 0),
+            end_time=dt.time(7, 0),
+            is_recurring=pattern is not None,
+            recurrence_pattern=pattern.value if pattern else None,
+        )
+        first = ORIGIN + dt.timedelta(days=rng.randrange(-1000, 1000))
+        last = first + dt.timedelta(days=rng.randrange(-3, 800))
+        dates = list(occurrence_dates(event, first, last))
+        counted = count_occurrence_dates(event, first, last)
+        if counted != len(dates) or dates != sorted(set(dates)):
+            return f'case {case}: {event} {first}..{last}: {counted} != {len(dates)}'
+        if any(not first <= day <= last or day < event.scheduled_date for day in dates):
+            return f'case {case}: {event} {first}..{last}: out of range'
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--series', type=int, default=200, help='定期開催イベント数')
+    parser.add_argument('--one-off-per-day', type=int, default=2)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--deep-offset', type=int, default=10_000)
+    parser.add_argument('--naive-max-days', type=int, default=365)
+    parser.add_argument('--check-cases', type=int, default=5_000)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    # 暗号用途ではない
+    seed = args.seed if args.seed is not None else random.randrange(2**32)  # noqa: S311
+    rng = random.Random(seed)  # noqa: S311
+    mismatch = check_counts(rng, args.check_cases)
+    if mismatch:
+        print(f'MISMATCH (seed={seed}) {mismatch}')
+        return 1
+    print(f'{args.check_cases} random ranges: counted == generated (seed={seed})')
+
+    repository = InMemoryEventRepository(
+        make_series(args.series, rng), args.one_off_per_day
+    )
+    usecase = EventUsecase(repository, POLICY)
+    date_from = dt.datetime.combine(ORIGIN, dt.time(0), tzinfo=POLICY.zone)
+
+    rows = []
+    failed = False
+    for label, days in WINDOWS:
+        for page, offset in (('first', 0), ('deep', args.deep_offset)):
+            input_dto = EventListInputDTO(
+                status=None,
+                date_from=date_from,
+                date_to=date_from + dt.timedelta(days=days),
+                limit=args.limit,
+                offset=offset,
+            )
+            output, lazy_seconds, lazy_peak = measure(
+                lambda input_dto=input_dto: usecase.list_events(input_dto)
+            )
+            naive_cell = ('-', '-')
+            if days <= args.naive_max_days:
+                (expected, expected_total), naive_seconds, naive_peak = measure(
+                    lambda input_dto=input_dto: naive_page(repository, input_dto)
+                )
+                naive_cell = (f'{naive_seconds * 1000:.1f}', f'{naive_peak / 1024:,.0f}')
+                if (
+                    page_key(output.occurrences) != page_key(expected)
+                    or output.total != expected_total
+                ):
+                    print(f'MISMATCH {label} {page} page (seed={seed})')
+                    failed = True
+            rows.append(
+                (
+                    label,
+                    page,
+                    f'{output.total:,}',
+                    f'{lazy_seconds * 1000:.1f}',
+                    f'{lazy_peak / 1024:,.0f}',
+                    *naive_cell,
+                )
+            )
+
+    print_table(
+        f'list_events: {args.series} series + {args.one_off_per_day} one-off/day, '
+        f'limit {args.limit}, deep offset {args.deep_offset:,}',
+        rows,
+        (
+            'window',
+            'page',
+            'occurrences',
+            'lazy ms',
+            'lazy peak KiB',
+            'naive ms',
+            'naive peak KiB',
+        ),
+    )
+
+    # status 付きの絞り込み（now の前後15日）も確認する
+    around_now = dt.datetime.now(dt.UTC) - dt.timedelta(days=15)
+    for status in EventStatus:
+        input_dto = EventListInputDTO(
+            status=status,
+            date_from=around_now,
+            date_to=around_now + dt.timedelta(days=30),
+            limit=args.limit,
+        )
+        output = usecase.list_events(input_dto)
+        expected, expected_total = naive_page(repository, input_dto)
+        if (
+            page_key(output.occurrences) != page_key(expected)
+            or output.total != expected_total
+        ):
+            print(f'MISMATCH status={status.value} (seed={seed})')
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
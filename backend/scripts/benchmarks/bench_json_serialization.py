@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+一覧系エンドポイントのレスポンスのシリアライズ時間を比較するベンチマーク
+
+GET /users（外部リンク付きのユーザー --items 人）と GET /ranking/*（--items 行と
+本人・ライバル）について、ユースケースの出力DTOから本文のバイト列を作るまでを比較する。
+
+- fastapi default: レスポンスモデルを作り、response_model で検証・シリアライズし直して
+  JSONResponse で出力する（エンドポイントがモデルを返す場合の FastAPI の経路）
+- model_dump_json: レスポンスモデルを作り、1回だけシリアライズする
+  （FAST_JSON_RESPONSES=false の経路）
+- fast (orjson): レスポンスモデルを作らずに辞書へ詰め替え、orjson で出力する
+
+fast の出力が fastapi default と JSON として一致しなければ終了コード 1 を返す。
+
+使用方法:
+    python scripts/benchmarks/bench_json_serialization.py [--items 100] [--iterations 200]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import print_table, setup_environment  # noqa: E402
+
+setup_environment(with_jwt_keys=False)
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from app.application.schemas.ranking_schemas import (  # noqa: E402
+    RankingItemDTO,
+    RankingOutputDTO,
+)
+from app.application.schemas.user_schemas import UserListOutputDTO  # noqa: E402
+from app.domain.entities.ranking import RankingType  # noqa: E402
+from app.domain.entities.user_profile import SocialLink, UserProfile  # noqa: E402
+from app.presentation.api.ranking_api import _to_data  # noqa: E402
+from app.presentation.api.user_api import _to_response  # noqa: E402
+from app.presentation.schemas.ranking_schemas import RankingResponse  # noqa: E402
+from app.presentation.schemas.user_schemas import UserListResponse  # noqa: E402
+from app.presentation.serializers.json import dumps  # noqa: E402
+from app.presentation.serializers.ranking_serializer import (  # noqa: E402
+    serialize_ranking,
+)
+from app.presentation.serializers.user_serializer import (  # noqa: E402
+    serialize_user_list,
+)
+
+
+def make_user_list(items: int) -> UserListOutputDTO:
+    joined_at = datetime(2026, 1, 1, 6, 30, tzinfo=UTC)
+    return UserListOutputDTO(
+        users=[
+            UserProfile(
+                id=uuid.uuid4(),
+                username=f'user{i}',
+                avatar_url=f'https://example.com/avatars/{i}.png',
+                display_name=f'朝活ユーザー{i}',
+                tagline='毎朝6時から勉強しています',
+                bio='自己紹介' * 40,
+                skills=['Python', 'TypeScript', 'React', 'AWS'],
+                interests=['読書', 'ランニング', 'コーヒー'],
+                vision='エンジニアとして独立する' if i % 2 else None,
+                is_vision_public=bool(i % 2),
+                social_links=[
+                    SocialLink(
+                        id=uuid.uuid4(),
+                        platform=platform,
+                        url=f'https://{platform}.com/user{i}',
+                        title=None if platform == 'github' else 'リンク',
+                    )
+                    for platform in ('twitter', 'github', 'blog')
+                ],
+                total_attendance_days=i * 3,
+                current_streak_days=i % 30,
+                max_streak_days=i % 60,
+                current_title_level=i % 8 + 1,
+                joined_at=joined_at,
+            )
+            for i in range(items)
+        ],
+        total=items * 10,
+        limit=items,
+        next_cursor='MjAyNi0wMS0wMVQwNjozMDowMCswMDowMA',
+        has_more=True,
+    )
+
+
+def make_ranking(items: int) -> RankingOutputDTO:
+    rows = [
+        RankingItemDTO(
+            rank=i + 1,
+            user_id=uuid.uuid4(),
+            username=f'user{i}',
+            avatar_url=None if i % 3 else f'https://example.com/avatars/{i}.png',
+            score=items - i,
+        )
+        for i in range(items)
+    ]
+    return RankingOutputDTO(
+        ranking_type=RankingType.MONTHLY,
+        month=date(2026, 10, 1),
+        rankings=rows,
+        me=rows[7],
+        rivals=rows[10:13],
+        total=items * 10,
+        limit=items,
+        offset=0,
+        has_more=True,
+    )
+
+
+def fastapi_default(model_class: type[BaseModel]) -> Callable[[BaseModel], bytes]:
+    """エンドポイントがモデルを返したときの FastAPI の処理（検証・シリアライズ・出力）"""
+    field = create_model_field(name='response', type_=model_class, mode='serialization')
+    loop = asyncio.new_event_loop()
+
+    def render(model: BaseModel) -> bytes:
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=model, is_coroutine=False)
+        )
+        return JSONResponse(content).body
+
+    return render
+
+
+def timed_us(func: Callable[[], bytes], iterations: int) -> float:
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def without_timestamp(body: bytes) -> dict:
+    content = json.loads(body)
+    content.pop('timestamp')
+    return content
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=100)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    timestamp = datetime.now(UTC)
+    render_users = fastapi_default(UserListResponse)
+    render_ranking = fastapi_default(RankingResponse)
+    user_list = make_user_list(args.items)
+    ranking = make_ranking(args.items)
+
+    def ranking_model() -> RankingResponse:
+        return RankingResponse(
+            data=_to_data(ranking), message='success', timestamp=timestamp
+        )
+
+    endpoints = {
+        'GET /users': {
+            'fastapi default': lambda: render_users(_to_response(user_list, timestamp)),
+            'model_dump_json': lambda: _to_response(user_list, timestamp)
+            .model_dump_json(by_alias=True)
+            .encode(),
+            'fast (orjson)': lambda: dumps(serialize_user_list(user_list, timestamp)),
+        },
+        'GET /ranking/monthly': {
+            'fastapi default': lambda: render_ranking(ranking_model()),
+            'model_dump_json': lambda: ranking_model()
+            .model_dump_json(by_alias=True)
+            .encode(),
+            'fast (orjson)': lambda: dumps(serialize_ranking(ranking, timestamp)),
+        },
+    }
+
+    rows = []
+    mismatches = []
+    for endpoint, paths in endpoints.items():
+        expected = without_timestamp(paths['fastapi default']())
+        baseline = None
+        for name, render in paths.items():
+            if without_timestamp(render()) != expected:
+                mismatches.append(f'{endpoint} {name}')
+            us = timed_us(render, args.iterations)
+            baseline = baseline or us
+            rows.append(
+                (
+                    endpoint,
+                    name,
+                    f'{us:,.0f}',
+                    f'{len(render()):,}',
+                    f'{baseline / us:.1f}x',
+                )
+            )
+
+    print_table(
+        f'response serialization ({args.items} items)',
+        rows,
+        ('endpoint', 'path', 'us/op', 'bytes', 'speedup'),
+    )
+    if mismatches:
+        print('\nMISMATCH with fastapi default: ' + ', '.join(mismatches))
+        return 1
+    print('\nall paths produce the same JSON as fastapi default')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+JWT 署名・検証のマイクロベンチマーク
+
+鍵キャッシュ導入前（毎回PEMをパース）と導入後（パース済み鍵を再利用）の
+tokens/sec を比較する。
+
+使用方法:
+    python scripts/benchmarks/bench_jwt_keys.py [--duration 2.0]
+"""
+
+import argparse
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import (  # noqa: E402
+    measure_throughput,
+    print_table,
+    setup_environment,
+)
+
+setup_environment()
+
+from jose import jwt  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.infrastructure.security.jwt_key_cache import jwt_key_cache  # noqa: E402
+
+USER_ID = '550e8400-e29b-41d4-a716-446655440000'
+
+
+def _claims() -> dict:
+    return {'user_id': USER_ID, 'exp': datetime.now(UTC) + timedelta(days=7)}
+
+
+def _legacy_keys() -> tuple[bytes, bytes]:
+    """キャッシュ導入前の _load_rsa_keys() と同じ処理"""
+    settings = get_settings()
+    private_key = settings.jwt_private_key.replace('\\n', '\n').encode('utf-8')
+    public_key = settings.jwt_public_key.replace('\\n', '\n').encode('utf-8')
+    return private_key, public_key
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--duration', type=float, default=2.0, help='計測秒数')
+    args = parser.parse_args()
+
+    keys = jwt_key_cache.get()
+    token = jwt.encode(_claims(), keys.signing_key, algorithm=keys.algorithm)
+
+    def legacy_sign():
+        private_key, _ = _legacy_keys()
+        jwt.encode(_claims(), private_key, algorithm='RS256')
+
+    def legacy_verify():
+        _, public_key = _legacy_keys()
+        jwt.decode(token, public_key, algorithms=['RS256'])
+
+    def cached_sign():
+        cached = jwt_key_cache.get()
+        jwt.encode(_claims(), cached.signing_key, algorithm=cached.algorithm)
+
+    def cached_verify():
+        cached = jwt_key_cache.get()
+        jwt.decode(token, cached.verifying_key, algorithms=[cached.algorithm])
+
+    rows = []
+    for name, before, after in (
+        ('sign', legacy_sign, cached_sign),
+        ('verify', legacy_verify, cached_verify),
+    ):
+        before_tps = measure_throughput(before, args.duration)
+        after_tps = measure_throughput(after, args.duration)
+        rows.append(
+            (
+                name,
+                f'{before_tps:,.0f}',
+                f'{after_tps:,.0f}',
+                f'x{after_tps / before_tps:.2f}',
+            )
+        )
+
+    print_table(
+        'JWT RS256 throughput (tokens/sec)',
+        rows,
+        ('operation', 'before (PEM parse)', 'after (cached key)', 'speedup'),
+    )
+
+
+if __name__ == '__main__':
+    main()
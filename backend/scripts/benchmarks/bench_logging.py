@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+ロギングモード別のリクエストレイテンシへの影響を計測するベンチマーク
+
+1リクエストあたり --logs-per-request 件のログを出力する処理を、
+--threads 本のスレッドから同時に実行し、1リクエストあたりのログ出力時間を比較する。
+ログの出力先は一時ディレクトリと /dev/null（標準出力）。
+
+使用方法:
+    python scripts/benchmarks/bench_logging.py [--requests 2000] [--threads 8]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import (  # noqa: E402
+    percentile,
+    print_table,
+    setup_environment,
+)
+
+setup_environment(with_jwt_keys=False)
+
+from app.config import get_settings  # noqa: E402
+from app.infrastructure.logging import logging as app_logging  # noqa: E402
+
+MODES = {
+    'development (sync + callsite)': {
+        'LOG_MODE': 'development',
+        'LOG_CAPTURE_CALLSITE': 'true',
+    },
+    'development (sync, no callsite)': {
+        'LOG_MODE': 'development',
+        'LOG_CAPTURE_CALLSITE': 'false',
+    },
+    'production (queue + JSON)': {
+        'LOG_MODE': 'production',
+        'LOG_CAPTURE_CALLSITE': 'false',
+    },
+}
+
+
+def run_mode(
+    env: dict[str, str], log_dir: str, requests: int, threads: int, logs_per_request: int
+) -> list[float]:
+    os.environ.update(env)
+    os.environ['LOG_DIR'] = log_dir
+    os.environ['LOG_LEVEL'] = 'INFO'
+    get_settings.cache_clear()
+    app_logging.setup_logging()
+
+    logger = logging.getLogger('bench.request')
+    latencies: list[float] = []
+    lock = threading.Lock()
+    per_thread = requests // threads
+
+    def worker() -> None:
+        local: list[float] = []
+        for i in range(per_thread):
+            started = time.perf_counter()
+            for j in range(logs_per_request):
+                logger.info('request %d step %d user=%s', i, j, 'user-001')
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    app_logging._stop_listener()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--logs-per-request', type=int, default=10)
+    args = parser.parse_args()
+
+    rows = []
+    stdout = sys.stdout
+    with tempfile.TemporaryDirectory() as log_dir, open(os.devnull, 'w') as devnull:
+        for name, env in MODES.items():
+            sys.stdout = devnull
+            try:
+                latencies = run_mode(
+                    env, log_dir, args.requests, args.threads, args.logs_per_request
+                )
+            finally:
+                sys.stdout = stdout
+            rows.append(
+                (
+                    name,
+                    f'{sum(latencies) / len(latencies) * 1e6:,.0f}',
+                    f'{percentile(latencies, 50) * 1e6:,.0f}',
+                    f'{percentile(latencies, 99) * 1e6:,.0f}',
+                )
+            )
+
+    print_table(
+        f'Logging overhead per request ({args.logs_per_request} records, '
+        f'{args.threads} threads)',
+        rows,
+        ('mode', 'mean us', 'p50 us', 'p99 us'),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+通知の配信ワーカー（NotificationDispatchUsecase）の throughput ベンチマーク
+
+--users 人（既定 100,000）のリマインダーを同じリマインダー送信時刻（21:00）に予約し、
+--fanout-subjects 人のライバル更新（それぞれ --followers 人がライバルに設定している）と
+あわせて、--workers 本（カンマ区切りで複数指定）のワーカーが同時に配信する時間を測る。
+予約後に --disabled-ratio の割合のユーザーがリマインダーを無効にし、配信時に除かれる。
+
+- batched: 既定の構成（--batch-size 件ずつ FOR UPDATE SKIP LOCKED で確保し、通知設定は
+  キャッシュ付きでまとめて読み、ライバルへの複製は複数行の INSERT）
+- row: 1件ずつ確保し、通知設定はキャッシュなし、複製は1行ずつ INSERT する
+
+各ワーカーはスレッドごとに接続を持ち、Barrier で揃えてから一斉に配信を始める。
+次のいずれかの場合は終了コード 1 を返す。
+
+- 同じ通知を複数のワーカーが確保した（二重配信）
+- 確保した通知が予約した通知と一致しない、または配信後に未送信の通知が残っている
+- 送信済みのリマインダー・削除された数・複製の数が期待値と一致しない
+
+PostgreSQL が必要（DATABASE_URL もしくは --database-url で接続先を指定）。
+
+使用方法:
+    python scripts/benchmarks/bench_notification_dispatch.py [--users 100000] \\
+        [--workers 1,4,8] [--batch-size 500] [--modes batched,row]
+"""
+
+import argparse
+import datetime as dt
+import os
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import (  # noqa: E402
+    create_tables,
+    print_table,
+    setup_environment,
+)
+
+setup_environment(with_jwt_keys=False)
+
+from sqlalchemy import create_engine, insert, select, text, update  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.application.use_cases.notification_dispatch_usecase import (  # noqa: E402
+    REMINDER_MESSAGE,
+    REMINDER_TITLE,
+    NotificationDispatchUsecase,
+)
+from app.domain.entities.notification import (  # noqa: E402
+    DueNotification,
+    NotificationAudience,
+    NotificationType,
+)
+from app.infrastructure.cache.notification_settings_cache import (  # noqa: E402
+    CachedNotificationSettingsRepository,
+    NotificationSettingsCache,
+)
+from app.infrastructure.db.models import (  # noqa: E402
+    Base,
+    NotificationModel,
+    NotificationSettingsModel,
+    UserRivalModel,
+)
+from app.infrastructure.db.repositories.notification_repository_impl import (  # noqa: E402
+    NotificationRepositoryImpl,
+)
+from app.infrastructure.db.repositories.notification_settings_repository_impl import (  # noqa: E402
+    NotificationSettingsRepositoryImpl,
+)
+from app.infrastructure.db.repositories.user_rival_repository_impl import (  # noqa: E402
+    UserRivalRepositoryImpl,
+)
+from app.infrastructure.db.retry_policy import RetryPolicy  # noqa: E402
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork  # noqa: E402
+
+SCHEMA = 'bench_notification_dispatch'
+TIMEZONE = 'Asia/Tokyo'
+REMINDER_TIME = dt.time(21, 0)
+
+
+class RowByRowNotificationRepository(NotificationRepositoryImpl):
+    """複製を1行ずつ INSERT する（比較用）"""
+
+    def insert_fanout(
+        self,
+        source: DueNotification,
+        user_ids: Sequence[uuid.UUID],
+        sent_at: dt.datetime,
+    ) -> int:
+        insert_one = super().insert_fanout
+        return sum(insert_one(source, [user_id], sent_at) for user_id in user_ids)
+
+
+@dataclass
+class Fixture:
+    """ベンチマーク用のユーザー・ライバル関係"""
+
+    user_ids: list[uuid.UUID]
+    subject_ids: list[uuid.UUID]
+    disabled_ids: list[uuid.UUID]
+    followers: int
+
+
+@dataclass
+class RunResult:
+    """1回の同時配信の結果"""
+
+    elapsed: float = 0.0
+    claimed: list[list[uuid.UUID]] = field(default_factory=list)
+    batches: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def build_batched(
+    session: Session, uow: SQLAlchemyUnitOfWork, batch_size: int, cache
+) -> NotificationDispatchUsecase:
+    return NotificationDispatchUsecase(
+        notification_repository=NotificationRepositoryImpl(session),
+        notification_settings_repository=CachedNotificationSettingsRepository(
+            NotificationSettingsRepositoryImpl(session), cache
+        ),
+        user_rival_repository=UserRivalRepositoryImpl(session),
+        unit_of_work=uow,
+        batch_size=batch_size,
+    )
+
+
+def build_row(
+    session: Session, uow: SQLAlchemyUnitOfWork, batch_size: int, cache
+) -> NotificationDispatchUsecase:
+    return NotificationDispatchUsecase(
+        notification_repository=RowByRowNotificationRepository(session),
+        notification_settings_repository=NotificationSettingsRepositoryImpl(session),
+        user_rival_repository=UserRivalRepositoryImpl(session),
+        unit_of_work=uow,
+        batch_size=1,
+    )
+
+
+MODES: dict[str, Callable[..., NotificationDispatchUsecase]] = {
+    'batched': build_batched,
+    'row': build_row,
+}
+
+
+def setup_schema(
+    engine: Engine, users: int, subjects: int, followers: int, disabled_ratio: float
+) -> Fixture:
+    with engine.connect() as connection:
+        connection.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        connection.execute(text(f'CREATE SCHEMA {SCHEMA}'))
+        connection.commit()
+        create_tables(connection, Base.metadata)
+        # text() の結果は型が付かないため、UUID にそろえて比較できるようにする
+        user_ids = [
+            uuid.UUID(str(user_id))
+            for user_id in connection.execute(
+                text(
+                    'INSERT INTO users (email, password_hash) '
+                    "SELECT 'notify' || i || '@example.com', 'x' "
+                    'FROM generate_series(1, :users) AS i RETURNING id'
+                ),
+                {'users': users},
+            ).scalars()
+        ]
+        connection.execute(
+            text(
+                'INSERT INTO notification_settings (user_id, reminder_time) '
+                'SELECT id, :reminder_time FROM users'
+            ),
+            {'reminder_time': REMINDER_TIME},
+        )
+        # 先頭の subjects 人を、それぞれ別の followers 人がライバルに設定する
+        subject_ids = user_ids[:subjects]
+        rivals = [
+            {
+                'user_id': user_ids[subjects + index * followers + offset],
+                'rival_user_id': subject,
+            }
+            for index, subject in enumerate(subject_ids)
+            for offset in range(followers)
+            if subjects + index * followers + offset < len(user_ids)
+        ]
+        if rivals:
+            connection.execute(insert(UserRivalModel), rivals)
+        connection.commit()
+
+    step = max(int(1 / disabled_ratio), 1) if disabled_ratio > 0 else 0
+    disabled_ids = user_ids[::step] if step else []
+    return Fixture(user_ids, subject_ids, disabled_ids, followers)
+
+
+def prepare_run(
+    engine: Engine, fixture: Fixture, day: dt.date, scheduled_at: dt.datetime
+) -> set[uuid.UUID]:
+    """通知を予約し直し、配信される予定の通知IDを返す"""
+    session = Session(bind=engine)
+    try:
+        session.execute(text('TRUNCATE notifications'))
+        session.execute(text('UPDATE notification_settings SET reminder_enabled = true'))
+        scheduled = NotificationRepositoryImpl(session).schedule_reminders(
+            day, TIMEZONE, REMINDER_TITLE, REMINDER_MESSAGE
+        )
+        assert scheduled == len(fixture.user_ids), scheduled
+        # 予約後にリマインダーを無効にしたユーザー（配信時に削除される）
+        session.execute(
+            update(NotificationSettingsModel)
+            .where(NotificationSettingsModel.user_id.in_(fixture.disabled_ids))
+            .values(reminder_enabled=False)
+        )
+        if fixture.subject_ids:
+            session.execute(
+                insert(NotificationModel),
+                [
+                    {
+                        'user_id': subject,
+                        'type': NotificationType.RIVAL_UPDATE.value,
+                        'audience': NotificationAudience.RIVAL_FOLLOWERS.value,
+                        'title': 'ライバルが朝活に参加しました',
+                        'message': '今日もライバルが朝活に参加しました',
+                        'data': {'streak': 7},
+                        'scheduled_at': scheduled_at,
+                    }
+                    for subject in fixture.subject_ids
+                ],
+            )
+        session.commit()
+        return set(session.scalars(select(NotificationModel.id)))
+    finally:
+        session.close()
+
+
+def run_workers(
+    session_factory: sessionmaker[Session],
+    build: Callable[..., NotificationDispatchUsecase],
+    workers: int,
+    batch_size: int,
+    now: dt.datetime,
+) -> RunResult:
+    result = RunResult()
+    cache = NotificationSettingsCache(maxsize=1_000_000, ttl_seconds=600)
+    barrier = threading.Barrier(workers + 1)
+
+    def worker() -> None:
+        session = session_factory()
+        uow = SQLAlchemyUnitOfWork(retry_policy=RetryPolicy())
+        uow.session = session  # ベンチマーク用のスキーマに接続する
+        usecase = build(session, uow, batch_size, cache)
+        barrier.wait()
+        try:
+            report = usecase.dispatch_due(now)
+        finally:
+            session.close()
+        with result.lock:
+            result.claimed.append(report.claimed_ids)
+            result.batches += report.batches
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def verify(
+    engine: Engine,
+    fixture: Fixture,
+    result: RunResult,
+    expected_ids: set[uuid.UUID],
+    now: dt.datetime,
+) -> list[str]:
+    errors = []
+    claimed = [item for ids in result.claimed for item in ids]
+    if len(claimed) != len(set(claimed)):
+        errors.append(f'double claimed: {len(claimed) - len(set(claimed))}')
+    if set(claimed) != expected_ids:
+        errors.append(f'claimed {len(set(claimed))} of {len(expected_ids)} notifications')
+
+    with engine.connect() as connection:
+        pending, reminders, fanouts, sources = connection.execute(
+            text(
+                'SELECT '
+                'count(*) FILTER (WHERE sent_at IS NULL AND scheduled_at <= :now), '
+                "count(*) FILTER (WHERE type = 'reminder' AND sent_at IS NOT NULL), "
+                'count(*) FILTER (WHERE source_id IS NOT NULL), '
+                "count(*) FILTER (WHERE audience = 'rival_followers' AND sent_at IS NOT NULL) "
+                'FROM notifications'
+            ),
+            {'now': now},
+        ).one()
+        expected_fanouts = connection.execute(
+            text('SELECT count(*) FROM user_rivals')
+        ).scalar_one()
+
+    expected_reminders = len(fixture.user_ids) - len(fixture.disabled_ids)
+    if pending:
+        errors.append(f'{pending} due notifications left unsent')
+    if reminders != expected_reminders:
+        errors.append(f'sent reminders {reminders} != {expected_reminders}')
+    if fanouts != expected_fanouts:
+        errors.append(f'fan-out rows {fanouts} != {expected_fanouts}')
+    if sources != len(fixture.subject_ids):
+        errors.append(f'fan-out sources sent {sources} != {len(fixture.subject_ids)}')
+    return errors
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'))
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--fanout-subjects', type=int, default=200)
+    parser.add_argument('--followers', type=int, default=50)
+    parser.add_argument('--disabled-ratio', type=float, default=0.1)
+    parser.add_argument('--workers', default='1,4,8')
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--modes', default='batched,row')
+    args = parser.parse_args()
+
+    if not args.database_url:
+        print('DATABASE_URL もしくは --database-url を指定してください')
+        return 1
+
+    worker_counts = [int(count) for count in args.workers.split(',')]
+    engine = create_engine(
+        args.database_url,
+        pool_size=max(worker_counts) + 1,
+        max_overflow=0,
+        # public に同名のテーブルがあっても使わないよう、ベンチマーク用のスキーマだけを見る
+        connect_args={'options': f'-c search_path={SCHEMA}'},
+    )
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    day = dt.date.today()
+    scheduled_at = dt.datetime.combine(day, REMINDER_TIME, tzinfo=ZoneInfo(TIMEZONE))
+    now = scheduled_at + dt.timedelta(minutes=1)
+
+    rows = []
+    failures = []
+    try:
+        fixture = setup_schema(
+            engine,
+            args.users,
+            args.fanout_subjects,
+            args.followers,
+            args.disabled_ratio,
+        )
+        for mode in args.modes.split(','):
+            for workers in worker_counts:
+                expected_ids = prepare_run(engine, fixture, day, scheduled_at)
+                result = run_workers(
+                    session_factory, MODES[mode], workers, args.batch_size, now
+                )
+                claimed = sum(len(ids) for ids in result.claimed)
+                errors = verify(engine, fixture, result, expected_ids, now)
+                failures.extend(f'{mode} x{workers}: {error}' for error in errors)
+                rows.append(
+                    (
+                        mode,
+                        str(workers),
+                        f'{claimed:,}',
+                        f'{result.batches:,}',
+                        f'{result.elapsed:.2f}',
+                        f'{claimed / result.elapsed:,.0f}',
+                        'NG' if errors else 'OK',
+                    )
+                )
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        engine.dispose()
+
+    print_table(
+        f'{args.users:,} reminders at {REMINDER_TIME:%H:%M} + {args.fanout_subjects} '
+        f'rival updates x {args.followers} followers (PostgreSQL)',
+        rows,
+        ('mode', 'workers', 'claimed', 'batches', 'seconds', 'notif/s', 'check'),
+    )
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f'NG: {failure}')
+        return 1
+    print('OK: every notification was claimed by exactly one worker and delivered once')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+通知の未読数（notification_counters）のベンチマーク
+
+--users 人に1人あたり --per-user 件の送信済みの通知（約3割が未読）を用意し、
+ユーザー1人の未読数を取得する時間を比べる。
+
+- counter: notification_counters の主キーで1行読む（GET /users/{id}/notifications の未読数）
+- count (partial index): 未読の通知を ix_notifications_unread で数える
+- count (no partial index): ix_notifications_unread を落として数える（従来の COUNT(*)）
+
+あわせて、未読数が通知の書き換えと同じトランザクションで正しく増減することを確認する。
+
+1. 未読数のない状態から修復バッチで未読数を作り、COUNT(*) と一致するか
+2. --workers 本のスレッドが同時に既読/未読・削除・ライバル通知の複製を --ops 回行った後、
+   全ユーザーの未読数が COUNT(*) と一致するか
+3. 一部のユーザーの未読数をずらした後、修復バッチがずれた人数だけ直し、一致に戻るか
+
+一致しない場合は終了コード 1 を返す。
+
+PostgreSQL が必要（DATABASE_URL もしくは --database-url で接続先を指定）。
+
+使用方法:
+    python scripts/benchmarks/bench_notification_unread_count.py [--users 2000] \\
+        [--per-user 200] [--workers 4] [--ops 5000]
+"""
+
+import argparse
+import datetime as dt
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import (  # noqa: E402
+    create_tables,
+    percentile,
+    print_table,
+    setup_environment,
+)
+
+setup_environment(with_jwt_keys=False)
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.application.schemas.notification_schemas import (  # noqa: E402
+    NotificationReadInputDTO,
+)
+from app.application.use_cases.notification_usecase import (  # noqa: E402
+    NotificationUsecase,
+)
+from app.domain.entities.notification import (  # noqa: E402
+    DueNotification,
+    NotificationAudience,
+    NotificationType,
+)
+from app.infrastructure.db.models import Base  # noqa: E402
+from app.infrastructure.db.repositories.notification_repository_impl import (  # noqa: E402
+    NotificationRepositoryImpl,
+)
+from app.infrastructure.db.retry_policy import RetryPolicy  # noqa: E402
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork  # noqa: E402
+
+SCHEMA = 'bench_notification_unread_count'
+FANOUT_SOURCES = 50
+FANOUT_RECIPIENTS = 20
+DRIFT_RATIO = 0.1
+
+
+def setup_schema(engine: Engine, users: int, per_user: int) -> list[uuid.UUID]:
+    with engine.connect() as connection:
+        connection.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        connection.execute(text(f'CREATE SCHEMA {SCHEMA}'))
+        connection.commit()
+        create_tables(connection, Base.metadata)
+        # text() の結果は型が付かないため、UUID にそろえて比較できるようにする
+        user_ids = [
+            uuid.UUID(str(user_id))
+            for user_id in connection.execute(
+                text(
+                    'INSERT INTO users (email, password_hash) '
+                    "SELECT 'unread' || i || '@example.com', 'x' "
+                    'FROM generate_series(1, :users) AS i RETURNING id'
+                ),
+                {'users': users},
+            ).scalars()
+        ]
+        # リポジトリを通さずに入れるため、この時点では未読数の行がない
+        connection.execute(
+            text(
+                'INSERT INTO notifications (user_id, type, title, message, is_read, '
+                'sent_at, created_at) '
+                "SELECT u.id, 'achievement', '称号を獲得しました', '朝活の達人', "
+                'random() >= 0.3, now(), now() - make_interval(mins => i) '
+                'FROM users u CROSS JOIN generate_series(1, :per_user) AS i'
+            ),
+            {'per_user': per_user},
+        )
+        # ライバル更新の複製元（配信済み）
+        connection.execute(
+            text(
+                'INSERT INTO notifications (user_id, type, audience, title, message, '
+                'sent_at) '
+                "SELECT id, 'rival_update', 'rival_followers', 'ライバルの進捗', "
+                "'ライバルが朝活に参加しました', now() "
+                'FROM users ORDER BY id LIMIT :sources'
+            ),
+            {'sources': FANOUT_SOURCES},
+        )
+        connection.execute(text('ANALYZE notifications'))
+        connection.commit()
+    return user_ids
+
+
+def mismatched_users(engine: Engine) -> int:
+    """未読数が COUNT(*) と一致しないユーザー数"""
+    with engine.connect() as connection:
+        return connection.execute(
+            text(
+                'SELECT count(*) FROM users u '
+                'LEFT JOIN notification_counters c ON c.user_id = u.id '
+                'LEFT JOIN ('
+                '  SELECT user_id, count(*) AS unread FROM notifications '
+                "  WHERE is_read = false AND audience = 'user' AND sent_at IS NOT NULL "
+                '  GROUP BY user_id'
+                ') n ON n.user_id = u.id '
+                'WHERE coalesce(c.unread_count, 0) <> coalesce(n.unread, 0)'
+            )
+        ).scalar_one()
+
+
+def build_usecase(session: Session) -> NotificationUsecase:
+    uow = SQLAlchemyUnitOfWork(retry_policy=RetryPolicy())
+    uow.session = session  # ベンチマーク用のスキーマに接続する
+    return NotificationUsecase(
+        notification_repository=NotificationRepositoryImpl(session), unit_of_work=uow
+    )
+
+
+def run_mixed_ops(
+    engine: Engine,
+    session_factory: sessionmaker[Session],
+    user_ids: list[uuid.UUID],
+    workers: int,
+    ops: int,
+) -> float:
+    """既読/未読・削除・複製を同時に行い、経過秒数を返す"""
+    with engine.connect() as connection:
+        targets = [
+            (uuid.UUID(str(row.id)), uuid.UUID(str(row.user_id)))
+            for row in connection.execute(
+                text(
+                    'SELECT id, user_id FROM notifications '
+                    "WHERE audience = 'user' ORDER BY random() LIMIT :ops"
+                ),
+                {'ops': ops},
+            )
+        ]
+        sources = [
+            DueNotification(
+                id=uuid.UUID(str(row.id)),
+                user_id=uuid.UUID(str(row.user_id)),
+                type=NotificationType.RIVAL_UPDATE,
+                audience=NotificationAudience.RIVAL_FOLLOWERS,
+                title=row.title,
+                message=row.message,
+            )
+            for row in connection.execute(
+                text(
+                    'SELECT id, user_id, title, message FROM notifications '
+                    "WHERE audience = 'rival_followers'"
+                )
+            )
+        ]
+    barrier = threading.Barrier(workers + 1)
+
+    def worker(index: int) -> None:
+        rng = random.Random(index)  # noqa: S311
+        session = session_factory()
+        usecase = build_usecase(session)
+        repository = usecase.notification_repository
+        now = dt.datetime.now(dt.UTC)
+        barrier.wait()
+        try:
+            for notification_id, user_id in targets[index::workers]:
+                roll = rng.random()
+                if roll < 0.1:
+                    usecase.delete_notification(notification_id, user_id)
+                elif roll < 0.2:
+                    source = rng.choice(sources)
+                    recipients = rng.sample(user_ids, FANOUT_RECIPIENTS)
+                    usecase.unit_of_work.run(
+                        lambda source=source, recipients=recipients: (
+                            repository.insert_fanout(source, recipients, now)
+                        )
+                    )
+                else:
+                    usecase.update_read(
+                        NotificationReadInputDTO(
+                            notification_id=notification_id,
+                            user_id=user_id,
+                            is_read=rng.random() < 0.5,
+                        )
+                    )
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def time_lookups(
+    session_factory: sessionmaker[Session], user_ids: list[uuid.UUID], samples: int
+) -> tuple[list[float], list[float]]:
+    """(未読数の行を読む時間, 未読の通知を数える時間) を samples 人分測る（ミリ秒）"""
+    session = session_factory()
+    repository = NotificationRepositoryImpl(session)
+    rng = random.Random(0)  # noqa: S311
+    sampled = rng.sample(user_ids, min(samples, len(user_ids)))
+    counter, count = [], []
+    try:
+        for user_id in sampled:
+            started = time.perf_counter()
+            repository.get_unread_count(user_id)
+            counter.append((time.perf_counter() - started) * 1000)
+            started = time.perf_counter()
+            repository.count_for_user(user_id, None, False)
+            count.append((time.perf_counter() - started) * 1000)
+    finally:
+        session.close()
+    return counter, count
+
+
+def timing_row(name: str, samples: list[float]) -> tuple[str, ...]:
+    return (
+        name,
+        f'{sum(samples) / len(samples):.3f}',
+        f'{percentile(samples, 50):.3f}',
+        f'{percentile(samples, 95):.3f}',
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'))
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--per-user', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--ops', type=int, default=5000)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--samples', type=int, default=500)
+    args = parser.parse_args()
+
+    if not args.database_url:
+        print('DATABASE_URL もしくは --database-url を指定してください')
+        return 1
+
+    engine = create_engine(
+        args.database_url,
+        pool_size=args.workers + 1,
+        max_overflow=0,
+        # public に同名のテーブルがあっても使わないよう、ベンチマーク用のスキーマだけを見る
+        connect_args={'options': f'-c search_path={SCHEMA}'},
+    )
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    failures = []
+    checks = []
+    try:
+        user_ids = setup_schema(engine, args.users, args.per_user)
+
+        # 1. 未読数のない状態から作る
+        started = time.perf_counter()
+        session = session_factory()
+        try:
+            repair = build_usecase(session).repair_unread_counts(args.batch_size)
+        finally:
+            session.close()
+        mismatched = mismatched_users(engine)
+        checks.append(
+            (
+                'initial repair',
+                f'{repair.corrected:,} corrected',
+                f'{time.perf_counter() - started:.2f}s',
+                str(mismatched),
+            )
+        )
+        if mismatched:
+            failures.append(f'{mismatched} users mismatched after the initial repair')
+
+        # 2. 同時の書き換え
+        elapsed = run_mixed_ops(engine, session_factory, user_ids, args.workers, args.ops)
+        mismatched = mismatched_users(engine)
+        checks.append(
+            (
+                f'{args.ops:,} ops x{args.workers} workers',
+                f'{args.ops / elapsed:,.0f} ops/s',
+                f'{elapsed:.2f}s',
+                str(mismatched),
+            )
+        )
+        if mismatched:
+            failures.append(f'{mismatched} users mismatched after concurrent updates')
+
+        # 3. ずれを入れて修復する
+        with engine.begin() as connection:
+            drifted = connection.execute(
+                text(
+                    'UPDATE notification_counters SET unread_count = unread_count + 3 '
+                    'WHERE user_id IN (SELECT user_id FROM notification_counters '
+                    'ORDER BY user_id LIMIT :limit)'
+                ),
+                {'limit': int(args.users * DRIFT_RATIO)},
+            ).rowcount
+        started = time.perf_counter()
+        session = session_factory()
+        try:
+            repair = build_usecase(session).repair_unread_counts(args.batch_size)
+        finally:
+            session.close()
+        mismatched = mismatched_users(engine)
+        checks.append(
+            (
+                f'repair {drifted:,} drifted',
+                f'{repair.corrected:,} corrected',
+                f'{time.perf_counter() - started:.2f}s',
+                str(mismatched),
+            )
+        )
+        if mismatched or repair.corrected != drifted:
+            failures.append(f'repair corrected {repair.corrected} of {drifted} drifted')
+
+        counter, count = time_lookups(session_factory, user_ids, args.samples)
+        with engine.begin() as connection:
+            connection.execute(text('DROP INDEX ix_notifications_unread'))
+        _, count_without_index = time_lookups(session_factory, user_ids, args.samples)
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        engine.dispose()
+
+    print_table(
+        'Unread counter consistency (PostgreSQL)',
+        checks,
+        ('phase', 'result', 'elapsed', 'mismatched users'),
+    )
+    print_table(
+        f'Unread count per user: {args.users:,} users x {args.per_user} notifications '
+        '(ms)',
+        [
+            timing_row('counter', counter),
+            timing_row('count (partial index)', count),
+            timing_row('count (no partial index)', count_without_index),
+        ],
+        ('method', 'mean', 'p50', 'p95'),
+    )
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f'NG: {failure}')
+        return 1
+    print('OK: unread counters match COUNT(*) for every user')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+オニオンアーキテクチャチェッカー（scripts/check_onion_architecture.py）のベンチマーク
+
+一時ディレクトリに --files 個（既定 5,000）のモジュールからなる合成の app/ ツリーを作り、
+次のモードでチェッカーを実行して時間を比較する。
+
+- cold serial: キャッシュなし・直列で全ファイルを解析する（変更前の方式に相当）
+- cold parallel: キャッシュなし・--jobs プロセスで解析する
+- warm cache: キャッシュ作成後、変更なしで再実行する（内容のハッシュだけ計算する）
+- warm + changed-only: 1ファイルを編集し、そのファイルだけを --changed-only で確認する
+
+ツリーには直接の違反（domain → infrastructure）と推移的な違反
+（application → di → infrastructure）を埋め込む。全体を確認するモードの違反
+（::error 行）が一致しない場合、または changed-only で編集したファイルの違反が
+報告されない場合は終了コード 1 を返す。
+
+使用方法:
+    python scripts/benchmarks/bench_onion_check.py [--files 5000] [--jobs 4] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts import check_onion_architecture as checker  # noqa: E402
+from scripts.benchmarks.common import print_table  # noqa: E402
+
+# レイヤーごとのファイル数の割合と、import してよいレイヤー
+LAYERS = {
+    'domain': (0.2, ('domain',)),
+    'application': (0.2, ('domain', 'application')),
+    'infrastructure': (0.3, ('domain', 'application', 'infrastructure')),
+    'presentation': (0.2, ('domain', 'application', 'presentation')),
+    'di': (0.1, ('domain', 'application', 'infrastructure')),
+}
+MODULES_PER_PACKAGE = 50
+
+
+def module_source(imports: list[str], index: int) -> str:
+    """import 文とそれなりの量の本体を持つモジュールのソース"""
+    lines = [
+        f'from {module.rsplit(".", 1)[0]} import {module.rsplit(".", 1)[1]}'
+        for module in imports
+    ]
+    lines.append('')
+    for i in range(8):
+        lines.extend(
+            [
+                '',
+                f'def function_{index}_{i}(value: int) -> int:',
+                f'    """合成モジュールの関数 {i}"""',
+                f'    total = value + {i}',
+                '    for step in range(3):',
+                '        total += step',
+                '    return total',
+            ]
+        )
+    return '\n'.join(lines) + '\n'
+
+
+def generate_tree(root: Path, files: int, seed: int) -> dict[str, list[str]]:
+    """合成の app/ ツリーを作り、レイヤー（ディレクトリ）ごとのモジュール名を返す"""
+    rng = random.Random(seed)  # noqa: S311
+    modules: dict[str, list[str]] = {}
+    for layer, (share, _) in LAYERS.items():
+        count = max(1, int(files * share))
+        modules[layer] = [
+            f'app.{layer}.pkg{i // MODULES_PER_PACKAGE}.mod{i}' for i in range(count)
+        ]
+
+    for layer, (_, allowed) in LAYERS.items():
+        outer = [module for name in allowed if name != layer for module in modules[name]]
+        for index, module in enumerate(modules[layer]):
+            # 同じレイヤーは番号の小さいモジュールだけを import する（循環させない）
+            candidates = outer + modules[layer][:index]
+            imports = rng.sample(candidates, k=min(4, len(candidates)))
+            path = root / Path(*module.split('.')[1:]).with_suffix('.py')
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(module_source(imports, index), encoding='utf-8')
+
+    # 直接の違反: domain → infrastructure
+    inject(root, modules['domain'][0], modules['infrastructure'][0])
+    # 推移的な違反: application → di（どのレイヤーにも属さない）→ infrastructure
+    inject(root, modules['di'][0], modules['infrastructure'][1])
+    inject(root, modules['application'][0], modules['di'][0])
+    return modules
+
+
+def inject(root: Path, module: str, target: str) -> Path:
+    path = root / Path(*module.split('.')[1:]).with_suffix('.py')
+    package, name = target.rsplit('.', 1)
+    path.write_text(f'from {package} import {name}\n' + path.read_text(encoding='utf-8'))
+    return path
+
+
+def run_checker(argv: list[str]) -> tuple[float, int, list[str]]:
+    """(実行時間[秒], 終了コード, ::error 行) を返す（出力は捨てる）"""
+    output = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        code = checker.main(argv)
+    elapsed = time.perf_counter() - started
+    errors = sorted(
+        line for line in output.getvalue().splitlines() if line.startswith('::error')
+    )
+    return elapsed, code, errors
+
+
+def best_of(
+    repeat: int, run: Callable[[], tuple[float, int, list[str]]]
+) -> tuple[float, int, list[str]]:
+    results = [run() for _ in range(repeat)]
+    return min(results, key=lambda result: result[0])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=5_000)
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app_root = Path(tmp) / 'app'
+        modules = generate_tree(app_root, args.files, args.seed)
+        cache_file = Path(tmp) / 'onion_check.json'
+        base = ['--app-root', str(app_root)]
+        cached = [*base, '--cache-file', str(cache_file), '--jobs', str(args.jobs)]
+
+        def cold_with_cache() -> tuple[float, int, list[str]]:
+            cache_file.unlink(missing_ok=True)
+            return run_checker(cached)
+
+        results = {
+            'cold serial (no cache)': best_of(
+                args.repeat, lambda: run_checker([*base, '--no-cache', '--jobs', '1'])
+            ),
+            f'cold parallel (no cache, {args.jobs} jobs)': best_of(
+                args.repeat,
+                lambda: run_checker([*base, '--no-cache', '--jobs', str(args.jobs)]),
+            ),
+            'cold + write cache': best_of(args.repeat, cold_with_cache),
+            'warm cache': best_of(args.repeat, lambda: run_checker(cached)),
+        }
+
+        edited = inject(app_root, modules['domain'][1], modules['presentation'][0])
+        changed_list = Path(tmp) / 'changed_files.txt'
+        changed_list.write_text(f'{edited}\n', encoding='utf-8')
+        results['warm + 1 edit, changed-only'] = best_of(
+            args.repeat,
+            lambda: run_checker([*cached, '--changed-only', str(changed_list)]),
+        )
+        total_files = sum(1 for _ in app_root.rglob('*.py'))
+
+    baseline = next(iter(results.values()))[0]
+    print_table(
+        f'check_onion_architecture on {total_files:,} synthetic files (best of {args.repeat})',
+        [
+            (
+                name,
+                f'{seconds * 1e3:,.0f}',
+                f'{baseline / seconds:.1f}x',
+                str(len(errors)),
+            )
+            for name, (seconds, _, errors) in results.items()
+        ],
+        ('mode', 'ms', 'speedup', 'errors'),
+    )
+
+    full_runs = list(results.values())[:-1]
+    expected = full_runs[0][2]
+    failures = []
+    if any(errors != expected for _, _, errors in full_runs):
+        failures.append('full runs report different violations')
+    if not any('Transitive forbidden dependency' in line for line in expected):
+        failures.append('the injected transitive violation was not reported')
+    changed_errors = results['warm + 1 edit, changed-only'][2]
+    if not changed_errors or not all(str(edited) in line for line in changed_errors):
+        failures.append('changed-only did not report exactly the edited file')
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f'NG: {failure}')
+        return 1
+    print(f'all full runs report the same {len(expected)} violation(s)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+bcrypt をリクエストスレッドで計算する場合とプロセスプールで計算する場合の比較ベンチマーク
+
+ログイン処理（PasswordHasher によるパスワード検証 + アクセストークン発行）を
+--threads 本のスレッドから同時に実行し、ログインのスループットとレイテンシ、
+同時に流れる軽いリクエスト（トークン検証）のレイテンシを比較する。プールありの場合は混雑時に 503 で拒否された件数も表示する。
+
+使用方法:
+    python scripts/benchmarks/bench_password_pool.py [--threads 16] [--duration 5] [--rounds 10]
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import (  # noqa: E402
+    percentile,
+    print_table,
+    setup_environment,
+)
+
+setup_environment()
+
+from fastapi import HTTPException  # noqa: E402
+from jose import jwt  # noqa: E402
+
+from app.infrastructure.security import password_hasher  # noqa: E402
+from app.infrastructure.security.jwt_key_cache import jwt_key_cache  # noqa: E402
+from app.infrastructure.security.security_service_impl import (  # noqa: E402
+    SecurityServiceImpl,
+)
+
+PASSWORD = 'correct horse battery staple'
+
+
+def run_case(
+    hasher: password_hasher.PasswordHasher,
+    hashed: str,
+    threads: int,
+    duration: float,
+) -> dict[str, object]:
+    service = SecurityServiceImpl()
+    keys = jwt_key_cache.get()
+    token = service.create_access_token(user_id='bench-user')
+
+    # ウォームアップ（プールのワーカープロセス起動を計測から除く）
+    for _ in range(max(hasher.max_workers, 1)):
+        hasher.verify(PASSWORD, hashed)
+
+    login_latencies: list[float] = []
+    probe_latencies: list[float] = []
+    rejected = 0
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def login_worker() -> None:
+        nonlocal rejected
+        local: list[float] = []
+        local_rejected = 0
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                if hasher.verify(PASSWORD, hashed):
+                    service.create_access_token(user_id='bench-user')
+            except HTTPException:
+                local_rejected += 1
+                time.sleep(0.01)
+                continue
+            local.append(time.perf_counter() - started)
+        with lock:
+            login_latencies.extend(local)
+            rejected += local_rejected
+
+    def probe_worker() -> None:
+        while not stop.is_set():
+            started = time.perf_counter()
+            jwt.decode(token, keys.verifying_key, algorithms=[keys.algorithm])
+            probe_latencies.append(time.perf_counter() - started)
+            time.sleep(0.01)
+
+    workers = [threading.Thread(target=login_worker) for _ in range(threads)]
+    workers.append(threading.Thread(target=probe_worker))
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    hasher.shutdown()
+    return {
+        'throughput': len(login_latencies) / elapsed,
+        'login_p50': percentile(login_latencies, 50),
+        'login_p99': percentile(login_latencies, 99),
+        'probe_p99': percentile(probe_latencies, 99),
+        'rejected': rejected,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--rounds', type=int, default=10, help='bcrypt のコスト')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--max-pending', type=int, default=8)
+    args = parser.parse_args()
+
+    hashed = (
+        password_hasher.get_crypt_context()
+        .using(bcrypt__rounds=args.rounds)
+        .hash(PASSWORD)
+    )
+    cases = {
+        'inline (request thread)': password_hasher.PasswordHasher(
+            max_workers=0, max_pending=0
+        ),
+        f'process pool ({args.workers} workers)': password_hasher.PasswordHasher(
+            max_workers=args.workers, max_pending=args.max_pending
+        ),
+    }
+
+    rows = []
+    for name, hasher in cases.items():
+        result = run_case(hasher, hashed, args.threads, args.duration)
+        rows.append(
+            (
+                name,
+                f'{result["throughput"]:,.1f}',
+                f'{result["login_p50"] * 1000:,.1f}',
+                f'{result["login_p99"] * 1000:,.1f}',
+                f'{result["probe_p99"] * 1000:,.2f}',
+                str(result['rejected']),
+            )
+        )
+
+    print_table(
+        f'Login under concurrency ({args.threads} threads, bcrypt rounds={args.rounds})',
+        rows,
+        ('mode', 'logins/s', 'p50 ms', 'p99 ms', 'probe p99 ms', 'rejected (503)'),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+ランキング（Leaderboard）の検証とベンチマーク
+
+1. ランダムなスコア更新を --cases 通り生成し、1ページ分の結果と順位を
+   素朴な全件ソートの結果と比較する。1件でも食い違えば終了コード 1 を返す。
+2. --users 人分のランキングについて、作成・差分更新・ページ取得・順位取得の時間を
+   リクエストごとに全件ソートする場合と比較する。
+3. --database-url（もしくは DATABASE_URL）を指定した場合は、attendance_statistics を
+   ORDER BY + OFFSET で読むページ取得と COUNT による順位取得の時間も計測する
+   （テーブルのデータはそのまま使い、書き込みはしない）。
+
+使用方法:
+    python scripts/benchmarks/bench_ranking.py [--users 100000] [--cases 300]
+        [--database-url postgresql+psycopg://...]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from app.domain.services.leaderboard import Leaderboard  # noqa: E402
+from scripts.benchmarks.common import print_table  # noqa: E402
+
+PAGE_LIMIT = 50
+
+
+def naive_ranking(scores: dict[uuid.UUID, int]) -> list[tuple[int, uuid.UUID, int]]:
+    """スコア降順・ユーザーID順に並べ、同点は同順位にした (順位, ユーザーID, スコア)"""
+    ordered = sorted(
+        ((score, user_id) for user_id, score in scores.items() if score > 0),
+        key=lambda item: (-item[0], item[1]),
+    )
+    ranking = []
+    for position, (score, user_id) in enumerate(ordered):
+        rank = ranking[-1][0] if ranking and ranking[-1][2] == score else position + 1
+        ranking.append((rank, user_id, score))
+    return ranking
+
+
+def check_case(rng: random.Random) -> str | None:
+    """ランダムな更新列の後のページ・順位を素朴な実装と比較し、食い違いを返す"""
+    users = [uuid.uuid4() for _ in range(rng.randint(1, 300))]
+    max_score = rng.choice([3, 30, 3000])
+    board = Leaderboard(capacity=rng.choice([1, 8, 1024]))
+    scores: dict[uuid.UUID, int] = {}
+
+    for _ in range(rng.randint(1, 600)):
+        user_id = rng.choice(users)
+        score = rng.randint(-1, max_score)
+        board.update(user_id, score)
+        scores[user_id] = score
+
+    expected = naive_ranking(scores)
+    if len(board) != len(expected):
+        return f'len: {len(board)} != {len(expected)}'
+
+    offset = rng.randint(0, len(expected) + 5)
+    limit = rng.randint(1, 60)
+    page = [(e.rank, e.user_id, e.score) for e in board.page(offset, limit)]
+    if page != expected[offset : offset + limit]:
+        return f'page(offset={offset}, limit={limit}) differs'
+
+    ranks = {user_id: rank for rank, user_id, _ in expected}
+    for user_id in users:
+        if board.rank_of(user_id) != ranks.get(user_id):
+            return f'rank_of({user_id}): {board.rank_of(user_id)} != {ranks.get(user_id)}'
+    return None
+
+
+def timed_us(func, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def bench_in_memory(
+    rng: random.Random, user_count: int, iterations: int
+) -> list[tuple[str, str, str]]:
+    users = [uuid.uuid4() for _ in range(user_count)]
+    # 参加日数は少数の常連が大きく、大半は小さい分布にする
+    scores = {user_id: int(rng.paretovariate(1.2)) - 1 for user_id in users}
+
+    started = time.perf_counter()
+    board = Leaderboard()
+    board.update_many(scores.items())
+    build = (time.perf_counter() - started) * 1e6
+
+    started = time.perf_counter()
+    naive_ranking(scores)
+    naive_sort = (time.perf_counter() - started) * 1e6
+
+    sample = [rng.choice(users) for _ in range(iterations)]
+    deep_offset = max(len(board) - PAGE_LIMIT, 0)
+    changed = iter(sample)
+
+    def update_one():
+        user_id = next(changed)
+        board.update(user_id, (board.score_of(user_id) or 0) + 1)
+
+    rows = [
+        ('build (all users)', build, naive_sort),
+        ('page top 50', timed_us(lambda: board.page(0, PAGE_LIMIT), iterations), None),
+        (
+            f'page offset {deep_offset:,}',
+            timed_us(lambda: board.page(deep_offset, PAGE_LIMIT), iterations),
+            None,
+        ),
+        (
+            'rank_of (me + 5 rivals)',
+            timed_us(lambda: [board.rank_of(u) for u in sample[:6]], iterations),
+            None,
+        ),
+        ('update one score', timed_us(update_one, iterations), None),
+    ]
+    # 全件ソートではリクエストごとに naive_sort の時間がかかる
+    return [
+        (name, f'{us:,.1f}', f'{(baseline or naive_sort) / us:,.0f}x')
+        for name, us, baseline in rows
+    ]
+
+
+def bench_database(database_url: str, iterations: int) -> list[tuple[str, str]]:
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine(database_url)
+    page_sql = text(
+        'SELECT user_id, total_attendance_days FROM attendance_statistics '
+        'WHERE total_attendance_days > 0 '
+        'ORDER BY total_attendance_days DESC, user_id LIMIT :limit OFFSET :offset'
+    )
+    rank_sql = text(
+        'SELECT count(*) + 1 FROM attendance_statistics '
+        'WHERE total_attendance_days > ('
+        '  SELECT total_attendance_days FROM attendance_statistics WHERE user_id = :user_id'
+        ')'
+    )
+    with engine.connect() as connection:
+        total = connection.execute(
+            text('SELECT count(*) FROM attendance_statistics')
+        ).scalar_one()
+        user_ids = (
+            connection.execute(
+                text('SELECT user_id FROM attendance_statistics LIMIT 100')
+            )
+            .scalars()
+            .all()
+        )
+        if not user_ids:
+            return [('attendance_statistics is empty', '-')]
+        deep_offset = max(total - PAGE_LIMIT, 0)
+
+        def page(offset: int):
+            return lambda: connection.execute(
+                page_sql, {'limit': PAGE_LIMIT, 'offset': offset}
+            ).all()
+
+        def rank():
+            return connection.execute(rank_sql, {'user_id': user_ids[0]}).scalar_one()
+
+        rows = [
+            ('ORDER BY LIMIT 50', timed_us(page(0), iterations)),
+            (f'ORDER BY OFFSET {deep_offset:,}', timed_us(page(deep_offset), iterations)),
+            ('COUNT rank (1 user)', timed_us(rank, iterations)),
+        ]
+    engine.dispose()
+    return [(name, f'{us:,.1f}') for name, us in rows]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--cases', type=int, default=300)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'))
+    args = parser.parse_args()
+
+    # 暗号用途ではない
+    seed = args.seed if args.seed is not None else random.randrange(2**32)  # noqa: S311
+    rng = random.Random(seed)  # noqa: S311
+    for case in range(args.cases):
+        mismatch = check_case(rng)
+        if mismatch:
+            print(f'MISMATCH (seed={seed}, case={case})')
+            print(mismatch)
+            return 1
+    print(f'{args.cases} random cases match naive sort (seed={seed})')
+
+    print_table(
+        f'in-memory leaderboard, {args.users:,} users '
+        '(ratio = naive per-request sort / operation)',
+        bench_in_memory(rng, args.users, args.iterations),
+        ('operation', 'us/op', 'vs sort'),
+    )
+
+    if args.database_url:
+        print_table(
+            'PostgreSQL per-request baseline',
+            bench_database(args.database_url, args.iterations),
+            ('query', 'us/op'),
+        )
+    else:
+        print('\nDATABASE_URL が未指定のため PostgreSQL の計測は省略しました')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
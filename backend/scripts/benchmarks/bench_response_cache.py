@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+レスポンスキャッシュ（GET /users, /ranking/*）の効果を計測するベンチマーク
+
+アプリを TestClient で起動し、ユースケースを --usecase-ms ミリ秒かかる偽物
+（DB の代わり）に差し替えて、GET /users の1リクエストの時間を比較する。
+
+- miss: キャッシュなし（毎回ユースケースを呼ぶ）
+- hit: キャッシュから本文を返す
+- 304: If-None-Match が一致し、本文なしで返す
+
+キャッシュのバックエンドはワーカー内の InMemoryResponseCache と、
+メモリ上の偽の Redis を使った RedisResponseCache の両方で計測する。
+最後に、ユースケースの呼び出し回数から無効化が正しく効いていることを確認し、
+食い違えば終了コード 1 を返す。
+
+使用方法:
+    python scripts/benchmarks/bench_response_cache.py [--requests 500] [--usecase-ms 20]
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import (  # noqa: E402
+    percentile,
+    print_table,
+    setup_environment,
+)
+
+setup_environment(with_jwt_keys=False)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.application.interfaces.response_cache import (  # noqa: E402
+    CacheNamespace,
+    IResponseCache,
+)
+from app.application.schemas.user_schemas import UserListOutputDTO  # noqa: E402
+from app.di.user import get_user_usecase  # noqa: E402
+from app.domain.entities.user_profile import UserProfile  # noqa: E402
+from app.infrastructure.cache.response_cache import (  # noqa: E402
+    InMemoryResponseCache,
+    RedisResponseCache,
+    get_response_cache,
+)
+from app.infrastructure.security.security_service_impl import (  # noqa: E402
+    get_current_user_from_cookie,
+)
+from app.main import app  # noqa: E402
+
+
+class FakeRedis:
+    """RedisResponseCache が使うコマンドだけを持つメモリ上の Redis"""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+
+    def get(self, name: str) -> bytes | None:
+        return self.values.get(name)
+
+    def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self.values.get(key) for key in keys]
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        self.values[name] = value
+        return True
+
+    def incr(self, name: str) -> int:
+        value = int(self.values.get(name, b'0')) + 1
+        self.values[name] = str(value).encode()
+        return value
+
+
+class SlowUserUsecase:
+    """DB への問い合わせの代わりに一定時間待つメンバー一覧ユースケース"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+        self.users = [
+            UserProfile(
+                id=uuid.uuid4(),
+                username=f'user{i}',
+                display_name=f'ユーザー{i}',
+                skills=['Python', 'React'],
+                interests=['読書'],
+                total_attendance_days=i,
+                joined_at=datetime(2026, 1, 1, tzinfo=UTC),
+            )
+            for i in range(20)
+        ]
+
+    def list_users(self, input_dto):
+        self.calls += 1
+        time.sleep(self.delay)
+        return UserListOutputDTO(
+            users=self.users,
+            total=len(self.users),
+            limit=input_dto.limit,
+            has_more=False,
+        )
+
+
+def measure(
+    client: TestClient, requests: int, headers: dict | None = None
+) -> list[float]:
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = client.get('/users', headers=headers)
+        samples.append((time.perf_counter() - started) * 1000)
+        assert response.status_code in (200, 304)
+    return samples
+
+
+def bench_backend(
+    name: str, cache: IResponseCache, usecase: SlowUserUsecase, requests: int
+) -> tuple[list[tuple[str, ...]], str | None]:
+    app.dependency_overrides[get_response_cache] = lambda: cache
+    client = TestClient(app)
+
+    rows = []
+    miss = []
+    for _ in range(requests):
+        cache.invalidate(CacheNamespace.USERS)
+        miss.extend(measure(client, 1))
+    hit = measure(client, requests)
+    etag = client.get('/users').headers['etag']
+    not_modified = measure(client, requests, headers={'If-None-Match': etag})
+
+    for label, samples in (('miss', miss), ('hit', hit), ('304', not_modified)):
+        rows.append(
+            (
+                f'{name} {label}',
+                f'{percentile(samples, 50):.2f}',
+                f'{percentile(samples, 95):.2f}',
+            )
+        )
+
+    # 無効化の確認: 無効化後の1回目だけユースケースを呼び、内容が同じなら ETag も同じ
+    before = usecase.calls
+    cache.invalidate(CacheNamespace.USERS)
+    first = client.get('/users', headers={'If-None-Match': etag})
+    second = client.get('/users')
+    error = None
+    if usecase.calls != before + 1:
+        error = f'{name}: 無効化後のユースケース呼び出しが {usecase.calls - before} 回'
+    elif first.status_code != 304 or second.headers['etag'] != etag:
+        error = f'{name}: 内容が同じなのに ETag が変わった'
+    return rows, error
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--usecase-ms', type=float, default=20.0)
+    args = parser.parse_args()
+
+    usecase = SlowUserUsecase(args.usecase_ms / 1000)
+    app.dependency_overrides[get_user_usecase] = lambda: usecase
+    app.dependency_overrides[get_current_user_from_cookie] = lambda: SimpleNamespace(
+        id=str(uuid.uuid4())
+    )
+
+    rows = []
+    errors = []
+    for name, cache in (
+        ('memory', InMemoryResponseCache(maxsize=1024)),
+        ('redis(fake)', RedisResponseCache(FakeRedis())),
+    ):
+        backend_rows, error = bench_backend(name, cache, usecase, args.requests)
+        rows.extend(backend_rows)
+        if error:
+            errors.append(error)
+
+    print_table(
+        f'GET /users ({args.requests} requests, usecase {args.usecase_ms:.0f}ms)',
+        rows,
+        ('case', 'p50 ms', 'p95 ms'),
+    )
+    for error in errors:
+        print(f'ERROR: {error}')
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+メンバー一覧（GET /users）のクエリのレイテンシを計測するベンチマーク
+
+PostgreSQL 上の専用スキーマに --users 人分のユーザー・メタデータ・ビジョン・
+外部リンク・参加統計・称号を投入し、検索条件ごとに UserProfileRepositoryImpl.search_profiles
+（カーソルで深いページを読む場合を含む）と、include_total 指定時の count_profiles を
+繰り返し実行して p50 / p95 を表示する。ページ取得の全体の p95 が --budget-ms を超えた場合は
+終了コード 1 を返す。
+
+PostgreSQL が必要（DATABASE_URL もしくは --database-url で接続先を指定）。
+pg_trgm 拡張が作成できない環境では trigram インデックスなしで計測する（search が遅くなる）。
+
+使用方法:
+    python scripts/benchmarks/bench_user_directory.py [--users 100000] [--budget-ms 100]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmarks.common import (  # noqa: E402
+    create_tables,
+    percentile,
+    print_table,
+    setup_environment,
+)
+
+setup_environment(with_jwt_keys=False)
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.application.use_cases.user_usecase import MAX_TOTAL_COUNT  # noqa: E402
+from app.domain.repositories.user_profile_repository import (  # noqa: E402
+    UserProfileFilter,
+)
+from app.infrastructure.db.models import Base  # noqa: E402
+from app.infrastructure.db.query_utils import encode_keyset_cursor  # noqa: E402
+from app.infrastructure.db.repositories.user_profile_repository_impl import (  # noqa: E402
+    UserProfileRepositoryImpl,
+)
+
+SCHEMA = 'bench_user_directory'
+
+SKILLS = [
+    'TypeScript', 'React', 'Vue', 'Python', 'Go', 'Rust', 'AWS', 'GCP', 'Docker',
+    'Kubernetes', 'SQL', 'Figma', 'Swift', 'Kotlin', 'Java', 'Ruby', 'PHP', 'C#',
+    'Unity', 'Flutter', 'Node.js', 'Next.js', 'Terraform', 'Linux', 'Excel',
+    'ライティング', 'デザイン', 'マーケティング', '英語', '簿記',
+]  # fmt: skip
+INTERESTS = [
+    '読書', 'ランニング', 'コーヒー', '筋トレ', 'ヨガ', '瞑想', '英会話', '料理',
+    '写真', '登山', 'カメラ', '映画', '音楽', 'ゲーム', '旅行', '投資', '資格勉強',
+    'ブログ', '早起き', '散歩',
+]  # fmt: skip
+
+# シナリオ名 → (絞り込み条件, 何行目の後ろから読むか)
+SCENARIOS = {
+    'no filter': (UserProfileFilter(), 0),
+    'no filter, after 5000 rows': (UserProfileFilter(), 5000),
+    'no filter, after 90000 rows': (UserProfileFilter(), 90000),
+    'search': (UserProfileFilter(search='エンジニア'), 0),
+    'search (ascii)': (UserProfileFilter(search='engineer'), 0),
+    'skills OR': (UserProfileFilter(skills=['Rust', 'Go']), 0),
+    'interests OR': (UserProfileFilter(interests=['瞑想', '登山']), 0),
+    'title levels': (UserProfileFilter(title_levels=[7, 8]), 0),
+    'combined': (
+        UserProfileFilter(search='エンジニア', skills=['React'], title_levels=[3, 4, 5]),
+        0,
+    ),
+}
+
+
+def cursor_after(session: Session, rows: int) -> str | None:
+    """先頭から rows 行目（登録日時の新しい順）の後ろを指すカーソル"""
+    if rows == 0:
+        return None
+    row = session.execute(
+        text(
+            'SELECT created_at, id FROM users WHERE is_active '
+            'ORDER BY created_at DESC, id DESC OFFSET :offset LIMIT 1'
+        ),
+        {'offset': rows - 1},
+    ).one()
+    return encode_keyset_cursor(row.created_at, row.id)
+
+
+def measure(iterations: int, run) -> list[float]:
+    """ウォームアップ後に run を iterations 回実行し、それぞれの所要時間を返す"""
+    run()
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def seed(session: Session, users: int) -> None:
+    """ベンチマーク用のデータを投入"""
+    params = {'users': users, 'skills': SKILLS, 'interests': INTERESTS}
+    statements = [
+        """
+        INSERT INTO users (email, password_hash, username, created_at)
+        SELECT 'user' || g || '@example.com', 'x', 'user_' || g,
+               now() - g * interval '1 minute'
+        FROM generate_series(1, :users) AS g
+        """,
+        """
+        INSERT INTO user_metadata (user_id, display_name, tagline, bio, skills, interests)
+        SELECT u.id,
+               (ARRAY['山田', '佐藤', 'Tanaka', 'Suzuki', '高橋'])[1 + (random() * 4)::int]
+                   || ' ' || u.username,
+               (ARRAY['毎朝5時起きを目指すエンジニア', '朝活で英語を勉強中',
+                      'frontend engineer', 'デザイナー見習い', '朝ランが日課'])
+                   [1 + (random() * 4)::int],
+               '自己紹介文です',
+               ARRAY(SELECT s FROM unnest(CAST(:skills AS text[])) AS s
+                     WHERE random() < 0.1 AND u.id IS NOT NULL),
+               ARRAY(SELECT i FROM unnest(CAST(:interests AS text[])) AS i
+                     WHERE random() < 0.1 AND u.id IS NOT NULL)
+        FROM users AS u
+        """,
+        """
+        INSERT INTO user_visions (user_id, vision, is_public)
+        SELECT id, '技術で社会に貢献する', random() < 0.5 FROM users
+        """,
+        """
+        INSERT INTO user_social_links (user_id, platform, url, is_public)
+        SELECT u.id, p.platform, 'https://example.com/' || u.username, random() < 0.8
+        FROM users AS u
+        CROSS JOIN LATERAL (
+            SELECT platform FROM unnest(ARRAY['twitter', 'github', 'note']) AS platform
+            WHERE random() < 0.5 AND u.id IS NOT NULL
+        ) AS p
+        """,
+        """
+        INSERT INTO attendance_statistics
+            (user_id, total_attendance_days, current_streak_days, max_streak_days)
+        SELECT id, (random() * 400)::int, (random() * 30)::int, (random() * 60)::int
+        FROM users
+        """,
+        """
+        INSERT INTO title_achievements (user_id, title_level, is_current)
+        SELECT id, 1 + (random() * 7)::int, true FROM users
+        """,
+    ]
+    for statement in statements:
+        session.execute(text(statement), params)
+    session.commit()
+    session.execute(text('ANALYZE'))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'))
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--budget-ms', type=float, default=100.0, help='p95 の予算')
+    parser.add_argument('--keep', action='store_true', help='終了後もスキーマを残す')
+    args = parser.parse_args()
+
+    if not args.database_url:
+        print('DATABASE_URL もしくは --database-url を指定してください')
+        return 1
+
+    engine = create_engine(args.database_url)
+    with engine.connect() as connection:
+        connection.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        connection.execute(text(f'CREATE SCHEMA {SCHEMA}'))
+        connection.execute(text(f'SET search_path TO {SCHEMA}, public'))
+        connection.commit()
+        with_trgm = create_tables(connection, Base.metadata)
+        connection.commit()
+        if not with_trgm:
+            print('pg_trgm が使えないため trigram インデックスなしで計測します')
+
+        session = Session(bind=connection)
+        try:
+            started = time.perf_counter()
+            seed(session, args.users)
+            print(f'{args.users:,} users seeded in {time.perf_counter() - started:.1f}s')
+
+            repository = UserProfileRepositoryImpl(session)
+            page_rows = []
+            count_rows = []
+            page_latencies: list[float] = []
+            count_latencies: list[float] = []
+            for name, (filter, after_rows) in SCENARIOS.items():
+                if after_rows >= args.users:
+                    continue
+                cursor = cursor_after(session, after_rows)
+
+                def search(filter=filter, cursor=cursor):
+                    return repository.search_profiles(filter, args.limit, cursor)
+
+                latencies = measure(args.iterations, search)
+                page_latencies.extend(latencies)
+                page_rows.append(
+                    (
+                        name,
+                        f'{len(search().profiles)}',
+                        f'{percentile(latencies, 50) * 1000:.1f}',
+                        f'{percentile(latencies, 95) * 1000:.1f}',
+                    )
+                )
+                if after_rows:
+                    continue
+
+                def count(filter=filter):
+                    return repository.count_profiles(filter, MAX_TOTAL_COUNT + 1)
+
+                latencies = measure(args.iterations, count)
+                count_latencies.extend(latencies)
+                matches = count()
+                count_rows.append(
+                    (
+                        name,
+                        f'{min(matches, MAX_TOTAL_COUNT):,}'
+                        + ('+' if matches > MAX_TOTAL_COUNT else ''),
+                        f'{percentile(latencies, 50) * 1000:.1f}',
+                        f'{percentile(latencies, 95) * 1000:.1f}',
+                    )
+                )
+        finally:
+            session.close()
+            if not args.keep:
+                connection.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+                connection.commit()
+
+    print_table(
+        f'GET /users page query ({args.users:,} users, limit={args.limit})',
+        page_rows,
+        ('scenario', 'rows', 'p50 ms', 'p95 ms'),
+    )
+    print_table(
+        f'GET /users?include_total=true count query (capped at {MAX_TOTAL_COUNT:,})',
+        count_rows,
+        ('scenario', 'total', 'p50 ms', 'p95 ms'),
+    )
+    count_p95_ms = percentile(count_latencies, 95) * 1000
+    print(f'\ncount p95: {count_p95_ms:.1f} ms')
+    p95_ms = percentile(page_latencies, 95) * 1000
+    verdict = 'OK' if p95_ms <= args.budget_ms else 'OVER BUDGET'
+    print(f'page p95: {p95_ms:.1f} ms (budget {args.budget_ms:.0f} ms) -> {verdict}')
+    return 0 if p95_ms <= args.budget_ms else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+ベンチマークスクリプト共通のユーティリティ
+
+各ベンチマークは `python scripts/benchmarks/<name>.py` で単体実行できるようにしている。
+アプリの Settings が要求する環境変数が未設定の場合は、ダミー値を補完する。
+"""
+
+import os
+import statistics
+import time
+from collections.abc import Callable
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from sqlalchemy import Connection, MetaData, text
+from sqlalchemy.exc import DBAPIError
+
+DUMMY_ENV = {
+    'POSTGRES_USER': 'bench_user',
+    'POSTGRES_PASSWORD': 'bench_password',
+    'POSTGRES_DB': 'bench_db',
+    'POSTGRES_HOST': 'localhost',
+}
+
+
+def setup_environment(with_jwt_keys: bool = True) -> None:
+    """ベンチマーク用の環境変数を補完"""
+    for key, value in DUMMY_ENV.items():
+        os.environ.setdefault(key, value)
+
+    if with_jwt_keys and not os.environ.get('JWT_PRIVATE_KEY'):
+        private_pem, public_pem = generate_rsa_pem_pair()
+        os.environ['JWT_ALGORITHM'] = 'RS256'
+        os.environ['JWT_PRIVATE_KEY'] = private_pem.replace('\n', '\\n')
+        os.environ['JWT_PUBLIC_KEY'] = public_pem.replace('\n', '\\n')
+
+
+def generate_rsa_pem_pair() -> tuple[str, str]:
+    """RSA-2048 鍵ペアをPEM文字列で生成"""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_pem.decode('utf-8'), public_pem.decode('utf-8')
+
+
+def measure_throughput(func: Callable[[], object], duration: float = 2.0) -> float:
+    """指定秒数だけ func を繰り返し実行し、1秒あたりの実行回数を返す"""
+    func()  # ウォームアップ
+    count = 0
+    started = time.perf_counter()
+    deadline = started + duration
+    while time.perf_counter() < deadline:
+        func()
+        count += 1
+    return count / (time.perf_counter() - started)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """サンプルのパーセンタイル値を返す（pct は 0-100）"""
+    if not samples:
+        return 0.0
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method='inclusive')[int(pct) - 1]
+
+
+def print_table(title: str, rows: list[tuple[str, ...]], header: tuple[str, ...]) -> None:
+    """結果を整形して出力"""
+    widths = [
+        max(len(str(row[i])) for row in [header, *rows]) for i in range(len(header))
+    ]
+    print(f'\n{title}')
+    print('  '.join(col.ljust(widths[i]) for i, col in enumerate(header)))
+    print('  '.join('-' * width for width in widths))
+    for row in rows:
+        print('  '.join(str(col).ljust(widths[i]) for i, col in enumerate(row)))
+
+
+def create_tables(connection: Connection, metadata: MetaData) -> bool:
+    """
+    ベンチマーク用のスキーマにテーブルを作成
+
+    pg_trgm（gin_trgm_ops）が使えない環境（拡張がインストールされていない、search_path
+    から見えないなど）では trigram インデックスを除いて作成する。
+
+    Returns:
+        bool: trigram インデックスを作成したか
+    """
+    try:
+        with connection.begin_nested():
+            connection.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    except DBAPIError:
+        pass
+    with_trgm = connection.execute(
+        text(
+            'SELECT EXISTS (SELECT 1 FROM pg_opclass '
+            "WHERE opcname = 'gin_trgm_ops' AND pg_opclass_is_visible(oid))"
+        )
+    ).scalar_one()
+    if with_trgm:
+        metadata.create_all(connection)
+        return True
+
+    skipped = {}
+    for table in metadata.tables.values():
+        skipped[table] = {
+            index
+            for index in table.indexes
+            if 'gin_trgm_ops' in index.dialect_options['postgresql']['ops'].values()
+        }
+        table.indexes -= skipped[table]
+    try:
+        metadata.create_all(connection)
+    finally:
+        for table, indexes in skipped.items():
+            table.indexes |= indexes
+    return False
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+bcrypt コスト較正スクリプト
+
+現在のハードウェアでパスワード検証にかかる時間を計測し、
+目標レイテンシに収まる最大の bcrypt コスト（rounds）を表示します。
+コストを1上げると計算時間は約2倍になります。
+
+使用方法:
+    python backend/scripts/calibrate_bcrypt_rounds.py [--target-ms 250]
+    または
+    make calibrate-bcrypt
+
+注意:
+    - 本番と同じスペックのマシン（コンテナのCPU制限も含む）で実行してください
+    - 結果は PASSWORD_BCRYPT_ROUNDS に設定します。コストを上げた場合、
+      既存ユーザーのハッシュは次回ログイン時に自動で再ハッシュされます
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from passlib.context import CryptContext
+
+# bcrypt が受け付けるコストの範囲
+MIN_ROUNDS = 4
+MAX_ROUNDS = 31
+
+PASSWORD = 'calibration-password'
+
+
+def measure_verify_ms(rounds: int, samples: int) -> float:
+    """指定コストでの検証時間（ミリ秒, 中央値）を計測"""
+    context = CryptContext(schemes=['bcrypt'], bcrypt__rounds=rounds)
+    hashed = context.hash(PASSWORD)
+    durations = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.verify(PASSWORD, hashed)
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations)
+
+
+def calibrate(
+    target_ms: float, samples: int, min_rounds: int
+) -> tuple[int | None, list[tuple[int, float]]]:
+    """
+    目標時間内に収まる最大のコストを探す
+
+    Returns:
+        tuple: (推奨コスト。min_rounds でも目標を超える場合は None, 計測結果の一覧)
+    """
+    results: list[tuple[int, float]] = []
+    best = None
+    for rounds in range(min_rounds, MAX_ROUNDS + 1):
+        elapsed_ms = measure_verify_ms(rounds, samples)
+        results.append((rounds, elapsed_ms))
+        if elapsed_ms > target_ms:
+            break
+        best = rounds
+        # 次のコストは約2倍かかるので、明らかに超える場合は計測しない
+        if elapsed_ms * 2 > target_ms * 1.5:
+            break
+    return best, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='bcrypt のコストを較正します')
+    parser.add_argument(
+        '--target-ms',
+        type=float,
+        default=250.0,
+        help='1回の検証にかけてよい時間（ミリ秒, デフォルト: 250）',
+    )
+    parser.add_argument(
+        '--samples', type=int, default=5, help='コストごとの計測回数（デフォルト: 5）'
+    )
+    parser.add_argument(
+        '--min-rounds',
+        type=int,
+        default=10,
+        help='推奨する最小のコスト（デフォルト: 10）',
+    )
+    args = parser.parse_args()
+
+    if not MIN_ROUNDS <= args.min_rounds <= MAX_ROUNDS:
+        print(f'--min-rounds は {MIN_ROUNDS}〜{MAX_ROUNDS} で指定してください')
+        return 1
+
+    print(f'目標: 検証 {args.target_ms:.0f}ms 以内（{args.samples}回の中央値）\n')
+    best, results = calibrate(args.target_ms, args.samples, args.min_rounds)
+
+    for rounds, elapsed_ms in results:
+        mark = '  <- 推奨' if rounds == best else ''
+        print(f'  rounds={rounds:2d}: {elapsed_ms:8.1f} ms{mark}')
+
+    if best is None:
+        print(
+            f'\nコスト {args.min_rounds} でも目標を超えました。'
+            'ハードウェアの増強か目標時間の見直しを検討してください'
+        )
+        return 1
+
+    print(f'\n.env に設定してください:\nPASSWORD_BCRYPT_ROUNDS={best}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
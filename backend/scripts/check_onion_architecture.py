@@ -1,8 +1,37 @@
 #!/usr/bin/env python3
+"""
+オニオンアーキテクチャの依存関係チェッカー
+
+app/ 配下のすべての .py を ast で解析し、import を抽出します。
+抽出結果はファイル内容の SHA-256 をキーにディスク（backend/.cache/onion_check.json）へ
+キャッシュし、内容が変わっていないファイルは再解析しません。キャッシュにないファイルが
+多い場合はプロセスプールで並列に解析します。
+
+直接の import に加えて、app/ 全体の import グラフを辿り、レイヤーに属さないモジュール
+（app.di, app.config など）を経由して禁止レイヤーに届く推移的な違反も検出します。
+
+使用方法:
+    python scripts/check_onion_architecture.py [--jobs N] [--no-cache]
+
+変更ファイルだけを確認する場合:
+    git diff --name-only origin/main... > changed_files.txt
+    python scripts/check_onion_architecture.py --changed-only changed_files.txt
+    変更ファイルの直接の違反と、変更ファイルを含む推移的な違反・循環依存だけを報告します
+    （グラフはキャッシュを使って全体から作ります）。
+"""
+
 from __future__ import annotations
 
+import argparse
 import ast
-from dataclasses import dataclass
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 RED = '\033[0;31m'
@@ -27,15 +56,41 @@ class ImportViolation:
     statement: str
 
 
+@dataclass
+class TransitiveViolation:
+    file: Path
+    lineno: int
+    chain: list[str]
+    rule: LayerRule
+
+
+@dataclass
+class ImportRecord:
+    lineno: int
+    # 解決したインポート元のモジュール（`from x import y` の x）
+    module: str
+    # `from x import y` の x.y（y がサブモジュールの場合のグラフの辺に使う）
+    names: list[str]
+    statement: str
+
+
+@dataclass
+class FileScan:
+    module_path: str
+    imports: list[ImportRecord] = field(default_factory=list)
+    # 読み込み・構文エラー（[read error] / [parse error] の文言）
+    error: str | None = None
+    error_lineno: int = 0
+
+
 SCRIPT_PATH = Path(__file__).resolve()
 REPO_ROOT = SCRIPT_PATH.parents[1]
 APP_ROOT = REPO_ROOT / 'app'
 
-
-if not APP_ROOT.exists():
-    raise SystemExit(
-        f'{RED}Error:{NC} backend/app directory not found at the same level as backend/scripts'
-    )
+CACHE_VERSION = 1
+DEFAULT_CACHE_FILE = REPO_ROOT / '.cache' / 'onion_check.json'
+# キャッシュにないファイルがこれより少なければプロセスプールを使わない（起動コストの方が大きい）
+PARALLEL_THRESHOLD = 256
 
 
 LAYER_RULES: list[LayerRule] = [
@@ -74,10 +129,12 @@ LAYER_PREFIX = {
 }
 
 
-def module_path_from_file(py_file: Path) -> str:
-    rel = py_file.relative_to(APP_ROOT)
+def module_path_from_file(py_file: Path, app_root: Path = APP_ROOT) -> str:
+    rel = py_file.relative_to(app_root)
     without_suffix = rel.with_suffix('')
     parts = ['app', *without_suffix.parts]
+    if parts[-1] == '__init__':
+        parts.pop()
     return '.'.join(parts)
 
 
@@ -99,6 +156,212 @@ def resolve_base_modules(module_path: str, node: ast.AST) -> list[str]:
     return []
 
 
+def iter_import_nodes(tree: ast.Module) -> list[ast.Import | ast.ImportFrom]:
+    """
+    関数内・if TYPE_CHECKING 内なども含めたすべての import 文
+
+    import は文なので、ast.walk のように式のノードまで辿らず、文の本体
+    （body / orelse / finalbody / except 節 / case 節）だけを辿る。
+    """
+    nodes: list[ast.Import | ast.ImportFrom] = []
+    stack: list[ast.AST] = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import | ast.ImportFrom):
+            nodes.append(node)
+            continue
+        for name in ('body', 'orelse', 'finalbody', 'handlers', 'cases'):
+            children = getattr(node, name, None)
+            if isinstance(children, list):
+                stack.extend(children)
+    nodes.sort(key=lambda node: (node.lineno, node.col_offset))
+    return nodes
+
+
+def scan_source(module_path: str, source: bytes) -> FileScan:
+    """ファイルの import 文を抽出（プロセスプールのワーカーでも実行する）"""
+    scan = FileScan(module_path=module_path)
+    try:
+        text = source.decode('utf-8')
+        tree = ast.parse(text)
+    except UnicodeDecodeError as exc:
+        scan.error = f'[read error] {exc}'
+        return scan
+    except SyntaxError as exc:
+        scan.error = f'[parse error] {exc.msg}'
+        scan.error_lineno = exc.lineno or 0
+        return scan
+
+    lines = text.splitlines()
+    for node in iter_import_nodes(tree):
+        lineno = getattr(node, 'lineno', 0)
+        statement = lines[lineno - 1].strip() if 0 < lineno <= len(lines) else ''
+        for module in resolve_base_modules(module_path, node):
+            if not module:
+                continue
+            names = (
+                [f'{module}.{alias.name}' for alias in node.names]
+                if isinstance(node, ast.ImportFrom)
+                else []
+            )
+            scan.imports.append(ImportRecord(lineno, module, names, statement))
+    return scan
+
+
+def _scan_worker(item: tuple[str, bytes]) -> FileScan:
+    return scan_source(*item)
+
+
+class ScanCache:
+    """ファイル内容の SHA-256 をキーにした import 抽出結果のキャッシュ"""
+
+    def __init__(self, path: Path | None):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.dirty = False
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get('version') == self._version():
+            self.entries = data.get('files', {})
+
+    @staticmethod
+    def _version() -> str:
+        # ast の結果は Python のバージョンで変わりうる
+        return f'{CACHE_VERSION}-py{sys.version_info[0]}.{sys.version_info[1]}'
+
+    def get(self, key: str, digest: str) -> FileScan | None:
+        entry = self.entries.get(key)
+        if entry is None or entry['sha256'] != digest:
+            return None
+        scan = entry['scan']
+        return FileScan(
+            module_path=scan['module_path'],
+            imports=[ImportRecord(*record) for record in scan['imports']],
+            error=scan['error'],
+            error_lineno=scan['error_lineno'],
+        )
+
+    def put(self, key: str, digest: str, scan: FileScan) -> None:
+        self.entries[key] = {
+            'sha256': digest,
+            'scan': {
+                'module_path': scan.module_path,
+                'imports': [
+                    [r.lineno, r.module, r.names, r.statement] for r in scan.imports
+                ],
+                'error': scan.error,
+                'error_lineno': scan.error_lineno,
+            },
+        }
+        self.dirty = True
+
+    def save(self, keep: set[str]) -> None:
+        """今回走査したファイルだけを残して保存（削除されたファイルを持ち越さない）"""
+        if self.path is None:
+            return
+        stale = self.entries.keys() - keep
+        if not self.dirty and not stale:
+            return
+        for key in stale:
+            del self.entries[key]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps({'version': self._version(), 'files': self.entries}),
+            encoding='utf-8',
+        )
+
+
+@dataclass
+class ScanStats:
+    files: int = 0
+    cache_hits: int = 0
+    parsed: int = 0
+    jobs: int = 1
+    seconds: float = 0.0
+
+
+def scan_tree(
+    app_root: Path, cache: ScanCache, jobs: int
+) -> tuple[dict[Path, FileScan], ScanStats]:
+    """app_root 配下の全ファイルを走査（キャッシュにないものだけ解析する）"""
+    started = time.perf_counter()
+    stats = ScanStats()
+    scans: dict[Path, FileScan] = {}
+    misses: list[tuple[Path, str, str, bytes]] = []
+    for py_file in sorted(app_root.rglob('*.py')):
+        key = py_file.relative_to(app_root).as_posix()
+        try:
+            source = py_file.read_bytes()
+        except OSError as exc:
+            scans[py_file] = FileScan(
+                module_path_from_file(py_file, app_root), error=f'[read error] {exc}'
+            )
+            continue
+        digest = hashlib.sha256(source).hexdigest()
+        cached = cache.get(key, digest)
+        if cached is not None:
+            scans[py_file] = cached
+            stats.cache_hits += 1
+        else:
+            misses.append((py_file, key, digest, source))
+
+    items = [
+        (module_path_from_file(py_file, app_root), source)
+        for py_file, _, _, source in misses
+    ]
+    if jobs > 1 and len(items) >= PARALLEL_THRESHOLD:
+        stats.jobs = jobs
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(
+                executor.map(
+                    _scan_worker, items, chunksize=max(1, len(items) // (jobs * 4))
+                )
+            )
+    else:
+        results = [scan_source(*item) for item in items]
+
+    for (py_file, key, digest, _), scan in zip(misses, results, strict=True):
+        scans[py_file] = scan
+        cache.put(key, digest, scan)
+
+    cache.save({py_file.relative_to(app_root).as_posix() for py_file in scans})
+    stats.files = len(scans)
+    stats.parsed = len(misses)
+    stats.seconds = time.perf_counter() - started
+    return scans, stats
+
+
+def build_import_graph(
+    scans: dict[Path, FileScan],
+) -> tuple[dict[str, set[str]], dict[tuple[str, str], int]]:
+    """
+    app.* モジュールの import グラフ
+
+    `from package import module` は、module がファイルとして存在すればそのモジュールへの
+    辺にする（名前空間パッケージで package のファイルがないため）。
+
+    Returns:
+        tuple: (モジュール → import するモジュール, (辺) → import 文の行番号)
+    """
+    known = {scan.module_path for scan in scans.values()}
+    graph: dict[str, set[str]] = {}
+    linenos: dict[tuple[str, str], int] = {}
+    for scan in scans.values():
+        targets = graph.setdefault(scan.module_path, set())
+        for record in scan.imports:
+            if not (record.module == 'app' or record.module.startswith('app.')):
+                continue
+            submodules = [name for name in record.names if name in known]
+            for target in submodules or [record.module]:
+                targets.add(target)
+                linenos.setdefault((scan.module_path, target), record.lineno)
+    return graph, linenos
+
+
 def classify_module(module: str) -> str | None:
     for layer, prefix in LAYER_PREFIX.items():
         if module == prefix or module.startswith(prefix + '.'):
@@ -150,63 +413,41 @@ def print_overview() -> None:
 
 def check_layer(
     rule: LayerRule,
-    graph: dict[str, set[str]],
-    files_checked: set[Path],
+    scans: dict[Path, FileScan],
+    app_root: Path,
+    changed: set[Path] | None,
 ) -> list[ImportViolation]:
-    layer_path = APP_ROOT / rule.directory
+    layer_path = app_root / rule.directory
+    layer_module = f'app.{rule.directory}'
     print(f'{YELLOW}Checking:{NC} {rule.name} layer dependencies...')
     if not layer_path.exists():
         print(f'  ⚠️  {rule.name} layer not found at {rel_to_repo(layer_path)}\n')
         return []
 
     violations: list[ImportViolation] = []
-    for py_file in layer_path.rglob('*.py'):
-        files_checked.add(py_file)
-        try:
-            source = py_file.read_text(encoding='utf-8')
-        except OSError as exc:
-            violations.append(ImportViolation(py_file, 0, 'N/A', f'[read error] {exc}'))
+    for py_file, scan in scans.items():
+        module = scan.module_path
+        if not (module == layer_module or module.startswith(layer_module + '.')):
             continue
-        try:
-            tree = ast.parse(source)
-        except SyntaxError as exc:
+        if changed is not None and py_file not in changed:
+            continue
+        if scan.error:
             violations.append(
-                ImportViolation(
-                    py_file, exc.lineno or 0, 'N/A', f'[parse error] {exc.msg}'
-                )
+                ImportViolation(py_file, scan.error_lineno, 'N/A', scan.error)
             )
             continue
-
-        module_path = module_path_from_file(py_file)
-        source_layer = classify_module(module_path)
-        if not source_layer:
+        if not classify_module(scan.module_path):
             continue
-        graph.setdefault(module_path, set())
-
-        lines = source.splitlines()
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Import | ast.ImportFrom):
-                continue
-            modules = resolve_base_modules(module_path, node)
-            if not modules:
-                continue
-            lineno = getattr(node, 'lineno', 0)
-            statement = lines[lineno - 1].strip() if 0 < lineno <= len(lines) else ''
-            for module in modules:
-                if not module:
-                    continue
-                dest_layer = classify_module(module)
-                if dest_layer:
-                    graph.setdefault(module_path, set()).add(module)
-                if is_forbidden(module, rule.forbidden):
-                    violations.append(
-                        ImportViolation(
-                            file=py_file,
-                            lineno=lineno,
-                            module=module,
-                            statement=statement,
-                        )
-                    )
+        violations.extend(
+            ImportViolation(
+                file=py_file,
+                lineno=record.lineno,
+                module=record.module,
+                statement=record.statement,
+            )
+            for record in scan.imports
+            if is_forbidden(record.module, rule.forbidden)
+        )
 
     if violations:
         print(f'{RED}❌{NC} Forbidden dependencies detected in {rule.name} layer:')
@@ -230,15 +471,90 @@ def check_layer(
     return violations
 
 
-def detect_circular_dependencies(graph: dict[str, set[str]]) -> set[tuple[str, str]]:
+def find_transitive_violations(
+    graph: dict[str, set[str]],
+    linenos: dict[tuple[str, str], int],
+    files: dict[str, Path],
+) -> list[TransitiveViolation]:
+    """
+    レイヤーに属さないモジュールだけを経由して禁止レイヤーに届く依存を探す
+
+    経由するモジュールがレイヤーに属する場合は、そのモジュール自身の（直接・推移的な）
+    違反として報告されるため、ここでは辿らない。禁止レイヤーごとに最短の経路を1つ返す。
+    """
+    rules = {rule.name: rule for rule in LAYER_RULES}
+    violations: list[TransitiveViolation] = []
+    for source in sorted(graph):
+        layer = classify_module(source)
+        if layer is None or not rules[layer].forbidden:
+            continue
+        rule = rules[layer]
+        parents: dict[str, str] = {}
+        queue = deque(
+            target for target in sorted(graph[source]) if classify_module(target) is None
+        )
+        for target in queue:
+            parents[target] = source
+        reported: set[str] = set()
+        while queue:
+            module = queue.popleft()
+            for target in sorted(graph.get(module, ())):
+                if target in parents or target == source:
+                    continue
+                parents[target] = module
+                target_layer = classify_module(target)
+                if target_layer is None:
+                    queue.append(target)
+                elif (
+                    is_forbidden(target, rule.forbidden) and target_layer not in reported
+                ):
+                    reported.add(target_layer)
+                    chain = [target]
+                    while chain[-1] != source:
+                        chain.append(parents[chain[-1]])
+                    chain.reverse()
+                    violations.append(
+                        TransitiveViolation(
+                            file=files[source],
+                            lineno=linenos.get((source, chain[1]), 0),
+                            chain=chain,
+                            rule=rule,
+                        )
+                    )
+    return violations
+
+
+def report_transitive_violations(violations: list[TransitiveViolation]) -> None:
+    print(f'{YELLOW}Checking:{NC} Transitive dependencies...')
+    if not violations:
+        print(f'{GREEN}✅{NC} No transitive forbidden dependencies found\n')
+        return
+    print(f'{RED}❌{NC} Forbidden dependencies reached through other modules:')
+    for violation in violations:
+        path = ' → '.join(violation.chain)
+        emit_error_annotation(
+            violation.file, violation.lineno, f'Transitive forbidden dependency: {path}'
+        )
+        print(f'    └─ {rel_to_repo(violation.file)}:{violation.lineno}')
+        print(f'       ⤷ {path}')
+    print()
+
+
+def detect_circular_dependencies(
+    graph: dict[str, set[str]], changed_modules: set[str] | None = None
+) -> set[tuple[str, str]]:
     print(f'{YELLOW}Checking:{NC} Circular dependencies...')
     pairs: set[tuple[str, str]] = set()
     for src, targets in graph.items():
+        if not classify_module(src):
+            continue
         for dst in targets:
-            if src == dst:
+            if src == dst or not classify_module(dst):
                 continue
             if src in graph.get(dst, set()):
                 pairs.add(tuple(sorted((src, dst))))
+    if changed_modules is not None:
+        pairs = {pair for pair in pairs if changed_modules.intersection(pair)}
     if pairs:
         print(f'{RED}❌{NC} Circular dependencies detected:')
         for a, b in sorted(pairs):
@@ -250,31 +566,109 @@ def detect_circular_dependencies(graph: dict[str, set[str]]) -> set[tuple[str, s
     return pairs
 
 
-def main() -> int:
+def read_changed_files(file_list: str, app_root: Path) -> set[Path]:
+    """
+    変更ファイルの一覧（1行1パス、'-' で標準入力）から app 配下の .py を取り出す
+
+    パスはカレントディレクトリ・backend・リポジトリのルートのいずれからの相対でもよい。
+    """
+    lines = (
+        sys.stdin.read().splitlines()
+        if file_list == '-'
+        else Path(file_list).read_text(encoding='utf-8').splitlines()
+    )
+    bases = (Path.cwd(), app_root.parent, app_root.parent.parent)
+    changed: set[Path] = set()
+    for line in lines:
+        name = line.strip()
+        if not name.endswith('.py'):
+            continue
+        for base in bases:
+            path = (base / name).resolve()
+            if path.is_relative_to(app_root):
+                changed.add(path)
+                break
+    return changed
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='キャッシュにないファイルを解析するプロセス数（1 は直列）',
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true', help='解析キャッシュを使わない'
+    )
+    parser.add_argument(
+        '--cache-file', type=Path, default=DEFAULT_CACHE_FILE, help='解析キャッシュのパス'
+    )
+    parser.add_argument(
+        '--changed-only',
+        metavar='FILE_LIST',
+        help='一覧のファイルに関わる違反だけを報告（1行1パス、- で標準入力）',
+    )
+    parser.add_argument(
+        '--app-root', type=Path, default=APP_ROOT, help='チェックする app ディレクトリ'
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    app_root = args.app_root.resolve()
+    if not app_root.exists():
+        raise SystemExit(
+            f'{RED}Error:{NC} backend/app directory not found at the same level as backend/scripts'
+        )
+
     print_header()
     print_overview()
     print('🔍 Running dependency checks...')
     print('━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n')
 
-    dependency_graph: dict[str, set[str]] = {}
-    violations_map: dict[str, list[ImportViolation]] = {}
-    files_checked: set[Path] = set()
+    cache = ScanCache(None if args.no_cache else args.cache_file)
+    scans, stats = scan_tree(app_root, cache, max(args.jobs, 1))
+    dependency_graph, linenos = build_import_graph(scans)
+    files = {scan.module_path: path for path, scan in scans.items()}
+
+    changed = None
+    changed_modules = None
+    if args.changed_only is not None:
+        changed = read_changed_files(args.changed_only, app_root)
+        changed_modules = {scans[path].module_path for path in changed if path in scans}
 
+    violations_map: dict[str, list[ImportViolation]] = {}
     for rule in LAYER_RULES:
-        violations = check_layer(rule, dependency_graph, files_checked)
+        violations = check_layer(rule, scans, app_root, changed)
         violations_map[rule.name] = violations
 
-    cycles = detect_circular_dependencies(dependency_graph)
+    transitive = find_transitive_violations(dependency_graph, linenos, files)
+    if changed_modules is not None:
+        transitive = [v for v in transitive if changed_modules.intersection(v.chain)]
+    report_transitive_violations(transitive)
+
+    cycles = detect_circular_dependencies(dependency_graph, changed_modules)
 
     print('━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━')
     print('📋 Summary')
     print('━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n')
 
+    files_checked = f'{len(scans)} files checked'
+    if changed is not None:
+        files_checked += f' ({len(changed)} changed)'
+    files_checked += (
+        f'. Scan: {stats.seconds * 1000:,.0f} ms, {stats.cache_hits} cached, '
+        f'{stats.parsed} parsed ({stats.jobs} process{"es" if stats.jobs > 1 else ""}).'
+    )
+
     violation_count = sum(len(items) for items in violations_map.values())
-    if violation_count == 0 and not cycles:
+    if violation_count == 0 and not transitive and not cycles:
         print(f'{GREEN}✅ All architecture checks passed{NC}\n')
         print('Code follows Onion Architecture principles.')
-        print(f'\n{len(files_checked)} files checked.')
+        print(f'\n{files_checked}')
         return 0
 
     if violation_count:
@@ -283,13 +677,17 @@ def main() -> int:
             items = violations_map[rule.name]
             if items:
                 print(f'- {rule.name}: {rule.description}')
+    if transitive:
+        print(
+            f'- Transitive: {len(transitive)} forbidden dependency chain(s) through modules outside the layers (e.g. app.di).'
+        )
     if cycles:
         print(
             '- Circular dependencies: Please resolve mutual dependencies between the modules above.'
         )
 
     print('\nPlease fix violations to maintain Onion Architecture.')
-    print(f'\n{len(files_checked)} files checked.')
+    print(f'\n{files_checked}')
     return 1
 
 
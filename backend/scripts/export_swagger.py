@@ -1,20 +1,85 @@
 #!/usr/bin/env python3
 """
 Export Swagger documentation from FastAPI application to HTML file.
+
+The routers listed in app.presentation.api.routers are imported directly instead of
+app.main, so neither logging nor the database engine is initialised.
+
+Usage:
+    python scripts/export_swagger.py                  # regenerate the whole spec
+    python scripts/export_swagger.py --incremental    # regenerate changed routers only
+
+Incremental mode fingerprints each router by the source of its module and every
+app.* module it imports (read with ast, without importing anything), plus the
+FastAPI/Pydantic versions and this script. Only routers whose fingerprint changed
+are imported and regenerated; the path items and components of the others come
+from the cache file. If two routers produce different components under the same
+name (which the whole-app generation would have renamed), it falls back to the
+full regeneration. In both modes a file is only written when its content changed.
 """
 
+import argparse
+import ast
+import asyncio
+import hashlib
 import json
 import sys
+import time
+from dataclasses import dataclass
+from functools import cache
+from importlib import metadata
 from pathlib import Path
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 # Add backend directory to Python path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
-# Import app from main.py
-from app.main import app  # noqa: E402
+from app.presentation.api.routers import (  # noqa: E402
+    API_TITLE,
+    API_VERSION,
+    ROUTER_MODULES,
+    load_router,
+)
 from scripts.openapi_sorter import sort_openapi_paths  # noqa: E402
 
+OUTPUT_DIR = backend_dir / 'documents' / 'api'
+DEFAULT_CACHE_FILE = backend_dir / '.cache' / 'export_swagger.json'
+CACHE_VERSION = 1
+
+# Order of the OpenAPI / Components objects (as serialised by FastAPI)
+TOP_LEVEL_ORDER = ('openapi', 'info', 'servers', 'paths', 'webhooks', 'components')
+COMPONENTS_ORDER = (
+    'schemas',
+    'responses',
+    'parameters',
+    'examples',
+    'requestBodies',
+    'headers',
+    'securitySchemes',
+    'links',
+    'callbacks',
+    'pathItems',
+)
+
+
+class ComponentConflictError(Exception):
+    """Two routers define different components under the same name."""
+
+
+@dataclass
+class RouterSpec:
+    """Resolved OpenAPI fragment generated from a single router."""
+
+    fingerprint: str
+    header: dict
+    paths: dict
+    components: dict
+
 
 def generate_swagger_html(openapi_json: dict) -> str:
     """Generate HTML with embedded Swagger UI."""
@@ -103,35 +168,241 @@ def resolve_refs(schema: dict, root_schema: dict) -> dict:
         return schema
 
 
-def main():
-    """Main function to export Swagger HTML."""
-    # Get OpenAPI schema from FastAPI app
-    openapi_schema = app.openapi()
+def module_file(module_name: str) -> Path | None:
+    """Source file of an app.* module (None for packages without __init__.py)."""
+    base = backend_dir.joinpath(*module_name.split('.'))
+    for candidate in (base.with_suffix('.py'), base / '__init__.py'):
+        if candidate.is_file():
+            return candidate
+    return None
 
+
+@cache
+def read_module(module_name: str) -> tuple[bytes, frozenset[str]]:
+    """
+    Source of an app.* module and the app.* modules it imports
+    (including `from package import module`). Cached because routers share most modules.
+    """
+    path = module_file(module_name)
+    if path is None:
+        return b'', frozenset()
+    source = path.read_bytes()
+    modules: set[str] = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.add(node.module)
+            modules.update(f'{node.module}.{alias.name}' for alias in node.names)
+    return source, frozenset(
+        name for name in modules if name == 'app' or name.startswith('app.')
+    )
+
+
+def environment_fingerprint() -> str:
+    """Inputs shared by every router: library versions, this script, routers.py."""
+    digest = hashlib.sha256()
+    for package in ('fastapi', 'pydantic'):
+        digest.update(f'{package}=={metadata.version(package)}\n'.encode())
+    for path in (
+        Path(__file__),
+        backend_dir / 'scripts' / 'openapi_sorter.py',
+        module_file('app.presentation.api.routers'),
+    ):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def router_fingerprint(module_name: str, environment: str) -> str:
+    """Hash of the router module and the source of every app.* module it imports."""
+    sources: dict[str, bytes] = {}
+    pending = [module_name]
+    while pending:
+        name = pending.pop()
+        if name in sources:
+            continue
+        sources[name], imports = read_module(name)
+        pending.extend(imports - sources.keys())
+
+    digest = hashlib.sha256(environment.encode())
+    for name in sorted(sources):
+        digest.update(f'{name}\n'.encode())
+        digest.update(hashlib.sha256(sources[name]).digest())
+    return digest.hexdigest()
+
+
+def generate_spec(routes: list) -> dict:
+    """OpenAPI schema for the given routes, with every $ref resolved."""
+    from fastapi.openapi.utils import get_openapi
+
+    openapi_schema = get_openapi(title=API_TITLE, version=API_VERSION, routes=routes)
     # Resolve all $ref to avoid reference resolution issues in standalone HTML
-    openapi_schema = resolve_refs(openapi_schema, openapi_schema)
+    return resolve_refs(openapi_schema, openapi_schema)
+
+
+def generate_router_spec(module_name: str, fingerprint: str) -> RouterSpec:
+    spec = generate_spec(load_router(module_name).routes)
+    return RouterSpec(
+        fingerprint=fingerprint,
+        header={key: spec[key] for key in ('openapi', 'info')},
+        paths=spec.get('paths', {}),
+        components=spec.get('components', {}),
+    )
 
-    # Sort the paths alphabetically
-    sorted_schema = sort_openapi_paths(openapi_schema)
 
-    # Generate HTML
-    html_content = generate_swagger_html(sorted_schema)
+def generate_full_spec() -> dict:
+    """Whole-app generation (the same routes as app.main, without importing it)."""
+    routes = [route for name in ROUTER_MODULES for route in load_router(name).routes]
+    return generate_spec(routes)
+
+
+def assemble_spec(specs: list[RouterSpec]) -> dict:
+    """
+    Merge router fragments in ROUTER_MODULES order, as get_openapi() does for the app.
+
+    Raises:
+        ComponentConflictError: a component name maps to different schemas
+    """
+    paths: dict = {}
+    components: dict = {}
+    for spec in specs:
+        for path, item in spec.paths.items():
+            paths.setdefault(path, {}).update(item)
+        for kind, definitions in spec.components.items():
+            merged = components.setdefault(kind, {})
+            for name, definition in definitions.items():
+                if merged.setdefault(name, definition) != definition:
+                    raise ComponentConflictError(f'{kind}/{name}')
+
+    if 'schemas' in components:
+        components['schemas'] = dict(sorted(components['schemas'].items()))
+    output = {**specs[0].header, 'paths': paths}
+    if components:
+        output['components'] = {
+            kind: components[kind] for kind in COMPONENTS_ORDER if kind in components
+        }
+    return {key: output[key] for key in TOP_LEVEL_ORDER if key in output}
+
+
+def load_cache(cache_file: Path, environment: str) -> dict[str, RouterSpec]:
+    try:
+        cache = json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != CACHE_VERSION or cache.get('environment') != environment:
+        return {}
+    return {name: RouterSpec(**entry) for name, entry in cache['routers'].items()}
+
+
+def save_cache(cache_file: Path, environment: str, specs: dict[str, RouterSpec]) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache = {
+        'version': CACHE_VERSION,
+        'environment': environment,
+        'routers': {name: spec.__dict__ for name, spec in specs.items()},
+    }
+    cache_file.write_text(json.dumps(cache), encoding='utf-8')
+
+
+async def build_incremental(cache_file: Path) -> tuple[dict, list[str]]:
+    """
+    Regenerate only the routers whose fingerprint changed.
+
+    Returns:
+        tuple: (sorted OpenAPI schema, regenerated router modules)
+    """
+    environment = environment_fingerprint()
+    # Read the cache while the sources are hashed
+    cache_task = asyncio.create_task(
+        asyncio.to_thread(load_cache, cache_file, environment)
+    )
+    fingerprints = [router_fingerprint(name, environment) for name in ROUTER_MODULES]
+    cached = await cache_task
+
+    specs: dict[str, RouterSpec] = {}
+    regenerated = []
+    for name, fingerprint in zip(ROUTER_MODULES, fingerprints, strict=True):
+        spec = cached.get(name)
+        if spec is None or spec.fingerprint != fingerprint:
+            # Schema generation is CPU-bound, so routers are generated one at a time
+            spec = generate_router_spec(name, fingerprint)
+            regenerated.append(name)
+        specs[name] = spec
+
+    try:
+        openapi_schema = assemble_spec(list(specs.values()))
+    except ComponentConflictError as e:
+        print(f'Component {e} differs between routers; regenerating the whole spec')
+        openapi_schema = generate_full_spec()
+        regenerated = list(ROUTER_MODULES)
+
+    if regenerated:
+        await asyncio.to_thread(save_cache, cache_file, environment, specs)
+    return sort_openapi_paths(openapi_schema), regenerated
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write the file only if its content differs. Returns whether it was written."""
+    data = content.encode('utf-8')
+    if path.is_file() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
+
+async def export(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    if args.incremental:
+        sorted_schema, regenerated = await build_incremental(args.cache_file)
+        print(f'Regenerated routers: {", ".join(regenerated) or "none"}')
+    else:
+        # Sort the paths alphabetically
+        sorted_schema = sort_openapi_paths(generate_full_spec())
+    generated = time.perf_counter()
 
     # Create output directory if it doesn't exist
-    output_dir = backend_dir / 'documents' / 'api'
-    output_dir.mkdir(parents=True, exist_ok=True)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    outputs = {
+        OUTPUT_DIR / 'swagger.html': generate_swagger_html(sorted_schema),
+        # Also export raw OpenAPI JSON for reference (sorted version)
+        OUTPUT_DIR / 'openapi.json': json.dumps(sorted_schema, indent=2),
+    }
+    written = await asyncio.gather(
+        *(
+            asyncio.to_thread(write_if_changed, path, content)
+            for path, content in outputs.items()
+        )
+    )
+    finished = time.perf_counter()
 
-    # Write HTML file
-    output_file = output_dir / 'swagger.html'
-    output_file.write_text(html_content, encoding='utf-8')
+    for (path, content), changed in zip(outputs.items(), written, strict=True):
+        state = 'exported to' if changed else 'unchanged, skipped'
+        print(f'{path.name} {state}: {path} ({len(content):,} bytes)')
+    print(
+        f'Generation: {(generated - started) * 1000:,.0f} ms, '
+        f'write: {(finished - generated) * 1000:,.0f} ms'
+    )
+    if resource is not None:
+        # ru_maxrss is in KiB on Linux
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f'Peak memory (RSS): {peak / 1024:,.1f} MiB')
 
-    print(f'Swagger HTML exported to: {output_file}')
-    print(f'File size: {len(html_content):,} bytes')
 
-    # Also export raw OpenAPI JSON for reference (sorted version)
-    openapi_file = output_dir / 'openapi.json'
-    openapi_file.write_text(json.dumps(sorted_schema, indent=2), encoding='utf-8')
-    print(f'OpenAPI JSON also exported to: {openapi_file}')
+def main():
+    """Main function to export Swagger HTML."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='regenerate only the routers that changed since the cached run',
+    )
+    parser.add_argument(
+        '--cache-file',
+        type=Path,
+        default=DEFAULT_CACHE_FILE,
+        help='cache of per-router fragments used by --incremental',
+    )
+    asyncio.run(export(parser.parse_args()))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+通知の配信ワーカー
+
+送信予定時刻を過ぎた未送信の通知を NOTIFICATION_DISPATCH_BATCH_SIZE 件ずつ
+FOR UPDATE SKIP LOCKED で確保して配信します。通知がなくなったら
+NOTIFICATION_POLL_SECONDS 秒待って再び確認します。確保した通知はコミットまで
+ほかのワーカーから見えないため、このワーカーは複数のプロセス・ホストで同時に
+動かして構いません（二重に配信しません）。
+
+- 本人宛ての通知: 通知設定でそのタイプを無効にしているユーザーの分は削除し、
+  残りを送信済みにします
+- rival_followers の通知（ライバル更新・称号獲得）: そのユーザーをライバルに
+  設定しているユーザーへ複数行の INSERT で複製します
+
+使用方法:
+    python scripts/notification_worker.py            # 常駐して配信する
+    python scripts/notification_worker.py --once     # 配信できる通知がなくなったら終了
+    python scripts/notification_worker.py --schedule-reminders [YYYY-MM-DD]
+    または
+    make notification-worker / make schedule-reminders
+
+リマインダーの予約（--schedule-reminders）は cron などで1日1回、その日の
+リマインダー送信時刻より前に実行してください（再実行しても重複しません）。
+"""
+
+import argparse
+import datetime as dt
+import logging
+import signal
+import sys
+import threading
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from app.application.use_cases.notification_dispatch_usecase import (  # noqa: E402
+    NotificationDispatchUsecase,
+)
+from app.config import get_settings  # noqa: E402
+from app.infrastructure.cache.notification_settings_cache import (  # noqa: E402
+    CachedNotificationSettingsRepository,
+    get_notification_settings_cache,
+)
+from app.infrastructure.db.repositories.notification_repository_impl import (  # noqa: E402
+    NotificationRepositoryImpl,
+)
+from app.infrastructure.db.repositories.notification_settings_repository_impl import (  # noqa: E402
+    NotificationSettingsRepositoryImpl,
+)
+from app.infrastructure.db.repositories.user_rival_repository_impl import (  # noqa: E402
+    UserRivalRepositoryImpl,
+)
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork  # noqa: E402
+
+logger = logging.getLogger('notification_worker')
+
+BATCHES_PER_ROUND = 10
+
+
+def build_usecase(
+    uow: SQLAlchemyUnitOfWork, batch_size: int
+) -> NotificationDispatchUsecase:
+    return NotificationDispatchUsecase(
+        notification_repository=NotificationRepositoryImpl(uow.session),
+        notification_settings_repository=CachedNotificationSettingsRepository(
+            NotificationSettingsRepositoryImpl(uow.session),
+            get_notification_settings_cache(),
+        ),
+        user_rival_repository=UserRivalRepositoryImpl(uow.session),
+        unit_of_work=uow,
+        batch_size=batch_size,
+    )
+
+
+def main() -> int:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=settings.notification_dispatch_batch_size,
+        help='1トランザクションで確保する通知の数',
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=settings.notification_poll_seconds,
+        help='配信する通知がない場合に待つ秒数',
+    )
+    parser.add_argument(
+        '--once', action='store_true', help='配信できる通知がなくなったら終了する'
+    )
+    parser.add_argument(
+        '--schedule-reminders',
+        nargs='?',
+        const='today',
+        metavar='YYYY-MM-DD',
+        help='指定日（省略時は今日）のリマインダーを予約して終了する',
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.schedule_reminders:
+        timezone = settings.notification_timezone
+        day = (
+            dt.datetime.now(ZoneInfo(timezone)).date()
+            if args.schedule_reminders == 'today'
+            else dt.date.fromisoformat(args.schedule_reminders)
+        )
+        with SQLAlchemyUnitOfWork() as uow:
+            scheduled = build_usecase(uow, args.batch_size).schedule_reminders(
+                day, timezone
+            )
+        print(f'{day} のリマインダーを予約しました: {scheduled} 件')
+        return 0
+
+    # SIGTERM / SIGINT では処理中のバッチをコミットしてから終了する
+    stopping = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: stopping.set())
+
+    logger.info('配信ワーカーを開始しました: batch_size=%d', args.batch_size)
+    while not stopping.is_set():
+        with SQLAlchemyUnitOfWork() as uow:
+            usecase = build_usecase(uow, args.batch_size)
+            # 停止の確認を挟むため、BATCHES_PER_ROUND バッチずつ配信する
+            while (
+                not stopping.is_set()
+                and usecase.dispatch_due(max_batches=BATCHES_PER_ROUND).batches
+                == BATCHES_PER_ROUND
+            ):
+                pass
+        if args.once:
+            break
+        stopping.wait(args.interval)
+    logger.info('配信ワーカーを終了しました')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+起動時間（インポート時間）のプロファイルスクリプト
+
+`python -X importtime -c "import app.main"` を別プロセスで --repeat 回実行し、
+中央値をレイヤー（app.domain / app.application / app.infrastructure /
+app.presentation / app.di）とサードパーティのパッケージごとに集計して表示します。
+
+- self: そのレイヤーのモジュール自身の実行時間の合計
+- cumulative: そのレイヤーのモジュールのインポートにかかった時間
+  （そこから読み込まれた他のレイヤー・パッケージの時間を含む）
+
+使用方法:
+    python scripts/profile_startup.py [--module app.main] [--repeat 5] [--top 15]
+    または
+    make profile-startup
+
+CI での利用:
+    python scripts/profile_startup.py --budget-ms 2500 --forbid passlib --forbid jose
+    インポート時間の中央値が --budget-ms を超えた場合、または --forbid のパッケージが
+    インポート時に読み込まれた場合（遅延読み込みが崩れた場合）は終了コード 1 を返します。
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# app 配下のレイヤー（長い接頭辞から判定する）
+APP_LAYERS = (
+    'app.domain',
+    'app.application',
+    'app.infrastructure',
+    'app.presentation',
+    'app.di',
+)
+
+LINE_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+@dataclass
+class ImportNode:
+    """-X importtime の1行（インポートの木の1ノード）"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    children: list['ImportNode'] = field(default_factory=list)
+
+
+def layer_of(module: str) -> str:
+    """モジュールの集計単位（app のレイヤー、またはトップレベルのパッケージ名）"""
+    if module == 'app' or module.startswith('app.'):
+        for layer in APP_LAYERS:
+            if module == layer or module.startswith(layer + '.'):
+                return layer
+        return 'app'
+    return module.split('.', 1)[0]
+
+
+def parse_importtime(output: str) -> list[ImportNode]:
+    """
+    -X importtime の出力をインポートの木にする
+
+    出力はインポートが完了した順（子が親より先）で、字下げの深さが木の深さを表す。
+    """
+    pending: dict[int, list[ImportNode]] = defaultdict(list)
+    for line in output.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        depth = len(indent) // 2
+        node = ImportNode(module, int(self_us), int(cumulative_us))
+        node.children = pending.pop(depth + 1, [])
+        pending[depth].append(node)
+    return pending[0]
+
+
+def aggregate(roots: list[ImportNode]) -> dict[str, tuple[int, int, int]]:
+    """
+    集計単位ごとの (self[us], cumulative[us], モジュール数)
+
+    cumulative は、同じ単位の祖先を持たないノード（その単位への入口）の
+    累積時間の合計（入れ子の二重計上を避ける）。
+    """
+    self_us: dict[str, int] = defaultdict(int)
+    cumulative_us: dict[str, int] = defaultdict(int)
+    modules: dict[str, int] = defaultdict(int)
+
+    def visit(node: ImportNode, ancestors: frozenset[str]) -> None:
+        layer = layer_of(node.module)
+        self_us[layer] += node.self_us
+        modules[layer] += 1
+        if layer not in ancestors:
+            cumulative_us[layer] += node.cumulative_us
+        for child in node.children:
+            visit(child, ancestors | {layer})
+
+    for root in roots:
+        visit(root, frozenset())
+    return {
+        layer: (self_us[layer], cumulative_us[layer], modules[layer]) for layer in self_us
+    }
+
+
+def run_importtime(module: str) -> str:
+    """別プロセスで module をインポートし、-X importtime の出力を返す"""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f'import {module} に失敗しました:\n{result.stderr[-2000:]}')
+    return result.stderr
+
+
+def print_table(title: str, rows: list[tuple[str, ...]], header: tuple[str, ...]) -> None:
+    widths = [
+        max(len(str(row[i])) for row in [header, *rows]) for i in range(len(header))
+    ]
+    print(f'\n{title}')
+    print('  '.join(col.ljust(widths[i]) for i, col in enumerate(header)))
+    print('  '.join('-' * width for width in widths))
+    for row in rows:
+        print('  '.join(str(col).ljust(widths[i]) for i, col in enumerate(row)))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--module', default='app.main', help='計測するモジュール')
+    parser.add_argument('--repeat', type=int, default=5, help='計測回数（中央値を使う）')
+    parser.add_argument('--top', type=int, default=15, help='表示する遅いモジュール数')
+    parser.add_argument(
+        '--budget-ms', type=float, help='インポート時間の上限（超えたら終了コード 1）'
+    )
+    parser.add_argument(
+        '--forbid',
+        action='append',
+        default=[],
+        help='インポート時に読み込まれてはいけないパッケージ（複数指定可）',
+    )
+    args = parser.parse_args()
+
+    totals: list[int] = []
+    layer_runs: dict[str, list[tuple[int, int, int]]] = defaultdict(list)
+    module_self: dict[str, list[int]] = defaultdict(list)
+    loaded: set[str] = set()
+    for _ in range(args.repeat):
+        roots = parse_importtime(run_importtime(args.module))
+        target = next(node for node in reversed(roots) if node.module == args.module)
+        totals.append(target.cumulative_us)
+        for layer, values in aggregate(roots).items():
+            layer_runs[layer].append(values)
+
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            loaded.add(node.module)
+            module_self[node.module].append(node.self_us)
+            stack.extend(node.children)
+
+    total_ms = statistics.median(totals) / 1000
+    layer_rows = sorted(
+        (
+            (
+                layer,
+                statistics.median(run[0] for run in runs) / 1000,
+                statistics.median(run[1] for run in runs) / 1000,
+                runs[-1][2],
+            )
+            for layer, runs in layer_runs.items()
+        ),
+        key=lambda row: row[2],
+        reverse=True,
+    )
+    print_table(
+        f'import {args.module}: {total_ms:,.0f} ms (median of {args.repeat})',
+        [
+            (
+                layer,
+                f'{self_ms:,.1f}',
+                f'{cumulative_ms:,.1f}',
+                f'{cumulative_ms / total_ms:.0%}',
+                str(count),
+            )
+            for layer, self_ms, cumulative_ms, count in layer_rows[: args.top]
+        ],
+        ('layer / package', 'self ms', 'cumulative ms', 'share', 'modules'),
+    )
+
+    slowest = sorted(
+        ((statistics.median(samples), module) for module, samples in module_self.items()),
+        reverse=True,
+    )[: args.top]
+    print_table(
+        'slowest modules (self)',
+        [(module, f'{us / 1000:,.1f}') for us, module in slowest],
+        ('module', 'self ms'),
+    )
+
+    failures = []
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        failures.append(
+            f'インポート時間 {total_ms:,.0f} ms が上限 {args.budget_ms:,.0f} ms を超えています'
+        )
+    failures.extend(
+        f'{package} がインポート時に読み込まれています'
+        for package in args.forbid
+        if any(m == package or m.startswith(package + '.') for m in loaded)
+    )
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f'NG: {failure}')
+        return 1
+    if args.budget_ms is not None or args.forbid:
+        print('OK: 起動時間の予算内です')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+通知の未読数の修復バッチ
+
+全ユーザーをユーザーID順に NOTIFICATION_COUNTER_REPAIR_BATCH_SIZE 人ずつ、
+未読の通知を数え直して notification_counters のずれを直します。未読数は通知の
+登録・送信・既読/未読・削除と同じトランザクションで増減するため通常はずれませんが、
+ユーザー削除によるカスケードや手作業での通知の書き換えの後に合わせ直すためのものです。
+
+バッチごとに未読数の行をロックしてから数えるため、通知の配信や既読の更新と
+同時に実行しても構いません。
+
+使用方法:
+    python scripts/repair_notification_counters.py [--batch-size 1000]
+    または
+    make repair-notification-counters
+
+cron などで1日1回、通知の少ない時間帯に実行してください。
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from app.application.use_cases.notification_usecase import (  # noqa: E402
+    NotificationUsecase,
+)
+from app.config import get_settings  # noqa: E402
+from app.infrastructure.db.repositories.notification_repository_impl import (  # noqa: E402
+    NotificationRepositoryImpl,
+)
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=get_settings().notification_counter_repair_batch_size,
+        help='1トランザクションで数え直すユーザー数',
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    started = time.perf_counter()
+    with SQLAlchemyUnitOfWork() as uow:
+        usecase = NotificationUsecase(
+            notification_repository=NotificationRepositoryImpl(uow.session),
+            unit_of_work=uow,
+        )
+        repair = usecase.repair_unread_counts(batch_size=args.batch_size)
+
+    print(
+        f'未読数を確認したユーザー: {repair.checked} 人、修正: {repair.corrected} 人 '
+        f'({time.perf_counter() - started:.1f}s, batch_size={args.batch_size})'
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
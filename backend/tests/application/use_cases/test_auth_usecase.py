@@ -0,0 +1,159 @@
+import uuid
+from dataclasses import replace
+
+import pytest
+from fastapi import HTTPException
+
+from app.application.schemas.auth_schemas import LoginInputDTO
+from app.application.use_cases.auth_usecase import AuthUsecase
+from app.di.auth import get_auth_usecase
+from app.domain.entities.user import User
+from app.infrastructure.db.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+
+EMAIL = 'user@example.com'
+PASSWORD = 'correct horse'
+WRONG_PASSWORD = 'wrong'
+OLD_HASH = 'old-hash'
+NEW_HASH = 'new-hash'
+DUMMY_HASH = 'dummy-hash'
+
+
+class FakeSecurityService:
+    """パスワードが一致すれば、new_hash を再ハッシュ結果として返す"""
+
+    def __init__(self, new_hash: str | None):
+        self.new_hash = new_hash
+        self.verified: list[str] = []
+
+    def verify_and_update_password(self, plain_password, hashed_password):
+        self.verified.append(hashed_password)
+        if plain_password != PASSWORD or hashed_password == DUMMY_HASH:
+            return False, None
+        return True, self.new_hash
+
+    def dummy_password_hash(self):
+        return DUMMY_HASH
+
+    def create_access_token(self, user_id, expires_delta=None):
+        return f'token-{user_id}'
+
+
+class FakeUserRepository:
+    def __init__(self, user: User):
+        self.users = {user.email: user}
+        self.updated: list[User] = []
+
+    def get_by_login_id(self, login_id):
+        return self.users.get(login_id)
+
+    def get_by_id(self, user_id):
+        return next((user for user in self.users.values() if user.id == user_id), None)
+
+    def update(self, user):
+        self.updated.append(user)
+        self.users[user.email] = user
+        return user
+
+
+class FakeUnitOfWork:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.runs = 0
+
+    def run(self, work):
+        self.runs += 1
+        if self.fail:
+            raise RuntimeError('db down')
+        return work()
+
+
+def _usecase(new_hash: str | None, uow: FakeUnitOfWork | None = None):
+    user = User(id=uuid.uuid4(), email=EMAIL, password_hash=OLD_HASH)
+    repository = FakeUserRepository(user)
+    usecase = AuthUsecase(
+        security_service=FakeSecurityService(new_hash),
+        user_repository=repository,
+        unit_of_work=uow or FakeUnitOfWork(),
+    )
+    return usecase, repository, user
+
+
+def test_di_wires_repository_and_unit_of_work():
+    uow = SQLAlchemyUnitOfWork()
+
+    usecase = get_auth_usecase(uow)
+
+    assert isinstance(usecase.user_repository, UserRepositoryImpl)
+    assert usecase.unit_of_work is uow
+
+
+def test_login_saves_rehashed_password():
+    usecase, repository, user = _usecase(new_hash=NEW_HASH)
+
+    output = usecase.login(LoginInputDTO(email=EMAIL, password=PASSWORD))
+
+    assert output.user_id == str(user.id)
+    assert repository.updated == [replace(user, password_hash=NEW_HASH)]
+
+
+def test_login_without_rehash_does_not_write():
+    uow = FakeUnitOfWork()
+    usecase, repository, _ = _usecase(new_hash=None, uow=uow)
+
+    usecase.login(LoginInputDTO(email=EMAIL, password=PASSWORD))
+
+    assert repository.updated == []
+    assert uow.runs == 0
+
+
+def test_login_succeeds_when_rehash_fails():
+    usecase, _, user = _usecase(new_hash=NEW_HASH, uow=FakeUnitOfWork(fail=True))
+
+    output = usecase.login(LoginInputDTO(email=EMAIL, password=PASSWORD))
+
+    assert output.user_id == str(user.id)
+
+
+def test_login_rejects_wrong_password():
+    usecase, repository, _ = _usecase(new_hash=NEW_HASH)
+
+    with pytest.raises(HTTPException) as exc_info:
+        usecase.login(LoginInputDTO(email=EMAIL, password=WRONG_PASSWORD))
+
+    assert exc_info.value.status_code == 401
+    assert repository.updated == []
+
+
+@pytest.mark.parametrize('is_active', [True, False])
+def test_login_verifies_dummy_hash_for_unknown_or_inactive_user(is_active):
+    usecase, repository, user = _usecase(new_hash=None)
+    repository.users[EMAIL] = replace(user, is_active=is_active)
+    email = 'unknown@example.com' if is_active else EMAIL
+
+    with pytest.raises(HTTPException) as exc_info:
+        usecase.login(LoginInputDTO(email=email, password=PASSWORD))
+
+    # 存在するユーザーと同じく bcrypt の検証を1回行ってから断る
+    assert exc_info.value.status_code == 401
+    assert usecase.security_service.verified == [DUMMY_HASH]
+
+
+def test_get_me_returns_the_stored_user():
+    usecase, _, user = _usecase(new_hash=None)
+
+    output = usecase.get_me(str(user.id))
+
+    assert output.id == str(user.id)
+    assert output.email == EMAIL
+    assert output.is_active is True
+
+
+@pytest.mark.parametrize('user_id', [str(uuid.uuid4()), 'not-a-uuid'])
+def test_get_me_returns_404_for_missing_user(user_id):
+    usecase, _, _ = _usecase(new_hash=None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        usecase.get_me(user_id)
+
+    assert exc_info.value.status_code == 404
@@ -0,0 +1,91 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from app.application.schemas.user_schemas import UserListInputDTO
+from app.application.use_cases import user_usecase
+from app.application.use_cases.user_usecase import UserUsecase
+from app.domain.entities.user_profile import UserProfile
+from app.domain.repositories.user_profile_repository import (
+    IUserProfileRepository,
+    UserProfileFilter,
+    UserProfilePage,
+)
+
+
+class FakeUserProfileRepository(IUserProfileRepository):
+    """profiles を先頭から limit 件ずつ返す（カーソルは次の位置）"""
+
+    def __init__(self, count: int):
+        self.profiles = [
+            UserProfile(
+                id=uuid.uuid4(),
+                username=f'user_{i}',
+                display_name=f'user_{i}',
+                total_attendance_days=0,
+                current_streak_days=0,
+                max_streak_days=0,
+                current_title_level=1,
+                joined_at=datetime(2024, 1, 1, tzinfo=UTC),
+            )
+            for i in range(count)
+        ]
+        self.count_calls: list[int] = []
+
+    def search_profiles(self, filter, limit, after_cursor=None):
+        start = int(after_cursor) if after_cursor is not None else 0
+        end = start + limit
+        next_cursor = str(end) if end < len(self.profiles) else None
+        return UserProfilePage(profiles=self.profiles[start:end], next_cursor=next_cursor)
+
+    def count_profiles(self, filter: UserProfileFilter, max_count: int) -> int:
+        self.count_calls.append(max_count)
+        return min(len(self.profiles), max_count)
+
+
+def _list(repository, **values):
+    return UserUsecase(repository).list_users(UserListInputDTO(limit=20, **values))
+
+
+def test_total_is_not_counted_unless_requested():
+    repository = FakeUserProfileRepository(50)
+
+    output = _list(repository)
+
+    assert output.total is None
+    assert output.has_more
+    assert output.next_cursor == '20'
+    assert repository.count_calls == []
+
+
+def test_total_of_single_page_uses_page_size():
+    repository = FakeUserProfileRepository(5)
+
+    output = _list(repository, include_total=True)
+
+    assert output.total == 5
+    assert not output.has_more
+    assert repository.count_calls == []
+
+
+def test_total_is_counted_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr(user_usecase, 'MAX_TOTAL_COUNT', 30)
+    repository = FakeUserProfileRepository(50)
+
+    output = _list(repository, include_total=True, cursor='20')
+
+    assert [user.username for user in output.users][0] == 'user_20'
+    assert output.total == 30
+    assert output.total_capped
+    assert repository.count_calls == [31]
+
+
+@pytest.mark.parametrize('count', [25, 30])
+def test_total_within_cap_is_exact(monkeypatch, count):
+    monkeypatch.setattr(user_usecase, 'MAX_TOTAL_COUNT', 30)
+
+    output = _list(FakeUserProfileRepository(count), include_total=True)
+
+    assert output.total == count
+    assert not output.total_capped
@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+# Settings が要求する環境変数（app を読み込む前に補完する）
+for _key, _value in {
+    'POSTGRES_USER': 'test_user',
+    'POSTGRES_PASSWORD': 'test_password',
+    'POSTGRES_DB': 'test_db',
+    'POSTGRES_HOST': 'localhost',
+}.items():
+    os.environ.setdefault(_key, _value)
+
+from app.config import get_settings  # noqa: E402
+from app.infrastructure.db import replica_routing, session  # noqa: E402
+
+# 設定を読んで作られるキャッシュ（環境変数を変えたテストの後に作り直す）
+_CACHED_FACTORIES = (
+    session.get_session_factory,
+    session.get_replica_session_factory,
+    session.get_readonly_primary_session_factory,
+    session.get_async_session_factory,
+    replica_routing.get_primary_stickiness,
+)
+
+
+def _reset_caches() -> None:
+    for engine_factory in (session.get_replica_engine, session.get_engine):
+        if engine_factory.cache_info().currsize:
+            engine_factory().dispose()
+        engine_factory.cache_clear()
+    for factory in _CACHED_FACTORIES:
+        factory.cache_clear()
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def settings_env(monkeypatch):
+    """
+    環境変数で設定を差し替える（None を渡した変数は削除する）
+
+    使用例:
+        def test_xxx(settings_env):
+            settings_env(DATABASE_URL='sqlite:///...', DATABASE_REPLICA_URL=None)
+    """
+
+    def apply(**values: str | None) -> None:
+        for key, value in values.items():
+            if value is None:
+                monkeypatch.delenv(key, raising=False)
+            else:
+                monkeypatch.setenv(key, value)
+        _reset_caches()
+
+    yield apply
+    _reset_caches()
+
+
+@pytest.fixture
+def postgres_url() -> str:
+    """DATABASE_URL（PostgreSQL）。未設定ならテストをスキップする"""
+    url = os.environ.get('DATABASE_URL', '')
+    if not url.startswith('postgresql'):
+        pytest.skip('DATABASE_URL（PostgreSQL）が未設定です')
+    return url
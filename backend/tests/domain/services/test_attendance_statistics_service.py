@@ -0,0 +1,164 @@
+import datetime as dt
+import random
+import uuid
+
+import pytest
+
+from app.domain.entities.attendance import AttendanceStatistics, AttendanceSummary
+from app.domain.services.attendance_statistics_service import (
+    AttendanceStatisticsService,
+    recompute_statistics,
+)
+
+START = dt.date(2025, 1, 1)
+SEEDS = range(20)
+CASES_PER_SEED = 8
+
+
+class InMemorySummaries:
+    """attendance_summaries の代わりに使う日付 -> サマリーの辞書"""
+
+    def __init__(self, user_id: uuid.UUID):
+        self.user_id = user_id
+        self.by_date: dict[dt.date, AttendanceSummary] = {}
+        self.loaded_days = 0
+
+    def attended_dates(self, start: dt.date, end: dt.date) -> set[dt.date]:
+        self.loaded_days += (end - start).days + 1
+        return {
+            day
+            for day, summary in self.by_date.items()
+            if start <= day <= end and summary.is_attended
+        }
+
+    def put(self, summary: AttendanceSummary) -> AttendanceSummary | None:
+        """サマリーを保存し、同じ日の更新前のサマリーを返す"""
+        previous = self.by_date.get(summary.date)
+        self.by_date[summary.date] = summary
+        return previous
+
+
+def _summary(
+    user_id: uuid.UUID, day: dt.date, sessions: int = 1, minutes: int = 30
+) -> AttendanceSummary:
+    return AttendanceSummary(
+        user_id=user_id,
+        date=day,
+        session_count=sessions,
+        total_duration_minutes=minutes if sessions else 0,
+    )
+
+
+def _random_summary(
+    rng: random.Random, user_id: uuid.UUID, day: dt.date
+) -> AttendanceSummary:
+    sessions = rng.choice([0, 1, 1, 2, 3])
+    return _summary(user_id, day, sessions, rng.randint(5, 120))
+
+
+def _random_day(rng: random.Random, today: dt.date, span: int) -> tuple[dt.date, dt.date]:
+    """当日（数日空けることもある）か過去日（バックフィル・修正）を選ぶ"""
+    if rng.random() < 0.6:
+        today += dt.timedelta(days=rng.choice([1, 1, 1, 2, 5]))
+        return today, today
+    day = START + dt.timedelta(days=rng.randint(0, max(span, (today - START).days)))
+    return day, today
+
+
+def _history(days: list[int]) -> tuple[InMemorySummaries, AttendanceStatistics]:
+    """START からの日数で指定した参加日の履歴と、その参加統計"""
+    user_id = uuid.uuid4()
+    store = InMemorySummaries(user_id)
+    for offset in days:
+        store.put(_summary(user_id, START + dt.timedelta(days=offset)))
+    return store, recompute_statistics(user_id, store.by_date.values())
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_apply_matches_full_recompute_on_random_histories(seed):
+    rng = random.Random(seed)  # noqa: S311 (暗号用途ではない)
+    service = AttendanceStatisticsService(chunk_days=rng.choice([1, 7, 31]))
+
+    for _ in range(CASES_PER_SEED):
+        user_id = uuid.uuid4()
+        store = InMemorySummaries(user_id)
+        statistics = AttendanceStatistics(user_id=user_id)
+        today = START
+        span = rng.randint(5, 90)
+
+        for step in range(rng.randint(20, 200)):
+            day, today = _random_day(rng, today, span)
+            summary = _random_summary(rng, user_id, day)
+            previous = store.put(summary)
+            statistics = service.apply(
+                statistics, previous, summary, store.attended_dates
+            )
+
+            expected = recompute_statistics(user_id, store.by_date.values())
+            assert statistics == expected, (
+                f'chunk_days={service.chunk_days} step={step} day={day} '
+                f'sessions={summary.session_count}'
+            )
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_apply_many_matches_full_recompute_on_random_batches(seed):
+    rng = random.Random(seed)  # noqa: S311 (暗号用途ではない)
+    service = AttendanceStatisticsService(chunk_days=rng.choice([1, 7, 31]))
+    user_id = uuid.uuid4()
+    store = InMemorySummaries(user_id)
+    statistics = AttendanceStatistics(user_id=user_id)
+    today = START
+
+    for _ in range(30):
+        changes = {}
+        for _ in range(rng.randint(1, 10)):
+            day, today = _random_day(rng, today, 60)
+            changes[day] = _random_summary(rng, user_id, day)
+        batch = [(store.put(summary), summary) for summary in changes.values()]
+
+        statistics = service.apply_many(statistics, batch, store.attended_dates)
+
+        assert statistics == recompute_statistics(user_id, store.by_date.values())
+
+
+def test_remove_day_reads_only_the_surrounding_streak():
+    # 2年分の毎日の参加の後、5日の連続参加（最長ではない）の中日を取り消す
+    history = list(range(730))
+    store, statistics = _history([*history, 800, 801, 802, 803, 804])
+    user_id = statistics.user_id
+    day = START + dt.timedelta(days=802)
+    service = AttendanceStatisticsService(chunk_days=7)
+
+    updated = service.apply(
+        statistics, store.by_date[day], _summary(user_id, day, 0), store.attended_dates
+    )
+
+    store.put(_summary(user_id, day, 0))
+    assert updated == recompute_statistics(user_id, store.by_date.values())
+    assert updated.current_streak_days == 2
+    assert updated.max_streak_days == 730
+    assert store.loaded_days <= 4 * service.chunk_days
+
+
+@pytest.mark.parametrize(
+    ('days', 'removed'),
+    [
+        ([0], 0),  # 唯一の参加日
+        ([0, 40, 41], 0),  # 初回参加日（次の参加日まで間が空いている）
+        ([0, 1, 40], 40),  # 最後の参加日（前の参加日まで間が空いている）
+        ([0, 1, 2, 10, 11, 12], 11),  # 同じ長さの最長の連続参加が他にもある
+        ([0, 1, 2, 3, 10, 11], 1),  # 唯一の最長の連続参加を分割する
+    ],
+)
+def test_remove_day_edge_cases(days, removed):
+    store, statistics = _history(days)
+    user_id = statistics.user_id
+    day = START + dt.timedelta(days=removed)
+
+    updated = AttendanceStatisticsService(chunk_days=7).apply(
+        statistics, store.by_date[day], _summary(user_id, day, 0), store.attended_dates
+    )
+
+    store.put(_summary(user_id, day, 0))
+    assert updated == recompute_statistics(user_id, store.by_date.values())
@@ -0,0 +1,315 @@
+import dataclasses
+import datetime as dt
+import itertools
+import uuid
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.domain.entities.event import Event, EventStatus, RecurrencePattern
+from app.domain.services.event_schedule_service import (
+    EventSchedulePolicy,
+    OccurrenceWindow,
+    _date_bounds,
+    count_occurrence_dates,
+    count_occurrences,
+    event_duration,
+    expand,
+    occurrence_dates,
+)
+
+POLICY = EventSchedulePolicy()
+ZONE = ZoneInfo('Asia/Tokyo')
+PATTERNS = [None, *RecurrencePattern]
+# 月末・年末・うるう日をまたぐ初回の開催日と期間
+SCHEDULED_DATES = [
+    dt.date(2024, 1, 31),
+    dt.date(2024, 2, 29),
+    dt.date(2023, 12, 31),
+    dt.date(2024, 12, 30),
+    dt.date(2025, 2, 28),
+    dt.date(2024, 3, 1),
+]
+RANGES = [
+    (dt.date(2024, 2, 1), dt.date(2024, 3, 1)),
+    (dt.date(2024, 2, 28), dt.date(2024, 2, 29)),
+    (dt.date(2023, 12, 25), dt.date(2024, 1, 7)),
+    (dt.date(2024, 12, 29), dt.date(2025, 1, 2)),
+    (dt.date(2025, 2, 1), dt.date(2025, 3, 31)),
+    (dt.date(2023, 1, 1), dt.date(2028, 12, 31)),
+    (dt.date(2024, 2, 29), dt.date(2024, 2, 29)),
+    (dt.date(2024, 3, 2), dt.date(2024, 3, 1)),  # 空の期間
+]
+DAY = dt.date(2024, 2, 29)
+
+
+def _event(
+    scheduled_date: dt.date = DAY,
+    pattern: RecurrencePattern | None = RecurrencePattern.DAILY,
+    start: dt.time = dt.time(6),
+    end: dt.time = dt.time(7),
+) -> Event:
+    return Event(
+        id=uuid.uuid4(),
+        creator_id=None,
+        title='朝活もくもく会',
+        description=None,
+        event_type='study',
+        scheduled_date=scheduled_date,
+        start_time=start,
+        end_time=end,
+        is_recurring=pattern is not None,
+        recurrence_pattern=pattern.value if pattern else None,
+    )
+
+
+def _reference_dates(event: Event, first: dt.date, last: dt.date) -> list[dt.date]:
+    """初回の開催日から1日ずつ数える素朴な実装"""
+    start = event.scheduled_date
+    matches = {
+        None: lambda day: day == start,
+        RecurrencePattern.DAILY: lambda day: True,
+        RecurrencePattern.WEEKDAYS: lambda day: day.weekday() < 5,
+        RecurrencePattern.WEEKLY: lambda day: (day - start).days % 7 == 0,
+        RecurrencePattern.BIWEEKLY: lambda day: (day - start).days % 14 == 0,
+        RecurrencePattern.MONTHLY: lambda day: day.day == start.day,
+    }[event.recurrence]
+    days = ((last - start).days + 1) if last >= start else 0
+    return [
+        day
+        for day in (start + dt.timedelta(days=offset) for offset in range(days))
+        if first <= day and matches(day)
+    ]
+
+
+def _local(day: dt.date, hour: int, minute: int = 0, microsecond: int = 0):
+    return dt.datetime.combine(day, dt.time(hour, minute, 0, microsecond), tzinfo=ZONE)
+
+
+@pytest.mark.parametrize(
+    ('pattern', 'scheduled_date', 'bounds'),
+    itertools.product(PATTERNS, SCHEDULED_DATES, RANGES),
+)
+def test_count_matches_generated_dates(pattern, scheduled_date, bounds):
+    event = _event(scheduled_date, pattern)
+
+    dates = list(occurrence_dates(event, *bounds))
+
+    assert count_occurrence_dates(event, *bounds) == len(dates)
+    assert dates == _reference_dates(event, *bounds)
+
+
+def test_monthly_skips_months_without_the_day():
+    event = _event(dt.date(2024, 1, 31), RecurrencePattern.MONTHLY)
+
+    dates = list(occurrence_dates(event, dt.date(2024, 1, 1), dt.date(2024, 12, 31)))
+
+    assert [day.month for day in dates] == [1, 3, 5, 7, 8, 10, 12]
+
+
+def test_leap_day_occurs_only_in_leap_years():
+    event = _event(dt.date(2024, 2, 29), RecurrencePattern.MONTHLY)
+
+    dates = occurrence_dates(event, dt.date(2024, 3, 1), dt.date(2028, 3, 31))
+
+    assert [day for day in dates if day.month == 2] == [dt.date(2028, 2, 29)]
+
+
+def test_unknown_pattern_is_treated_as_one_off():
+    event = dataclasses.replace(_event(), recurrence_pattern='yearly')
+
+    assert event.recurrence is None
+    assert count_occurrence_dates(event, DAY, DAY + dt.timedelta(days=30)) == 1
+
+
+@pytest.mark.parametrize(
+    ('start', 'end', 'expected'),
+    [
+        (dt.time(6), dt.time(7), dt.timedelta(hours=1)),
+        (dt.time(23), dt.time(1), dt.timedelta(hours=2)),  # 翌日に終わる
+        (dt.time(6), dt.time(6), dt.timedelta(days=1)),
+    ],
+)
+def test_event_duration(start, end, expected):
+    assert event_duration(_event(start=start, end=end)) == expected
+
+
+@pytest.mark.parametrize(
+    ('start', 'end', 'expected'),
+    [
+        # 期間の開始は含み、終了は含まない
+        (_local(DAY, 6), _local(DAY, 7), (DAY, DAY)),
+        (_local(DAY, 6, microsecond=1), _local(DAY, 7), None),
+        (_local(DAY, 0), _local(DAY, 6), None),
+        (_local(DAY, 0), _local(DAY, 6, microsecond=1), (DAY, DAY)),
+        # 月末・年末をまたぐ
+        (_local(DAY, 5), _local(dt.date(2024, 3, 1), 6), (DAY, DAY)),
+        (_local(DAY, 7), _local(dt.date(2024, 3, 2), 0), (dt.date(2024, 3, 1),) * 2),
+        (
+            _local(dt.date(2024, 12, 31), 5),
+            _local(dt.date(2025, 1, 1), 7),
+            (dt.date(2024, 12, 31), dt.date(2025, 1, 1)),
+        ),
+        # 別のタイムゾーンで渡しても開催日はイベントのタイムゾーンで数える
+        (
+            dt.datetime(2024, 2, 28, 21, tzinfo=dt.UTC),  # 2/29 06:00 JST
+            dt.datetime(2024, 2, 29, 21, tzinfo=dt.UTC),  # 3/1 06:00 JST
+            (DAY, DAY),
+        ),
+        (_local(DAY, 7), _local(DAY, 6), None),  # 開始が終了より後
+    ],
+)
+def test_date_bounds(start, end, expected):
+    event = _event()
+    window = OccurrenceWindow(start=start, end=end)
+
+    assert _date_bounds(event, window, event_duration(event), ZONE) == expected
+
+
+@pytest.mark.parametrize(
+    ('status', 'now', 'expected'),
+    [
+        (EventStatus.UPCOMING, _local(DAY, 6), (_local(DAY, 6, microsecond=1), None)),
+        (
+            EventStatus.ONGOING,
+            _local(DAY, 6),
+            (_local(DAY, 5, microsecond=1), _local(DAY, 6, microsecond=1)),
+        ),
+        (EventStatus.PAST, _local(DAY, 6), (None, _local(DAY, 5, microsecond=1))),
+    ],
+)
+def test_start_range_narrows_to_status(status, now, expected):
+    window = OccurrenceWindow(
+        start=_local(DAY, 0),
+        end=_local(DAY + dt.timedelta(days=1), 0),
+        status=status,
+        now=now,
+    )
+
+    lo, hi = window.start_range(dt.timedelta(hours=1))
+
+    assert (lo, hi) == (expected[0] or window.start, expected[1] or window.end)
+
+
+def test_start_range_without_status_is_the_window():
+    window = OccurrenceWindow(start=_local(DAY, 0), end=_local(DAY, 12))
+
+    assert window.start_range(dt.timedelta(hours=1)) == (window.start, window.end)
+
+
+NOW = _local(DAY, 10, 30)
+
+
+@pytest.mark.parametrize(
+    ('status', 'date_from', 'date_to', 'expected'),
+    [
+        (None, None, None, (_local(DAY, 0), _local(DAY, 0) + dt.timedelta(days=90))),
+        (
+            EventStatus.UPCOMING,
+            None,
+            None,
+            (_local(DAY, 0), _local(DAY, 0) + dt.timedelta(days=90)),
+        ),
+        # 開催中は日をまたぐ開催を含めるため now の1日前から
+        (
+            EventStatus.ONGOING,
+            None,
+            None,
+            (NOW - dt.timedelta(days=1), NOW + dt.timedelta(days=89)),
+        ),
+        (EventStatus.PAST, None, None, (NOW - dt.timedelta(days=90), NOW)),
+        (
+            EventStatus.PAST,
+            None,
+            _local(dt.date(2024, 1, 1), 0),
+            (_local(dt.date(2023, 10, 3), 0), _local(dt.date(2024, 1, 1), 0)),
+        ),
+        # タイムゾーンのない日時は policy のタイムゾーンの時刻とみなす
+        (
+            None,
+            dt.datetime(2024, 3, 1),
+            None,
+            (_local(dt.date(2024, 3, 1), 0), _local(dt.date(2024, 5, 30), 0)),
+        ),
+        (
+            None,
+            dt.datetime(2024, 3, 1, tzinfo=dt.UTC),
+            dt.datetime(2024, 3, 2),
+            (dt.datetime(2024, 3, 1, tzinfo=dt.UTC), _local(dt.date(2024, 3, 2), 0)),
+        ),
+    ],
+)
+def test_policy_window(status, date_from, date_to, expected):
+    window = POLICY.window(NOW, status, date_from, date_to)
+
+    assert (window.start, window.end) == expected
+    assert window.status == status
+    assert window.now == NOW
+
+
+def test_policy_window_uses_the_policy_day_for_today():
+    # UTC では2/29の20時だが、東京ではすでに3/1
+    window = POLICY.window(dt.datetime(2024, 2, 29, 20, tzinfo=dt.UTC))
+
+    assert window.start == _local(dt.date(2024, 3, 1), 0)
+    assert window.now.tzinfo == ZONE
+
+
+def _starts(event: Event, now: dt.datetime, status: EventStatus) -> list[dt.datetime]:
+    window = POLICY.window(now, status)
+    occurrences = list(expand(event, window, ZONE))
+    assert count_occurrences(event, window, ZONE) == len(occurrences)
+    return [occurrence.starts_at for occurrence in occurrences]
+
+
+@pytest.mark.parametrize(
+    ('now', 'status'),
+    [
+        # 開始の直前まで upcoming、開始から終了の直前まで ongoing、終了から past
+        (_local(DAY, 5, 59, 999999), EventStatus.UPCOMING),
+        (_local(DAY, 6), EventStatus.ONGOING),
+        (_local(DAY, 6, 59, 999999), EventStatus.ONGOING),
+        (_local(DAY, 7), EventStatus.PAST),
+    ],
+)
+def test_occurrence_status_boundaries(now, status):
+    event = _event(DAY, None)
+
+    for candidate in EventStatus:
+        in_list = _local(DAY, 6) in _starts(event, now, candidate)
+        assert in_list == (candidate == status), candidate
+
+
+@pytest.mark.parametrize(
+    ('now', 'status'),
+    [
+        (_local(DAY, 22, 59, 999999), EventStatus.UPCOMING),
+        (_local(DAY, 23), EventStatus.ONGOING),
+        (_local(dt.date(2024, 3, 1), 0, 59, 999999), EventStatus.ONGOING),
+        (_local(dt.date(2024, 3, 1), 1), EventStatus.PAST),
+    ],
+)
+def test_overnight_occurrence_status_boundaries(now, status):
+    # 23:00〜翌1:00 の開催は、日付が変わっても前日の開催回が開催中になる
+    event = _event(DAY, None, start=dt.time(23), end=dt.time(1))
+
+    for candidate in EventStatus:
+        in_list = _local(DAY, 23) in _starts(event, now, candidate)
+        assert in_list == (candidate == status), candidate
+
+
+def test_daily_event_splits_into_past_ongoing_and_upcoming():
+    event = _event(dt.date(2024, 2, 1), RecurrencePattern.DAILY)
+    now = _local(DAY, 6, 30)
+
+    past = _starts(event, now, EventStatus.PAST)
+    ongoing = _starts(event, now, EventStatus.ONGOING)
+    upcoming = _starts(event, now, EventStatus.UPCOMING)
+
+    assert (past[0], past[-1]) == (
+        _local(dt.date(2024, 2, 1), 6),
+        _local(DAY - dt.timedelta(days=1), 6),
+    )
+    assert ongoing == [_local(DAY, 6)]
+    assert upcoming[0] == _local(dt.date(2024, 3, 1), 6)
+    assert len(upcoming) == 89  # 今日の0時から90日のうち今日を除く
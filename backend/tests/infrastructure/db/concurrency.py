@@ -0,0 +1,63 @@
+import threading
+from collections.abc import Callable
+from typing import TypeVar
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.infrastructure.db.retry_policy import RetryPolicy
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+
+T = TypeVar('T')
+
+WORKERS = 32  # 同時接続数（max_connections の既定 100 に収まる数）
+
+
+def run_concurrently(tasks: list[Callable[[], T]], workers: int) -> list[T]:
+    """
+    tasks を workers 本のスレッドで一斉に実行し、tasks の順に結果を返す
+
+    全スレッドを Barrier で揃えてから始める。例外はすべて終わってから最初のものを送出する。
+    """
+    results: list = [None] * len(tasks)
+    errors: list[BaseException] = []
+    next_index = iter(range(len(tasks)))
+    lock = threading.Lock()
+    barrier = threading.Barrier(min(workers, len(tasks)))
+
+    def worker() -> None:
+        barrier.wait()
+        while True:
+            with lock:
+                index = next(next_index, None)
+            if index is None:
+                return
+            try:
+                results[index] = tasks[index]()
+            except BaseException as e:  # noqa: BLE001 (呼び出し元で送出し直す)
+                with lock:
+                    errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(barrier.parties)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def in_unit_of_work(
+    session_factory: sessionmaker[Session], work: Callable[[Session], T]
+) -> T:
+    """
+    work をテスト用のエンジンに接続した Unit of Work で実行してコミット
+
+    デッドロック・直列化の失敗はアプリと同じ方針で待機してやり直す。
+    """
+    uow = SQLAlchemyUnitOfWork(retry_policy=RetryPolicy(max_attempts=10, deadline=30))
+    uow.session = session_factory()
+    try:
+        return uow.run(lambda: work(uow.session))
+    finally:
+        uow.session.close()
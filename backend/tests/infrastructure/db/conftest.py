@@ -0,0 +1,104 @@
+import uuid
+
+import pytest
+from sqlalchemy import Connection, create_engine, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.db.models import Base
+from tests.infrastructure.db.concurrency import WORKERS
+
+
+def _create_tables(connection: Connection) -> None:
+    """
+    テーブルを作成（pg_trgm が使えない環境では trigram インデックスを除く）
+
+    trigram インデックスはメンバー検索の性能のためだけのもので、テストの結果には影響しない。
+    """
+    try:
+        with connection.begin_nested():
+            connection.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    except DBAPIError:
+        pass
+    with_trgm = connection.execute(
+        text(
+            'SELECT EXISTS (SELECT 1 FROM pg_opclass '
+            "WHERE opcname = 'gin_trgm_ops' AND pg_opclass_is_visible(oid))"
+        )
+    ).scalar_one()
+    skipped = {
+        table: set()
+        if with_trgm
+        else {
+            index
+            for index in table.indexes
+            if 'gin_trgm_ops' in index.dialect_options['postgresql']['ops'].values()
+        }
+        for table in Base.metadata.tables.values()
+    }
+    for table, indexes in skipped.items():
+        table.indexes -= indexes
+    try:
+        Base.metadata.create_all(connection)
+    finally:
+        for table, indexes in skipped.items():
+            table.indexes |= indexes
+
+
+@pytest.fixture
+def pg_engine(postgres_url):
+    """
+    テストごとのスキーマにテーブルを作った PostgreSQL のエンジン
+
+    search_path をそのスキーマだけにするため、public に同名のテーブルがあっても使わない。
+    テストの終了時にスキーマごと削除する。
+    """
+    schema = f'test_{uuid.uuid4().hex[:12]}'
+    engine = create_engine(
+        postgres_url,
+        pool_size=WORKERS,
+        max_overflow=0,
+        connect_args={'options': f'-c search_path={schema}'},
+    )
+    try:
+        with engine.connect() as connection:
+            connection.execute(text(f'CREATE SCHEMA {schema}'))
+            _create_tables(connection)
+            connection.commit()
+        yield engine
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA IF EXISTS {schema} CASCADE'))
+        engine.dispose()
+
+
+@pytest.fixture
+def pg_session_factory(pg_engine) -> sessionmaker:
+    return sessionmaker(bind=pg_engine, autoflush=False)
+
+
+@pytest.fixture
+def insert_users(pg_engine):
+    """
+    ユーザーを count 人登録し、IDを登録順に返す
+
+    使用例:
+        def test_xxx(insert_users):
+            user_ids = insert_users(100)
+    """
+
+    def insert(count: int) -> list[uuid.UUID]:
+        with pg_engine.begin() as connection:
+            return list(
+                connection.execute(
+                    text(
+                        'INSERT INTO users (email, password_hash) '
+                        "SELECT 'user' || i || '-' || gen_random_uuid() || "
+                        "'@example.com', 'x' "
+                        'FROM generate_series(1, :count) AS i ORDER BY i RETURNING id'
+                    ),
+                    {'count': count},
+                ).scalars()
+            )
+
+    return insert
@@ -0,0 +1,111 @@
+import datetime as dt
+from collections import Counter
+
+import pytest
+from sqlalchemy import text
+
+from app.domain.entities.event import ParticipationOutcome
+from app.infrastructure.db.repositories.event_participant_repository_impl import (
+    EventParticipantRepositoryImpl,
+)
+from tests.infrastructure.db.concurrency import (
+    WORKERS,
+    in_unit_of_work,
+    run_concurrently,
+)
+
+USERS = 1000
+SEATS = 50
+
+
+@pytest.fixture
+def event(pg_engine, insert_users):
+    """定員 SEATS のイベントと、USERS 人のユーザーID"""
+    user_ids = insert_users(USERS)
+    with pg_engine.begin() as connection:
+        event_id = connection.execute(
+            text(
+                'INSERT INTO events (title, scheduled_date, start_time, end_time, '
+                'max_participants) VALUES '
+                "('朝活もくもく会', :day, '06:00', '07:00', :seats) RETURNING id"
+            ),
+            {'day': dt.date.today() + dt.timedelta(days=1), 'seats': SEATS},
+        ).scalar_one()
+    return event_id, user_ids
+
+
+def _event_state(engine, event_id) -> tuple[int, int]:
+    """(events.participant_count, 登録済みの行数)"""
+    with engine.connect() as connection:
+        return connection.execute(
+            text(
+                'SELECT participant_count, (SELECT count(*) FROM event_participants '
+                "WHERE event_id = :id AND status = 'registered') "
+                'FROM events WHERE id = :id'
+            ),
+            {'id': event_id},
+        ).one()
+
+
+def _participate(session_factory, event_id, user_id, cancel=False):
+    def work(session):
+        repository = EventParticipantRepositoryImpl(session)
+        if cancel:
+            return repository.cancel(event_id, user_id).outcome
+        return repository.register(event_id, user_id).outcome
+
+    return lambda: in_unit_of_work(session_factory, work)
+
+
+def test_simultaneous_joins_admit_exactly_the_seats(pg_engine, pg_session_factory, event):
+    event_id, user_ids = event
+
+    outcomes = run_concurrently(
+        [_participate(pg_session_factory, event_id, user) for user in user_ids],
+        WORKERS,
+    )
+
+    assert Counter(outcomes) == {
+        ParticipationOutcome.JOINED: SEATS,
+        ParticipationOutcome.FULL: USERS - SEATS,
+    }
+    assert _event_state(pg_engine, event_id) == (SEATS, SEATS)
+
+
+def test_cancel_twice_reports_already_cancelled(pg_engine, pg_session_factory, event):
+    event_id, (user_id, *_) = event
+
+    outcomes = [
+        _participate(pg_session_factory, event_id, user_id, cancel=cancel)()
+        for cancel in (False, True, True)
+    ]
+
+    assert outcomes == [
+        ParticipationOutcome.JOINED,
+        ParticipationOutcome.CANCELLED,
+        ParticipationOutcome.ALREADY_CANCELLED,
+    ]
+    assert _event_state(pg_engine, event_id) == (0, 0)
+
+
+def test_concurrent_cancels_of_one_registration(pg_engine, pg_session_factory, event):
+    event_id, (user_id, *_) = event
+    _participate(pg_session_factory, event_id, user_id)()
+
+    outcomes = run_concurrently(
+        [_participate(pg_session_factory, event_id, user_id, cancel=True)] * 8, 8
+    )
+
+    assert Counter(outcomes) == {
+        ParticipationOutcome.CANCELLED: 1,
+        ParticipationOutcome.ALREADY_CANCELLED: 7,
+    }
+    assert _event_state(pg_engine, event_id) == (0, 0)
+
+
+def test_cancel_without_registration_is_not_registered(pg_session_factory, event):
+    event_id, (user_id, *_) = event
+
+    outcome = _participate(pg_session_factory, event_id, user_id, cancel=True)()
+
+    assert outcome == ParticipationOutcome.NOT_REGISTERED
@@ -0,0 +1,186 @@
+import datetime as dt
+import random
+import threading
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.application.use_cases.notification_usecase import NotificationUsecase
+from app.domain.entities.notification import (
+    DueNotification,
+    NotificationAudience,
+    NotificationType,
+)
+from app.infrastructure.db.repositories.notification_repository_impl import (
+    NotificationRepositoryImpl,
+)
+from app.infrastructure.db.retry_policy import RetryPolicy
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+from tests.infrastructure.db.concurrency import in_unit_of_work, run_concurrently
+
+USERS = 120
+PER_USER = 30  # 1人あたりの通知（約3割が未読、約1割が未送信）
+SOURCES = 10  # ライバル更新の複製元
+WORKERS = 8
+OPS_PER_WORKER = 150
+REPAIR_BATCH_SIZE = 16  # 修復のバッチを細かくし、通知の書き換えと何度も重ねる
+NOW = dt.datetime(2026, 10, 17, 21, 0, tzinfo=dt.UTC)
+
+# 未読数が COUNT(*)（UNREAD と同じ条件）と一致しないユーザー
+MISMATCHED_USERS = text(
+    'SELECT u.id FROM users u '
+    'LEFT JOIN notification_counters c ON c.user_id = u.id '
+    'LEFT JOIN ('
+    '  SELECT user_id, count(*) AS unread FROM notifications '
+    "  WHERE is_read = false AND audience = 'user' AND sent_at IS NOT NULL "
+    '  GROUP BY user_id'
+    ') n ON n.user_id = u.id '
+    'WHERE coalesce(c.unread_count, 0) <> coalesce(n.unread, 0)'
+)
+
+
+@pytest.fixture
+def notifications(pg_engine, insert_users):
+    """
+    通知をリポジトリを通さずに入れ（未読数の行はない状態）、
+    (ユーザーID, 本人宛ての通知の (ID, ユーザーID), ライバル更新の複製元) を返す
+    """
+    user_ids = insert_users(USERS)
+    with pg_engine.begin() as connection:
+        connection.execute(text('SELECT setseed(0.25)'))
+        targets = connection.execute(
+            text(
+                'INSERT INTO notifications (user_id, type, title, message, is_read, '
+                'sent_at, created_at) '
+                "SELECT u.id, 'achievement', '称号を獲得しました', '朝活の達人', "
+                'random() >= 0.3, '
+                'CASE WHEN random() < 0.1 THEN NULL ELSE now() END, '
+                'now() - make_interval(mins => i) '
+                'FROM users u CROSS JOIN generate_series(1, :per_user) AS i '
+                'RETURNING id, user_id'
+            ),
+            {'per_user': PER_USER},
+        ).all()
+        sources = [
+            DueNotification(
+                id=row.id,
+                user_id=row.user_id,
+                type=NotificationType.RIVAL_UPDATE,
+                audience=NotificationAudience.RIVAL_FOLLOWERS,
+                title=row.title,
+                message=row.message,
+            )
+            for row in connection.execute(
+                text(
+                    'INSERT INTO notifications (user_id, type, audience, title, '
+                    'message, sent_at) '
+                    "SELECT id, 'rival_update', 'rival_followers', 'ライバルの進捗', "
+                    "'ライバルが朝活に参加しました', now() "
+                    'FROM users ORDER BY id LIMIT :sources '
+                    'RETURNING id, user_id, title, message'
+                ),
+                {'sources': SOURCES},
+            )
+        ]
+    return user_ids, [tuple(target) for target in targets], sources
+
+
+def _mismatched(engine) -> list[uuid.UUID]:
+    with engine.connect() as connection:
+        return list(connection.execute(MISMATCHED_USERS).scalars())
+
+
+def _repair(session_factory) -> int:
+    """全ユーザーの未読数を修復し、直した人数を返す"""
+    session = session_factory()
+    uow = SQLAlchemyUnitOfWork(retry_policy=RetryPolicy(max_attempts=10, deadline=30))
+    uow.session = session
+    try:
+        return (
+            NotificationUsecase(NotificationRepositoryImpl(session), uow)
+            .repair_unread_counts(batch_size=REPAIR_BATCH_SIZE)
+            .corrected
+        )
+    finally:
+        session.close()
+
+
+def _operation(rng: random.Random, user_ids, targets, sources):
+    """mark_sent / set_read / delete_for_user / insert_fanout のいずれか1つ"""
+    notification_id, user_id = rng.choice(targets)
+    roll = rng.random()
+    if roll < 0.15:
+        return lambda repository: repository.mark_sent([notification_id], NOW)
+    if roll < 0.3:
+        return lambda repository: repository.delete_for_user(notification_id, user_id)
+    if roll < 0.45:
+        source = rng.choice(sources)
+        recipients = rng.sample(user_ids, 15)
+        return lambda repository: repository.insert_fanout(source, recipients, NOW)
+    is_read = rng.random() < 0.5
+    return lambda repository: repository.set_read(notification_id, user_id, is_read)
+
+
+def test_repair_fills_counters_for_existing_notifications(
+    pg_engine, pg_session_factory, notifications
+):
+    assert _mismatched(pg_engine)  # リポジトリを通さずに入れた分は数えていない
+
+    assert _repair(pg_session_factory) > 0
+
+    assert _mismatched(pg_engine) == []
+    assert _repair(pg_session_factory) == 0
+
+
+def test_counters_match_count_under_concurrent_writes_and_repair(
+    pg_engine, pg_session_factory, notifications
+):
+    user_ids, targets, sources = notifications
+    _repair(pg_session_factory)
+    # 一部のユーザーの未読数をずらし、同時に動く修復で直させる
+    with pg_engine.begin() as connection:
+        connection.execute(
+            text(
+                'UPDATE notification_counters SET unread_count = unread_count + 3 '
+                'WHERE user_id = ANY(:user_ids)'
+            ),
+            {'user_ids': user_ids[::7]},
+        )
+    running = [WORKERS]  # 書き込み中のワーカー数
+    lock = threading.Lock()
+
+    def writer(seed: int):
+        def run() -> None:
+            rng = random.Random(seed)  # noqa: S311 (暗号用途ではない)
+            try:
+                for _ in range(OPS_PER_WORKER):
+                    operation = _operation(rng, user_ids, targets, sources)
+                    in_unit_of_work(
+                        pg_session_factory,
+                        lambda session, operation=operation: operation(
+                            NotificationRepositoryImpl(session)
+                        ),
+                    )
+            finally:
+                with lock:
+                    running[0] -= 1
+
+        return run
+
+    def repairer() -> int:
+        # 書き込みが続く間、全ユーザーの修復を繰り返す（少なくとも1周は重なる）
+        passes = 0
+        while passes == 0 or running[0]:
+            _repair(pg_session_factory)
+            passes += 1
+        return passes
+
+    results = run_concurrently(
+        [repairer, *(writer(seed) for seed in range(WORKERS))], WORKERS + 1
+    )
+
+    assert results[0] >= 1
+    # 修復をもう一度動かさなくても一致している
+    assert _mismatched(pg_engine) == []
+    assert _repair(pg_session_factory) == 0
@@ -0,0 +1,177 @@
+import datetime as dt
+from collections import Counter
+
+import pytest
+from sqlalchemy import insert, text, update
+
+from app.application.use_cases.notification_dispatch_usecase import (
+    REMINDER_MESSAGE,
+    REMINDER_TITLE,
+    NotificationDispatchUsecase,
+)
+from app.domain.entities.notification import NotificationAudience, NotificationType
+from app.infrastructure.db.models import (
+    NotificationModel,
+    NotificationSettingsModel,
+    UserRivalModel,
+)
+from app.infrastructure.db.repositories.notification_repository_impl import (
+    NotificationRepositoryImpl,
+)
+from app.infrastructure.db.repositories.notification_settings_repository_impl import (
+    NotificationSettingsRepositoryImpl,
+)
+from app.infrastructure.db.repositories.user_rival_repository_impl import (
+    UserRivalRepositoryImpl,
+)
+from app.infrastructure.db.retry_policy import RetryPolicy
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+from tests.infrastructure.db.concurrency import run_concurrently
+
+USERS = 600
+SUBJECTS = 6  # ライバル更新を出すユーザー
+FOLLOWERS = 20  # 1人をライバルに設定しているユーザー
+DISABLED_EVERY = 10  # リマインダーを無効にするユーザーの間隔
+WORKERS = 8
+BATCH_SIZE = 7  # ワーカー同士が確保を競うよう小さくする
+DAY = dt.date(2026, 10, 17)
+TIMEZONE = 'Asia/Tokyo'
+NOW = dt.datetime(2026, 10, 17, 12, 1, tzinfo=dt.UTC)  # 21:01 JST
+
+
+@pytest.fixture
+def due_notifications(pg_engine, pg_session_factory, insert_users):
+    """
+    USERS 人分のリマインダーと SUBJECTS 件のライバル更新を予約し、
+    (予約した通知のID, 届くリマインダーの数, 複製される数) を返す
+
+    sent_at の変更はトリガーで sent_log に記録する（コミットされた変更だけが残る）。
+    """
+    user_ids = insert_users(USERS)
+    subjects = user_ids[:SUBJECTS]
+    followers = {
+        subject: user_ids[SUBJECTS + index * FOLLOWERS :][:FOLLOWERS]
+        for index, subject in enumerate(subjects)
+    }
+    disabled = user_ids[::DISABLED_EVERY]
+
+    with pg_session_factory() as session:
+        session.execute(
+            text(
+                'CREATE TABLE sent_log (notification_id uuid NOT NULL);'
+                'CREATE FUNCTION log_sent() RETURNS trigger AS $$ BEGIN '
+                'INSERT INTO sent_log VALUES (NEW.id); RETURN NEW; END $$ '
+                'LANGUAGE plpgsql;'
+                'CREATE TRIGGER log_sent AFTER UPDATE OF sent_at ON notifications '
+                'FOR EACH ROW WHEN (OLD.sent_at IS DISTINCT FROM NEW.sent_at) '
+                'EXECUTE FUNCTION log_sent()'
+            )
+        )
+        session.execute(
+            insert(UserRivalModel),
+            [
+                {'user_id': follower, 'rival_user_id': subject}
+                for subject, ids in followers.items()
+                for follower in ids
+            ],
+        )
+        NotificationRepositoryImpl(session).schedule_reminders(
+            DAY, TIMEZONE, REMINDER_TITLE, REMINDER_MESSAGE
+        )
+        session.execute(
+            insert(NotificationSettingsModel),
+            [{'user_id': user_id, 'reminder_enabled': False} for user_id in disabled],
+        )
+        session.execute(
+            insert(NotificationModel),
+            [
+                {
+                    'user_id': subject,
+                    'type': NotificationType.RIVAL_UPDATE.value,
+                    'audience': NotificationAudience.RIVAL_FOLLOWERS.value,
+                    'title': 'ライバルが朝活に参加しました',
+                    'message': '今日もライバルが朝活に参加しました',
+                    'scheduled_at': NOW - dt.timedelta(minutes=1),
+                }
+                for subject in subjects
+            ],
+        )
+        # 送信予定時刻が1時間後の通知（今回は確保されない）
+        session.execute(
+            update(NotificationModel)
+            .where(NotificationModel.user_id == user_ids[-1])
+            .values(scheduled_at=NOW + dt.timedelta(hours=1))
+        )
+        session.commit()
+        due_ids = set(
+            session.scalars(
+                text('SELECT id FROM notifications WHERE scheduled_at <= :now'),
+                {'now': NOW},
+            )
+        )
+
+    delivered = USERS - 1 - len(set(disabled) - {user_ids[-1]})
+    return due_ids, delivered, SUBJECTS * FOLLOWERS
+
+
+def _worker(session_factory):
+    def dispatch():
+        session = session_factory()
+        uow = SQLAlchemyUnitOfWork(retry_policy=RetryPolicy(max_attempts=10, deadline=30))
+        uow.session = session
+        try:
+            return NotificationDispatchUsecase(
+                notification_repository=NotificationRepositoryImpl(session),
+                notification_settings_repository=NotificationSettingsRepositoryImpl(
+                    session
+                ),
+                user_rival_repository=UserRivalRepositoryImpl(session),
+                unit_of_work=uow,
+                batch_size=BATCH_SIZE,
+            ).dispatch_due(NOW)
+        finally:
+            session.close()
+
+    return dispatch
+
+
+def test_concurrent_workers_claim_and_send_each_notification_once(
+    pg_engine, pg_session_factory, due_notifications
+):
+    due_ids, delivered, fanouts = due_notifications
+
+    reports = run_concurrently([_worker(pg_session_factory)] * WORKERS, WORKERS)
+
+    claimed = Counter(item for report in reports for item in report.claimed_ids)
+    assert set(claimed) == due_ids
+    assert max(claimed.values()) == 1
+    # 複数のワーカーが実際に確保を分け合っている
+    assert sum(1 for report in reports if report.claimed) > 1
+    assert sum(report.delivered for report in reports) == delivered
+    assert sum(report.fanout_deliveries for report in reports) == fanouts
+
+    with pg_engine.connect() as connection:
+        sent_log = Counter(
+            connection.execute(text('SELECT notification_id FROM sent_log')).scalars()
+        )
+        pending, sent_at, fanout_rows = connection.execute(
+            text(
+                'SELECT '
+                'count(*) FILTER (WHERE sent_at IS NULL AND scheduled_at <= :now), '
+                'array_agg(DISTINCT sent_at), '
+                'count(*) FILTER (WHERE source_id IS NOT NULL) '
+                'FROM notifications'
+            ),
+            {'now': NOW},
+        ).one()
+
+    # 送信済みへの更新は通知ごとに1回だけ（リマインダーを無効にした分は削除済み）
+    assert max(sent_log.values()) == 1
+    assert len(sent_log) == delivered + SUBJECTS
+    assert set(sent_log) <= due_ids
+    assert pending == 0
+    assert sent_at == [NOW, None]  # 送信済みは NOW、未来の1件だけ未送信
+    assert fanout_rows == fanouts
+
+    # すべて配信済みなので、もう一度動かしても何も確保しない
+    assert not _worker(pg_session_factory)().claimed
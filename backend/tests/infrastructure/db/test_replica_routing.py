@@ -0,0 +1,148 @@
+import sqlite3
+from http.cookies import SimpleCookie
+
+import pytest
+from fastapi import Request, Response
+from sqlalchemy import text
+
+from app.di.unit_of_work import get_readonly_unit_of_work, get_unit_of_work
+from app.infrastructure.db import replica_routing
+from app.infrastructure.db.replica_routing import STICKY_COOKIE, PrimaryStickiness
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+
+STICKY_SECONDS = 5.0
+STICKY_SECRET = 'test-secret'
+
+
+def _create_database(path, name: str) -> str:
+    """どちらのDBから読んだか分かるよう、name を1行入れたDBを作る"""
+    with sqlite3.connect(path) as connection:
+        connection.execute('CREATE TABLE origin (name TEXT NOT NULL)')
+        connection.execute('INSERT INTO origin VALUES (?)', (name,))
+    return f'sqlite:///{path}'
+
+
+def _names(path) -> list[str]:
+    with sqlite3.connect(path) as connection:
+        return [row[0] for row in connection.execute('SELECT name FROM origin')]
+
+
+def _read_origin(uow: SQLAlchemyUnitOfWork) -> str:
+    return uow.session.execute(text('SELECT name FROM origin LIMIT 1')).scalar_one()
+
+
+def _request(cookie: str | None = None) -> Request:
+    headers = [(b'cookie', f'{STICKY_COOKIE}={cookie}'.encode())] if cookie else []
+    return Request({'type': 'http', 'headers': headers})
+
+
+def _read_via_di(request: Request) -> str:
+    dependency = get_readonly_unit_of_work(request)
+    uow = next(dependency)
+    try:
+        return _read_origin(uow)
+    finally:
+        dependency.close()
+
+
+def _write_via_di() -> Response:
+    """get_unit_of_work で書き込みをコミットし、レスポンス（Cookie）を返す"""
+    response = Response()
+    dependency = get_unit_of_work(response)
+    uow = next(dependency)
+    try:
+        uow.run(
+            lambda: uow.session.execute(text("INSERT INTO origin VALUES ('written')"))
+        )
+    finally:
+        dependency.close()
+    return response
+
+
+def _sticky_cookie(response: Response) -> str | None:
+    cookie = SimpleCookie(response.headers.get('set-cookie', ''))
+    return cookie[STICKY_COOKIE].value if STICKY_COOKIE in cookie else None
+
+
+@pytest.fixture
+def databases(tmp_path, settings_env):
+    primary = tmp_path / 'primary.db'
+    replica = tmp_path / 'replica.db'
+    settings_env(
+        DATABASE_URL=_create_database(primary, 'primary'),
+        DATABASE_REPLICA_URL=_create_database(replica, 'replica'),
+        DB_REPLICA_STICKY_SECONDS=str(STICKY_SECONDS),
+        DB_REPLICA_STICKY_SECRET=STICKY_SECRET,
+    )
+    return primary, replica
+
+
+def test_readonly_unit_of_work_reads_from_replica(databases):
+    with SQLAlchemyUnitOfWork(readonly=True) as uow:
+        assert _read_origin(uow) == 'replica'
+
+
+def test_writes_go_to_primary(databases):
+    primary, replica = databases
+
+    with SQLAlchemyUnitOfWork() as uow:
+        assert _read_origin(uow) == 'primary'
+        uow.run(
+            lambda: uow.session.execute(text("INSERT INTO origin VALUES ('written')"))
+        )
+
+    assert _names(primary) == ['primary', 'written']
+    assert _names(replica) == ['replica']
+
+
+def test_reads_stick_to_primary_within_window_after_write(databases, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(replica_routing.time, 'time', lambda: now)
+
+    cookie = _sticky_cookie(_write_via_di())
+    assert cookie is not None
+
+    # 別のワーカーでも Cookie だけで判定できる（プロセス内の状態を持たない）
+    replica_routing.get_primary_stickiness.cache_clear()
+    assert _read_via_di(_request(cookie)) == 'primary'
+
+    now += STICKY_SECONDS - 0.1
+    assert _read_via_di(_request(cookie)) == 'primary'
+
+    now += 0.2
+    assert _read_via_di(_request(cookie)) == 'replica'
+
+
+def test_reads_without_or_with_forged_cookie_use_replica(databases):
+    assert _read_via_di(_request()) == 'replica'
+
+    forged = PrimaryStickiness(STICKY_SECONDS, 'other-secret').issue()
+    assert _read_via_di(_request(forged)) == 'replica'
+
+    # 署名が正しくても window より先の期限は受け付けない
+    too_long = PrimaryStickiness(3600, STICKY_SECRET).issue()
+    assert _read_via_di(_request(too_long)) == 'replica'
+
+
+def test_reads_fall_back_to_primary_without_replica(tmp_path, settings_env):
+    settings_env(
+        DATABASE_URL=_create_database(tmp_path / 'primary.db', 'primary'),
+        DATABASE_REPLICA_URL=None,
+    )
+
+    with SQLAlchemyUnitOfWork(readonly=True) as uow:
+        assert _read_origin(uow) == 'primary'
+    # 読み取りは常にプライマリなので、プライマリに固定する Cookie も発行しない
+    assert _sticky_cookie(_write_via_di()) is None
+    assert _read_via_di(_request()) == 'primary'
+
+
+def test_replica_requires_sticky_secret(tmp_path, settings_env):
+    settings_env(
+        DATABASE_URL=_create_database(tmp_path / 'primary.db', 'primary'),
+        DATABASE_REPLICA_URL=_create_database(tmp_path / 'replica.db', 'replica'),
+        DB_REPLICA_STICKY_SECRET='',
+    )
+
+    with pytest.raises(RuntimeError):
+        replica_routing.get_primary_stickiness()
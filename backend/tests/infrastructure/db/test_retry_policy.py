@@ -0,0 +1,176 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.application.interfaces.unit_of_work import TransactionConflictError
+from app.infrastructure.db.retry_policy import RetryPolicy
+from app.infrastructure.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+class FakeClock:
+    """sleep した分だけ進む時計"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.advance(seconds)
+
+
+class ConflictingSession:
+    """commit が conflicts 回だけデッドロックで失敗するセッション"""
+
+    def __init__(self, conflicts: int, error: str = 'deadlock detected'):
+        self.conflicts = conflicts
+        self.error = error
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self) -> None:
+        self.commits += 1
+        if self.commits <= self.conflicts:
+            raise OperationalError('UPDATE events', {}, Exception(self.error))
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+def _ceiling(low: float, high: float) -> float:
+    """ジッターの上限をそのまま返す（待機時間の上限を確かめる）"""
+    return high
+
+
+def _policy(clock: FakeClock, **overrides) -> RetryPolicy:
+    options = {
+        'max_attempts': 10,
+        'base_delay': 0.05,
+        'max_delay': 1.0,
+        'deadline': 60.0,
+        'clock': clock,
+        'uniform': _ceiling,
+    } | overrides
+    return RetryPolicy(**options)
+
+
+def _uow(clock: FakeClock, session: ConflictingSession, **overrides):
+    uow = SQLAlchemyUnitOfWork(
+        retry_policy=_policy(clock, **overrides), sleep=clock.sleep
+    )
+    uow.session = session
+    return uow
+
+
+def test_backoff_doubles_up_to_max_delay():
+    policy = _policy(FakeClock())
+
+    delays = [policy.backoff(attempt) for attempt in range(1, 8)]
+
+    assert delays == [0.05, 0.1, 0.2, 0.4, 0.8, 1.0, 1.0]
+
+
+def test_jitter_is_uniform_between_zero_and_the_ceiling():
+    calls = []
+    policy = _policy(
+        FakeClock(),
+        uniform=lambda low, high: calls.append((low, high)) or high / 2,
+    )
+
+    assert policy.backoff(3) == pytest.approx(0.1)
+    assert calls == [(0, pytest.approx(0.2))]
+
+
+def test_default_jitter_stays_below_the_ceiling():
+    policy = RetryPolicy(base_delay=0.05, max_delay=1.0)
+
+    delays = [policy.backoff(attempt) for attempt in range(1, 8) for _ in range(200)]
+
+    assert all(0 <= delay <= 1.0 for delay in delays)
+    assert len(set(delays)) > 1  # 同じ待機時間に揃わない
+
+
+def test_budget_stops_after_max_attempts():
+    budget = _policy(FakeClock(), max_attempts=3).start()
+
+    assert [budget.next_delay() for _ in range(4)] == [0.05, 0.1, None, None]
+    assert budget.attempt == 3
+
+
+def test_budget_stops_before_the_deadline():
+    clock = FakeClock()
+    budget = _policy(clock, deadline=0.3).start()
+
+    assert budget.next_delay() == 0.05
+    clock.advance(0.05)
+    assert budget.next_delay() == 0.1
+    clock.advance(0.1)
+    # 0.15 秒経過後に 0.2 秒待つと期限の 0.3 秒に達する
+    assert budget.next_delay() is None
+    assert budget.attempt == 3
+
+
+def test_run_retries_with_backoff_then_commits():
+    clock = FakeClock()
+    session = ConflictingSession(conflicts=3)
+    uow = _uow(clock, session)
+
+    assert uow.run(lambda: 'ok') == 'ok'
+
+    assert clock.sleeps == [0.05, 0.1, 0.2]
+    assert (session.commits, session.rollbacks) == (4, 3)
+
+
+def test_run_raises_conflict_after_max_attempts():
+    clock = FakeClock()
+    session = ConflictingSession(conflicts=10)
+    uow = _uow(clock, session, max_attempts=4)
+
+    with pytest.raises(TransactionConflictError, match='4回試行'):
+        uow.run(lambda: None)
+
+    assert clock.sleeps == [0.05, 0.1, 0.2]
+    assert session.commits == 4
+
+
+def test_run_raises_conflict_when_the_deadline_would_pass():
+    clock = FakeClock()
+    session = ConflictingSession(conflicts=10)
+    uow = _uow(clock, session, deadline=1.0)
+
+    with pytest.raises(TransactionConflictError):
+        uow.run(lambda: clock.advance(0.1))
+
+    # 試行ごとに 0.1 秒かかり、次の待機で 1 秒を超える手前で打ち切る
+    assert clock.sleeps == [0.05, 0.1, 0.2]
+    assert clock.now - 100.0 == pytest.approx(0.35 + 0.4)
+    assert session.commits == 4
+
+
+def test_run_does_not_retry_other_errors():
+    clock = FakeClock()
+    session = ConflictingSession(conflicts=1, error='connection refused')
+    uow = _uow(clock, session)
+
+    with pytest.raises(OperationalError):
+        uow.run(lambda: None)
+
+    assert clock.sleeps == []
+    assert session.commits == 1
+
+
+def test_commit_raises_conflict_without_retrying():
+    clock = FakeClock()
+    session = ConflictingSession(conflicts=1, error='could not serialize access')
+    uow = _uow(clock, session)
+
+    with pytest.raises(TransactionConflictError):
+        uow.commit()
+
+    assert clock.sleeps == []
+    assert session.rollbacks == 1
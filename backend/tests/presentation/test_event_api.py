@@ -0,0 +1,80 @@
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.application.schemas.event_schemas import EventParticipationOutputDTO
+from app.di.event import get_event_participation_usecase
+from app.domain.entities.event import ParticipationOutcome, ParticipationResult
+from app.infrastructure.security.security_service_impl import (
+    User,
+    get_current_user_from_cookie,
+)
+from app.presentation.api import event_api
+
+EVENT_ID = uuid.uuid4()
+USER_ID = uuid.uuid4()
+
+
+class FakeParticipationUsecase:
+    """指定した outcome を返す参加ステータス更新ユースケース"""
+
+    def __init__(self, outcome: ParticipationOutcome):
+        self.outcome = outcome
+
+    def update_status(self, input_dto):
+        result = ParticipationResult(
+            event_id=input_dto.event_id,
+            user_id=input_dto.user_id,
+            outcome=self.outcome,
+            max_participants=50,
+        )
+        return EventParticipationOutputDTO(
+            event_id=result.event_id,
+            user_id=result.user_id,
+            outcome=result.outcome,
+            status=result.status,
+            participant_count=result.participant_count,
+            max_participants=result.max_participants,
+        )
+
+
+def _put_status(outcome: ParticipationOutcome, status: str):
+    app = FastAPI()
+    app.include_router(event_api.router)
+    app.dependency_overrides[get_current_user_from_cookie] = lambda: User(id=str(USER_ID))
+    app.dependency_overrides[get_event_participation_usecase] = lambda: (
+        FakeParticipationUsecase(outcome)
+    )
+    return TestClient(app).put(
+        f'/events/{EVENT_ID}/participants/{USER_ID}', json={'status': status}
+    )
+
+
+@pytest.mark.parametrize(
+    ('outcome', 'status'),
+    [
+        (ParticipationOutcome.JOINED, 'registered'),
+        (ParticipationOutcome.ALREADY_REGISTERED, 'registered'),
+        (ParticipationOutcome.CANCELLED, 'cancelled'),
+        (ParticipationOutcome.ALREADY_CANCELLED, 'cancelled'),
+    ],
+)
+def test_update_status_is_idempotent(outcome, status):
+    response = _put_status(outcome, status)
+
+    assert response.status_code == 200
+    assert response.json()['data']['status'] == status
+
+
+@pytest.mark.parametrize(
+    ('outcome', 'status', 'expected'),
+    [
+        (ParticipationOutcome.FULL, 'registered', 409),
+        (ParticipationOutcome.NOT_REGISTERED, 'cancelled', 409),
+        (ParticipationOutcome.EVENT_NOT_FOUND, 'cancelled', 404),
+    ],
+)
+def test_update_status_rejects_unchangeable_requests(outcome, status, expected):
+    assert _put_status(outcome, status).status_code == expected
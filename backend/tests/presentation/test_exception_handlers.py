@@ -0,0 +1,28 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.application.interfaces.unit_of_work import TransactionConflictError
+from app.presentation.exception_handlers import (
+    TRANSACTION_CONFLICT_RETRY_AFTER,
+    register_exception_handlers,
+)
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+
+    @app.post('/conflict')
+    def conflict():
+        raise TransactionConflictError('リトライ上限に達しました（3回試行）')
+
+    register_exception_handlers(app)
+    return TestClient(app)
+
+
+def test_transaction_conflict_returns_503_with_retry_after():
+    response = _client().post('/conflict')
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == str(TRANSACTION_CONFLICT_RETRY_AFTER)
+    # 内部のエラーメッセージはクライアントに返さない
+    assert '試行' not in response.json()['detail']
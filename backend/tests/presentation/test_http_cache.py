@@ -0,0 +1,35 @@
+import pytest
+from fastapi import Request
+
+from app.application.interfaces.response_cache import CacheNamespace
+from app.presentation.http_cache import _cache_key
+
+NAMESPACES = (CacheNamespace.USERS,)
+
+
+def _key(query_string: str) -> str:
+    request = Request(
+        {
+            'type': 'http',
+            'path': '/users',
+            'query_string': query_string.encode(),
+            'headers': [],
+        }
+    )
+    return _cache_key(request, NAMESPACES, (1,), vary='')
+
+
+@pytest.mark.parametrize(
+    ('first', 'second'),
+    [
+        ('search=a%26skills%3Db', 'search=a&skills=b'),
+        ('search=a%3Db', 'search%3Da=b'),
+        ('skills=a%2Cb', 'skills=a&skills=b'),
+    ],
+)
+def test_cache_key_distinguishes_escaped_delimiters(first, second):
+    assert _key(first) != _key(second)
+
+
+def test_cache_key_ignores_parameter_order():
+    assert _key('limit=20&search=a') == _key('search=a&limit=20')
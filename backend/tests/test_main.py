@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from app import main
+from app.infrastructure.security.password_hasher import get_password_hasher
+
+
+@pytest.fixture
+def lifespan(monkeypatch):
+    """DB に接続せずにアプリの起動・終了処理を動かす"""
+
+    async def dispose_engines() -> None:
+        pass
+
+    monkeypatch.setattr(main, 'setup_logging', lambda: None)
+    monkeypatch.setattr(main, 'init_engines', lambda: None)
+    monkeypatch.setattr(main, 'dispose_engines', dispose_engines)
+    get_password_hasher.cache_clear()
+
+    async def serve(during) -> None:
+        async with main.lifespan(main.app):
+            during()
+
+    def run(during=lambda: None) -> None:
+        asyncio.run(serve(during))
+
+    yield run
+    get_password_hasher.cache_clear()
+
+
+def test_shutdown_stops_the_password_hasher_workers(lifespan):
+    def login() -> None:
+        hasher = get_password_hasher()
+        hasher.max_workers = 1
+        assert hasher.verify('password', hasher.hash('password'))
+        assert hasher._executor is not None
+
+    lifespan(login)
+
+    assert get_password_hasher()._executor is None
+
+
+def test_shutdown_does_not_create_the_password_hasher(lifespan):
+    lifespan()
+
+    assert get_password_hasher.cache_info().currsize == 0